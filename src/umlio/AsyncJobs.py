@@ -0,0 +1,35 @@
+
+from typing import Callable
+from typing import TypeVar
+
+from asyncio import CancelledError
+from asyncio import get_running_loop
+from asyncio import shield
+
+from concurrent.futures import Executor
+
+JobResult = TypeVar('JobResult')
+
+
+async def runJob(executor: Executor | None, job: Callable[[], JobResult]) -> JobResult:
+    """
+    Run a blocking job off the event loop.  A job that has started always runs to its end,
+    even when the awaiting task is cancelled;  The cancellation takes effect once it is done.
+    So readers and writers are only ever cancelled between jobs, never halfway through
+    writing a diagram
+
+    Args:
+        executor:  Where the job runs;  None for the event loop's default executor
+        job:       The blocking work
+
+    Returns:  What the job returns
+    """
+    runningJob = get_running_loop().run_in_executor(executor, job)
+    try:
+        return await shield(runningJob)
+    except CancelledError:
+        try:
+            await runningJob
+        except Exception:
+            pass          # The caller asked to stop;  The cancellation is what matters
+        raise
@@ -0,0 +1,184 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from time import perf_counter
+
+from umlio.ProjectTypes import ProjectSummary
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.ContainerFormat import ContainerHeader
+from umlio.ContainerFormat import HEADER_STRUCT
+from umlio.ContainerFormat import isContainer
+
+from umlio.IRReader import DEFAULT_READ_WORKERS
+from umlio.IRReader import IRReader
+from umlio.IRTypes import ProjectIR
+from umlio.ProjectConverter import ProjectConverter
+from umlio.ProjectProbe import ProjectProbe
+
+from umlio.codecs.Codec import MAGIC_LENGTH
+from umlio.codecs.CompressionProfile import CompressionProfile
+from umlio.codecs.CompressionProfile import codecForId
+from umlio.codecs.CompressionProfile import codecForLeadingBytes
+
+from umlio.sources.SourceSniffer import sourceForFile
+
+JobDetails = NewType('JobDetails', Dict[str, Any])
+
+
+def jobDetailsFactory() -> JobDetails:
+    return JobDetails({})
+
+
+@dataclass
+class JobResult:
+    """
+    What a batch job reports about a single file;  Plain values only, so that it pickles
+    and goes straight into a JSON summary
+    """
+    fileName:  str
+    succeeded: bool       = True
+    message:   str        = ''
+    seconds:   float      = 0.0
+    details:   JobDetails = field(default_factory=jobDetailsFactory)
+
+
+JobResults = NewType('JobResults', List[JobResult])
+
+
+def convertJob(fileName: Path, outputFileName: Path, compressionProfile: CompressionProfile, containerFormat: bool) -> JobResult:
+    """
+    Convert or recompress a file;  The output format follows the output suffix
+    """
+    def convert(details: JobDetails):
+        projectConverter: ProjectConverter = ProjectConverter(compressionProfile=compressionProfile, containerFormat=containerFormat)
+
+        details['inputFormat']  = storedFormat(fileName=fileName)
+        details['inputBytes']   = fileName.stat().st_size
+        details['xmlBytes']     = projectConverter.convert(fileName=fileName, outputFileName=outputFileName)
+        details['outputFile']   = str(outputFileName)
+        details['outputFormat'] = storedFormat(fileName=outputFileName)
+        details['outputBytes']  = outputFileName.stat().st_size
+
+    return _runJob(fileName=fileName, job=convert)
+
+
+def validateJob(fileName: Path) -> JobResult:
+    """
+    Deserialize a file to the intermediate representation;  That checks the compression, the
+    XML and every model object and link reference without building any shapes
+    """
+    def validate(details: JobDetails):
+        projectIR: ProjectIR = IRReader().read(xmlSource=sourceForFile(fileName=fileName))
+
+        details['format']   = storedFormat(fileName=fileName)
+        details['version']  = projectIR.version
+        details['diagrams'] = len(projectIR.diagramIRs)
+
+    return _runJob(fileName=fileName, job=validate)
+
+
+def statsJob(fileName: Path) -> JobResult:
+    """
+    Probe a file;  The sizes, the format and what each diagram holds
+    """
+    def stats(details: JobDetails):
+        projectSummary: ProjectSummary = ProjectProbe().probe(fileName=fileName)
+
+        elementCounts: Dict[str, int] = {}
+        for diagramSummary in projectSummary.diagramSummaries:
+            for elementName, elementCount in diagramSummary.elementCounts.items():
+                elementCounts[elementName] = elementCounts.get(elementName, 0) + elementCount
+
+        details['format']        = storedFormat(fileName=fileName)
+        details['storedBytes']   = fileName.stat().st_size
+        details['version']       = projectSummary.version
+        details['codePath']      = str(projectSummary.codePath)
+        details['elementCounts'] = elementCounts
+        details['diagrams']      = [
+            {
+                'title':         diagramSummary.documentTitle,
+                'type':          diagramSummary.documentType.value,
+                'elementCounts': dict(diagramSummary.elementCounts)
+            }
+            for diagramSummary in projectSummary.diagramSummaries
+        ]
+
+    return _runJob(fileName=fileName, job=stats)
+
+
+def storedFormat(fileName: Path) -> str:
+    """
+    Returns:  xml, the codec name of a single stream project file or container/ and the codec name
+    """
+    if fileName.suffix == XML_SUFFIX:
+        return 'xml'
+
+    with fileName.open('rb') as projectFile:
+        leadingBytes: bytes = projectFile.read(max(HEADER_STRUCT.size, MAGIC_LENGTH))
+
+    if isContainer(leadingBytes=leadingBytes) is True:
+        return f'container/{codecForId(codecId=ContainerHeader.unpack(headerBytes=leadingBytes).codecId).name}'
+
+    return codecForLeadingBytes(leadingBytes=leadingBytes[:MAGIC_LENGTH]).name
+
+
+def _runJob(fileName: Path, job: Callable[[JobDetails], None]) -> JobResult:
+    """
+    A failure is reported, not raised;  The rest of the batch goes on
+    """
+    jobResult: JobResult = JobResult(fileName=str(fileName))
+    startTime: float     = perf_counter()
+    try:
+        job(jobResult.details)
+    except Exception as e:
+        jobResult.succeeded = False
+        jobResult.message   = f'{type(e).__name__}: {e}'
+
+    jobResult.seconds = perf_counter() - startTime
+
+    return jobResult
+
+
+class BatchRunner:
+    """
+    Runs a job per file in a pool of worker processes;  Headless
+    """
+    def __init__(self, workers: int = DEFAULT_READ_WORKERS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._workers: int = max(1, workers)
+
+    def run(self, job: Callable[..., JobResult], jobArguments: List[Dict[str, Any]]) -> Iterator[JobResult]:
+        """
+        Args:
+            job:           A module level job function such as convertJob
+            jobArguments:  The keyword arguments of each job
+
+        Returns:  The job results in completion order
+        """
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            futures: List[Future] = [executor.submit(job, **arguments) for arguments in jobArguments]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
@@ -0,0 +1,135 @@
+from typing import List
+from typing import NewType
+
+from dataclasses import dataclass
+
+from os import cpu_count
+
+from struct import Struct
+
+from zlib import crc32
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.ZlibCodec import ZLIB_CODEC_ID
+
+from umlio.exceptions.CorruptProjectFileException import CorruptProjectFileException
+from umlio.exceptions.UnsupportedVersion import UnsupportedVersion
+
+#
+# The version 2 project file container.  All integers are big endian
+#
+#   header              magic, format version, codec id, block count, table of contents offset
+#   block ...           independently compressed with the header's codec
+#   table of contents   one entry per block, in document order
+#
+# Block 0 is the XML declaration and the project start tag.  Then one block per UMLDiagram,
+# then the project end tag.  The uncompressed blocks, concatenated, are exactly the XML a
+# legacy single stream file holds.  A legacy file starts with a zlib header (0x78) and so
+# never with the magic
+#
+CONTAINER_MAGIC:          bytes = b'\x89UDT'
+CONTAINER_FORMAT_VERSION: int   = 2
+
+HEADER_STRUCT: Struct = Struct('>4sHHIQ')
+ENTRY_STRUCT:  Struct = Struct('>QIQII')
+
+DEFAULT_CODEC_THREADS: int = min(4, cpu_count() or 1)
+
+
+@dataclass
+class BlockEntry:
+    compressedOffset:   int
+    compressedLength:   int
+    uncompressedOffset: int
+    uncompressedLength: int
+    checksum:           int
+
+    @property
+    def uncompressedEnd(self) -> int:
+        return self.uncompressedOffset + self.uncompressedLength
+
+
+BlockEntries = NewType('BlockEntries', List[BlockEntry])
+
+
+def blockEntriesFactory() -> BlockEntries:
+    return BlockEntries([])
+
+
+@dataclass
+class ContainerHeader:
+    formatVersion:         int = CONTAINER_FORMAT_VERSION
+    codecId:               int = ZLIB_CODEC_ID
+    blockCount:            int = 0
+    tableOfContentsOffset: int = 0
+
+    def pack(self) -> bytes:
+        return HEADER_STRUCT.pack(CONTAINER_MAGIC, self.formatVersion, self.codecId, self.blockCount, self.tableOfContentsOffset)
+
+    @classmethod
+    def unpack(cls, headerBytes: bytes) -> 'ContainerHeader':
+
+        if len(headerBytes) < HEADER_STRUCT.size or isContainer(leadingBytes=headerBytes) is False:
+            raise CorruptProjectFileException('Not a project file container')
+
+        magic, formatVersion, codecId, blockCount, tableOfContentsOffset = HEADER_STRUCT.unpack(headerBytes[:HEADER_STRUCT.size])
+        if formatVersion != CONTAINER_FORMAT_VERSION:
+            raise UnsupportedVersion(f'Container format version {formatVersion} is not supported')
+
+        return ContainerHeader(formatVersion=formatVersion, codecId=codecId, blockCount=blockCount, tableOfContentsOffset=tableOfContentsOffset)
+
+
+def isContainer(leadingBytes: bytes) -> bool:
+    """
+    Args:
+        leadingBytes:  At least the first len(CONTAINER_MAGIC) bytes of a project file
+
+    Returns:  True for a version 2 container, False for a legacy single stream file
+    """
+    return leadingBytes[:len(CONTAINER_MAGIC)] == CONTAINER_MAGIC
+
+
+def packBlockEntries(blockEntries: BlockEntries) -> bytes:
+    return b''.join(ENTRY_STRUCT.pack(e.compressedOffset, e.compressedLength, e.uncompressedOffset, e.uncompressedLength, e.checksum) for e in blockEntries)
+
+
+def unpackBlockEntries(tableOfContents: bytes, blockCount: int) -> BlockEntries:
+
+    if len(tableOfContents) != blockCount * ENTRY_STRUCT.size:
+        raise CorruptProjectFileException(f'The table of contents is truncated;  Expected {blockCount} entries')
+
+    return BlockEntries([BlockEntry(*entryFields) for entryFields in ENTRY_STRUCT.iter_unpack(tableOfContents)])
+
+
+def compressBlock(xmlBytes: bytes, codec: Codec) -> bytes:
+    """
+    Runs on a codec thread;  The standard library codecs release the GIL while they work
+    """
+    return codec.compress(xmlBytes)
+
+
+def decompressBlock(compressedBytes: bytes, codec: Codec, blockEntry: BlockEntry, blockNumber: int, maximumLength: int) -> bytes:
+    """
+    Runs on a codec thread;  The standard library codecs release the GIL while they work
+
+    Args:
+        compressedBytes:  The block as stored
+        codec:            The codec the header names
+        blockEntry:       Its table of contents entry
+        blockNumber:      For the error message
+        maximumLength:    The most XML bytes to inflate;  The entry's declared length comes from
+                          the file, so the caller caps it at what the decompression limits allow
+
+    Returns:  The block's XML
+    """
+    try:
+        xmlBytes: bytes = codec.decompress(compressedBytes, maxLength=min(blockEntry.uncompressedLength, maximumLength) + 1)
+    except UnsupportedVersion:
+        raise
+    except Exception as e:
+        raise CorruptProjectFileException(f'Block {blockNumber} does not decompress: {e}')
+
+    if len(xmlBytes) != blockEntry.uncompressedLength or crc32(xmlBytes) != blockEntry.checksum:
+        raise CorruptProjectFileException(f'Block {blockNumber} failed its CRC check')
+
+    return xmlBytes
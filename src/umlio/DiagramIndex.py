@@ -0,0 +1,146 @@
+
+from typing import List
+from typing import NewType
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import blake2b
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import replace as osReplace
+from os import stat_result
+
+from pathlib import Path
+
+from umlio.ProjectTypes import UmlDocumentTitle
+from umlio.ProjectTypes import UmlDocumentType
+
+from umlio.deserializer.XmlDiagramScanner import DiagramLocation
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+
+#
+# A sidecar next to an uncompressed project;  Project.xml is indexed by Project.xml.idx
+#
+INDEX_SUFFIX:         str = '.idx'
+INDEX_FORMAT_VERSION: int = 1
+
+DIAGRAM_HASH_SIZE: int = 16
+
+
+@dataclass
+class IndexedDiagram:
+    """
+    Where a UMLDiagram element lives in the XML;  The range covers the element and nothing else
+    """
+    documentTitle: str = ''
+    documentType:  str = ''
+    startOffset:   int = 0
+    length:        int = 0
+    contentHash:   str = ''
+
+
+IndexedDiagrams = NewType('IndexedDiagrams', List[IndexedDiagram])
+
+
+def indexedDiagramsFactory() -> IndexedDiagrams:
+    return IndexedDiagrams([])
+
+
+@dataclass
+class DiagramIndex:
+    """
+    What a reader needs to go straight to a diagram.  The size and modification time of the
+    XML file are recorded when the index is saved;  An index that no longer matches them is
+    stale.  Each diagram's hash is checked when the diagram is read
+    """
+    formatVersion:   int             = INDEX_FORMAT_VERSION
+    size:            int             = 0
+    modifiedTime:    int             = 0
+    version:         str             = ''
+    codePath:        str             = ''
+    prologLength:    int             = 0
+    indexedDiagrams: IndexedDiagrams = field(default_factory=indexedDiagramsFactory)
+
+    def scannedProject(self, prolog: bytes) -> ScannedProject:
+        """
+        Args:
+            prolog:  The first prologLength bytes of the XML file
+
+        Returns:  What a scan of the XML file would have found
+        """
+        scannedProject: ScannedProject = ScannedProject(version=self.version, codePath=self.codePath, prolog=prolog)
+
+        for indexedDiagram in self.indexedDiagrams:
+            scannedProject.diagramLocations.append(
+                DiagramLocation(
+                    documentTitle=UmlDocumentTitle(indexedDiagram.documentTitle),
+                    documentType=UmlDocumentType(indexedDiagram.documentType),
+                    startOffset=indexedDiagram.startOffset,
+                    endOffset=indexedDiagram.startOffset + indexedDiagram.length,
+                    contentHash=indexedDiagram.contentHash
+                )
+            )
+
+        return scannedProject
+
+
+def indexFileName(xmlFileName: Path) -> Path:
+    return xmlFileName.with_name(f'{xmlFileName.name}{INDEX_SUFFIX}')
+
+
+def diagramHash(fragment: bytes) -> str:
+    return blake2b(fragment, digest_size=DIAGRAM_HASH_SIZE).hexdigest()
+
+
+def saveDiagramIndex(diagramIndex: DiagramIndex, xmlFileName: Path):
+    """
+    Call this once the XML file is complete;  The index is stamped with its size and
+    modification time
+
+    Args:
+        diagramIndex:  The index collected while the XML was written
+        xmlFileName:   The indexed XML file
+    """
+    xmlStat: stat_result = xmlFileName.stat()
+
+    diagramIndex.size         = xmlStat.st_size
+    diagramIndex.modifiedTime = xmlStat.st_mtime_ns
+
+    indexData: dict = dict(diagramIndex.__dict__)
+    indexData['indexedDiagrams'] = [indexedDiagram.__dict__ for indexedDiagram in diagramIndex.indexedDiagrams]
+
+    indexPath:     Path = indexFileName(xmlFileName=xmlFileName)
+    temporaryPath: Path = indexPath.with_name(f'{indexPath.name}.tmp')
+
+    temporaryPath.write_text(jsonDumps(indexData, indent=1))
+    osReplace(temporaryPath, indexPath)
+
+
+def loadDiagramIndex(xmlFileName: Path) -> DiagramIndex | None:
+    """
+    Args:
+        xmlFileName:  An uncompressed project file
+
+    Returns:  Its index;  None when there is none or it is unreadable or stale
+    """
+    indexPath: Path = indexFileName(xmlFileName=xmlFileName)
+    if indexPath.exists() is False:
+        return None
+
+    try:
+        indexData:    dict         = jsonLoads(indexPath.read_text())
+        diagramIndex: DiagramIndex = DiagramIndex(**indexData)
+        diagramIndex.indexedDiagrams = IndexedDiagrams([IndexedDiagram(**indexedDiagram) for indexedDiagram in indexData['indexedDiagrams']])
+        for indexedDiagram in diagramIndex.indexedDiagrams:
+            UmlDocumentType(indexedDiagram.documentType)
+    except (ValueError, TypeError, KeyError):
+        return None
+
+    xmlStat: stat_result = xmlFileName.stat()
+    if diagramIndex.formatVersion != INDEX_FORMAT_VERSION or diagramIndex.size != xmlStat.st_size or diagramIndex.modifiedTime != xmlStat.st_mtime_ns:
+        return None
+
+    return diagramIndex
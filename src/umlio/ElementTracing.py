@@ -0,0 +1,51 @@
+from logging import DEBUG
+from logging import Logger
+
+#
+# Element level tracing logs every class, method, code line and link read or written.
+# It is off unless turned on here;  Then each module's logger must be at DEBUG too
+#
+_elementTracing: bool = False
+
+
+def setElementTracing(elementTracing: bool):
+    """
+    The single switch for element level tracing;  Takes effect on the next read or write
+    """
+    global _elementTracing
+    _elementTracing = elementTracing
+
+
+def elementTracing() -> bool:
+    return _elementTracing
+
+
+class ElementTracer:
+    """
+    Lazy per element debug logging for one module.  Check enabled once, before a loop;  Pass
+    the values as arguments, so they are only formatted when the message is emitted.
+
+    Usage:
+        tracing: bool = self._elementTracer.enabled
+        for codeElement in codeElements:
+            if tracing is True:
+                self._elementTracer.trace('%s', codeElement.cdata)
+    """
+    def __init__(self, logger: Logger):
+        """
+        Args:
+            logger:  The module's logger
+        """
+        self._logger: Logger = logger
+
+    @property
+    def enabled(self) -> bool:
+        return _elementTracing is True and self._logger.isEnabledFor(DEBUG)
+
+    def trace(self, message: str, *args: object):
+        """
+        Args:
+            message:  A %-style format
+            *args:    The values for the format
+        """
+        self._logger.debug(message, *args)
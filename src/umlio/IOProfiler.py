@@ -0,0 +1,169 @@
+from typing import ContextManager
+from typing import Mapping
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from cProfile import Profile
+
+from contextlib import nullcontext
+
+from dataclasses import dataclass
+
+from datetime import datetime
+
+from os import environ
+
+from pathlib import Path
+
+from types import TracebackType
+
+from tracemalloc import is_tracing
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+from tracemalloc import take_snapshot
+
+#
+# Set the directory to profile every Reader and Writer call without touching the code;
+# Set the memory variable to a non-empty value to take a tracemalloc snapshot as well
+#
+PROFILE_DIRECTORY_VARIABLE: str = 'UMLIO_PROFILE_DIRECTORY'
+PROFILE_MEMORY_VARIABLE:    str = 'UMLIO_PROFILE_MEMORY'
+
+PROFILE_SUFFIX:  str = '.prof'
+SNAPSHOT_SUFFIX: str = '.tracemalloc'
+
+TIMESTAMP_FORMAT: str = '%Y%m%d-%H%M%S-%f'
+
+NO_PROFILER: ContextManager = nullcontext()
+
+
+@dataclass
+class ProfileSettings:
+    """
+    Where the profiles go and whether to snapshot the memory too;  A snapshot slows the
+    profiled call down a lot more than the profiler does
+    """
+    directory: Path = Path('.')
+    memory:    bool = False
+
+
+def environmentProfileSettings(environment: Mapping[str, str] = environ) -> Optional[ProfileSettings]:
+    """
+    Args:
+        environment:  Where to look up the variables
+
+    Returns:  The settings the environment asks for;  None when profiling is not asked for
+    """
+    directoryName: str = environment.get(PROFILE_DIRECTORY_VARIABLE, '')
+    if directoryName == '':
+        return None
+
+    return ProfileSettings(directory=Path(directoryName), memory=environment.get(PROFILE_MEMORY_VARIABLE, '') != '')
+
+
+class IOProfiler:
+    """
+    Profiles one read or write with cProfile;  Optionally takes a tracemalloc snapshot at
+    the end.  The output file names carry the project file name, its stored size and the
+    operation;  e.g. BigProject-1048576-read-20260101-120000-000000.prof.  Load them with
+    pstats.Stats and tracemalloc.Snapshot.load.
+
+    cProfile only sees the thread that enters the profiler;  Executor threads, codec threads
+    and worker processes do not show up.  A failed call is profiled too
+    """
+    def __init__(self, profileSettings: ProfileSettings, operation: str, fileName: Path, fileSize: Optional[int] = None):
+        """
+        Args:
+            profileSettings:  Where the profiles go
+            operation:        Goes into the output file names;  e.g. read or write
+            fileName:         The project file read or written
+            fileSize:         The stored size;  When None, the size of the file once the call is done;  0 when unknown
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._profileSettings: ProfileSettings = profileSettings
+        self._operation:       str             = operation
+        self._fileName:        Path            = fileName
+        self._fileSize:        Optional[int]   = fileSize
+
+        self._profile:          Optional[Profile] = None
+        self._startedTracing:   bool              = False
+        self._profileFileName:  Optional[Path]    = None
+        self._snapshotFileName: Optional[Path]    = None
+
+    @property
+    def profileFileName(self) -> Optional[Path]:
+        """
+        The cProfile output;  None until the profiled call is done or if another profiler was running
+        """
+        return self._profileFileName
+
+    @property
+    def snapshotFileName(self) -> Optional[Path]:
+        """
+        The tracemalloc snapshot;  None unless the settings ask for one
+        """
+        return self._snapshotFileName
+
+    def __enter__(self) -> 'IOProfiler':
+
+        if self._profileSettings.memory is True and is_tracing() is False:
+            startTracing()
+            self._startedTracing = True
+
+        profile: Profile = Profile()
+        try:
+            profile.enable()
+            self._profile = profile
+        except ValueError as e:
+            self.logger.warning(f'Not profiling {self._fileName.name}: {e}')
+
+        return self
+
+    def __exit__(self, excType: Optional[type], excValue: Optional[BaseException], traceBack: Optional[TracebackType]) -> None:
+
+        if self._profile is not None:
+            self._profile.disable()
+
+        baseName:  str  = self._baseName()
+        directory: Path = self._profileSettings.directory
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if self._profile is not None:
+            self._profileFileName = directory / f'{baseName}{PROFILE_SUFFIX}'
+            self._profile.dump_stats(self._profileFileName)
+            self.logger.info(f'Profile written to {self._profileFileName}')
+
+        if self._profileSettings.memory is True:
+            self._snapshotFileName = directory / f'{baseName}{SNAPSHOT_SUFFIX}'
+            take_snapshot().dump(str(self._snapshotFileName))
+            if self._startedTracing is True:
+                stopTracing()
+            self.logger.info(f'Memory snapshot written to {self._snapshotFileName}')
+
+    def _baseName(self) -> str:
+        """
+        Returns:  The output file name without its suffix
+        """
+        fileSize: Optional[int] = self._fileSize
+        if fileSize is None:
+            fileSize = self._fileName.stat().st_size if self._fileName.is_file() is True else 0
+
+        fileStem:  str = self._fileName.stem if self._fileName.stem != '' else 'project'
+        timeStamp: str = datetime.now().strftime(TIMESTAMP_FORMAT)
+
+        return f'{fileStem}-{fileSize}-{self._operation}-{timeStamp}'
+
+
+def ioProfiler(profileSettings: Optional[ProfileSettings], operation: str, fileName: Path, fileSize: Optional[int] = None) -> ContextManager:
+    """
+    See IOProfiler for the arguments
+
+    Returns:  The profiler;  A shared do nothing context manager when profiling is off
+    """
+    if profileSettings is None:
+        return NO_PROFILER
+
+    return IOProfiler(profileSettings=profileSettings, operation=operation, fileName=fileName, fileSize=fileSize)
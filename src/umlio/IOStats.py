@@ -0,0 +1,203 @@
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from collections import Counter
+
+from contextlib import nullcontext
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from time import perf_counter
+from time import thread_time
+
+from umlio.ProjectTypes import ElementCounts
+from umlio.ProjectTypes import elementCountsFactory
+
+from umlio.XMLConstants import XmlConstants
+
+if TYPE_CHECKING:
+    from umlio.IOTypes import UmlProject
+
+#
+# The phases of a read, then those of a write
+#
+PHASE_DECOMPRESS:           str = 'decompress'              # Reading the stored bytes and decompressing them
+PHASE_PARSE:                str = 'parse'                   # Untangling the XML
+PHASE_MODEL_BUILD:          str = 'modelBuild'              # XmlToUmlModel conversion to the intermediate representation
+PHASE_SHAPE_BUILD:          str = 'shapeBuild'
+PHASE_LINK_RATIONALIZATION: str = 'linkRationalization'     # BasicUtils.rationalizeTheLinkDataModel
+PHASE_SERIALIZE:            str = 'serialize'
+PHASE_COMPRESS:             str = 'compress'                # Compressing and writing the stored bytes
+
+OPERATION_READ:  str = 'read'
+OPERATION_WRITE: str = 'write'
+
+NO_PHASE: ContextManager = nullcontext()
+
+
+@dataclass
+class PhaseStats:
+    wallSeconds: float = 0.0
+    cpuSeconds:  float = 0.0
+    calls:       int   = 0
+
+
+PhaseStatsMap = NewType('PhaseStatsMap', Dict[str, PhaseStats])
+
+
+def phaseStatsMapFactory() -> PhaseStatsMap:
+    return PhaseStatsMap({})
+
+
+@dataclass
+class IOStats:
+    """
+    What one read or write spent where.  The phase times are exclusive;  A phase that runs
+    inside another is not counted again in the outer one.  So the phases add up to at most
+    the total.  CPU time is that of the thread the phase ran on;  Worker processes and codec
+    threads are not included.
+
+    bytesIn and bytesOut follow the data;  A read takes in the stored bytes and puts out XML,
+    a write the other way round.  The element counts are keyed by XmlConstants element name
+    """
+    operation:     str           = ''
+    fileName:      Path          = Path('')
+    bytesIn:       int           = 0
+    bytesOut:      int           = 0
+    wallSeconds:   float         = 0.0
+    cpuSeconds:    float         = 0.0
+    phases:        PhaseStatsMap = field(default_factory=phaseStatsMapFactory)
+    elementCounts: ElementCounts = field(default_factory=elementCountsFactory)
+
+    def __post_init__(self):
+        self._phaseTimers: List[PhaseTimer] = []
+
+    def phase(self, phaseName: str) -> 'PhaseTimer':
+        """
+        Usage:  with ioStats.phase(PHASE_PARSE):
+
+        Returns:  A context manager that adds its duration to the phase
+        """
+        return PhaseTimer(ioStats=self, phaseName=phaseName)
+
+    def total(self) -> 'PhaseTimer':
+        """
+        Returns:  A context manager that times the whole operation
+        """
+        return PhaseTimer(ioStats=self, phaseName='')
+
+    def countProject(self, umlProject: 'UmlProject'):
+        """
+        Count the diagrams, shapes and model elements;  Do not call it on a lazily read project,
+        it would load every diagram
+        """
+        counts: Counter = Counter()
+        for umlDocument in umlProject.umlDocuments.values():
+            counts[XmlConstants.ELEMENT_UML_DIAGRAM]  += 1
+            counts[XmlConstants.ELEMENT_UML_CLASS]    += len(umlDocument.umlClasses)
+            counts[XmlConstants.ELEMENT_UML_NOTE]     += len(umlDocument.umlNotes)
+            counts[XmlConstants.ELEMENT_UML_TEXT]     += len(umlDocument.umlTexts)
+            counts[XmlConstants.ELEMENT_UML_ACTOR]    += len(umlDocument.umlActors)
+            counts[XmlConstants.ELEMENT_UML_USE_CASE] += len(umlDocument.umlUseCases)
+            counts[XmlConstants.ELEMENT_UML_LINK]     += len(umlDocument.umlLinks)
+            counts[XmlConstants.ELEMENT_LOLLIPOP]     += len(umlDocument.umlLollipopInterfaces)
+            for umlClass in umlDocument.umlClasses:
+                counts[XmlConstants.ELEMENT_MODEL_METHOD] += len(umlClass.modelClass.methods)
+                counts[XmlConstants.ELEMENT_MODEL_FIELD]  += len(umlClass.modelClass.fields)
+                for method in umlClass.modelClass.methods:
+                    counts[XmlConstants.ELEMENT_MODEL_PARAMETER] += len(method.parameters)
+
+        self.elementCounts = ElementCounts({elementName: count for elementName, count in counts.items() if count > 0})
+
+    def countDiagrams(self, diagramCount: int):
+        """
+        All that is known about a lazily read project
+        """
+        self.elementCounts = ElementCounts({XmlConstants.ELEMENT_UML_DIAGRAM: diagramCount})
+
+
+IOStatsHook = Callable[[IOStats], None]
+
+
+class PhaseTimer:
+    """
+    Times one run of a phase.  Timers nest;  A timer takes the time of the timers inside it out
+    of its own.  Enter and exit a timer on the same thread
+    """
+    def __init__(self, ioStats: IOStats, phaseName: str):
+
+        self._ioStats:   IOStats = ioStats
+        self._phaseName: str     = phaseName
+
+        self._startWall: float = 0.0
+        self._startCpu:  float = 0.0
+        self._innerWall: float = 0.0
+        self._innerCpu:  float = 0.0
+
+    def __enter__(self) -> 'PhaseTimer':
+
+        self._ioStats._phaseTimers.append(self)
+        self._startWall = perf_counter()
+        self._startCpu  = thread_time()
+
+        return self
+
+    def __exit__(self, excType, excValue, traceBack) -> None:
+
+        wallSeconds: float = perf_counter() - self._startWall
+        cpuSeconds:  float = thread_time() - self._startCpu
+
+        phaseTimers: List[PhaseTimer] = self._ioStats._phaseTimers
+        phaseTimers.pop()
+
+        if self._phaseName == '':
+            self._ioStats.wallSeconds += wallSeconds
+            self._ioStats.cpuSeconds  += cpuSeconds
+            return
+
+        phaseStats: PhaseStats = self._ioStats.phases.setdefault(self._phaseName, PhaseStats())
+        phaseStats.wallSeconds += wallSeconds - self._innerWall
+        phaseStats.cpuSeconds  += cpuSeconds - self._innerCpu
+        phaseStats.calls       += 1
+
+        if len(phaseTimers) > 0 and phaseTimers[-1]._phaseName != '':
+            phaseTimers[-1]._innerWall += wallSeconds
+            phaseTimers[-1]._innerCpu  += cpuSeconds
+
+
+def phase(ioStats: Optional[IOStats], phaseName: str) -> ContextManager:
+    """
+    For code that runs once per diagram or less;  Guard anything that runs per element with
+    an `if ioStats is not None` instead
+
+    Returns:  The phase timer;  A shared do nothing context manager when stats are off
+    """
+    return NO_PHASE if ioStats is None else ioStats.phase(phaseName)
+
+
+def timedChunks(ioStats: IOStats, xmlChunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Times fetching each chunk as decompression;  Counts the XML bytes
+
+    Args:
+        ioStats:    Where to add the time and the bytes
+        xmlChunks:  The raw XML bytes in document order
+    """
+    chunkIterator: Iterator[bytes] = iter(xmlChunks)
+    while True:
+        with ioStats.phase(PHASE_DECOMPRESS):
+            xmlChunk: bytes | None = next(chunkIterator, None)
+        if xmlChunk is None:
+            return
+        ioStats.bytesOut += len(xmlChunk)
+        yield xmlChunk
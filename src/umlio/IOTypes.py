@@ -2,55 +2,51 @@
 from typing import Dict
 from typing import List
 from typing import NewType
-
-from enum import Enum
+from typing import TYPE_CHECKING
 
 from dataclasses import dataclass
 from dataclasses import field
 
 from pathlib import Path
 
-from untangle import Element
-
-from codeallybasic.SecureConversions import SecureConversions
-
-from umlshapes.shapes.UmlActor import UmlActor
-from umlshapes.shapes.UmlClass import UmlClass
-from umlshapes.shapes.UmlNote import UmlNote
-from umlshapes.shapes.UmlText import UmlText
-from umlshapes.shapes.UmlUseCase import UmlUseCase
-from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
-
-from umlshapes.links.UmlLink import UmlLink
-from umlshapes.types.UmlDimensions import UmlDimensions
-from umlshapes.types.UmlPosition import UmlPosition
-
-from umlio.XMLConstants import XmlConstants
+from umlio.ProjectTypes import DiagramSummaries
+from umlio.ProjectTypes import DiagramSummary
+from umlio.ProjectTypes import ElementAttributes
+from umlio.ProjectTypes import ElementCounts
+from umlio.ProjectTypes import Elements
+from umlio.ProjectTypes import GraphicInformation
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import ProjectData
+from umlio.ProjectTypes import ProjectInformation
+from umlio.ProjectTypes import ProjectSummary
+from umlio.ProjectTypes import UmlDocumentTitle
+from umlio.ProjectTypes import UmlDocumentType
+from umlio.ProjectTypes import UmlLinkAttributes
+from umlio.ProjectTypes import XML_SUFFIX
+from umlio.ProjectTypes import XML_VERSION
 
-XML_VERSION: str = '14.0'
-
-PROJECT_SUFFIX: str = '.udt'        # UML Diagramming Tool
-XML_SUFFIX:     str = '.xml'
-
-
-UmlDocumentTitle = NewType('UmlDocumentTitle', str)
-UmlClasses       = NewType('UmlClasses',      List[UmlClass])
-UmlUseCases      = NewType('UmlUseCases',     List[UmlUseCase])
-UmlActors        = NewType('UmlActors',       List[UmlActor])
-UmlNotes         = NewType('UmlNotes',        List[UmlNote])
-UmlTexts         = NewType('UmlTexts',        List[UmlText])
-UmlLinks         = NewType('UmlLinks',        List[UmlLink])
-
-UmlLollipopInterfaces = NewType('UmlLollipopInterfaces', List[UmlLollipopInterface])
+#
+# The shapes are only named here;  Importing them pulls in wx.  They are loaded when a
+# project is actually materialized, so the rest of umlio imports headless
+#
+if TYPE_CHECKING:
+    from umlshapes.shapes.UmlActor import UmlActor
+    from umlshapes.shapes.UmlClass import UmlClass
+    from umlshapes.shapes.UmlNote import UmlNote
+    from umlshapes.shapes.UmlText import UmlText
+    from umlshapes.shapes.UmlUseCase import UmlUseCase
+    from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
 
-ElementAttributes = NewType('ElementAttributes', Dict[str, str])
+    from umlshapes.links.UmlLink import UmlLink
 
+UmlClasses       = NewType('UmlClasses',      List['UmlClass'])
+UmlUseCases      = NewType('UmlUseCases',     List['UmlUseCase'])
+UmlActors        = NewType('UmlActors',       List['UmlActor'])
+UmlNotes         = NewType('UmlNotes',        List['UmlNote'])
+UmlTexts         = NewType('UmlTexts',        List['UmlText'])
+UmlLinks         = NewType('UmlLinks',        List['UmlLink'])
 
-class UmlDocumentType(Enum):
-    CLASS_DOCUMENT    = 'Class Document'
-    USE_CASE_DOCUMENT = 'Use Case Document'
-    SEQUENCE_DOCUMENT = 'Sequence Document'
-    NOT_SET          = 'Not Set'
+UmlLollipopInterfaces = NewType('UmlLollipopInterfaces', List['UmlLollipopInterface'])
 
 
 def umlClassesFactory() -> UmlClasses:
@@ -138,13 +134,6 @@ UmlDocuments = NewType('UmlDocuments', Dict[UmlDocumentTitle, UmlDocument])
 def createUmlDocumentsFactory() -> UmlDocuments:
     return UmlDocuments({})
 
-@dataclass
-class ProjectInformation:
-    fileName:    Path = Path('')
-    version:     str  = XML_VERSION
-    codePath:    Path = Path('')
-
-
 @dataclass
 class UmlProject(ProjectInformation):
     umlDocuments: UmlDocuments = field(default_factory=createUmlDocumentsFactory)
@@ -159,66 +148,3 @@ class UmlProject(ProjectInformation):
         umlProject.umlDocuments[DEFAULT_CLASS_DIAGRAM_NAME] = umlDocument
 
         return umlProject
-
-
-#
-# Untangler helper types
-#
-Elements = NewType('Elements', List[Element])
-
-
-@dataclass
-class GraphicInformation:
-    """
-    Internal Class used to move information from a untangler element into Python
-    """
-    id:       str
-    size:     UmlDimensions
-    position: UmlPosition
-
-    @classmethod
-    def toGraphicInfo(cls, graphicElement: Element) -> 'GraphicInformation':
-
-        graphicInformation: GraphicInformation = GraphicInformation(
-            id=graphicElement[XmlConstants.ATTRIBUTE_ID],
-            position=UmlPosition(
-                x=int(graphicElement[XmlConstants.ATTRIBUTE_X]),
-                y=int(graphicElement[XmlConstants.ATTRIBUTE_Y])
-            ),
-            size=UmlDimensions(
-                width=SecureConversions.secureInteger(graphicElement[XmlConstants.ATTRIBUTE_WIDTH]),
-                height=SecureConversions.secureInteger(graphicElement[XmlConstants.ATTRIBUTE_HEIGHT])
-            )
-        )
-
-        return graphicInformation
-
-
-@dataclass
-class UmlLinkAttributes:
-
-    #     f'        <UmlLink id="{UML_LINK_CANONICAL_MONIKER}" fromX="248" fromY="300" toX="190" toY="174" spline="False">\n'
-    fromPosition: UmlPosition
-    toPosition:   UmlPosition
-    id:     str = 'NO ID'
-    spline: bool = False
-
-    @classmethod
-    def fromGraphicLink(cls, linkElement: Element) -> 'UmlLinkAttributes':
-
-        fromX: int = SecureConversions.secureInteger(linkElement[XmlConstants.ATTRIBUTE_LINK_FROM_X])
-        fromY: int = SecureConversions.secureInteger(linkElement[XmlConstants.ATTRIBUTE_LINK_FROM_Y])
-        toY:   int = int(linkElement[XmlConstants.ATTRIBUTE_LINK_TO_X])
-        toX:   int = int(linkElement[XmlConstants.ATTRIBUTE_LINK_TO_Y])
-
-        shapeId: str  = linkElement[XmlConstants.ATTRIBUTE_ID]
-        spline:  bool = SecureConversions.secureBoolean(linkElement[XmlConstants.ATTRIBUTE_SPLINE])
-
-        gla: UmlLinkAttributes = UmlLinkAttributes(
-            fromPosition=UmlPosition(x=fromX, y=fromY),
-            toPosition=UmlPosition(x=toX, y=toY),
-            spline=spline,
-            id=shapeId
-        )
-
-        return gla
@@ -0,0 +1,258 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from os import cpu_count
+
+from untangle import Element
+
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import ProjectIR
+
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import ProjectData
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+from umlio.deserializer.XmlDiagramScanner import XmlDiagramScanner
+from umlio.deserializer.XmlToDiagramIR import MODEL_LOCK
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sources.BoundedXmlSource import DEFAULT_DECOMPRESSION_LIMITS
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.SourceSniffer import projectDataSource
+from umlio.sources.SourceSniffer import projectFileSource
+from umlio.sources.SourceSniffer import sourceForFile
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import XmlSource
+
+DEFAULT_READ_WORKERS: int = cpu_count() or 1
+
+IRReadResult = tuple[Path, ProjectIR | Exception]
+
+
+def diagramDocumentToIR(diagramDocument: bytes) -> DiagramIR:
+    """
+    The worker process side of a parallel read;  Module level so that it pickles
+
+    Args:
+        diagramDocument:  A one diagram project document
+
+    Returns:  The diagram's intermediate representation
+    """
+    xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+    xmlToDiagramIR.deserializeXmlChunks(xmlChunks=[diagramDocument], fileName=Path(''))
+
+    return next(iter(xmlToDiagramIR.projectIR.diagramIRs.values()))
+
+
+def xmlToProjectIR(xmlBytes: bytes, fileName: Path) -> ProjectIR:
+    """
+    The worker process side of a batch read;  Module level so that it pickles
+
+    Args:
+        xmlBytes:  A complete project document
+        fileName:  The file it came from
+
+    Returns:  The project's intermediate representation
+    """
+    xmlToDiagramIR:    XmlToDiagramIR = XmlToDiagramIR()
+    umlProjectElement: Element        = xmlToDiagramIR.untangle(xmlChunks=[xmlBytes])
+    with MODEL_LOCK:
+        xmlToDiagramIR.deserializeUmlProject(umlProjectElement=umlProjectElement, fileName=fileName)
+
+    return xmlToDiagramIR.projectIR
+
+
+class IRReader:
+    """
+    The headless half of Reader.  It stops at the intermediate representation;  Hand the
+    result to DiagramIRToUmlShapes on the GUI thread to get the shapes.
+
+    Nothing this module imports needs wx
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def readProjectFile(self, fileName: Path, workers: int = 1,
+                        decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> ProjectIR:
+        """
+        Args:
+            fileName:             The fully qualified PROJECT_SUFFIX file name
+            workers:              The number of worker processes;  See read
+            decompressionLimits:  Where to abandon a file that expands too much;  None to trust the file
+
+        Returns:  The project's intermediate representation
+        """
+        if fileName.suffix != PROJECT_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} suffix')
+
+        return self.read(xmlSource=projectFileSource(fileName=fileName, decompressionLimits=decompressionLimits), workers=workers)
+
+    def readXmlFile(self, fileName: Path, workers: int = 1) -> ProjectIR:
+        """
+        Args:
+            fileName: The fully qualified XML_SUFFIX file name
+            workers:  The number of worker processes;  See read
+
+        Returns:  The project's intermediate representation
+        """
+        if fileName.suffix != XML_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {XML_SUFFIX} suffix')
+
+        return self.read(xmlSource=XmlFileSource(fileName=fileName), workers=workers)
+
+    def readData(self, projectData: ProjectData, fileName: Path = Path(''), workers: int = 1,
+                 decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> ProjectIR:
+        """
+        No suffix to go by;  The format is recognized from the leading bytes
+
+        Args:
+            projectData:          Plain XML or any project file format;  As bytes or a binary file
+            fileName:             Only a label for the project
+            workers:              The number of worker processes;  See read
+            decompressionLimits:  Where to abandon data that expands too much;  None to trust the data
+
+        Returns:  The project's intermediate representation
+        """
+        return self.read(xmlSource=projectDataSource(projectData=projectData, fileName=fileName, decompressionLimits=decompressionLimits), workers=workers)
+
+    def readMany(self, fileNames: Iterable[Path], workers: int = DEFAULT_READ_WORKERS, maximumPending: int = 0, processes: bool = True,
+                 decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> Iterator[IRReadResult]:
+        """
+        Read a batch of PROJECT_SUFFIX and XML_SUFFIX files in parallel.  Each file is read and
+        decompressed on a thread, through the same sources readProjectFile and readXmlFile use;
+        Then it is parsed in a worker process.
+
+        Results come in completion order, not in the order of fileNames.  A file that fails
+        yields its exception instead of a ProjectIR;  The batch goes on.  Only maximumPending
+        files are in flight at a time and fileNames is consumed no faster than the results are;
+        So a slow consumer holds back the readers instead of piling up parsed projects
+
+        Args:
+            fileNames:            The files to read;  May be a lazy iterable such as Path.rglob()
+            workers:              The number of decompression threads and parse processes
+            maximumPending:       The most files in flight;  0 for twice the workers
+            processes:            When False, the files are parsed on a single thread instead
+            decompressionLimits:  Where to abandon a file that expands too much;  None to trust every file
+
+        Returns:  An iterator of (fileName, ProjectIR or exception) tuples
+        """
+        workers        = max(1, workers)
+        maximumPending = maximumPending if maximumPending > 0 else 2 * workers
+
+        fileNameIterator: Iterator[Path] = iter(fileNames)
+
+        #
+        # Parse threads would only queue up on MODEL_LOCK;  One is enough
+        #
+        decoders: Executor = ThreadPoolExecutor(max_workers=workers)
+        parsers:  Executor = ProcessPoolExecutor(max_workers=workers) if processes is True else ThreadPoolExecutor(max_workers=1)
+
+        pendingReads: Dict[Future, Path] = {}
+        pendingParse: Dict[Future, Path] = {}
+        try:
+            while True:
+                while len(pendingReads) + len(pendingParse) < maximumPending:
+                    fileName: Path | None = next(fileNameIterator, None)
+                    if fileName is None:
+                        break
+                    pendingReads[decoders.submit(self._readXml, fileName, decompressionLimits)] = fileName
+
+                if len(pendingReads) + len(pendingParse) == 0:
+                    break
+
+                done, _ = wait(list(pendingReads.keys()) + list(pendingParse.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in pendingReads:
+                        readFileName: Path = pendingReads.pop(future)
+                        try:
+                            pendingParse[parsers.submit(xmlToProjectIR, future.result(), readFileName)] = readFileName
+                        except Exception as e:
+                            yield readFileName, e
+                    else:
+                        parsedFileName: Path = pendingParse.pop(future)
+                        try:
+                            yield parsedFileName, future.result()
+                        except Exception as e:
+                            yield parsedFileName, e
+        finally:
+            decoders.shutdown(wait=True, cancel_futures=True)
+            parsers.shutdown(wait=True, cancel_futures=True)
+
+    def read(self, xmlSource: XmlSource, workers: int = 1) -> ProjectIR:
+        """
+        Args:
+            xmlSource:  Where the XML comes from
+            workers:    When greater than one, the project is split by diagram and the
+                        diagrams are parsed in up to that many worker processes
+
+        Returns:  The project's intermediate representation
+        """
+        if workers > 1:
+            return self._readInParallel(xmlSource=xmlSource, workers=workers)
+
+        xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+        xmlToDiagramIR.deserializeXmlChunks(xmlChunks=xmlSource.chunks(), fileName=xmlSource.fileName)
+
+        return xmlToDiagramIR.projectIR
+
+    def _readXml(self, fileName: Path, decompressionLimits: DecompressionLimits | None) -> bytes:
+        """
+        The thread side of a batch read
+
+        Returns:  The uncompressed XML
+        """
+        return b''.join(sourceForFile(fileName=fileName, decompressionLimits=decompressionLimits).chunks())
+
+    def _readInParallel(self, xmlSource: XmlSource, workers: int) -> ProjectIR:
+        """
+        The uncompressed XML is read once;  The scan finds the diagram boundaries and each
+        diagram is parsed on its own.  The results come back in document order;  Unnamed notes
+        are numbered per diagram, so they get the same names as in a sequential read
+
+        Args:
+            xmlSource:  Where the XML comes from
+            workers:    The maximum number of worker processes
+
+        Returns:  The project's intermediate representation
+        """
+        xmlBytes:       bytes          = b''.join(xmlSource.chunks())
+        scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=[xmlBytes])
+
+        diagramDocuments: List[bytes] = [
+            scannedProject.diagramDocument(fragment=xmlBytes[diagramLocation.startOffset:diagramLocation.endOffset])
+            for diagramLocation in scannedProject.diagramLocations
+        ]
+        if len(diagramDocuments) < 2:
+            xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+            xmlToDiagramIR.deserializeXmlChunks(xmlChunks=[xmlBytes], fileName=xmlSource.fileName)
+            return xmlToDiagramIR.projectIR
+
+        projectIR: ProjectIR = ProjectIR(fileName=xmlSource.fileName, version=scannedProject.version, codePath=cast(Path, scannedProject.codePath))
+
+        maxWorkers: int = min(workers, len(diagramDocuments))
+        self.logger.debug(f'Parsing {len(diagramDocuments)} diagrams in {maxWorkers} processes')
+        with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+            for diagramIR in executor.map(diagramDocumentToIR, diagramDocuments):
+                projectIR.diagramIRs[diagramIR.documentTitle] = diagramIR
+
+        return projectIR
@@ -0,0 +1,124 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from umlmodel.Actor import Actor
+from umlmodel.Class import Class
+from umlmodel.Interface import Interface
+from umlmodel.Link import Link
+from umlmodel.Note import Note
+from umlmodel.Text import Text
+from umlmodel.UseCase import UseCase
+
+from umlshapes.types.UmlPosition import UmlPositions
+
+from umlio.ProjectTypes import GraphicInformation
+from umlio.ProjectTypes import ProjectInformation
+from umlio.ProjectTypes import UmlDocumentTitle
+from umlio.ProjectTypes import UmlDocumentType
+from umlio.ProjectTypes import UmlLinkAttributes
+
+#
+# The intermediate representation (IR) sits between the XML and the UML shapes.  It is
+# plain data:  umlmodel objects plus the geometry the shapes need.  So it pickles and
+# nothing here imports wx.
+#
+# Bump this whenever the layout of these classes changes;  It invalidates persisted IR
+#
+IR_VERSION: int = 1
+
+
+@dataclass
+class ClassIR:
+    modelClass:         Class
+    graphicInformation: GraphicInformation
+
+
+@dataclass
+class NoteIR:
+    modelNote:          Note
+    graphicInformation: GraphicInformation
+
+
+@dataclass
+class TextIR:
+    modelText:          Text
+    graphicInformation: GraphicInformation
+
+
+@dataclass
+class ActorIR:
+    modelActor:         Actor
+    graphicInformation: GraphicInformation
+
+
+@dataclass
+class UseCaseIR:
+    modelUseCase:       UseCase
+    graphicInformation: GraphicInformation
+
+
+@dataclass
+class LinkIR:
+    """
+    The model link already references the model objects at its ends;  The IDs are
+    the model IDs used to find the shapes at those ends
+    """
+    link:              Link
+    sourceId:          str
+    destinationId:     str
+    umlLinkAttributes: UmlLinkAttributes
+    controlPoints:     UmlPositions
+
+
+@dataclass
+class LollipopIR:
+    """
+    attachedToId is the UmlClass (shape) ID, not the model ID
+    """
+    interface:      Interface
+    attachedToId:   str
+    attachmentSide: str
+    lineCentum:     float
+
+
+ClassIRs    = NewType('ClassIRs',    List[ClassIR])
+NoteIRs     = NewType('NoteIRs',     List[NoteIR])
+TextIRs     = NewType('TextIRs',     List[TextIR])
+ActorIRs    = NewType('ActorIRs',    List[ActorIR])
+UseCaseIRs  = NewType('UseCaseIRs',  List[UseCaseIR])
+LinkIRs     = NewType('LinkIRs',     List[LinkIR])
+LollipopIRs = NewType('LollipopIRs', List[LollipopIR])
+
+
+@dataclass
+class DiagramIR:
+    documentType:    UmlDocumentType  = UmlDocumentType.NOT_SET
+    documentTitle:   UmlDocumentTitle = UmlDocumentTitle('')
+    scrollPositionX: int = 1
+    scrollPositionY: int = 1
+    pixelsPerUnitX:  int = 1
+    pixelsPerUnitY:  int = 1
+    classIRs:        ClassIRs    = field(default_factory=lambda: ClassIRs([]))
+    noteIRs:         NoteIRs     = field(default_factory=lambda: NoteIRs([]))
+    textIRs:         TextIRs     = field(default_factory=lambda: TextIRs([]))
+    actorIRs:        ActorIRs    = field(default_factory=lambda: ActorIRs([]))
+    useCaseIRs:      UseCaseIRs  = field(default_factory=lambda: UseCaseIRs([]))
+    linkIRs:         LinkIRs     = field(default_factory=lambda: LinkIRs([]))
+    lollipopIRs:     LollipopIRs = field(default_factory=lambda: LollipopIRs([]))
+
+
+DiagramIRs = NewType('DiagramIRs', Dict[UmlDocumentTitle, DiagramIR])
+
+
+def diagramIRsFactory() -> DiagramIRs:
+    return DiagramIRs({})
+
+
+@dataclass
+class ProjectIR(ProjectInformation):
+    diagramIRs: DiagramIRs = field(default_factory=diagramIRsFactory)
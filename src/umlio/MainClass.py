@@ -0,0 +1,247 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import asdict
+
+from glob import glob
+
+from json import dumps as jsonDumps
+
+from pathlib import Path
+
+from time import perf_counter
+
+from click import Choice
+from click import IntRange
+from click import argument
+from click import echo
+from click import group
+from click import option
+from click import Context
+from click import pass_context
+from click import version_option
+
+from umlio import __version__
+
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.BatchJobs import BatchRunner
+from umlio.BatchJobs import JobResult
+from umlio.BatchJobs import JobResults
+from umlio.BatchJobs import convertJob
+from umlio.BatchJobs import statsJob
+from umlio.BatchJobs import validateJob
+
+from umlio.IRReader import DEFAULT_READ_WORKERS
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+PROJECT_SUFFIXES: Tuple[str, ...] = (PROJECT_SUFFIX, XML_SUFFIX)
+GLOB_CHARACTERS:  str             = '*?['
+
+#
+# A file to work on and the directory that relative output paths start from
+#
+SourceFile  = Tuple[Path, Path]
+SourceFiles = List[SourceFile]
+
+
+class MainClass:
+    """
+    The command line;  Bulk conversion, recompression, validation and statistics over
+    files, directories and globs.  Each file is handled in a worker process.  Progress goes
+    to standard error and a JSON summary to standard output or a file.
+
+    Nothing here imports wx
+    """
+    def __init__(self, workers: int, summaryFileName: Path | None, quiet: bool):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._workers:         int         = workers
+        self._summaryFileName: Path | None = summaryFileName
+        self._quiet:           bool        = quiet
+
+    def convert(self, sources: Tuple[str, ...], toSuffix: str, outputDirectory: Path | None,
+                compressionProfile: CompressionProfile, containerFormat: bool) -> bool:
+
+        jobArguments: List[Dict[str, Any]] = []
+        for fileName, rootDirectory in self._sourceFiles(sources=sources):
+            if fileName.suffix == toSuffix:
+                continue
+            outputFileName: Path = fileName.with_suffix(toSuffix)
+            if outputDirectory is not None:
+                outputFileName = outputDirectory / outputFileName.relative_to(rootDirectory)
+                outputFileName.parent.mkdir(parents=True, exist_ok=True)
+            jobArguments.append(
+                {'fileName': fileName, 'outputFileName': outputFileName, 'compressionProfile': compressionProfile, 'containerFormat': containerFormat}
+            )
+
+        return self._run(commandName='convert', job=convertJob, jobArguments=jobArguments)
+
+    def recompress(self, sources: Tuple[str, ...], compressionProfile: CompressionProfile, containerFormat: bool) -> bool:
+
+        jobArguments: List[Dict[str, Any]] = [
+            {'fileName': fileName, 'outputFileName': fileName, 'compressionProfile': compressionProfile, 'containerFormat': containerFormat}
+            for fileName, _ in self._sourceFiles(sources=sources) if fileName.suffix == PROJECT_SUFFIX
+        ]
+        return self._run(commandName='recompress', job=convertJob, jobArguments=jobArguments)
+
+    def validate(self, sources: Tuple[str, ...]) -> bool:
+
+        jobArguments: List[Dict[str, Any]] = [{'fileName': fileName} for fileName, _ in self._sourceFiles(sources=sources)]
+
+        return self._run(commandName='validate', job=validateJob, jobArguments=jobArguments)
+
+    def stats(self, sources: Tuple[str, ...]) -> bool:
+
+        jobArguments: List[Dict[str, Any]] = [{'fileName': fileName} for fileName, _ in self._sourceFiles(sources=sources)]
+
+        return self._run(commandName='stats', job=statsJob, jobArguments=jobArguments)
+
+    def _run(self, commandName: str, job: Callable[..., JobResult], jobArguments: List[Dict[str, Any]]) -> bool:
+        """
+        Returns:  True when every file succeeded
+        """
+        startTime:  float      = perf_counter()
+        jobResults: JobResults = JobResults([])
+        for jobResult in BatchRunner(workers=self._workers).run(job=job, jobArguments=jobArguments):
+            jobResults.append(jobResult)
+            self._progress(jobResult=jobResult, completed=len(jobResults), total=len(jobArguments))
+
+        failed: int = len([jobResult for jobResult in jobResults if jobResult.succeeded is False])
+        summary: Dict[str, Any] = {
+            'command':   commandName,
+            'version':   __version__,
+            'files':     len(jobResults),
+            'succeeded': len(jobResults) - failed,
+            'failed':    failed,
+            'seconds':   perf_counter() - startTime,
+            'results':   [asdict(jobResult) for jobResult in sorted(jobResults, key=lambda r: r.fileName)],
+        }
+        summaryJson: str = jsonDumps(summary, indent=2)
+        if self._summaryFileName is None:
+            echo(summaryJson)
+        else:
+            self._summaryFileName.write_text(summaryJson + '\n')
+
+        return failed == 0
+
+    def _progress(self, jobResult: JobResult, completed: int, total: int):
+
+        if self._quiet is True:
+            return
+
+        status: str = 'ok    ' if jobResult.succeeded is True else 'FAILED'
+        width:  int = len(str(total))
+        echo(f'[{completed:>{width}}/{total}] {status} {jobResult.fileName}  {jobResult.message}'.rstrip(), err=True)
+
+    def _sourceFiles(self, sources: Tuple[str, ...]) -> SourceFiles:
+        """
+        Directories are searched recursively for project files;  Globs are expanded here too
+        for shells that pass them through
+
+        Returns:  Each file once, in a stable order
+        """
+        sourceFiles: Dict[Path, Path] = {}
+        for source in sources:
+            sourcePaths: List[Path] = [Path(source)]
+            if any(globCharacter in source for globCharacter in GLOB_CHARACTERS):
+                sourcePaths = [Path(path) for path in sorted(glob(source, recursive=True))]
+            for sourcePath in sourcePaths:
+                if sourcePath.is_dir() is True:
+                    for fileName in sorted(sourcePath.rglob('*')):
+                        if fileName.suffix in PROJECT_SUFFIXES and fileName.is_file() is True:
+                            sourceFiles.setdefault(fileName, sourcePath)
+                else:
+                    sourceFiles.setdefault(sourcePath, sourcePath.parent)
+
+        return list(sourceFiles.items())
+
+
+PROFILE_NAMES: List[str] = [profile.value for profile in CompressionProfile.availableProfiles()]
+
+
+@group()
+@version_option(version=f'{__version__}', message='%(version)s')
+@option('-w', '--workers', type=IntRange(min=1), default=DEFAULT_READ_WORKERS, show_default=True, help='The number of worker processes')
+@option('-s', '--summary', 'summaryFileName', type=Path, default=None, help='Write the JSON summary to this file instead of standard output')
+@option('-q', '--quiet', is_flag=True, default=False, help='No progress output')
+@pass_context
+def commandHandler(context: Context, workers: int, summaryFileName: Path | None, quiet: bool):
+    """
+    Convert, recompress, validate and summarize UML project files in bulk.  SOURCES are
+    .udt or .xml files, directories to search recursively or globs
+    """
+    context.obj = MainClass(workers=workers, summaryFileName=summaryFileName, quiet=quiet)
+
+
+@commandHandler.command()
+@argument('sources', nargs=-1, required=True)
+@option('-t', '--to', 'toFormat', type=Choice(['udt', 'xml']), required=True, help='The output format')
+@option('-o', '--output-directory', 'outputDirectory', type=Path, default=None, help='Write here instead of next to each source')
+@option('-p', '--profile', type=Choice(PROFILE_NAMES), default=CompressionProfile.BALANCED.value, show_default=True, help='How .udt output is compressed')
+@option('-c', '--container', is_flag=True, default=False, help='Write .udt output as the version 2 container')
+@pass_context
+def convert(context: Context, sources: Tuple[str, ...], toFormat: str, outputDirectory: Path | None, profile: str, container: bool):
+    """
+    Convert between .xml and .udt;  Files already in the output format are skipped
+    """
+    mainClass: MainClass = context.obj
+    succeeded: bool      = mainClass.convert(
+        sources=sources,
+        toSuffix=f'.{toFormat}',
+        outputDirectory=outputDirectory,
+        compressionProfile=CompressionProfile(profile),
+        containerFormat=container
+    )
+    context.exit(0 if succeeded is True else 1)
+
+
+@commandHandler.command()
+@argument('sources', nargs=-1, required=True)
+@option('-p', '--profile', type=Choice(PROFILE_NAMES), default=CompressionProfile.BALANCED.value, show_default=True, help='The new compression')
+@option('-c', '--container', is_flag=True, default=False, help='Rewrite as the version 2 container')
+@pass_context
+def recompress(context: Context, sources: Tuple[str, ...], profile: str, container: bool):
+    """
+    Rewrite .udt files in place with another compression
+    """
+    mainClass: MainClass = context.obj
+
+    context.exit(0 if mainClass.recompress(sources=sources, compressionProfile=CompressionProfile(profile), containerFormat=container) is True else 1)
+
+
+@commandHandler.command()
+@argument('sources', nargs=-1, required=True)
+@pass_context
+def validate(context: Context, sources: Tuple[str, ...]):
+    """
+    Fully deserialize each file, short of building shapes;  Report the ones that fail
+    """
+    mainClass: MainClass = context.obj
+
+    context.exit(0 if mainClass.validate(sources=sources) is True else 1)
+
+
+@commandHandler.command()
+@argument('sources', nargs=-1, required=True)
+@pass_context
+def stats(context: Context, sources: Tuple[str, ...]):
+    """
+    Sizes, formats and element counts per file and diagram
+    """
+    mainClass: MainClass = context.obj
+
+    context.exit(0 if mainClass.stats(sources=sources) is True else 1)
+
+
+if __name__ == '__main__':
+    commandHandler()
@@ -0,0 +1,102 @@
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+from umlio.deserializer.XmlDiagramScanner import XmlDiagramScanner
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+from umlio.sinks.ContainerFileSink import ContainerFileSink
+from umlio.sinks.XmlFileSink import XmlFileSink
+from umlio.sinks.XmlSink import XmlSink
+
+from umlio.sources.BoundedXmlSource import DEFAULT_DECOMPRESSION_LIMITS
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.SourceSniffer import sourceForFile
+
+XmlRange  = Tuple[int, int]
+XmlRanges = List[XmlRange]
+
+
+class ProjectConverter:
+    """
+    Converts project files between the XML, the compressed and the container formats
+    without deserializing them.  The XML is copied byte for byte;  A scan finds the diagram
+    boundaries so that the container gets a block per diagram.
+
+    This module does not depend on wx;  Bulk migrations can run it headless
+    """
+    def __init__(self, compressionProfile: CompressionProfile = CompressionProfile.BALANCED, containerFormat: bool = False,
+                 decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS):
+        """
+        Args:
+            compressionProfile:   How PROJECT_SUFFIX output is compressed
+            containerFormat:      When True, PROJECT_SUFFIX output is the version 2 container
+            decompressionLimits:  Where to abandon an input file that expands too much;  None to trust every file
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._compressionProfile:  CompressionProfile         = compressionProfile
+        self._containerFormat:     bool                       = containerFormat
+        self._decompressionLimits: DecompressionLimits | None = decompressionLimits
+
+    def convert(self, fileName: Path, outputFileName: Path) -> int:
+        """
+        The output format follows the output suffix.  The output replaces an existing file only
+        once it is complete;  So a file can be converted onto itself, e.g. to recompress it
+
+        Args:
+            fileName:        A PROJECT_SUFFIX or XML_SUFFIX file
+            outputFileName:  A PROJECT_SUFFIX or XML_SUFFIX file
+
+        Returns:  The number of XML bytes converted
+        """
+        xmlBytes:       bytes          = b''.join(sourceForFile(fileName=fileName, decompressionLimits=self._decompressionLimits).chunks())
+        scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=[xmlBytes])
+
+        with self._projectSink(fileName=outputFileName) as xmlSink:
+            for startOffset, endOffset in self._xmlRanges(xmlSize=len(xmlBytes), scannedProject=scannedProject):
+                xmlSink.write(xmlBytes[startOffset:endOffset])
+                xmlSink.endBlock()
+
+        self.logger.debug(f'{fileName} -> {outputFileName}: {len(xmlBytes)} bytes of XML')
+
+        return len(xmlBytes)
+
+    def _projectSink(self, fileName: Path) -> XmlSink:
+        """
+        Returns:  The sink for the output suffix and the selected container format and compression profile
+        """
+        if fileName.suffix == XML_SUFFIX:
+            return XmlFileSink(fileName=fileName)
+        elif fileName.suffix != PROJECT_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} or {XML_SUFFIX} suffix')
+        elif self._containerFormat is True:
+            return ContainerFileSink(fileName=fileName, codec=self._compressionProfile.codec)
+        else:
+            return CompressedFileSink(fileName=fileName, codec=self._compressionProfile.codec)
+
+    def _xmlRanges(self, xmlSize: int, scannedProject: ScannedProject) -> XmlRanges:
+        """
+        The same blocks the serializer ends;  The project start tag, each diagram and the
+        project end tag
+
+        Returns:  Adjoining ranges that cover the whole XML
+        """
+        boundaries: List[int] = [0] + [diagramLocation.startOffset for diagramLocation in scannedProject.diagramLocations]
+        if len(scannedProject.diagramLocations) > 0:
+            boundaries.append(scannedProject.diagramLocations[-1].endOffset)
+        boundaries.append(xmlSize)
+
+        return [(startOffset, endOffset) for startOffset, endOffset in zip(boundaries, boundaries[1:]) if endOffset > startOffset]
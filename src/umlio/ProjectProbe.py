@@ -0,0 +1,67 @@
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from umlio.ProjectTypes import DiagramSummary
+from umlio.ProjectTypes import DiagramSummaries
+from umlio.ProjectTypes import ElementCounts
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import ProjectSummary
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+from umlio.deserializer.XmlDiagramScanner import XmlDiagramScanner
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sources.SourceSniffer import projectFileSource
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import XmlSource
+
+
+class ProjectProbe:
+    """
+    Summarizes a project file without deserializing it.  Only the project and diagram
+    attributes are read and the diagram children are merely counted;  No shapes are built.
+
+    This module does not depend on wx;  Project browsers and indexing jobs can use it headless
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def probe(self, fileName: Path) -> ProjectSummary:
+        """
+        Args:
+            fileName:  A fully qualified PROJECT_SUFFIX or XML_SUFFIX file name
+
+        Returns:  The project summary
+        """
+        xmlSource: XmlSource
+        if fileName.suffix == PROJECT_SUFFIX:
+            xmlSource = projectFileSource(fileName=fileName)
+        elif fileName.suffix == XML_SUFFIX:
+            xmlSource = XmlFileSource(fileName=fileName)
+        else:
+            raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} or {XML_SUFFIX} suffix')
+
+        scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=xmlSource.chunks())
+
+        diagramSummaries: DiagramSummaries = DiagramSummaries([])
+        for diagramLocation in scannedProject.diagramLocations:
+            diagramSummaries.append(
+                DiagramSummary(
+                    documentTitle=diagramLocation.documentTitle,
+                    documentType=diagramLocation.documentType,
+                    elementCounts=ElementCounts(dict(diagramLocation.elementCounts))
+                )
+            )
+
+        return ProjectSummary(
+            fileName=fileName,
+            version=scannedProject.version,
+            codePath=Path(scannedProject.codePath),
+            diagramSummaries=diagramSummaries
+        )
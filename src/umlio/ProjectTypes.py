@@ -0,0 +1,148 @@
+
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Union
+
+from enum import Enum
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from untangle import Element
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from umlshapes.types.UmlDimensions import UmlDimensions
+from umlshapes.types.UmlPosition import UmlPosition
+
+from umlio.XMLConstants import XmlConstants
+
+#
+# The parts of the IO types that do not need wx;  IOTypes re-exports all of them
+#
+XML_VERSION: str = '14.0'
+
+PROJECT_SUFFIX: str = '.udt'        # UML Diagramming Tool
+XML_SUFFIX:     str = '.xml'
+
+
+UmlDocumentTitle = NewType('UmlDocumentTitle', str)
+
+ElementAttributes = NewType('ElementAttributes', Dict[str, str])
+ElementCounts     = NewType('ElementCounts',     Dict[str, int])
+
+#
+# What the data entry points accept;  The stored bytes of a project or a binary file positioned at them
+#
+ProjectData = Union[BinaryIO, bytes, bytearray, memoryview]
+
+
+class UmlDocumentType(Enum):
+    CLASS_DOCUMENT    = 'Class Document'
+    USE_CASE_DOCUMENT = 'Use Case Document'
+    SEQUENCE_DOCUMENT = 'Sequence Document'
+    NOT_SET          = 'Not Set'
+
+
+@dataclass
+class ProjectInformation:
+    fileName:    Path = Path('')
+    version:     str  = XML_VERSION
+    codePath:    Path = Path('')
+
+
+def elementCountsFactory() -> ElementCounts:
+    return ElementCounts({})
+
+
+@dataclass
+class DiagramSummary:
+    """
+    What a probe reports about a single diagram.  The element counts are keyed by
+    the XML element name of the diagram's direct children, e.g. UmlClass, UmlLink
+    """
+    documentTitle: UmlDocumentTitle = UmlDocumentTitle('')
+    documentType:  UmlDocumentType  = UmlDocumentType.NOT_SET
+    elementCounts: ElementCounts    = field(default_factory=elementCountsFactory)
+
+
+DiagramSummaries = NewType('DiagramSummaries', List[DiagramSummary])
+
+
+def diagramSummariesFactory() -> DiagramSummaries:
+    return DiagramSummaries([])
+
+
+@dataclass
+class ProjectSummary(ProjectInformation):
+    """
+    A project as seen by a probe;  No shapes, just the diagram summaries
+    """
+    diagramSummaries: DiagramSummaries = field(default_factory=diagramSummariesFactory)
+
+
+#
+# Untangler helper types
+#
+Elements = NewType('Elements', List[Element])
+
+
+@dataclass
+class GraphicInformation:
+    """
+    Internal Class used to move information from a untangler element into Python
+    """
+    id:       str
+    size:     UmlDimensions
+    position: UmlPosition
+
+    @classmethod
+    def toGraphicInfo(cls, graphicElement: Element) -> 'GraphicInformation':
+
+        graphicInformation: GraphicInformation = GraphicInformation(
+            id=graphicElement[XmlConstants.ATTRIBUTE_ID],
+            position=UmlPosition(
+                x=int(graphicElement[XmlConstants.ATTRIBUTE_X]),
+                y=int(graphicElement[XmlConstants.ATTRIBUTE_Y])
+            ),
+            size=UmlDimensions(
+                width=SecureConversions.secureInteger(graphicElement[XmlConstants.ATTRIBUTE_WIDTH]),
+                height=SecureConversions.secureInteger(graphicElement[XmlConstants.ATTRIBUTE_HEIGHT])
+            )
+        )
+
+        return graphicInformation
+
+
+@dataclass
+class UmlLinkAttributes:
+
+    #     f'        <UmlLink id="{UML_LINK_CANONICAL_MONIKER}" fromX="248" fromY="300" toX="190" toY="174" spline="False">\n'
+    fromPosition: UmlPosition
+    toPosition:   UmlPosition
+    id:     str = 'NO ID'
+    spline: bool = False
+
+    @classmethod
+    def fromGraphicLink(cls, linkElement: Element) -> 'UmlLinkAttributes':
+
+        fromX: int = SecureConversions.secureInteger(linkElement[XmlConstants.ATTRIBUTE_LINK_FROM_X])
+        fromY: int = SecureConversions.secureInteger(linkElement[XmlConstants.ATTRIBUTE_LINK_FROM_Y])
+        toY:   int = int(linkElement[XmlConstants.ATTRIBUTE_LINK_TO_X])
+        toX:   int = int(linkElement[XmlConstants.ATTRIBUTE_LINK_TO_Y])
+
+        shapeId: str  = linkElement[XmlConstants.ATTRIBUTE_ID]
+        spline:  bool = SecureConversions.secureBoolean(linkElement[XmlConstants.ATTRIBUTE_SPLINE])
+
+        gla: UmlLinkAttributes = UmlLinkAttributes(
+            fromPosition=UmlPosition(x=fromX, y=fromY),
+            toPosition=UmlPosition(x=toX, y=toY),
+            spline=spline,
+            id=shapeId
+        )
+
+        return gla
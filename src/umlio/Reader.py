@@ -1,18 +1,84 @@
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import cast
 
 from pathlib import Path
 
+from concurrent.futures import Executor
+
+from functools import partial
+
+from time import perf_counter
+
 from logging import Logger
 from logging import getLogger
 
-from zlib import decompress
-from zlib import ZLIB_VERSION
+from untangle import Element
+
+from umlio.IOProfiler import ProfileSettings
+from umlio.IOProfiler import environmentProfileSettings
+from umlio.IOProfiler import ioProfiler
+
+from umlio.IOStats import IOStats
+from umlio.IOStats import IOStatsHook
+from umlio.IOStats import OPERATION_READ
+from umlio.IOStats import PHASE_DECOMPRESS
+from umlio.IOStats import PHASE_PARSE
+from umlio.IOStats import phase
+from umlio.IOStats import timedChunks
 
 from umlio.IOTypes import PROJECT_SUFFIX
+from umlio.IOTypes import ProjectData
+from umlio.IOTypes import ProjectSummary
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentTitle
+from umlio.IOTypes import UmlDocuments
 from umlio.IOTypes import UmlProject
 from umlio.IOTypes import XML_SUFFIX
-from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import ProjectIR
+
+from umlio.AsyncJobs import runJob
+
+from umlio.DiagramIndex import DiagramIndex
+from umlio.DiagramIndex import diagramHash
+from umlio.DiagramIndex import loadDiagramIndex
+
+from umlio.IRReader import DEFAULT_READ_WORKERS
+from umlio.IRReader import IRReader
+from umlio.ProjectProbe import ProjectProbe
+
+from umlio.cache.ParseCache import ParseCache
+
+from umlio.deserializer.LazyUmlDocuments import LazyUmlDocuments
+from umlio.deserializer.XmlDiagramScanner import DiagramLocation
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+from umlio.deserializer.XmlDiagramScanner import XmlDiagramScanner
+from umlio.deserializer.XmlToDiagramIR import MODEL_LOCK
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
 from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
 
+from umlio.sources.BoundedXmlSource import DEFAULT_DECOMPRESSION_LIMITS
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.SourceSniffer import projectDataSource
+from umlio.sources.SourceSniffer import projectFileSource
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import FragmentRange
+from umlio.sources.XmlSource import FragmentRanges
+from umlio.sources.XmlSource import XmlSource
+
+#
+# The shape materializers import wx;  They are loaded on the first read that builds shapes
+#
+if TYPE_CHECKING:
+    from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+
+ReadResult = tuple[Path, UmlProject | Exception]
+
 
 class Reader:
     """
@@ -21,6 +87,144 @@ class Reader:
 
         self.logger: Logger = getLogger(__name__)
 
+        self._singlePass: bool = False
+        self._lazy:       bool = False
+
+        self._parseCache: Optional[ParseCache] = None
+        self._workers:    int                  = 1
+
+        self._decompressionLimits: Optional[DecompressionLimits] = DEFAULT_DECOMPRESSION_LIMITS
+        self._executor:            Optional[Executor]            = None
+
+        self._collectStats: bool                  = False
+        self._statsHook:    Optional[IOStatsHook] = None
+        self._lastStats:    Optional[IOStats]     = None
+
+        self._profileSettings: Optional[ProfileSettings] = environmentProfileSettings()
+
+    @property
+    def singlePass(self) -> bool:
+        """
+        When True, the event driven deserializer builds the shapes while the XML is parsed
+        instead of first untangling the whole document;  The resulting project is the same
+        """
+        return self._singlePass
+
+    @singlePass.setter
+    def singlePass(self, singlePass: bool):
+        self._singlePass = singlePass
+
+    @property
+    def lazy(self) -> bool:
+        """
+        When True, the read only scans for the diagram titles and types.  Each UmlDocument
+        is deserialized the first time it is looked up in UmlProject.umlDocuments.
+
+        A single stream PROJECT_SUFFIX file cannot seek;  The first lookup inflates it once
+        and keeps the XML of the diagrams not looked up yet.  Each is dropped once its
+        document is built;  Until then they cost about as much memory as the uncompressed XML
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool):
+        self._lazy = lazy
+
+    @property
+    def parseCache(self) -> Optional[ParseCache]:
+        """
+        When set, a read first looks for the project in the cache;  On a hit no XML is parsed,
+        only the shapes are built.  Lazy reads do not use the cache
+        """
+        return self._parseCache
+
+    @parseCache.setter
+    def parseCache(self, parseCache: Optional[ParseCache]):
+        self._parseCache = parseCache
+
+    @property
+    def workers(self) -> int:
+        """
+        When greater than one, the diagrams are parsed in up to that many worker processes.
+        The shapes are still built on the calling thread.  Lazy reads ignore this
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        self._workers = workers
+
+    @property
+    def decompressionLimits(self) -> Optional[DecompressionLimits]:
+        """
+        Where a PROJECT_SUFFIX read gives up on a file that expands too much, with a
+        DecompressionLimitException;  None trusts every file
+        """
+        return self._decompressionLimits
+
+    @decompressionLimits.setter
+    def decompressionLimits(self, decompressionLimits: Optional[DecompressionLimits]):
+        self._decompressionLimits = decompressionLimits
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """
+        Where the coroutine reads do their blocking work;  None uses the event loop's default
+        executor.  Hand the same bounded executor to every reader and writer to cap how many
+        conversions run at once
+        """
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Optional[Executor]):
+        self._executor = executor
+
+    @property
+    def collectStats(self) -> bool:
+        """
+        When True, each read times its phases and counts its bytes and elements;  See IOStats.
+        With workers or on a parse cache miss the parse phase includes decompression and the
+        model build;  They happen together in IRReader.  A lazy read only covers the scan.
+        readMany collects nothing
+        """
+        return self._collectStats
+
+    @collectStats.setter
+    def collectStats(self, collectStats: bool):
+        self._collectStats = collectStats
+
+    @property
+    def statsHook(self) -> Optional[IOStatsHook]:
+        """
+        Called with the stats at the end of every read that collects them;  Forward them to
+        your own metrics from here
+        """
+        return self._statsHook
+
+    @statsHook.setter
+    def statsHook(self, statsHook: Optional[IOStatsHook]):
+        self._statsHook = statsHook
+
+    @property
+    def lastStats(self) -> Optional[IOStats]:
+        """
+        The stats of the most recent read that collected them
+        """
+        return self._lastStats
+
+    @property
+    def profileSettings(self) -> Optional[ProfileSettings]:
+        """
+        When set, each readProjectFile, readData and readXmlFile call is profiled;  See IOProfiler.
+        Defaults to what the UMLIO_PROFILE_DIRECTORY and UMLIO_PROFILE_MEMORY environment
+        variables ask for.  The coroutine versions and readMany are not profiled
+        """
+        return self._profileSettings
+
+    @profileSettings.setter
+    def profileSettings(self, profileSettings: Optional[ProfileSettings]):
+        self._profileSettings = profileSettings
+
     def readProjectFile(self, fileName: Path) -> UmlProject:
         """
         Parse the input PROJECT_SUFFIX file
@@ -32,13 +236,20 @@ class Reader:
         if len(suffix) < 0 or suffix != PROJECT_SUFFIX:
             raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} suffix')
 
-        rawXmlString: str = self._decompressFile(fileName=fileName)
-
-        xmlToUmlShapes: XmlToUmlShapes = XmlToUmlShapes()
+        return self._read(xmlSource=projectFileSource(fileName=fileName, decompressionLimits=self._decompressionLimits))
 
-        xmlToUmlShapes.deserializeXml(xmlString=rawXmlString, fileName=fileName)
+    def readData(self, projectData: ProjectData, fileName: Path = Path('')) -> UmlProject:
+        """
+        Parse a project that is already in memory or arrives as a binary file;  There is no
+        suffix to check, so plain XML and every project file format are recognized from the
+        leading bytes.  Bytes and memory views are parsed in place.  The parse cache only
+        applies to files
 
-        return xmlToUmlShapes.umlProject
+        Args:
+            projectData:  The project's stored bytes or a binary file positioned at them
+            fileName:     Only a label;  It becomes the project's file name
+        """
+        return self._read(xmlSource=projectDataSource(projectData=projectData, fileName=fileName, decompressionLimits=self._decompressionLimits))
 
     def readXmlFile(self, fileName: Path) -> UmlProject:
         """
@@ -51,31 +262,399 @@ class Reader:
         if len(suffix) < 0 or suffix != XML_SUFFIX:
             raise UnsupportedFileTypeException(message=f'File does not end with .xml suffix')
 
-        xmlToUmlShapes: XmlToUmlShapes = XmlToUmlShapes()
+        return self._read(xmlSource=XmlFileSource(fileName=fileName), indexed=True)
 
-        xmlToUmlShapes.deserializeXmlFile(fileName=fileName)
+    async def aReadProjectFile(self, fileName: Path) -> UmlProject:
+        """
+        The coroutine version of readProjectFile.  The file is read and decompressed on the
+        executor;  Then each diagram is parsed to its intermediate representation there as a
+        job of its own.  The shapes are built on the awaiting thread, as readMany does;  So run
+        the event loop on the GUI thread.  A cancelled read stops between diagrams.
 
-        return xmlToUmlShapes.umlProject
+        The options that change how the XML is read, lazy, parseCache and workers, do not
+        apply;  The decompression limits do
+
+        Args:
+            fileName: The fully qualified file name
+        """
+        if fileName.suffix != PROJECT_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} suffix')
+
+        return await self._aRead(openSource=partial(projectFileSource, fileName=fileName, decompressionLimits=self._decompressionLimits))
+
+    async def aReadXmlFile(self, fileName: Path) -> UmlProject:
+        """
+        The coroutine version of readXmlFile;  See aReadProjectFile
+
+        Args:
+            fileName: Fully qualified file name
+        """
+        if fileName.suffix != XML_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {XML_SUFFIX} suffix')
+
+        return await self._aRead(openSource=partial(XmlFileSource, fileName=fileName))
+
+    def readMany(self, fileNames: Iterable[Path], workers: int = DEFAULT_READ_WORKERS, maximumPending: int = 0, processes: bool = True) -> Iterator[ReadResult]:
+        """
+        Read a batch of PROJECT_SUFFIX and XML_SUFFIX files in parallel;  See IRReader.readMany for
+        the pipeline, the ordering and the backpressure.  The shapes are built on the calling
+        thread as each file completes.  A file that fails yields its exception;  The batch goes on.
+
+        The decompression limits apply;  lazy, parseCache and workers do not
+
+        Args:
+            fileNames:       The files to read;  May be a lazy iterable such as Path.rglob()
+            workers:         The number of decompression threads and parse processes
+            maximumPending:  The most files in flight;  0 for twice the workers
+            processes:       When False, the files are parsed on a single thread instead
+
+        Returns:  An iterator of (fileName, UmlProject or exception) tuples in completion order
+        """
+        irReadResults: Iterator = IRReader().readMany(
+            fileNames=fileNames,
+            workers=workers,
+            maximumPending=maximumPending,
+            processes=processes,
+            decompressionLimits=self._decompressionLimits
+        )
+        for fileName, projectIR in irReadResults:
+            if isinstance(projectIR, Exception):
+                self.logger.debug(f'{fileName}: {projectIR}')
+                yield fileName, projectIR
+                continue
+            try:
+                with MODEL_LOCK:
+                    umlProject: UmlProject = self._materialize(projectIR=projectIR)
+            except Exception as e:
+                yield fileName, e
+                continue
+            yield fileName, umlProject
+
+    def readXmlDiagram(self, fileName: Path, documentTitle: UmlDocumentTitle) -> UmlDocument:
+        """
+        Parse a single diagram of an XML_SUFFIX file.  When the file has an up to date diagram
+        index only that diagram's bytes are read;  Otherwise the file is scanned for it
+
+        Args:
+            fileName:       Fully qualified file name
+            documentTitle:  The diagram to read
+
+        Returns:  The fully deserialized document
 
-    def _decompressFile(self, fileName: Path) -> str:
+        Raises:  KeyError when the project has no such diagram
         """
-        Decompresses a previously UML Diagrammer compressed file
+        if fileName.suffix != XML_SUFFIX:
+            raise UnsupportedFileTypeException(message=f'File does not end with {XML_SUFFIX} suffix')
+
+        xmlSource:       XmlSource       = XmlFileSource(fileName=fileName)
+        scannedProject:  ScannedProject  = self._scan(xmlSource=xmlSource, indexed=True)
+        diagramLocation: DiagramLocation = self._diagramLocation(scannedProject=scannedProject, documentTitle=documentTitle)
+
+        return self._readDiagram(xmlSource=xmlSource, scannedProject=scannedProject, diagramLocation=diagramLocation)
+
+    def probe(self, fileName: Path) -> ProjectSummary:
+        """
+        Summarize a PROJECT_SUFFIX or XML_SUFFIX file without building any shapes.  Headless
+        callers that must not import wx should use ProjectProbe directly
 
         Args:
-            fileName: Fully qualified file name with a PROJECT_SUFFIX suffix
+            fileName: Fully qualified file name
 
-        Returns:  A raw XML String
+        Returns:  The version, code path, and the title, type and element counts of each diagram
         """
-        try:
-            with open(fileName, "rb") as compressedFile:
-                compressedData: bytes = compressedFile.read()
-        except (ValueError, Exception) as e:
-            self.logger.error(f'decompress open:  {e}')
-            raise e
+        return ProjectProbe().probe(fileName=fileName)
+
+    def _read(self, xmlSource: XmlSource, indexed: bool = False) -> UmlProject:
+        """
+        Args:
+            xmlSource:  Where the XML comes from
+            indexed:    When True, a lazy read uses the file's diagram index if it is up to date
+
+        Returns:  The project, read the way the options say
+        """
+        fileSize: int | None = None if self._profileSettings is None else xmlSource.storedSize
+        with ioProfiler(self._profileSettings, operation=OPERATION_READ, fileName=xmlSource.fileName, fileSize=fileSize):
+            umlProject: UmlProject = self._readCounted(xmlSource=xmlSource, indexed=indexed)
+
+        return umlProject
+
+    def _readCounted(self, xmlSource: XmlSource, indexed: bool) -> UmlProject:
+        """
+        _read that collects the stats when asked to
+        """
+        ioStats: Optional[IOStats] = self._newStats(fileName=xmlSource.fileName)
+        if ioStats is None:
+            return self._readProject(xmlSource=xmlSource, indexed=indexed, ioStats=None)
+
+        with ioStats.total():
+            umlProject: UmlProject = self._readProject(xmlSource=xmlSource, indexed=indexed, ioStats=ioStats)
+
+        ioStats.bytesIn = xmlSource.storedSize
+        if self._lazy is True:
+            ioStats.countDiagrams(diagramCount=len(umlProject.umlDocuments))
+        else:
+            ioStats.countProject(umlProject=umlProject)
+        self._reportStats(ioStats=ioStats)
+
+        return umlProject
+
+    def _readProject(self, xmlSource: XmlSource, indexed: bool, ioStats: Optional[IOStats]) -> UmlProject:
+
+        if self._lazy is True:
+            with phase(ioStats, PHASE_PARSE):
+                return self._readLazily(xmlSource=xmlSource, indexed=indexed)
+        #
+        # A coroutine read or readMany may be building model objects on another thread
+        #
+        with MODEL_LOCK:
+            return self._readEagerly(xmlSource=xmlSource, indexed=indexed, ioStats=ioStats)
+
+    def _readEagerly(self, xmlSource: XmlSource, indexed: bool, ioStats: Optional[IOStats]) -> UmlProject:
+
+        if self._parseCache is not None and xmlSource.inMemory is False:
+            return self._readCached(xmlSource=xmlSource, parseCache=self._parseCache, ioStats=ioStats)
+        if self._workers > 1:
+            with phase(ioStats, PHASE_PARSE):
+                projectIR: ProjectIR = IRReader().read(xmlSource=xmlSource, workers=self._workers)
+            return self._materialize(projectIR=projectIR, ioStats=ioStats)
+
+        xmlToUmlShapes: XmlToUmlShapes  = self._xmlToUmlShapes()
+        xmlChunks:      Iterable[bytes] = xmlSource.chunks()
+        if ioStats is not None:
+            xmlToUmlShapes.ioStats = ioStats
+            xmlChunks              = timedChunks(ioStats=ioStats, xmlChunks=xmlChunks)
+
+        xmlToUmlShapes.deserializeXmlChunks(xmlChunks=xmlChunks, fileName=xmlSource.fileName)
+
+        return xmlToUmlShapes.umlProject
+
+    async def _aRead(self, openSource: Callable[[], XmlSource]) -> UmlProject:
+        """
+        Args:
+            openSource:  Creates the source;  Sniffing the format already reads the file
+
+        Returns:  The fully deserialized project
+        """
+        ioStats: Optional[IOStats] = self._newStats(fileName=Path(''))
+        startTime: float = perf_counter()
+
+        xmlSource, scannedProject = await runJob(self._executor, partial(self._bufferAndScan, openSource=openSource, ioStats=ioStats))
+
+        umlProject: UmlProject = UmlProject(
+            fileName=xmlSource.fileName,
+            version=scannedProject.version,
+            codePath=cast(Path, scannedProject.codePath)
+        )
+        for diagramLocation in scannedProject.diagramLocations:
+            diagramIR: DiagramIR = await runJob(
+                self._executor,
+                partial(self._readDiagramIR, xmlSource=xmlSource, scannedProject=scannedProject, diagramLocation=diagramLocation, ioStats=ioStats)
+            )
+            with MODEL_LOCK:
+                umlProject.umlDocuments[diagramIR.documentTitle] = self._materializeDiagram(diagramIR=diagramIR, ioStats=ioStats)
+
+        if ioStats is not None:
+            ioStats.wallSeconds = perf_counter() - startTime
+            ioStats.cpuSeconds  = sum(phaseStats.cpuSeconds for phaseStats in ioStats.phases.values())
+            ioStats.countProject(umlProject=umlProject)
+            self._reportStats(ioStats=ioStats)
+
+        return umlProject
+
+    def _bufferAndScan(self, openSource: Callable[[], XmlSource], ioStats: Optional[IOStats] = None) -> tuple[XmlSource, ScannedProject]:
+        """
+        Decompress once;  The diagrams are then cut from memory instead of inflating the file again for each
+
+        Returns:  The uncompressed XML as a source and the scan of it
+        """
+        xmlSource: XmlSource = openSource()
+        with phase(ioStats, PHASE_DECOMPRESS):
+            xmlBytes: bytes = b''.join(xmlSource.chunks())
+        with phase(ioStats, PHASE_PARSE):
+            scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=[xmlBytes])
+
+        if ioStats is not None:
+            ioStats.fileName = xmlSource.fileName
+            ioStats.bytesIn  = xmlSource.storedSize
+            ioStats.bytesOut = len(xmlBytes)
+
+        return XmlFileSource(fileName=xmlSource.fileName, projectBuffer=memoryview(xmlBytes)), scannedProject
+
+    def _newStats(self, fileName: Path) -> Optional[IOStats]:
+        """
+        Returns:  Fresh stats for a read;  None when they are not collected
+        """
+        if self._collectStats is False:
+            return None
+
+        return IOStats(operation=OPERATION_READ, fileName=fileName)
+
+    def _reportStats(self, ioStats: IOStats):
+
+        self._lastStats = ioStats
+        if self._statsHook is not None:
+            self._statsHook(ioStats)
+
+    def _xmlToUmlShapes(self) -> 'XmlToUmlShapes':
+        """
+        Returns:  The deserializer selected by the singlePass option
+        """
+        from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+        from umlio.deserializer.XmlStreamToUmlShapes import XmlStreamToUmlShapes
+
+        if self._singlePass is True:
+            return XmlStreamToUmlShapes()
         else:
-            self.logger.info(f'{ZLIB_VERSION=}')
-            xmlBytes:  bytes = decompress(compressedData)  # has b`....` around it
-            xmlString: str   = xmlBytes.decode()
-            self.logger.debug(f'Document read:\n{xmlString}')
+            return XmlToUmlShapes()
+
+    def _materialize(self, projectIR: ProjectIR, ioStats: Optional[IOStats] = None) -> UmlProject:
+        """
+        Returns:  The project with its shapes built
+        """
+        from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+
+        diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
+        diagramIRToUmlShapes.ioStats = ioStats
+
+        return diagramIRToUmlShapes.materializeProject(projectIR=projectIR)
+
+    def _materializeDiagram(self, diagramIR: DiagramIR, ioStats: Optional[IOStats] = None) -> UmlDocument:
+        """
+        Returns:  The document with its shapes built
+        """
+        from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+
+        diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
+        diagramIRToUmlShapes.ioStats = ioStats
+
+        return diagramIRToUmlShapes.materialize(diagramIR=diagramIR)
+
+    def _readCached(self, xmlSource: XmlSource, parseCache: ParseCache, ioStats: Optional[IOStats] = None) -> UmlProject:
+        """
+        On a miss, parse to the intermediate representation and remember it
+
+        Args:
+            xmlSource:   Where the XML comes from
+            parseCache:  The cache to consult
+            ioStats:     Optional;  Where to add the phase times
+
+        Returns:  The fully deserialized project
+        """
+        projectIR: ProjectIR | None = parseCache.load(fileName=xmlSource.fileName)
+        if projectIR is None:
+            with phase(ioStats, PHASE_PARSE):
+                projectIR = IRReader().read(xmlSource=xmlSource, workers=self._workers)
+            parseCache.store(fileName=xmlSource.fileName, projectIR=projectIR)
+
+        return self._materialize(projectIR=projectIR, ioStats=ioStats)
+
+    def _readLazily(self, xmlSource: XmlSource, indexed: bool = False) -> UmlProject:
+        """
+        Scan the XML for the diagrams;  Defer deserializing them until they are used
+
+        Args:
+            xmlSource:  Where the XML comes from
+            indexed:    When True, a diagram index stands in for the scan
+
+        Returns:  A project whose documents are a LazyUmlDocuments mapping
+        """
+        scannedProject: ScannedProject = self._scan(xmlSource=xmlSource, indexed=indexed)
+        firstScan:      ScannedProject = scannedProject        # The one the lazy documents hold the locations of
+
+        def diagramLoader(diagramLocation: DiagramLocation) -> UmlDocument:
+            #
+            # Without an index there is no content hash to check;  The file's stamp tells whether the scan's offsets still hold
+            #
+            nonlocal scannedProject
+            if xmlSource.changedSinceStamp is True:
+                self.logger.warning(f'{xmlSource.fileName} changed since it was scanned;  Scanning it again')
+                scannedProject = self._scan(xmlSource=xmlSource)
+            if scannedProject is not firstScan:
+                diagramLocation = self._diagramLocation(scannedProject=scannedProject, documentTitle=diagramLocation.documentTitle)
+
+            return self._readDiagram(xmlSource=xmlSource, scannedProject=scannedProject, diagramLocation=diagramLocation)
+
+        umlProject: UmlProject = UmlProject(
+            fileName=xmlSource.fileName,
+            version=scannedProject.version,
+            codePath=cast(Path, scannedProject.codePath)
+        )
+        umlProject.umlDocuments = cast(UmlDocuments, LazyUmlDocuments(diagramLocations=scannedProject.diagramLocations, diagramLoader=diagramLoader))
+
+        return umlProject
+
+    def _readDiagramIR(self, xmlSource: XmlSource, scannedProject: ScannedProject, diagramLocation: DiagramLocation,
+                       ioStats: Optional[IOStats] = None) -> DiagramIR:
+        """
+        The executor side of a coroutine read;  No shapes, so nothing here touches wx.  Other
+        reads may be building model objects at the same time;  Only that part holds MODEL_LOCK
+
+        Returns:  The diagram's intermediate representation
+        """
+        fragment: bytes = xmlSource.fragment(startOffset=diagramLocation.startOffset, endOffset=diagramLocation.endOffset)
+
+        xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+        with phase(ioStats, PHASE_PARSE):
+            umlProjectElement: Element = xmlToDiagramIR.untangle(xmlChunks=[scannedProject.diagramDocument(fragment=fragment)])
+            with MODEL_LOCK:
+                xmlToDiagramIR.deserializeUmlProject(umlProjectElement=umlProjectElement, fileName=xmlSource.fileName)
+
+        return xmlToDiagramIR.projectIR.diagramIRs[diagramLocation.documentTitle]
+
+    def _readDiagram(self, xmlSource: XmlSource, scannedProject: ScannedProject, diagramLocation: DiagramLocation,
+                     ioStats: Optional[IOStats] = None) -> UmlDocument:
+        """
+        Parse a single diagram
+
+        Args:
+            xmlSource:       Where the XML comes from
+            scannedProject:  The scan results
+            diagramLocation: The diagram to deserialize
+            ioStats:         Optional;  Where to add the phase times
+
+        Returns:  The fully deserialized document
+        """
+        fragment: bytes = xmlSource.fragment(startOffset=diagramLocation.startOffset, endOffset=diagramLocation.endOffset)
+
+        if diagramLocation.contentHash != '' and diagramHash(fragment=fragment) != diagramLocation.contentHash:
+            self.logger.warning(f'{xmlSource.fileName} changed since it was indexed;  Scanning it')
+            scannedProject  = self._scan(xmlSource=xmlSource)
+            diagramLocation = self._diagramLocation(scannedProject=scannedProject, documentTitle=diagramLocation.documentTitle)
+            fragment        = xmlSource.fragment(startOffset=diagramLocation.startOffset, endOffset=diagramLocation.endOffset)
+
+        xmlToUmlShapes: XmlToUmlShapes = self._xmlToUmlShapes()
+        xmlToUmlShapes.ioStats = ioStats
+        with MODEL_LOCK:
+            xmlToUmlShapes.deserializeXmlChunks(xmlChunks=[scannedProject.diagramDocument(fragment=fragment)], fileName=xmlSource.fileName)
+
+        return xmlToUmlShapes.umlProject.umlDocuments[diagramLocation.documentTitle]
+
+    def _scan(self, xmlSource: XmlSource, indexed: bool = False) -> ScannedProject:
+        """
+        Args:
+            xmlSource:  Where the XML comes from
+            indexed:    When True, use the file's diagram index if it is up to date
+
+        Returns:  The project attributes and the location of every diagram
+        """
+        xmlSource.noteFileStamp()
+        if indexed is True:
+            diagramIndex: DiagramIndex | None = loadDiagramIndex(xmlFileName=xmlSource.fileName)
+            if diagramIndex is not None:
+                return diagramIndex.scannedProject(prolog=xmlSource.fragment(startOffset=0, endOffset=diagramIndex.prologLength))
+            self.logger.debug(f'{xmlSource.fileName} has no up to date diagram index;  Scanning it')
+
+        scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=xmlSource.chunks())
+        xmlSource.expectFragments(fragmentRanges=FragmentRanges([
+            FragmentRange((diagramLocation.startOffset, diagramLocation.endOffset)) for diagramLocation in scannedProject.diagramLocations
+        ]))
+
+        return scannedProject
+
+    def _diagramLocation(self, scannedProject: ScannedProject, documentTitle: UmlDocumentTitle) -> DiagramLocation:
+
+        for diagramLocation in scannedProject.diagramLocations:
+            if diagramLocation.documentTitle == documentTitle:
+                return diagramLocation
 
-        return xmlString
+        raise KeyError(documentTitle)
@@ -1,15 +1,51 @@
+from typing import BinaryIO
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 from pathlib import Path
 
-from zlib import compress
-from zlib import ZLIB_VERSION
+from concurrent.futures import Executor
+
+from functools import partial
+
+from time import perf_counter
+
+from umlio.IOProfiler import ProfileSettings
+from umlio.IOProfiler import environmentProfileSettings
+from umlio.IOProfiler import ioProfiler
+
+from umlio.IOStats import IOStats
+from umlio.IOStats import IOStatsHook
+from umlio.IOStats import OPERATION_WRITE
+from umlio.IOStats import PHASE_SERIALIZE
+from umlio.IOStats import phase
 
 from umlio.IOTypes import PROJECT_SUFFIX
+from umlio.IOTypes import UmlDocument
 from umlio.IOTypes import UmlProject
 from umlio.IOTypes import XML_SUFFIX
-from umlio.serializer.UmlShapesToXml import UmlShapesToXml
+
+from umlio.AsyncJobs import runJob
+
+from umlio.DiagramIndex import DiagramIndex
+from umlio.DiagramIndex import indexFileName
+from umlio.DiagramIndex import saveDiagramIndex
+
+from umlio.cache.DiagramFragmentCache import DiagramFragmentCache
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+from umlio.sinks.XmlSink import XmlSink
+from umlio.sinks.XmlFileSink import XmlFileSink
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+from umlio.sinks.ContainerFileSink import ContainerFileSink
+
+#
+# The shape serializers import wx;  They are loaded on the first write
+#
+if TYPE_CHECKING:
+    from umlio.serializer.UmlShapesToXmlStream import UmlShapesToXmlStream
 
 
 class Writer:
@@ -22,6 +58,129 @@ class Writer:
 
         self.logger: Logger = getLogger(__name__)
 
+        self._fragmentCache:      DiagramFragmentCache | None = None
+        self._containerFormat:    bool                        = False
+        self._compressionProfile: CompressionProfile          = CompressionProfile.BALANCED
+        self._diagramIndex:       bool                        = False
+        self._executor:           Executor | None             = None
+
+        self._collectStats: bool               = False
+        self._statsHook:    IOStatsHook | None = None
+        self._lastStats:    IOStats | None     = None
+
+        self._profileSettings: ProfileSettings | None = environmentProfileSettings()
+
+    @property
+    def incremental(self) -> bool:
+        """
+        When True, each save only re-serializes the diagrams that changed since the previous
+        save through this writer;  Use one writer per open project
+        """
+        return self._fragmentCache is not None
+
+    @incremental.setter
+    def incremental(self, incremental: bool):
+        if incremental is False:
+            self._fragmentCache = None
+        elif self._fragmentCache is None:
+            self._fragmentCache = DiagramFragmentCache()
+
+    @property
+    def containerFormat(self) -> bool:
+        """
+        When True, writeFile writes the version 2 container;  One compressed block per diagram,
+        compressed on codec threads.  Older releases of this library cannot read it
+        """
+        return self._containerFormat
+
+    @containerFormat.setter
+    def containerFormat(self, containerFormat: bool):
+        self._containerFormat = containerFormat
+
+    @property
+    def compressionProfile(self) -> CompressionProfile:
+        """
+        How writeFile compresses;  Reader recognizes every profile on its own
+        """
+        return self._compressionProfile
+
+    @compressionProfile.setter
+    def compressionProfile(self, compressionProfile: CompressionProfile):
+        self._compressionProfile = compressionProfile
+
+    @property
+    def diagramIndex(self) -> bool:
+        """
+        When True, writeXmlFile also writes a sidecar index with the byte range and hash of
+        each diagram;  Reader then goes straight to a diagram instead of scanning for it.
+        When False, any index left from an earlier save is removed
+        """
+        return self._diagramIndex
+
+    @diagramIndex.setter
+    def diagramIndex(self, diagramIndex: bool):
+        self._diagramIndex = diagramIndex
+
+    @property
+    def executor(self) -> Executor | None:
+        """
+        Where the coroutine writes do their blocking work;  None uses the event loop's default
+        executor.  Hand the same bounded executor to every reader and writer to cap how many
+        conversions run at once
+        """
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Executor | None):
+        self._executor = executor
+
+    @property
+    def collectStats(self) -> bool:
+        """
+        When True, each write times its phases and counts its bytes and elements;  See IOStats.
+        Written to a stream that cannot seek, the stored bytes are not counted
+        """
+        return self._collectStats
+
+    @collectStats.setter
+    def collectStats(self, collectStats: bool):
+        self._collectStats = collectStats
+
+    @property
+    def statsHook(self) -> IOStatsHook | None:
+        """
+        Called with the stats at the end of every write that collects them
+        """
+        return self._statsHook
+
+    @statsHook.setter
+    def statsHook(self, statsHook: IOStatsHook | None):
+        self._statsHook = statsHook
+
+    @property
+    def lastStats(self) -> IOStats | None:
+        """
+        The stats of the most recent write that collected them
+        """
+        return self._lastStats
+
+    @property
+    def profileSettings(self) -> ProfileSettings | None:
+        """
+        When set, each writeFile, writeXmlFile, writeStream and writeXmlStream call is profiled;
+        See IOProfiler.  Defaults to what the UMLIO_PROFILE_DIRECTORY and UMLIO_PROFILE_MEMORY
+        environment variables ask for.  The coroutine versions are not profiled
+        """
+        return self._profileSettings
+
+    @profileSettings.setter
+    def profileSettings(self, profileSettings: ProfileSettings | None):
+        self._profileSettings = profileSettings
+
+    @property
+    def fragmentCache(self) -> DiagramFragmentCache | None:
+        return self._fragmentCache
+
     def writeFile(self, umlProject: UmlProject, fileName: Path):
         """
         Writes to a compressed project file file
@@ -33,22 +192,46 @@ class Writer:
         if fileName.suffix != PROJECT_SUFFIX:
             fileName = fileName / PROJECT_SUFFIX
 
-        umlShapesToXml: UmlShapesToXml = UmlShapesToXml(projectFileName=fileName, projectCodePath=umlProject.codePath)
+        self._write(umlProject=umlProject, projectFileName=fileName, xmlSink=self._projectSink(fileName=fileName))
 
-        for umlDiagram in umlProject.umlDocuments.values():
-            umlShapesToXml.serialize(umlDiagram=umlDiagram)
+    def writeXmlFile(self, umlProject: UmlProject, fileName: Path):
+        """
+        Writes to an XML file
+        Args:
+            umlProject:   The project we have to serialize
+            fileName:     Where to write the XML;  Should be a full qualified file name
+        """
+        if fileName.suffix != XML_SUFFIX:
+            fileName = fileName / XML_SUFFIX
 
-        rawXml: str = umlShapesToXml.xml
+        diagramIndex: DiagramIndex | None = DiagramIndex() if self._diagramIndex is True else None
 
-        self.logger.debug(f'{ZLIB_VERSION=}')
-        byteText:        bytes  = rawXml.encode()
-        compressedBytes: bytes = compress(byteText)
+        self._write(umlProject=umlProject, projectFileName=umlProject.fileName, xmlSink=XmlFileSink(fileName=fileName), diagramIndex=diagramIndex)
 
-        fileName.write_bytes(compressedBytes)
+        if diagramIndex is None:
+            indexFileName(xmlFileName=fileName).unlink(missing_ok=True)
+        else:
+            saveDiagramIndex(diagramIndex=diagramIndex, xmlFileName=fileName)
 
-    def writeXmlFile(self, umlProject: UmlProject, fileName: Path):
+    async def aWriteFile(self, umlProject: UmlProject, fileName: Path):
         """
-        Writes to an XML file
+        The coroutine version of writeFile.  Each diagram is serialized and compressed on the
+        executor as a job of its own;  So the event loop never blocks.  A cancelled write stops
+        between diagrams and leaves any existing file untouched
+
+        Args:
+            umlProject: The project we have to serialize
+            fileName:   Where to write the XML;  Should be a full qualified file name
+        """
+        if fileName.suffix != PROJECT_SUFFIX:
+            fileName = fileName / PROJECT_SUFFIX
+
+        await self._aStreamProject(umlProject=umlProject, projectFileName=fileName, xmlSink=self._projectSink(fileName=fileName))
+
+    async def aWriteXmlFile(self, umlProject: UmlProject, fileName: Path):
+        """
+        The coroutine version of writeXmlFile;  See aWriteFile
+
         Args:
             umlProject:   The project we have to serialize
             fileName:     Where to write the XML;  Should be a full qualified file name
@@ -56,9 +239,218 @@ class Writer:
         if fileName.suffix != XML_SUFFIX:
             fileName = fileName / XML_SUFFIX
 
-        umlToXml: UmlShapesToXml = UmlShapesToXml(projectFileName=umlProject.fileName, projectCodePath=umlProject.codePath)
+        diagramIndex: DiagramIndex | None = DiagramIndex() if self._diagramIndex is True else None
+
+        await self._aStreamProject(umlProject=umlProject, projectFileName=umlProject.fileName, xmlSink=XmlFileSink(fileName=fileName), diagramIndex=diagramIndex)
+
+        if diagramIndex is None:
+            await runJob(self._executor, partial(indexFileName(xmlFileName=fileName).unlink, missing_ok=True))
+        else:
+            await runJob(self._executor, partial(saveDiagramIndex, diagramIndex=diagramIndex, xmlFileName=fileName))
+
+    def writeStream(self, umlProject: UmlProject, projectStream: BinaryIO):
+        """
+        Writes the compressed project to a binary file the caller owns;  The same bytes
+        writeFile would write.  The container format needs a seekable stream.  The stream
+        is left open
+
+        Args:
+            umlProject:     The project we have to serialize
+            projectStream:  Where the compressed project goes;  e.g. a BytesIO or a socket file
+        """
+        self._write(
+            umlProject=umlProject,
+            projectFileName=umlProject.fileName,
+            xmlSink=self._projectSink(fileName=umlProject.fileName, outputStream=projectStream),
+            outputStream=projectStream
+        )
+
+    def writeXmlStream(self, umlProject: UmlProject, xmlStream: BinaryIO):
+        """
+        Writes the plain XML to a binary file the caller owns;  The stream is left open
+
+        Args:
+            umlProject:  The project we have to serialize
+            xmlStream:   Where the XML goes
+        """
+        self._write(
+            umlProject=umlProject,
+            projectFileName=umlProject.fileName,
+            xmlSink=XmlFileSink(fileName=umlProject.fileName, outputStream=xmlStream),
+            outputStream=xmlStream
+        )
+
+    def _projectSink(self, fileName: Path, outputStream: BinaryIO | None = None) -> XmlSink:
+        """
+        Returns:  The sink for the selected container format and compression profile
+        """
+        if self._containerFormat is True:
+            return ContainerFileSink(fileName=fileName, codec=self._compressionProfile.codec, outputStream=outputStream)
+
+        return CompressedFileSink(fileName=fileName, codec=self._compressionProfile.codec, outputStream=outputStream)
+
+    async def _aStreamProject(self, umlProject: UmlProject, projectFileName: Path, xmlSink: XmlSink, diagramIndex: DiagramIndex | None = None):
+        """
+        _streamProject a diagram per executor job.  The sink is entered and left on the executor
+        too;  A failed or cancelled write throws its temporary file away
+
+        Args:
+            umlProject:       The project we have to serialize
+            projectFileName:  The file name recorded in the project element
+            xmlSink:          Where the XML goes;  Not yet entered
+            diagramIndex:     Optional;  Filled in as the diagrams are written
+        """
+        umlShapesToXml: UmlShapesToXmlStream = self._umlShapesToXml(
+            umlProject=umlProject,
+            projectFileName=projectFileName,
+            xmlSink=xmlSink,
+            diagramIndex=diagramIndex
+        )
+        ioStats:   IOStats | None = self._newStats(xmlSink=xmlSink)
+        startTime: float          = perf_counter()
+
+        await runJob(self._executor, xmlSink.__enter__)
+        try:
+            for umlDiagram in list(umlProject.umlDocuments.values()):
+                await runJob(self._executor, partial(self._serializeDiagram, umlShapesToXml=umlShapesToXml, umlDiagram=umlDiagram, ioStats=ioStats))
+            await runJob(self._executor, partial(self._closeProject, umlShapesToXml=umlShapesToXml, ioStats=ioStats))
+        except BaseException as e:
+            await runJob(self._executor, partial(xmlSink.__exit__, type(e), e, e.__traceback__))
+            raise
+
+        await runJob(self._executor, partial(xmlSink.__exit__, None, None, None))
+
+        if ioStats is not None:
+            ioStats.wallSeconds = perf_counter() - startTime
+            ioStats.cpuSeconds  = sum(phaseStats.cpuSeconds for phaseStats in ioStats.phases.values())
+            self._reportStats(ioStats=ioStats, umlProject=umlProject, xmlSink=xmlSink, outputStream=None, startPosition=0)
+
+        if self._fragmentCache is not None:
+            self._fragmentCache.retain(documentTitles=list(umlProject.umlDocuments.keys()))
+
+    def _write(self, umlProject: UmlProject, projectFileName: Path, xmlSink: XmlSink, diagramIndex: DiagramIndex | None = None,
+               outputStream: BinaryIO | None = None):
+        """
+        Stream the project into the sink;  Collect the stats when asked to
+
+        Args:
+            umlProject:       The project we have to serialize
+            projectFileName:  The file name recorded in the project element
+            xmlSink:          Where the XML goes;  Not yet entered
+            diagramIndex:     Optional;  Filled in as the diagrams are written
+            outputStream:     The caller's stream the sink writes to, if any
+        """
+        fileSize: int | None = None if outputStream is None else 0
+        with ioProfiler(self._profileSettings, operation=OPERATION_WRITE, fileName=xmlSink.fileName, fileSize=fileSize):
+            self._writeCounted(umlProject=umlProject, projectFileName=projectFileName, xmlSink=xmlSink, diagramIndex=diagramIndex, outputStream=outputStream)
+
+    def _writeCounted(self, umlProject: UmlProject, projectFileName: Path, xmlSink: XmlSink, diagramIndex: DiagramIndex | None,
+                      outputStream: BinaryIO | None):
+        """
+        _write that collects the stats when asked to
+        """
+        ioStats: IOStats | None = self._newStats(xmlSink=xmlSink)
+        if ioStats is None:
+            with xmlSink:
+                self._streamProject(umlProject=umlProject, projectFileName=projectFileName, xmlSink=xmlSink, diagramIndex=diagramIndex)
+            return
+
+        startPosition: int = self._streamPosition(outputStream=outputStream)
+        with ioStats.total():
+            with xmlSink:
+                self._streamProject(umlProject=umlProject, projectFileName=projectFileName, xmlSink=xmlSink, diagramIndex=diagramIndex, ioStats=ioStats)
+
+        self._reportStats(ioStats=ioStats, umlProject=umlProject, xmlSink=xmlSink, outputStream=outputStream, startPosition=startPosition)
+
+    def _streamProject(self, umlProject: UmlProject, projectFileName: Path, xmlSink: XmlSink, diagramIndex: DiagramIndex | None = None,
+                       ioStats: IOStats | None = None):
+        """
+        Serialize the project a diagram at a time straight into the sink
+
+        Args:
+            umlProject:       The project we have to serialize
+            projectFileName:  The file name recorded in the project element
+            xmlSink:          Where the XML goes
+            diagramIndex:     Optional;  Filled in as the diagrams are written
+            ioStats:          Optional;  Where to add the phase times
+        """
+        umlShapesToXml: UmlShapesToXmlStream = self._umlShapesToXml(
+            umlProject=umlProject,
+            projectFileName=projectFileName,
+            xmlSink=xmlSink,
+            diagramIndex=diagramIndex
+        )
 
         for umlDiagram in umlProject.umlDocuments.values():
-            umlToXml.serialize(umlDiagram=umlDiagram)
+            self._serializeDiagram(umlShapesToXml=umlShapesToXml, umlDiagram=umlDiagram, ioStats=ioStats)
+
+        self._closeProject(umlShapesToXml=umlShapesToXml, ioStats=ioStats)
+
+        if self._fragmentCache is not None:
+            self._fragmentCache.retain(documentTitles=list(umlProject.umlDocuments.keys()))
+
+    def _serializeDiagram(self, umlShapesToXml: 'UmlShapesToXmlStream', umlDiagram: UmlDocument, ioStats: IOStats | None):
+
+        with phase(ioStats, PHASE_SERIALIZE):
+            umlShapesToXml.serialize(umlDiagram=umlDiagram)
+
+    def _closeProject(self, umlShapesToXml: 'UmlShapesToXmlStream', ioStats: IOStats | None):
+
+        with phase(ioStats, PHASE_SERIALIZE):
+            umlShapesToXml.close()
+
+    def _newStats(self, xmlSink: XmlSink) -> IOStats | None:
+        """
+        Returns:  Fresh stats for a write, handed to the sink too;  None when they are not collected
+        """
+        if self._collectStats is False:
+            return None
+
+        ioStats: IOStats = IOStats(operation=OPERATION_WRITE, fileName=xmlSink.fileName)
+        xmlSink.ioStats = ioStats
+
+        return ioStats
+
+    def _reportStats(self, ioStats: IOStats, umlProject: UmlProject, xmlSink: XmlSink, outputStream: BinaryIO | None, startPosition: int):
+        """
+        Count what was written;  Then hand the stats out
+
+        Args:
+            ioStats:        The stats of the write
+            umlProject:     The project that was written
+            xmlSink:        The sink it was written to;  Already left
+            outputStream:   The caller's stream the sink wrote to, if any
+            startPosition:  Where the stream was before the write
+        """
+        ioStats.bytesIn = xmlSink.xmlOffset
+        if outputStream is None:
+            ioStats.bytesOut = xmlSink.fileName.stat().st_size
+        elif outputStream.seekable() is True:
+            ioStats.bytesOut = outputStream.tell() - startPosition
+        ioStats.countProject(umlProject=umlProject)
+
+        self._lastStats = ioStats
+        if self._statsHook is not None:
+            self._statsHook(ioStats)
+
+    def _streamPosition(self, outputStream: BinaryIO | None) -> int:
+        """
+        Returns:  Where a seekable output stream is;  Zero for anything else
+        """
+        if outputStream is not None and outputStream.seekable() is True:
+            return outputStream.tell()
+        return 0
+
+    def _umlShapesToXml(self, umlProject: UmlProject, projectFileName: Path, xmlSink: XmlSink, diagramIndex: DiagramIndex | None) -> 'UmlShapesToXmlStream':
+        """
+        Returns:  A serializer for the project that writes into the sink
+        """
+        from umlio.serializer.UmlShapesToXmlStream import UmlShapesToXmlStream
 
-        umlToXml.writeXml(fileName=fileName)
+        return UmlShapesToXmlStream(
+            projectFileName=projectFileName,
+            projectCodePath=umlProject.codePath,
+            xmlSink=xmlSink,
+            fragmentCache=self._fragmentCache,
+            diagramIndex=diagramIndex
+        )
@@ -0,0 +1,372 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+
+from functools import partial
+
+from gc import collect
+
+from json import dumps as jsonDumps
+
+from pathlib import Path
+
+from sys import platform as sysPlatform
+
+from tempfile import TemporaryDirectory
+
+from tracemalloc import get_traced_memory
+from tracemalloc import is_tracing
+from tracemalloc import reset_peak
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+
+from click import Choice
+from click import command
+from click import echo
+from click import option
+
+from umlio.IOTypes import UmlProject
+from umlio.IRReader import IRReader
+from umlio.ProjectConverter import ProjectConverter
+
+from umlio.benchmark.ProjectGenerator import GENERATOR_ENCODING
+from umlio.benchmark.ProjectGenerator import GeneratorParameters
+from umlio.benchmark.ProjectGenerator import ProjectGenerator
+
+from umlio.benchmark.StageBenchmark import STAGES
+from umlio.benchmark.StageBenchmark import StageBenchmark
+from umlio.benchmark.StageBenchmark import StageResult
+from umlio.benchmark.StageBenchmark import StageRunner
+from umlio.benchmark.StageBenchmark import parseSweep
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+try:
+    from resource import RUSAGE_SELF
+    from resource import getrusage
+    RSS_AVAILABLE: bool = True
+except ImportError:
+    RSS_AVAILABLE = False
+
+#
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+#
+RSS_UNITS: int = 1 if sysPlatform == 'darwin' else 1024
+
+#
+# The public calls, after the pipeline stages;  Only the intermediate representation read is headless
+#
+STAGE_READ_IR:           str = 'readIR'
+STAGE_READ_PROJECT_FILE: str = 'readProjectFile'
+STAGE_DESERIALIZE_XML:   str = 'deserializeXml'
+STAGE_WRITE_FILE:        str = 'writeFile'
+
+CALL_STAGES:   List[str] = [STAGE_READ_IR, STAGE_READ_PROJECT_FILE, STAGE_DESERIALIZE_XML, STAGE_WRITE_FILE]
+MEMORY_STAGES: List[str] = STAGES + CALL_STAGES
+
+ELEMENT_COUNT: int = 200
+#
+# The generator parameter that sets how many of each element a diagram has
+#
+ELEMENT_PARAMETERS: Dict[str, str] = {
+    'UmlClass':             'classesPerDiagram',
+    'UmlNote':              'notesPerDiagram',
+    'UmlLink':              'linksPerDiagram',
+    'UmlLollipopInterface': 'lollipopsPerDiagram',
+}
+#
+# Only the measured element;  Links keep the default classes to link between
+#
+ISOLATED_ELEMENTS: GeneratorParameters = GeneratorParameters(notesPerDiagram=0, linksPerDiagram=0, lollipopsPerDiagram=0)
+
+
+def peakRss() -> Optional[int]:
+    """
+    Returns:  The process high water mark in bytes;  None where the platform does not report it
+    """
+    if RSS_AVAILABLE is False:
+        return None
+
+    return getrusage(RUSAGE_SELF).ru_maxrss * RSS_UNITS
+
+
+@dataclass
+class StageMemory:
+    """
+    peakBytes and retainedBytes are relative to what was allocated when the stage started;  A
+    stage that frees more than it keeps retains a negative amount.  The RSS high water mark
+    only ever grows;  rssGrowthBytes is how much this stage raised it
+    """
+    peakBytes:      int           = 0
+    retainedBytes:  int           = 0
+    peakRssBytes:   Optional[int] = None
+    rssGrowthBytes: Optional[int] = None
+
+
+StageMemories = NewType('StageMemories', Dict[str, Optional[StageMemory]])
+
+
+def stageMemoriesFactory() -> StageMemories:
+    return StageMemories({stageName: None for stageName in MEMORY_STAGES})
+
+
+@dataclass
+class MemoryMeasurement:
+    generatorParameters: GeneratorParameters
+    xmlBytes:            int           = 0
+    compressedBytes:     int           = 0
+    stageMemories:       StageMemories = field(default_factory=stageMemoriesFactory)
+
+
+MemoryMeasurements = NewType('MemoryMeasurements', List[MemoryMeasurement])
+
+
+@dataclass
+class ElementCost:
+    """
+    What one more element adds to a loaded project;  The representation is shapes when wx
+    is installed, the intermediate representation otherwise
+    """
+    elementName:         str
+    generatorParameters: GeneratorParameters
+    representation:      str   = ''
+    bytesPerElement:     float = 0.0
+
+
+ElementCosts = NewType('ElementCosts', List[ElementCost])
+
+
+class AllocationTracing:
+    """
+    Traces allocations for the duration;  Leaves tracing alone if someone else started it
+    """
+    def __init__(self):
+        self._started: bool = False
+
+    def __enter__(self):
+        if is_tracing() is False:
+            startTracing()
+            self._started = True
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        if self._started is True:
+            stopTracing()
+
+
+class MemoryBenchmark(StageBenchmark):
+    """
+    The memory mode of the stage benchmark;  Traces allocations with tracemalloc instead of
+    timing.  Each stage runs once.  Reports what each stage allocated at its peak, what it
+    left allocated and how far it raised the process RSS high water mark.  tracemalloc adds
+    its own overhead to the RSS.  Run as
+
+        python -m umlio.benchmark.MemoryBenchmark --sweep classesPerDiagram=100,1000 --cost UmlClass:methodsPerClass=0,5,20
+    """
+    def __init__(self, compressionProfile: CompressionProfile = CompressionProfile.BALANCED, shapeStages: bool = True):
+
+        super().__init__(repetitions=1, compressionProfile=compressionProfile, shapeStages=shapeStages)
+
+    def measure(self, generatorParameters: GeneratorParameters) -> MemoryMeasurement:   # type: ignore[override]
+        """
+        Returns:  The memory used by each stage and call for one generated project
+        """
+        xml: bytes = ProjectGenerator(generatorParameters=generatorParameters).generateXml()
+
+        measurement:   MemoryMeasurement = MemoryMeasurement(generatorParameters=generatorParameters, xmlBytes=len(xml))
+        stageMemories: StageMemories     = measurement.stageMemories
+
+        runStage: StageRunner = partial(self._traceStage, stageMemories)
+
+        with AllocationTracing():
+            measurement.compressedBytes = self._runPipeline(xml=xml, runStage=runStage)
+            self._runCalls(xml=xml, runStage=runStage)
+
+        self.logger.info(f'{len(xml)} XML bytes: {stageMemories}')
+
+        return measurement
+
+    def elementCosts(self, elementName: str, parameterName: str, values: List[int], generatorParameters: GeneratorParameters = ISOLATED_ELEMENTS) -> ElementCosts:
+        """
+        Args:
+            elementName:          One of ELEMENT_PARAMETERS, e.g. UmlClass
+            parameterName:        What varies, e.g. methodsPerClass
+            values:               The values it takes, one cost each
+            generatorParameters:  The values of the other parameters
+
+        Returns:  The cost of a single element for each value
+        """
+        return ElementCosts([
+            self.elementCost(elementName=elementName, generatorParameters=replace(generatorParameters, **{parameterName: value})) for value in values
+        ])
+
+    def elementCost(self, elementName: str, generatorParameters: GeneratorParameters, elementCount: int = ELEMENT_COUNT) -> ElementCost:
+        """
+        The difference between a project with elementCount of the element in each diagram and one
+        with none;  Divided by the number of elements
+
+        Returns:  The bytes one element keeps alive once the project is loaded
+        """
+        assert elementName in ELEMENT_PARAMETERS, f'No generator parameter for {elementName}'
+
+        countName:            str                 = ELEMENT_PARAMETERS[elementName]
+        withElements:         GeneratorParameters = replace(generatorParameters, **{countName: elementCount})
+        withoutElementsBytes: int                 = self._loadedBytes(generatorParameters=replace(generatorParameters, **{countName: 0}))
+        withElementsBytes:    int                 = self._loadedBytes(generatorParameters=withElements)
+
+        return ElementCost(
+            elementName=elementName,
+            generatorParameters=withElements,
+            representation='shapes' if self.shapeStages is True else 'intermediate',
+            bytesPerElement=(withElementsBytes - withoutElementsBytes) / (elementCount * withElements.diagrams)
+        )
+
+    def memoryResults(self, measurements: MemoryMeasurements, elementCosts: ElementCosts) -> Dict[str, Any]:
+        """
+        Returns:  The stage results plus the element costs;  Ready for JSON
+        """
+        memoryResults: Dict[str, Any] = self.results(measurements=measurements)     # type: ignore[arg-type]
+
+        memoryResults['stages']       = MEMORY_STAGES
+        memoryResults['elementCosts'] = [asdict(elementCost) for elementCost in elementCosts]
+
+        return memoryResults
+
+    def _runCalls(self, xml: bytes, runStage: StageRunner):
+        """
+        The public read and write calls on a project file;  End to end, so they include what
+        the pipeline stages split apart
+        """
+        with TemporaryDirectory() as temporaryDirectory:
+            xmlFileName:     Path = Path(temporaryDirectory) / 'Generated.xml'
+            projectFileName: Path = Path(temporaryDirectory) / 'Generated.udt'
+
+            xmlFileName.write_bytes(xml)
+            ProjectConverter(compressionProfile=self._compressionProfile).convert(fileName=xmlFileName, outputFileName=projectFileName)
+
+            runStage(STAGE_READ_IR, lambda: IRReader().readProjectFile(fileName=projectFileName))
+
+            if self.shapeStages is True:
+                from umlio.Reader import Reader
+                from umlio.Writer import Writer
+
+                umlProject: UmlProject = runStage(STAGE_READ_PROJECT_FILE, lambda: Reader().readProjectFile(fileName=projectFileName))
+
+                runStage(STAGE_DESERIALIZE_XML, lambda: self._deserializeXml(xml=xml, fileName=xmlFileName))
+                runStage(STAGE_WRITE_FILE,      lambda: Writer().writeFile(umlProject=umlProject, fileName=Path(temporaryDirectory) / 'Written.udt'))
+
+    def _deserializeXml(self, xml: bytes, fileName: Path) -> UmlProject:
+        """
+        Returns:  The project;  So that it counts as retained
+        """
+        from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+
+        xmlToUmlShapes: XmlToUmlShapes = XmlToUmlShapes()
+        xmlToUmlShapes.deserializeXml(xmlString=xml.decode(GENERATOR_ENCODING), fileName=fileName)
+
+        return xmlToUmlShapes.umlProject
+
+    def _traceStage(self, stageMemories: StageMemories, stageName: str, stage: Callable[[], StageResult]) -> StageResult:
+        """
+        Holds on to the stage's result until its retained memory is counted
+
+        Returns:  What the stage returned
+        """
+        collect()
+        startBytes, _ = get_traced_memory()
+        startRss: Optional[int] = peakRss()
+        reset_peak()
+
+        result: StageResult = stage()
+
+        _, peakBytes = get_traced_memory()
+        collect()
+        retainedBytes, _ = get_traced_memory()
+        endRss: Optional[int] = peakRss()
+
+        stageMemories[stageName] = StageMemory(
+            peakBytes=peakBytes - startBytes,
+            retainedBytes=retainedBytes - startBytes,
+            peakRssBytes=endRss,
+            rssGrowthBytes=None if endRss is None or startRss is None else endRss - startRss
+        )
+
+        return result
+
+    def _loadedBytes(self, generatorParameters: GeneratorParameters) -> int:
+        """
+        Returns:  What a loaded project keeps allocated;  The parse tree and the other
+        intermediate results are gone by then
+        """
+        xml: bytes = ProjectGenerator(generatorParameters=generatorParameters).generateXml()
+
+        with AllocationTracing():
+            collect()
+            startBytes, _ = get_traced_memory()
+
+            loaded: Any = self._resolveLinks(builtDiagrams=self._buildModels(umlProjectElement=self._parse(xml=xml)))
+            if self.shapeStages is True:
+                loaded = self._buildShapes(projectIR=loaded)
+
+            collect()
+            loadedBytes, _ = get_traced_memory()
+
+        del loaded
+
+        return loadedBytes - startBytes
+
+
+def parseCost(cost: str) -> Tuple[str, str, List[int]]:
+    """
+    Args:
+        cost:  As in UmlClass:methodsPerClass=0,5,20
+
+    Returns:  The element name, the parameter name and its values
+    """
+    elementName, _, sweep = cost.partition(':')
+    parameterName, values = parseSweep(sweep=sweep)
+
+    return elementName, parameterName, values
+
+
+@command()
+@option('-s', '--sweep', 'sweeps', multiple=True, default=['classesPerDiagram=100,1000'], show_default=True,
+        help='A generator parameter and its values;  Repeat for more sweeps')
+@option('-c', '--cost', 'costs', multiple=True, default=['UmlClass:methodsPerClass=0,5,20', 'UmlLink:controlPointsPerLink=0,2,8'], show_default=True,
+        help='An element, the generator parameter to vary and its values;  Repeat for more elements')
+@option('-p', '--profile', type=Choice([profile.value for profile in CompressionProfile.availableProfiles()]),
+        default=CompressionProfile.BALANCED.value, show_default=True, help='The compression the codec stages use')
+@option('--no-shapes', 'noShapes', is_flag=True, default=False, help='Skip the stages that need wx')
+@option('-o', '--output', 'outputFileName', type=Path, default=None, help='Write the JSON results here instead of standard output')
+def memoryHandler(sweeps: Tuple[str, ...], costs: Tuple[str, ...], profile: str, noShapes: bool, outputFileName: Path | None):
+    """
+    Measure the memory each read and write stage uses over sweeps of generated project sizes;
+    And what a single class, note, link or lollipop costs once loaded
+    """
+    memoryBenchmark: MemoryBenchmark    = MemoryBenchmark(compressionProfile=CompressionProfile(profile), shapeStages=not noShapes)
+    measurements:    MemoryMeasurements = MemoryMeasurements([])
+    elementCosts:    ElementCosts       = ElementCosts([])
+    for sweep in sweeps:
+        parameterName, values = parseSweep(sweep=sweep)
+        measurements.extend(memoryBenchmark.sweep(parameterName=parameterName, values=values))      # type: ignore[arg-type]
+    for cost in costs:
+        elementName, parameterName, values = parseCost(cost=cost)
+        elementCosts.extend(memoryBenchmark.elementCosts(elementName=elementName, parameterName=parameterName, values=values))
+
+    memoryResults: str = jsonDumps(memoryBenchmark.memoryResults(measurements=measurements, elementCosts=elementCosts), indent=2)
+    if outputFileName is None:
+        echo(memoryResults)
+    else:
+        outputFileName.write_text(memoryResults + '\n')
+
+
+if __name__ == '__main__':
+    memoryHandler()
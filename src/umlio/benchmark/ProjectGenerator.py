@@ -0,0 +1,237 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from random import Random
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import SubElement
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+
+from umlio.ProjectTypes import UmlDocumentType
+from umlio.ProjectTypes import XML_VERSION
+
+from umlio.XMLConstants import XmlConstants
+
+GENERATOR_ENCODING: str = 'iso-8859-1'
+INDENT_SPACES:      str = '    '
+
+DEFAULT_SEED: int = 42
+
+VISIBILITIES: List[str] = ['PUBLIC', 'PRIVATE', 'PROTECTED']
+TYPE_NAMES:   List[str] = ['int', 'float', 'str', 'bool', 'list']
+
+#
+# The links between classes;  Notes attach with NOTELINK
+#
+CLASS_LINK_TYPES:       List[str] = ['ASSOCIATION', 'AGGREGATION', 'COMPOSITION', 'INHERITANCE', 'INTERFACE']
+ASSOCIATION_LINK_TYPES: List[str] = ['ASSOCIATION', 'AGGREGATION', 'COMPOSITION']
+ATTACHMENT_SIDES:       List[str] = ['Top', 'Bottom', 'Left', 'Right']
+
+
+@dataclass
+class GeneratorParameters:
+    """
+    The shape of a generated project;  The counts are per diagram, per class or per method
+    """
+    diagrams:             int = 1
+    classesPerDiagram:    int = 10
+    methodsPerClass:      int = 3
+    parametersPerMethod:  int = 2
+    fieldsPerClass:       int = 2
+    notesPerDiagram:      int = 2
+    linksPerDiagram:      int = 10
+    controlPointsPerLink: int = 2
+    lollipopsPerDiagram:  int = 1
+    seed:                 int = DEFAULT_SEED
+
+
+class ProjectGenerator:
+    """
+    Writes a synthetic class diagram project as the serializer would.  The same parameters
+    always give the same bytes;  The names, geometry and link ends come from a seeded
+    random number generator.
+
+    Headless;  Read the XML back with Reader to get a UmlProject with shapes
+    """
+    def __init__(self, generatorParameters: GeneratorParameters):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._generatorParameters: GeneratorParameters = generatorParameters
+
+    def generateXml(self) -> bytes:
+        """
+        Returns:  The project XML, pretty printed
+        """
+        random:  Random  = Random(self._generatorParameters.seed)
+        modelId: int     = 1
+        project: Element = Element(XmlConstants.ELEMENT_UML_PROJECT, attrib={
+            XmlConstants.ATTRIBUTE_FILENAME:  'Generated.udt',
+            XmlConstants.ATTRIBUTE_VERSION:   XML_VERSION,
+            XmlConstants.ATTRIBUTE_CODE_PATH: '/generated',
+        })
+        for diagramNumber in range(self._generatorParameters.diagrams):
+            modelId = self._generateDiagram(project=project, diagramNumber=diagramNumber, firstModelId=modelId, random=random)
+
+        xmlIndent(project, space=INDENT_SPACES)
+
+        return xmlToString(project, encoding=GENERATOR_ENCODING, xml_declaration=True)
+
+    def _generateDiagram(self, project: Element, diagramNumber: int, firstModelId: int, random: Random) -> int:
+        """
+        Returns:  The next free model ID
+        """
+        p: GeneratorParameters = self._generatorParameters
+
+        diagram: Element = SubElement(project, XmlConstants.ELEMENT_UML_DIAGRAM, attrib={
+            XmlConstants.ATTRIBUTE_DOCUMENT_TYPE:     UmlDocumentType.CLASS_DOCUMENT.value,
+            XmlConstants.ATTRIBUTE_TITLE:             f'Class Diagram {diagramNumber}',
+            XmlConstants.ATTRIBUTE_SCROLL_POSITION_X: '1',
+            XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y: '1',
+            XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X: '20',
+            XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y: '20',
+        })
+        modelId:  int       = firstModelId
+        classIds: List[str] = []
+        shapeIds: List[str] = []
+        for classNumber in range(p.classesPerDiagram):
+            shapeId: str = f'class.{diagramNumber}.{classNumber}'
+            umlClass: Element = self._shapeElement(parent=diagram, elementName=XmlConstants.ELEMENT_UML_CLASS, shapeId=shapeId, random=random)
+            self._generateModelClass(umlClass=umlClass, modelId=str(modelId), className=f'Class{diagramNumber}_{classNumber}', random=random)
+
+            classIds.append(str(modelId))
+            shapeIds.append(shapeId)
+            modelId += 1
+
+        noteIds: List[str] = []
+        for noteNumber in range(p.notesPerDiagram):
+            umlNote: Element = self._shapeElement(parent=diagram, elementName=XmlConstants.ELEMENT_UML_NOTE, shapeId=f'note.{diagramNumber}.{noteNumber}', random=random)
+            SubElement(umlNote, XmlConstants.ELEMENT_MODEL_NOTE, attrib={
+                XmlConstants.ATTRIBUTE_ID:       str(modelId),
+                XmlConstants.ATTRIBUTE_CONTENT:  f'Note {noteNumber} of diagram {diagramNumber}',
+                XmlConstants.ATTRIBUTE_FILENAME: '',
+            })
+            noteIds.append(str(modelId))
+            modelId += 1
+
+        if len(classIds) > 0:
+            for linkNumber in range(p.linksPerDiagram):
+                self._generateLink(diagram=diagram, linkId=f'link.{diagramNumber}.{linkNumber}', classIds=classIds, noteIds=noteIds, random=random)
+
+            for lollipopNumber in range(p.lollipopsPerDiagram):
+                implementorNumber: int = random.randrange(len(classIds))
+                self._generateLollipop(
+                    diagram=diagram,
+                    modelId=str(modelId),
+                    interfaceName=f'IInterface{diagramNumber}_{lollipopNumber}',
+                    attachedToId=shapeIds[implementorNumber],
+                    className=f'Class{diagramNumber}_{implementorNumber}',
+                    random=random
+                )
+                modelId += 1
+
+        return modelId
+
+    def _generateModelClass(self, umlClass: Element, modelId: str, className: str, random: Random):
+
+        p: GeneratorParameters = self._generatorParameters
+
+        modelClass: Element = SubElement(umlClass, XmlConstants.ELEMENT_MODEL_CLASS, attrib={
+            XmlConstants.ATTRIBUTE_ID:                     modelId,
+            XmlConstants.ATTRIBUTE_NAME:                   className,
+            XmlConstants.ATTRIBUTE_DISPLAY_METHODS:        'True',
+            XmlConstants.ATTRIBUTE_DISPLAY_PARAMETERS:     'Display Parameters',
+            XmlConstants.ATTRIBUTE_DISPLAY_CONSTRUCTOR:    'Display',
+            XmlConstants.ATTRIBUTE_DISPLAY_DUNDER_METHODS: 'Display',
+            XmlConstants.ATTRIBUTE_DISPLAY_FIELDS:         'True',
+            XmlConstants.ATTRIBUTE_DISPLAY_STEREOTYPE:     'True',
+            XmlConstants.ATTRIBUTE_FILENAME:               f'{className}.py',
+            XmlConstants.ATTRIBUTE_DESCRIPTION:            f'I am {className}',
+        })
+        for methodNumber in range(p.methodsPerClass):
+            modelMethod: Element = SubElement(modelClass, XmlConstants.ELEMENT_MODEL_METHOD, attrib={
+                XmlConstants.ATTRIBUTE_NAME:               f'method{methodNumber}',
+                XmlConstants.ATTRIBUTE_VISIBILITY:         random.choice(VISIBILITIES),
+                XmlConstants.ATTRIBUTE_METHOD_RETURN_TYPE: random.choice(TYPE_NAMES),
+            })
+            SubElement(modelMethod, XmlConstants.ELEMENT_MODEL_SOURCE_CODE)
+            for parameterNumber in range(p.parametersPerMethod):
+                SubElement(modelMethod, XmlConstants.ELEMENT_MODEL_PARAMETER, attrib={
+                    XmlConstants.ATTRIBUTE_NAME:           f'parameter{parameterNumber}',
+                    XmlConstants.ATTRIBUTE_PARAMETER_TYPE: random.choice(TYPE_NAMES),
+                    XmlConstants.ATTRIBUTE_DEFAULT_VALUE:  str(random.randrange(100)),
+                })
+
+        for fieldNumber in range(p.fieldsPerClass):
+            SubElement(modelClass, XmlConstants.ELEMENT_MODEL_FIELD, attrib={
+                XmlConstants.ATTRIBUTE_NAME:          f'field{fieldNumber}',
+                XmlConstants.ATTRIBUTE_VISIBILITY:    random.choice(VISIBILITIES),
+                XmlConstants.ATTRIBUTE_FIELD_TYPE:    random.choice(TYPE_NAMES),
+                XmlConstants.ATTRIBUTE_DEFAULT_VALUE: str(random.randrange(100)),
+            })
+
+    def _generateLink(self, diagram: Element, linkId: str, classIds: List[str], noteIds: List[str], random: Random):
+        """
+        About half the links start at a note when the diagram has notes
+        """
+        linkType: str = random.choice(CLASS_LINK_TYPES)
+
+        sourceId, destinationId = random.sample(classIds, 2) if len(classIds) > 1 else (classIds[0], classIds[0])
+        if len(noteIds) > 0 and random.random() < 0.5:
+            linkType = 'NOTELINK'
+            sourceId = random.choice(noteIds)
+
+        umlLink: Element = SubElement(diagram, XmlConstants.ELEMENT_UML_LINK, attrib={
+            XmlConstants.ATTRIBUTE_ID:          linkId,
+            XmlConstants.ATTRIBUTE_LINK_FROM_X: str(random.randrange(2000)),
+            XmlConstants.ATTRIBUTE_LINK_FROM_Y: str(random.randrange(2000)),
+            XmlConstants.ATTRIBUTE_LINK_TO_X:   str(random.randrange(2000)),
+            XmlConstants.ATTRIBUTE_LINK_TO_Y:   str(random.randrange(2000)),
+            XmlConstants.ATTRIBUTE_SPLINE:      'False',
+        })
+        for _ in range(self._generatorParameters.controlPointsPerLink):
+            SubElement(umlLink, XmlConstants.ELEMENT_MODEL_LINE_CONTROL_POINT, attrib={
+                XmlConstants.ATTRIBUTE_X: str(random.randrange(2000)),
+                XmlConstants.ATTRIBUTE_Y: str(random.randrange(2000)),
+            })
+        if linkType in ASSOCIATION_LINK_TYPES:
+            for labelName in [XmlConstants.ELEMENT_ASSOCIATION_LABEL, XmlConstants.ELEMENT_ASSOCIATION_SOURCE_LABEL, XmlConstants.ELEMENT_ASSOCIATION_DESTINATION_LABEL]:
+                SubElement(umlLink, labelName, attrib={XmlConstants.ATTRIBUTE_DELTA_X: '0', XmlConstants.ATTRIBUTE_DELTA_Y: '0'})
+
+        SubElement(umlLink, XmlConstants.ELEMENT_MODEL_LINK, attrib={
+            XmlConstants.ATTRIBUTE_NAME:                          f'{linkType.lower()} {linkId}',
+            XmlConstants.ATTRIBUTE_LINK_TYPE:                     linkType,
+            XmlConstants.ATTRIBUTE_SOURCE_ID:                     sourceId,
+            XmlConstants.ATTRIBUTE_DESTINATION_ID:                destinationId,
+            XmlConstants.ATTRIBUTE_BIDIRECTIONAL:                 'False',
+            XmlConstants.ATTRIBUTE_SOURCE_CARDINALITY_VALUE:      '1',
+            XmlConstants.ATTRIBUTE_DESTINATION_CARDINALITY_VALUE: '*',
+        })
+
+    def _generateLollipop(self, diagram: Element, modelId: str, interfaceName: str, attachedToId: str, className: str, random: Random):
+
+        lollipop: Element = SubElement(diagram, XmlConstants.ELEMENT_LOLLIPOP, attrib={
+            XmlConstants.ATTRIBUTE_LINE_CENTUM:     f'{random.random():.2f}',
+            XmlConstants.ATTRIBUTE_ATTACHMENT_SIDE: random.choice(ATTACHMENT_SIDES),
+            XmlConstants.ATTRIBUTE_ATTACHED_TO_ID:  attachedToId,
+        })
+        modelInterface: Element = SubElement(lollipop, XmlConstants.ELEMENT_MODEL_INTERFACE, attrib={
+            XmlConstants.ATTRIBUTE_ID:          modelId,
+            XmlConstants.ATTRIBUTE_NAME:        interfaceName,
+            XmlConstants.ATTRIBUTE_DESCRIPTION: '',
+        })
+        SubElement(modelInterface, XmlConstants.ELEMENT_MODEL_IMPLEMENTOR, attrib={XmlConstants.ELEMENT_MODEL_IMPLEMENTING_CLASS_NAME: className})
+
+    def _shapeElement(self, parent: Element, elementName: str, shapeId: str, random: Random) -> Element:
+        return SubElement(parent, elementName, attrib={
+            XmlConstants.ATTRIBUTE_ID:     shapeId,
+            XmlConstants.ATTRIBUTE_WIDTH:  str(100 + random.randrange(200)),
+            XmlConstants.ATTRIBUTE_HEIGHT: str(50 + random.randrange(150)),
+            XmlConstants.ATTRIBUTE_X:      str(random.randrange(4000)),
+            XmlConstants.ATTRIBUTE_Y:      str(random.randrange(4000)),
+        })
@@ -0,0 +1,381 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import TypeVar
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import replace
+
+from datetime import datetime
+from datetime import timezone
+
+from importlib.util import find_spec
+
+from json import dumps as jsonDumps
+
+from pathlib import Path
+
+from platform import platform
+from platform import python_version
+
+from time import perf_counter
+
+from xml.etree.ElementTree import Element as XmlElement
+from xml.etree.ElementTree import fromstring as xmlFromString
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+
+from click import Choice
+from click import IntRange
+from click import command
+from click import echo
+from click import option
+
+from defusedxml.sax import make_parser
+
+from untangle import Element
+from untangle import Handler
+
+from umlio import __version__
+
+from umlio.IOTypes import UmlProject
+
+from umlio.IRTypes import ClassIRs
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import LinkIRs
+from umlio.IRTypes import LollipopIRs
+from umlio.IRTypes import NoteIRs
+from umlio.IRTypes import ProjectIR
+from umlio.IRTypes import TextIRs
+
+from umlio.XMLConstants import XmlConstants
+
+from umlio.benchmark.ProjectGenerator import GeneratorParameters
+from umlio.benchmark.ProjectGenerator import INDENT_SPACES
+from umlio.benchmark.ProjectGenerator import ProjectGenerator
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+from umlio.deserializer.XmlToDiagramIR import ModelObjects
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
+
+#
+# The shape stages import wx;  They are loaded only when those stages run
+#
+if TYPE_CHECKING:
+    from umlio.serializer.UmlShapesToXml import UmlShapesToXml
+
+REPETITIONS: int = 3
+
+#
+# In pipeline order;  A read runs the first six, a write the last three
+#
+STAGE_DECOMPRESS:      str = 'decompress'
+STAGE_PARSE:           str = 'parse'
+STAGE_MODEL_BUILD:     str = 'modelBuild'
+STAGE_LINK_RESOLUTION: str = 'linkResolution'
+STAGE_SHAPE_BUILD:     str = 'shapeBuild'
+STAGE_SERIALIZE:       str = 'serialize'
+STAGE_PRETTY_PRINT:    str = 'prettyPrint'
+STAGE_COMPRESS:        str = 'compress'
+
+STAGES: List[str] = [
+    STAGE_DECOMPRESS, STAGE_PARSE, STAGE_MODEL_BUILD, STAGE_LINK_RESOLUTION,
+    STAGE_SHAPE_BUILD, STAGE_SERIALIZE, STAGE_PRETTY_PRINT, STAGE_COMPRESS
+]
+#
+# These need wx;  Without it they are reported as None
+#
+SHAPE_STAGES: List[str] = [STAGE_SHAPE_BUILD, STAGE_SERIALIZE]
+
+SWEEPABLE_PARAMETERS: List[str] = [parameter.name for parameter in fields(GeneratorParameters) if parameter.name != 'seed']
+
+StageResult = TypeVar('StageResult')
+
+StageRunner = Callable[[str, Callable[[], Any]], Any]
+
+StageSeconds = NewType('StageSeconds', Dict[str, Optional[float]])
+
+BuiltDiagrams = NewType('BuiltDiagrams', List[Tuple[Element, DiagramIR]])
+
+
+def stageSecondsFactory() -> StageSeconds:
+    return StageSeconds({stageName: None for stageName in STAGES})
+
+
+def shapeLayerAvailable() -> bool:
+    """
+    Checks without importing;  Importing wx is the expensive part
+    """
+    return find_spec('wx') is not None
+
+
+@dataclass
+class StageMeasurement:
+    generatorParameters: GeneratorParameters
+    xmlBytes:            int          = 0
+    compressedBytes:     int          = 0
+    stageSeconds:        StageSeconds = field(default_factory=stageSecondsFactory)
+
+
+StageMeasurements = NewType('StageMeasurements', List[StageMeasurement])
+
+
+class StageBenchmark:
+    """
+    Times each stage of a read and a write on generated projects;  A sweep varies one
+    generator parameter and keeps the rest.  Each stage reports the best of the repetitions.
+    Headless unless wx is installed, in which case the shape stages are timed too.  Run as
+
+        python -m umlio.benchmark.StageBenchmark --sweep classesPerDiagram=10,100,1000 --output results.json
+    """
+    def __init__(self, repetitions: int = REPETITIONS, compressionProfile: CompressionProfile = CompressionProfile.BALANCED, shapeStages: bool = True):
+        """
+        Args:
+            repetitions:         How many times each stage runs
+            compressionProfile:  What the compress and decompress stages use
+            shapeStages:         When False, skip the wx stages even if wx is installed
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._repetitions:        int                = repetitions
+        self._compressionProfile: CompressionProfile = compressionProfile
+        self._shapeStages:        bool               = shapeStages and shapeLayerAvailable()
+
+        self._app: Any = None
+
+    @property
+    def shapeStages(self) -> bool:
+        """
+        Returns:  True when the shape build and serialize stages are timed
+        """
+        return self._shapeStages
+
+    def sweep(self, parameterName: str, values: List[int], generatorParameters: GeneratorParameters = GeneratorParameters()) -> StageMeasurements:
+        """
+        Args:
+            parameterName:        One of SWEEPABLE_PARAMETERS
+            values:               The values it takes, one measurement each
+            generatorParameters:  The values of the other parameters
+
+        Returns:  The measurements in the order of the values
+        """
+        assert parameterName in SWEEPABLE_PARAMETERS, f'Cannot sweep {parameterName}'
+
+        measurements: StageMeasurements = StageMeasurements([])
+        for value in values:
+            measurements.append(self.measure(generatorParameters=replace(generatorParameters, **{parameterName: value})))
+
+        return measurements
+
+    def measure(self, generatorParameters: GeneratorParameters) -> StageMeasurement:
+        """
+        Returns:  The stage timings for one generated project
+        """
+        xml: bytes = ProjectGenerator(generatorParameters=generatorParameters).generateXml()
+
+        measurement:  StageMeasurement = StageMeasurement(generatorParameters=generatorParameters, xmlBytes=len(xml))
+        stageSeconds: StageSeconds     = measurement.stageSeconds
+
+        measurement.compressedBytes = self._runPipeline(xml=xml, runStage=lambda stageName, stage: self._timeStage(stageSeconds, stageName, stage))
+
+        self.logger.info(f'{len(xml)} XML bytes: {stageSeconds}')
+
+        return measurement
+
+    def results(self, measurements: StageMeasurements) -> Dict[str, Any]:
+        """
+        Returns:  The measurements and the environment they were taken in;  Ready for JSON
+        """
+        return {
+            'umlioVersion':       __version__,
+            'pythonVersion':      python_version(),
+            'platform':           platform(),
+            'timestamp':          datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'repetitions':        self._repetitions,
+            'compressionProfile': self._compressionProfile.value,
+            'stages':             STAGES,
+            'results':            [asdict(measurement) for measurement in measurements],
+        }
+
+    def writeResults(self, measurements: StageMeasurements, fileName: Path):
+        fileName.write_text(jsonDumps(self.results(measurements=measurements), indent=2) + '\n')
+
+    def _runPipeline(self, xml: bytes, runStage: StageRunner) -> int:
+        """
+        Each stage works on the output of the one before it, so that every stage sees a
+        realistic input
+
+        Args:
+            xml:       The project document
+            runStage:  Runs a stage by name and returns what the stage returned
+
+        Returns:  The compressed size
+        """
+        codec:      Codec = self._compressionProfile.codec
+        compressed: bytes = codec.compress(xml)
+
+        runStage(STAGE_DECOMPRESS, lambda: codec.decompress(compressed))
+
+        umlProjectElement: Element       = runStage(STAGE_PARSE,           lambda: self._parse(xml=xml))
+        builtDiagrams:     BuiltDiagrams = runStage(STAGE_MODEL_BUILD,     lambda: self._buildModels(umlProjectElement=umlProjectElement))
+        projectIR:         ProjectIR     = runStage(STAGE_LINK_RESOLUTION, lambda: self._resolveLinks(builtDiagrams=builtDiagrams))
+
+        if self._shapeStages is True:
+            umlProject: UmlProject = runStage(STAGE_SHAPE_BUILD, lambda: self._buildShapes(projectIR=projectIR))
+            runStage(STAGE_SERIALIZE, lambda: self._serialize(umlProject=umlProject))
+
+        projectElement: XmlElement = xmlFromString(xml)
+        runStage(STAGE_PRETTY_PRINT, lambda: self._prettyPrint(projectElement=projectElement))
+        runStage(STAGE_COMPRESS,     lambda: codec.compress(xml))
+
+        return len(compressed)
+
+    def _timeStage(self, stageSeconds: StageSeconds, stageName: str, stage: Callable[[], StageResult]) -> StageResult:
+        """
+        Returns:  What the last repetition of the stage returned
+        """
+        bestSeconds: float = float('inf')
+        for _ in range(self._repetitions):
+            startTime: float = perf_counter()
+            result: StageResult = stage()
+            bestSeconds = min(bestSeconds, perf_counter() - startTime)
+
+        stageSeconds[stageName] = bestSeconds
+
+        return result
+
+    def _parse(self, xml: bytes) -> Element:
+        """
+        As XmlToDiagramIR.deserializeXmlChunks parses
+        """
+        handler: Handler = Handler()
+        parser           = make_parser()
+
+        parser.setContentHandler(handler)
+        parser.feed(xml)
+        parser.close()
+
+        return handler.root.UmlProject
+
+    def _buildModels(self, umlProjectElement: Element) -> BuiltDiagrams:
+        """
+        The class diagram half of XmlToDiagramIR.deserializeUmlDiagram that precedes the links
+        """
+        xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+        builtDiagrams:  BuiltDiagrams  = BuiltDiagrams([])
+        for umlDiagramElement in umlProjectElement.get_elements(XmlConstants.ELEMENT_UML_DIAGRAM):
+            diagramIR: DiagramIR = xmlToDiagramIR.createDiagramIR(umlDiagramElement=umlDiagramElement)
+
+            diagramIR.classIRs    = ClassIRs([xmlToDiagramIR.toClassIR(classElement=e) for e in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_CLASS)])
+            diagramIR.noteIRs     = NoteIRs([xmlToDiagramIR.toNoteIR(noteElement=e) for e in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_NOTE)])
+            diagramIR.textIRs     = TextIRs([xmlToDiagramIR.toTextIR(textElement=e) for e in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_TEXT)])
+            diagramIR.lollipopIRs = LollipopIRs([xmlToDiagramIR.toLollipopIR(lollipopElement=e) for e in umlDiagramElement.get_elements(XmlConstants.ELEMENT_LOLLIPOP)])
+
+            builtDiagrams.append((umlDiagramElement, diagramIR))
+
+        return builtDiagrams
+
+    def _resolveLinks(self, builtDiagrams: BuiltDiagrams) -> ProjectIR:
+        """
+        Returns:  The complete intermediate representation
+        """
+        xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+        projectIR:      ProjectIR      = ProjectIR()
+        for umlDiagramElement, diagramIR in builtDiagrams:
+            modelObjects: ModelObjects = xmlToDiagramIR.buildModelObjects(diagramIR=diagramIR)
+
+            diagramIR.linkIRs = LinkIRs([
+                xmlToDiagramIR.toLinkIR(umlLinkElement=e, modelObjects=modelObjects) for e in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_LINK)
+            ])
+            projectIR.diagramIRs[diagramIR.documentTitle] = diagramIR
+
+        return projectIR
+
+    def _buildShapes(self, projectIR: ProjectIR) -> UmlProject:
+        """
+        Includes the link shapes;  They cannot be built apart from the shapes at their ends
+        """
+        from wx import App
+        from wx import GetApp
+
+        from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+
+        if GetApp() is None:
+            self._app = App()
+
+        return DiagramIRToUmlShapes().materializeProject(projectIR=projectIR)
+
+    def _serialize(self, umlProject: UmlProject) -> 'UmlShapesToXml':
+        """
+        Returns:  The serializer;  Its XML is not pretty printed yet
+        """
+        from umlio.serializer.UmlShapesToXml import UmlShapesToXml
+
+        umlShapesToXml: UmlShapesToXml = UmlShapesToXml(projectFileName=umlProject.fileName, projectCodePath=umlProject.codePath)
+        for umlDocument in umlProject.umlDocuments.values():
+            umlShapesToXml.serialize(umlDiagram=umlDocument)
+
+        return umlShapesToXml
+
+    def _prettyPrint(self, projectElement: XmlElement) -> bytes:
+        """
+        Indenting again replaces the earlier indentation;  So each repetition does the same work
+        """
+        xmlIndent(projectElement, space=INDENT_SPACES)
+
+        return xmlToString(projectElement, encoding='iso-8859-1', xml_declaration=True)
+
+
+def parseSweep(sweep: str) -> Tuple[str, List[int]]:
+    """
+    Args:
+        sweep:  As in classesPerDiagram=10,100,1000
+
+    Returns:  The parameter name and its values
+    """
+    parameterName, _, values = sweep.partition('=')
+
+    return parameterName, [int(value) for value in values.split(',')]
+
+
+@command()
+@option('-s', '--sweep', 'sweeps', multiple=True, default=['classesPerDiagram=10,100,1000'], show_default=True,
+        help='A generator parameter and its values;  Repeat for more sweeps')
+@option('-r', '--repetitions', type=IntRange(min=1), default=REPETITIONS, show_default=True, help='Runs per stage;  The best one counts')
+@option('-p', '--profile', type=Choice([profile.value for profile in CompressionProfile.availableProfiles()]),
+        default=CompressionProfile.BALANCED.value, show_default=True, help='The compression the codec stages use')
+@option('--no-shapes', 'noShapes', is_flag=True, default=False, help='Skip the stages that need wx')
+@option('-o', '--output', 'outputFileName', type=Path, default=None, help='Write the JSON results here instead of standard output')
+def benchmarkHandler(sweeps: Tuple[str, ...], repetitions: int, profile: str, noShapes: bool, outputFileName: Path | None):
+    """
+    Time each read and write stage over sweeps of generated project sizes.  Parameters
+    that can be swept are diagrams, classesPerDiagram, methodsPerClass, parametersPerMethod,
+    fieldsPerClass, notesPerDiagram, linksPerDiagram, controlPointsPerLink and lollipopsPerDiagram
+    """
+    stageBenchmark: StageBenchmark    = StageBenchmark(repetitions=repetitions, compressionProfile=CompressionProfile(profile), shapeStages=not noShapes)
+    measurements:   StageMeasurements = StageMeasurements([])
+    for sweep in sweeps:
+        parameterName, values = parseSweep(sweep=sweep)
+        measurements.extend(stageBenchmark.sweep(parameterName=parameterName, values=values))
+
+    if outputFileName is None:
+        echo(jsonDumps(stageBenchmark.results(measurements=measurements), indent=2))
+    else:
+        stageBenchmark.writeResults(measurements=measurements, fileName=outputFileName)
+
+
+if __name__ == '__main__':
+    benchmarkHandler()
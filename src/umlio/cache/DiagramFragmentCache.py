@@ -0,0 +1,81 @@
+from typing import Dict
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from umlio.ProjectTypes import UmlDocumentTitle
+
+from umlio.cache.ParseCache import CacheStatistics
+
+
+@dataclass
+class CachedFragment:
+    fingerprint: bytes
+    fragment:    bytes
+
+
+class DiagramFragmentCache:
+    """
+    An in memory cache of each diagram's serialized XML.  An entry is reused only while
+    the diagram's fingerprint still matches;  See DiagramFingerprint.  So an edit anywhere
+    in a diagram, including its document attributes, invalidates it.
+
+    Only the diagrams that changed are serialized;  The others are neither built as element
+    trees nor indented nor encoded
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._entries:    Dict[UmlDocumentTitle, CachedFragment] = {}
+        self._statistics: CacheStatistics                        = CacheStatistics()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """
+        Hits are reused diagrams;  Misses are re-serialized ones
+        """
+        return self._statistics
+
+    def load(self, documentTitle: UmlDocumentTitle, fingerprint: bytes) -> bytes | None:
+        """
+        Args:
+            documentTitle:  The diagram title
+            fingerprint:    The diagram's current fingerprint
+
+        Returns:  The cached fragment or None when the diagram is new or changed
+        """
+        cachedFragment: CachedFragment | None = self._entries.get(documentTitle)
+        if cachedFragment is None or cachedFragment.fingerprint != fingerprint:
+            self._statistics.misses += 1
+            return None
+
+        self._statistics.hits += 1
+        return cachedFragment.fragment
+
+    def store(self, documentTitle: UmlDocumentTitle, fingerprint: bytes, fragment: bytes):
+        """
+        Args:
+            documentTitle:  The diagram title
+            fingerprint:    The fingerprint of the diagram that was serialized
+            fragment:       The serialized diagram
+        """
+        self._entries[documentTitle] = CachedFragment(fingerprint=fingerprint, fragment=fragment)
+        self._statistics.stores += 1
+
+    def retain(self, documentTitles: list[UmlDocumentTitle]):
+        """
+        Forget the diagrams that were removed or renamed
+
+        Args:
+            documentTitles:  The titles of the diagrams just saved
+        """
+        for documentTitle in list(self._entries.keys()):
+            if documentTitle not in documentTitles:
+                del self._entries[documentTitle]
+                self._statistics.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,267 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import replace as osReplace
+from os import stat_result
+from os import utime as osUtime
+
+from pathlib import Path
+
+from tempfile import NamedTemporaryFile
+
+from pickle import HIGHEST_PROTOCOL
+from pickle import UnpicklingError
+from pickle import dumps as pickleDumps
+from pickle import loads as pickleLoads
+
+from umlmodel import __version__ as umlModelVersion
+
+from umlshapes import __version__ as umlShapesVersion
+
+from umlio import __version__ as umlIOVersion
+
+from umlio.IRTypes import IR_VERSION
+from umlio.IRTypes import ProjectIR
+
+DEFAULT_MAXIMUM_CACHE_SIZE: int = 256 * 1024 * 1024
+
+HASH_CHUNK_SIZE:  int = 1024 * 1024
+INDEX_FILE_NAME:  str = 'index.json'
+ENTRY_SUFFIX:     str = '.ir'
+TEMPORARY_SUFFIX: str = '.tmp'
+
+#
+# Entries are pickled umlmodel and umlshapes objects;  A newer package may still unpickle an old
+# entry but leave out attributes it added.  So the entries of other versions are never looked up
+#
+ENTRY_VERSION: str = f'ir{IR_VERSION}-umlio{umlIOVersion}-umlmodel{umlModelVersion}-umlshapes{umlShapesVersion}'
+
+
+EntryStat = tuple[Path, stat_result]
+
+
+@dataclass
+class CacheStatistics:
+    hits:      int = 0
+    misses:    int = 0
+    stores:    int = 0
+    evictions: int = 0
+
+    @property
+    def hitRatio(self) -> float:
+        lookups: int = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+@dataclass
+class FileSignature:
+    """
+    What the index remembers about a project file;  When the size and modification
+    time still match, the content hash is reused instead of recomputed
+    """
+    size:          int
+    modifiedTime:  int
+    contentHash:   str
+
+
+class ParseCache:
+    """
+    An on disk cache of parsed projects.  Each entry is the pickled ProjectIR of a project
+    file, named after the hash of the file's content.  So renamed or copied files still hit.
+    An index keyed by file name keeps each file's size, modification time and hash;  Unchanged
+    files are not rehashed.
+
+    Entries are evicted least recently used first once the cache outgrows maximumSize.
+    Entry names carry ENTRY_VERSION;  After an upgrade the old entries just age out.
+
+    Processes may share the directory;  The cache is only bookkeeping, so a store that fails
+    is logged and never fails the read.  Only point this at a directory you own;  Loading an
+    entry unpickles it
+    """
+    def __init__(self, cacheDirectory: Path, maximumSize: int = DEFAULT_MAXIMUM_CACHE_SIZE):
+        """
+
+        Args:
+            cacheDirectory: Where to keep the entries;  Created if it does not exist
+            maximumSize:    The cap on the total size of the entries, in bytes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: Path            = cacheDirectory
+        self._maximumSize:    int             = maximumSize
+        self._statistics:     CacheStatistics = CacheStatistics()
+
+        self._cacheDirectory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cacheDirectory(self) -> Path:
+        return self._cacheDirectory
+
+    @property
+    def maximumSize(self) -> int:
+        return self._maximumSize
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """
+        The hit and miss counts since this cache was created
+        """
+        return self._statistics
+
+    def load(self, fileName: Path) -> ProjectIR | None:
+        """
+        Args:
+            fileName:  The project file
+
+        Returns:  The cached ProjectIR or None on a miss
+        """
+        entryPath: Path = self._entryPath(fileName=fileName)
+        if entryPath.exists() is False:
+            self._statistics.misses += 1
+            return None
+
+        try:
+            projectIR: ProjectIR = pickleLoads(entryPath.read_bytes())
+        except (OSError, UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            self.logger.warning(f'Discarding unreadable cache entry {entryPath.name}: {e}')
+            entryPath.unlink(missing_ok=True)
+            self._statistics.misses += 1
+            return None
+
+        osUtime(entryPath)          # Recently used
+        self._statistics.hits += 1
+        self.logger.debug(f'Cache hit: {fileName}')
+
+        projectIR.fileName = fileName
+
+        return projectIR
+
+    def store(self, fileName: Path, projectIR: ProjectIR):
+        """
+        Args:
+            fileName:   The project file
+            projectIR:  What was parsed from it
+        """
+        try:
+            entryPath: Path = self._entryPath(fileName=fileName)
+            self._atomicWrite(path=entryPath, data=pickleDumps(projectIR, protocol=HIGHEST_PROTOCOL))
+            self._statistics.stores += 1
+
+            self._evict()
+        except OSError as e:
+            self.logger.warning(f'Could not cache {fileName}: {e}')
+
+    def clear(self):
+        """
+        Removes every entry and the index
+        """
+        for entryPath in self._entryPaths():
+            entryPath.unlink(missing_ok=True)
+        self._indexPath().unlink(missing_ok=True)
+
+    def _entryPath(self, fileName: Path) -> Path:
+        return self._cacheDirectory / f'{self._contentHash(fileName=fileName)}-{ENTRY_VERSION}{ENTRY_SUFFIX}'
+
+    def _contentHash(self, fileName: Path) -> str:
+        """
+        Reuses the indexed hash when the file size and modification time are unchanged.
+
+        The index is read, updated and rewritten without a lock;  When processes race, one
+        of their updates is lost.  That only costs a rehash of the file on its next lookup
+        """
+        fileStat:  stat_result = fileName.stat()
+        indexKey:  str         = str(fileName.resolve())
+
+        index:     Dict[str, Dict] = self._readIndex()
+        signature: Dict | None     = index.get(indexKey)
+        if signature is not None:
+            fileSignature: FileSignature = FileSignature(**signature)
+            if fileSignature.size == fileStat.st_size and fileSignature.modifiedTime == fileStat.st_mtime_ns:
+                return fileSignature.contentHash
+
+        contentHash = sha256()
+        with fileName.open('rb') as projectFile:
+            while chunk := projectFile.read(HASH_CHUNK_SIZE):
+                contentHash.update(chunk)
+
+        index = {indexedName: indexedSignature for indexedName, indexedSignature in index.items() if Path(indexedName).exists() is True}
+        index[indexKey] = FileSignature(size=fileStat.st_size, modifiedTime=fileStat.st_mtime_ns, contentHash=contentHash.hexdigest()).__dict__
+        try:
+            self._atomicWrite(path=self._indexPath(), data=jsonDumps(index, indent=1).encode())
+        except OSError as e:
+            self.logger.warning(f'Could not update the cache index: {e}')
+
+        return contentHash.hexdigest()
+
+    def _evict(self):
+        """
+        Least recently used first;  A hit touches its entry
+        """
+        entryStats: List[EntryStat] = sorted(self._entryStats(), key=lambda entryStat: entryStat[1].st_mtime_ns)
+        totalSize:  int             = sum(entryStat[1].st_size for entryStat in entryStats)
+
+        while totalSize > self._maximumSize and len(entryStats) > 0:
+            oldest, oldestStat = entryStats.pop(0)
+            totalSize -= oldestStat.st_size
+            oldest.unlink(missing_ok=True)
+            self._statistics.evictions += 1
+            self.logger.debug(f'Evicted: {oldest.name}')
+
+    def _entryPaths(self) -> List[Path]:
+        return list(self._cacheDirectory.glob(f'*{ENTRY_SUFFIX}'))
+
+    def _entryStats(self) -> List[EntryStat]:
+        """
+        Skips the entries another process evicted or cleared since the directory was listed
+        """
+        entryStats: List[EntryStat] = []
+        for entryPath in self._entryPaths():
+            try:
+                entryStats.append((entryPath, entryPath.stat()))
+            except FileNotFoundError:
+                self.logger.debug(f'Already gone: {entryPath.name}')
+
+        return entryStats
+
+    def _indexPath(self) -> Path:
+        return self._cacheDirectory / INDEX_FILE_NAME
+
+    def _readIndex(self) -> Dict[str, Dict]:
+
+        indexPath: Path = self._indexPath()
+        if indexPath.exists() is False:
+            return {}
+        try:
+            return cast(Dict[str, Dict], jsonLoads(indexPath.read_text()))
+        except ValueError:
+            self.logger.warning('Rebuilding the corrupt cache index')
+            return {}
+
+    def _atomicWrite(self, path: Path, data: bytes):
+        """
+        Concurrent readers never see a partial file;  Each writer gets a temporary file of its
+        own, so processes sharing the cache directory do not write over each other
+        """
+        temporaryFile = NamedTemporaryFile(dir=path.parent, prefix=f'{path.name}.', suffix=TEMPORARY_SUFFIX, delete=False)
+        temporaryPath: Path = Path(temporaryFile.name)
+        try:
+            with temporaryFile:
+                temporaryFile.write(data)
+            osReplace(temporaryPath, path)
+        except OSError:
+            temporaryPath.unlink(missing_ok=True)
+            raise
@@ -0,0 +1,35 @@
+
+from bz2 import BZ2Compressor
+from bz2 import BZ2Decompressor
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.Codec import Decompressor
+from umlio.codecs.Codec import NeedsInputDecompressor
+
+BZ2_CODEC_ID: int   = 2
+BZ2_MAGIC:    bytes = b'BZh'
+
+
+class Bz2Codec(Codec):
+
+    def __init__(self, level: int = 9):
+
+        self._level: int = level
+
+    @property
+    def name(self) -> str:
+        return 'bz2'
+
+    @property
+    def codecId(self) -> int:
+        return BZ2_CODEC_ID
+
+    def matches(self, leadingBytes: bytes) -> bool:
+        return leadingBytes.startswith(BZ2_MAGIC)
+
+    def compressor(self) -> Compressor:
+        return BZ2Compressor(self._level)
+
+    def decompressor(self) -> Decompressor:
+        return NeedsInputDecompressor(BZ2Decompressor())
@@ -0,0 +1,131 @@
+from typing import Protocol
+
+from abc import ABC
+from abc import abstractmethod
+
+MAGIC_LENGTH: int = 8       # Enough leading bytes to recognize any codec
+
+
+class Compressor(Protocol):
+    """
+    What zlib.compressobj(), bz2.BZ2Compressor, lzma.LZMACompressor and zstd's compressor have in common
+    """
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class Decompressor(ABC):
+    """
+    A bounded, incremental decompressor.  The compressed input a call could not expand
+    is kept;  Call again with empty input until needsInput is True
+    """
+    @abstractmethod
+    def decompress(self, data: bytes, maxLength: int) -> bytes:
+        """
+        Args:
+            data:       More compressed bytes;  May be empty
+            maxLength:  The most bytes to return;  -1 for no limit
+
+        Returns:  Decompressed bytes;  May be empty
+        """
+        pass
+
+    def flush(self) -> bytes:
+        """
+        Call once the compressed input is exhausted
+
+        Returns:  Whatever output is still pending
+        """
+        return b''
+
+    @property
+    @abstractmethod
+    def needsInput(self) -> bool:
+        pass
+
+    @property
+    @abstractmethod
+    def eof(self) -> bool:
+        """
+        True once the end of the compressed stream was reached
+        """
+        pass
+
+
+class Codec(ABC):
+    """
+    A compression format for project files.  Codecs are stateless;  Each call to
+    compressor() or decompressor() starts a new stream
+    """
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def codecId(self) -> int:
+        """
+        How the version 2 container records the codec of its blocks
+        """
+        pass
+
+    @abstractmethod
+    def matches(self, leadingBytes: bytes) -> bool:
+        """
+        Args:
+            leadingBytes:  The first bytes of a file;  At least MAGIC_LENGTH of them when the file is that long
+
+        Returns:  True when the bytes start a stream of this codec
+        """
+        pass
+
+    @abstractmethod
+    def compressor(self) -> Compressor:
+        pass
+
+    @abstractmethod
+    def decompressor(self) -> Decompressor:
+        pass
+
+    def compress(self, data: bytes) -> bytes:
+        compressor: Compressor = self.compressor()
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes, maxLength: int = -1) -> bytes:
+        """
+        Args:
+            data:       A complete compressed stream
+            maxLength:  The most bytes to expand;  -1 for no limit
+
+        Returns:  The decompressed bytes;  Never more than maxLength of them
+        """
+        decompressor: Decompressor = self.decompressor()
+        decompressed: bytes        = decompressor.decompress(data, maxLength)
+        if maxLength < 0 or len(decompressed) < maxLength:
+            decompressed += decompressor.flush()
+            if decompressor.eof is False:
+                raise EOFError(f'{self.name} stream ended prematurely')
+
+        return decompressed
+
+
+class NeedsInputDecompressor(Decompressor):
+    """
+    Adapts the bz2, lzma and zstd decompressors;  They already keep their unconsumed input
+    """
+    def __init__(self, decompressor):
+
+        self._decompressor = decompressor
+
+    def decompress(self, data: bytes, maxLength: int) -> bytes:
+        return self._decompressor.decompress(data, maxLength)
+
+    @property
+    def needsInput(self) -> bool:
+        return self._decompressor.needs_input
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor.eof
@@ -0,0 +1,122 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from pathlib import Path
+
+from sys import argv
+
+from time import perf_counter
+
+from umlio.ProjectTypes import PROJECT_SUFFIX
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+from umlio.sources.SourceSniffer import projectFileSource
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import XmlSource
+
+MEGABYTE:    int = 1024 * 1024
+REPETITIONS: int = 5
+
+
+@dataclass
+class CodecMeasurement:
+    fileName:          str
+    profile:           CompressionProfile
+    xmlSize:           int
+    compressedSize:    int
+    compressSeconds:   float
+    decompressSeconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.xmlSize / self.compressedSize
+
+    @property
+    def compressThroughput(self) -> float:
+        return self.xmlSize / MEGABYTE / self.compressSeconds
+
+    @property
+    def decompressThroughput(self) -> float:
+        return self.xmlSize / MEGABYTE / self.decompressSeconds
+
+
+CodecMeasurements = List[CodecMeasurement]
+
+
+class CodecBenchmark:
+    """
+    Compares the compression profiles on real project files;  Headless.  Run as
+
+        python -m umlio.codecs.CodecBenchmark project.udt [project.xml ...]
+    """
+    def __init__(self, repetitions: int = REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._repetitions: int = repetitions
+
+    def measure(self, fileNames: List[Path]) -> CodecMeasurements:
+        """
+        Args:
+            fileNames:  Project files in either format
+
+        Returns:  One measurement per file and available profile;  The best of the repetitions
+        """
+        measurements: CodecMeasurements = []
+        for fileName in fileNames:
+            xmlSource: XmlSource = projectFileSource(fileName=fileName) if fileName.suffix == PROJECT_SUFFIX else XmlFileSource(fileName=fileName)
+            xml:       bytes     = b''.join(xmlSource.chunks())
+            for profile in CompressionProfile.availableProfiles():
+                measurements.append(self._measureProfile(fileName=fileName, xml=xml, profile=profile))
+
+        return measurements
+
+    def table(self, measurements: CodecMeasurements) -> str:
+        """
+        Returns:  The measurements as a Markdown table
+        """
+        lines: List[str] = [
+            '| Project | Profile | XML bytes | Compressed bytes | Ratio | Compress MB/s | Decompress MB/s |',
+            '|---------|---------|----------:|-----------------:|------:|--------------:|----------------:|',
+        ]
+        for m in measurements:
+            lines.append(
+                f'| {m.fileName} | {m.profile.value} | {m.xmlSize} | {m.compressedSize} | {m.ratio:.1f} '
+                f'| {m.compressThroughput:.1f} | {m.decompressThroughput:.1f} |'
+            )
+        return '\n'.join(lines)
+
+    def _measureProfile(self, fileName: Path, xml: bytes, profile: CompressionProfile) -> CodecMeasurement:
+
+        codec:             Codec = profile.codec
+        compressSeconds:   float = float('inf')
+        decompressSeconds: float = float('inf')
+        compressed:        bytes = b''
+        for _ in range(self._repetitions):
+            startTime: float = perf_counter()
+            compressed = codec.compress(xml)
+            compressSeconds = min(compressSeconds, perf_counter() - startTime)
+
+            startTime = perf_counter()
+            codec.decompress(compressed)
+            decompressSeconds = min(decompressSeconds, perf_counter() - startTime)
+
+        return CodecMeasurement(
+            fileName=fileName.name,
+            profile=profile,
+            xmlSize=len(xml),
+            compressedSize=len(compressed),
+            compressSeconds=compressSeconds,
+            decompressSeconds=decompressSeconds
+        )
+
+
+if __name__ == '__main__':
+    codecBenchmark: CodecBenchmark = CodecBenchmark()
+    print(codecBenchmark.table(codecBenchmark.measure(fileNames=[Path(fileName) for fileName in argv[1:]])))
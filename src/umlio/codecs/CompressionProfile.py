@@ -0,0 +1,95 @@
+from typing import List
+
+from enum import Enum
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Bz2Codec import Bz2Codec
+from umlio.codecs.LzmaCodec import LzmaCodec
+from umlio.codecs.ZlibCodec import ZlibCodec
+from umlio.codecs.ZlibDictionaryCodec import ZlibDictionaryCodec
+from umlio.codecs.ZstdCodec import ZSTD_AVAILABLE
+from umlio.codecs.ZstdCodec import ZSTD_MAGIC
+from umlio.codecs.ZstdCodec import ZstdCodec
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+
+class CompressionProfile(Enum):
+    """
+    How a project file is compressed.  FAST suits autosave, SMALLEST or LZMA archival exports.
+    BALANCED is what every earlier release wrote.  DICTIONARY is zlib primed with the project
+    file vocabulary;  It suits small and medium projects that are saved and synced often
+    """
+    FAST       = 'fast'
+    BALANCED   = 'balanced'
+    SMALLEST   = 'smallest'
+    DICTIONARY = 'dictionary'
+    BZ2        = 'bz2'
+    LZMA       = 'lzma'
+    ZSTD       = 'zstd'
+
+    @property
+    def codec(self) -> Codec:
+
+        if self == CompressionProfile.FAST:
+            return ZlibCodec(level=1)
+        elif self == CompressionProfile.SMALLEST:
+            return ZlibCodec(level=9)
+        elif self == CompressionProfile.DICTIONARY:
+            return ZlibDictionaryCodec()
+        elif self == CompressionProfile.BZ2:
+            return Bz2Codec()
+        elif self == CompressionProfile.LZMA:
+            return LzmaCodec()
+        elif self == CompressionProfile.ZSTD:
+            if ZSTD_AVAILABLE is False:
+                raise UnsupportedFileTypeException(message='This Python does not provide zstd')
+            return ZstdCodec()
+        else:
+            return ZlibCodec()
+
+    @classmethod
+    def availableProfiles(cls) -> List['CompressionProfile']:
+        return [profile for profile in cls if profile != CompressionProfile.ZSTD or ZSTD_AVAILABLE is True]
+
+
+def codecs() -> List[Codec]:
+    """
+    Returns:  One codec of each format this Python can read
+    """
+    readableCodecs: List[Codec] = [ZlibCodec(), ZlibDictionaryCodec(), LzmaCodec(), Bz2Codec()]
+    if ZSTD_AVAILABLE is True:
+        readableCodecs.append(ZstdCodec())
+
+    return readableCodecs
+
+
+def codecForLeadingBytes(leadingBytes: bytes) -> Codec:
+    """
+    Args:
+        leadingBytes:  The first MAGIC_LENGTH bytes of a compressed project file
+
+    Returns:  The codec that wrote it
+    """
+    for codec in codecs():
+        if codec.matches(leadingBytes=leadingBytes) is True:
+            return codec
+
+    if leadingBytes.startswith(ZSTD_MAGIC):
+        raise UnsupportedFileTypeException(message='The project file is zstd compressed;  This Python does not provide zstd')
+
+    raise UnsupportedFileTypeException(message=f'Unrecognized project file compression: {leadingBytes[:4]!r}')
+
+
+def codecForId(codecId: int) -> Codec:
+    """
+    Args:
+        codecId:  As recorded by the version 2 container
+
+    Returns:  The codec that wrote its blocks
+    """
+    for codec in codecs():
+        if codec.codecId == codecId:
+            return codec
+
+    raise UnsupportedFileTypeException(message=f'Unsupported container codec: {codecId}')
@@ -0,0 +1,38 @@
+
+from lzma import FORMAT_XZ
+from lzma import LZMACompressor
+from lzma import LZMADecompressor
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.Codec import Decompressor
+from umlio.codecs.Codec import NeedsInputDecompressor
+
+LZMA_CODEC_ID: int   = 1
+XZ_MAGIC:      bytes = b'\xfd7zXZ\x00'
+
+
+class LzmaCodec(Codec):
+    """
+    The .xz container;  Slow to compress, the smallest files
+    """
+    def __init__(self, preset: int = 6):
+
+        self._preset: int = preset
+
+    @property
+    def name(self) -> str:
+        return 'lzma'
+
+    @property
+    def codecId(self) -> int:
+        return LZMA_CODEC_ID
+
+    def matches(self, leadingBytes: bytes) -> bool:
+        return leadingBytes.startswith(XZ_MAGIC)
+
+    def compressor(self) -> Compressor:
+        return LZMACompressor(format=FORMAT_XZ, preset=self._preset)
+
+    def decompressor(self) -> Decompressor:
+        return NeedsInputDecompressor(LZMADecompressor(format=FORMAT_XZ))
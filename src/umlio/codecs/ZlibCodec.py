@@ -0,0 +1,75 @@
+
+from zlib import MAX_WBITS
+from zlib import Z_DEFAULT_COMPRESSION
+from zlib import compressobj
+from zlib import decompressobj
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.Codec import Decompressor
+
+ZLIB_CODEC_ID: int = 0
+
+
+class ZlibDecompressor(Decompressor):
+    """
+    zlib hands back what it could not expand as the unconsumed tail instead of keeping it
+    """
+    def __init__(self, zdict: bytes | None = None):
+
+        self._decompressor = decompressobj() if zdict is None else decompressobj(MAX_WBITS, zdict=zdict)
+        self._unconsumedTail: bytes = b''
+
+    def decompress(self, data: bytes, maxLength: int) -> bytes:
+
+        decompressed: bytes = self._decompressor.decompress(self._unconsumedTail + data, max(maxLength, 0))
+        self._unconsumedTail = self._decompressor.unconsumed_tail
+
+        return decompressed
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+    @property
+    def needsInput(self) -> bool:
+        return len(self._unconsumedTail) == 0
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor.eof
+
+
+class ZlibCodec(Codec):
+    """
+    The legacy project file format;  zlib.compress() with its default level is the balanced profile
+    """
+    def __init__(self, level: int = Z_DEFAULT_COMPRESSION):
+
+        self._level: int = level
+
+    @property
+    def name(self) -> str:
+        return 'zlib'
+
+    @property
+    def codecId(self) -> int:
+        return ZLIB_CODEC_ID
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    def matches(self, leadingBytes: bytes) -> bool:
+        """
+        A deflate compression method nibble and a header checksum that is a multiple of 31
+        """
+        if len(leadingBytes) < 2:
+            return False
+
+        return leadingBytes[0] & 0x0F == 8 and (leadingBytes[0] * 256 + leadingBytes[1]) % 31 == 0
+
+    def compressor(self) -> Compressor:
+        return compressobj(self._level)
+
+    def decompressor(self) -> Decompressor:
+        return ZlibDecompressor()
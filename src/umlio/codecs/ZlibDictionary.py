@@ -0,0 +1,104 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from umlio.XMLConstants import XmlConstants
+
+from umlio.exceptions.UnsupportedVersion import UnsupportedVersion
+
+#
+# A preset zlib dictionary primes the compressor with the project file vocabulary;  Small files,
+# which never get far enough to learn it, shrink the most.
+#
+# Never edit a released version.  A file compressed with a dictionary can only be decompressed with
+# exactly the same bytes;  Extend the vocabulary by adding a new version and making it the latest
+#
+DICTIONARY_VERSION_1:      int = 1
+LATEST_DICTIONARY_VERSION: int = DICTIONARY_VERSION_1
+
+#
+# The XmlConstants names as of dictionary version 1;  Their values are the vocabulary
+#
+VERSION_1_ATTRIBUTES: Tuple[str, ...] = (
+    'ATTRIBUTE_VERSION', 'ATTRIBUTE_DOCUMENT_TYPE', 'ATTRIBUTE_TITLE', 'ATTRIBUTE_CODE_PATH', 'ATTRIBUTE_SCROLL_POSITION_X',
+    'ATTRIBUTE_SCROLL_POSITION_Y', 'ATTRIBUTE_PIXELS_PER_UNIT_X', 'ATTRIBUTE_PIXELS_PER_UNIT_Y', 'ATTRIBUTE_ID',
+    'ATTRIBUTE_WIDTH', 'ATTRIBUTE_HEIGHT', 'ATTRIBUTE_X', 'ATTRIBUTE_Y', 'ATTRIBUTE_NAME', 'ATTRIBUTE_DISPLAY_STEREOTYPE',
+    'ATTRIBUTE_DISPLAY_METHODS', 'ATTRIBUTE_DISPLAY_FIELDS', 'ATTRIBUTE_DISPLAY_PARAMETERS', 'ATTRIBUTE_DISPLAY_CONSTRUCTOR',
+    'ATTRIBUTE_DISPLAY_DUNDER_METHODS', 'ATTRIBUTE_STEREOTYPE', 'ATTRIBUTE_FILENAME', 'ATTRIBUTE_CONTENT',
+    'ATTRIBUTE_DESCRIPTION', 'ATTRIBUTE_VISIBILITY', 'ATTRIBUTE_MESSAGE', 'ATTRIBUTE_DEFAULT_VALUE',
+    'ATTRIBUTE_METHOD_RETURN_TYPE', 'ATTRIBUTE_SOURCE_CARDINALITY_VALUE', 'ATTRIBUTE_DESTINATION_CARDINALITY_VALUE',
+    'ATTRIBUTE_DELTA_X', 'ATTRIBUTE_DELTA_Y', 'ATTRIBUTE_LINK_FROM_X', 'ATTRIBUTE_LINK_FROM_Y', 'ATTRIBUTE_LINK_TO_X',
+    'ATTRIBUTE_LINK_TO_Y', 'ATTRIBUTE_SPLINE', 'ATTRIBUTE_LINK_TYPE', 'ATTRIBUTE_SOURCE_ID', 'ATTRIBUTE_DESTINATION_ID',
+    'ATTRIBUTE_BIDIRECTIONAL', 'ATTRIBUTE_SD_MESSAGE_SOURCE_ID', 'ATTRIBUTE_SD_MESSAGE_DESTINATION_ID',
+    'ATTRIBUTE_INSTANCE_NAME', 'ATTRIBUTE_LIFE_LINE_LENGTH', 'ATTRIBUTE_SOURCE_TIME', 'ATTRIBUTE_DESTINATION_TIME',
+    'ATTRIBUTE_IMPLEMENTING_CLASS_NAME', 'ATTRIBUTE_LINE_CENTUM', 'ATTRIBUTE_ATTACHMENT_SIDE', 'ATTRIBUTE_ATTACHED_TO_ID',
+    'ATTRIBUTE_FIELD_TYPE', 'ATTRIBUTE_PARAMETER_TYPE',
+)
+VERSION_1_ELEMENTS: Tuple[str, ...] = (
+    'ELEMENT_UML_PROJECT', 'ELEMENT_UML_DIAGRAM', 'ELEMENT_UML_CLASS', 'ELEMENT_UML_USE_CASE', 'ELEMENT_UML_ACTOR',
+    'ELEMENT_UML_NOTE', 'ELEMENT_UML_TEXT', 'ELEMENT_UML_LINK', 'ELEMENT_LOLLIPOP', 'ELEMENT_ASSOCIATION_LABEL',
+    'ELEMENT_ASSOCIATION_SOURCE_LABEL', 'ELEMENT_ASSOCIATION_DESTINATION_LABEL', 'ELEMENT_MODEL_CLASS', 'ELEMENT_MODEL_TEXT',
+    'ELEMENT_MODEL_NOTE', 'ELEMENT_MODEL_ACTOR', 'ELEMENT_MODEL_USE_CASE', 'ELEMENT_MODEL_LINK', 'ELEMENT_MODEL_INTERFACE',
+    'ELEMENT_MODEL_IMPLEMENTOR', 'ELEMENT_MODEL_IMPLEMENTING_CLASS_NAME', 'ELEMENT_MODEL_METHOD', 'ELEMENT_MODEL_PARAMETER',
+    'ELEMENT_MODEL_FIELD', 'ELEMENT_MODEL_MODIFIER', 'ELEMENT_MODEL_SOURCE_CODE', 'ELEMENT_MODEL_CODE',
+    'ELEMENT_MODEL_SD_INSTANCE', 'ELEMENT_MODEL_SD_MESSAGE', 'ELEMENT_MODEL_LINE_CONTROL_POINT',
+)
+VERSION_1_VALUES: Tuple[str, ...] = (
+    'Sequence Document', 'Use Case Document', 'Class Document', 'NOTELINK', 'INTERFACE', 'INHERITANCE', 'COMPOSITION', 'AGGREGATION', 'ASSOCIATION', 'Right', 'Left', 'Top', 'Bottom',
+    'noStereotype', 'Do Not Display Parameters', 'Display Parameters', 'Do Not Display', 'Display', 'PROTECTED', 'PRIVATE',
+    'PUBLIC', 'float', 'str', 'int', 'Unspecified', 'False', 'True', '',
+)
+VERSION_1_XML_VERSION: str = '14.0'
+
+INDENT_SPACES: str = '    '
+MAXIMUM_DEPTH: int = 6
+
+
+def buildDictionary(attributeNames: Tuple[str, ...], elementNames: Tuple[str, ...], values: Tuple[str, ...], xmlVersion: str) -> bytes:
+    """
+    zlib reaches the end of the dictionary most cheaply;  So the most frequent strings go last
+
+    Args:
+        attributeNames:  XmlConstants attribute names
+        elementNames:    XmlConstants element names
+        values:          Common attribute values, least frequent first
+        xmlVersion:      The project XML version current at the time
+
+    Returns:  The dictionary
+    """
+    pieces: List[str] = [
+        f"<?xml version='1.0' encoding='iso-8859-1'?>\n<{XmlConstants.ELEMENT_UML_PROJECT} "
+        f'{XmlConstants.ATTRIBUTE_FILENAME}="" {XmlConstants.ATTRIBUTE_VERSION}="{xmlVersion}" {XmlConstants.ATTRIBUTE_CODE_PATH}="'
+    ]
+    pieces.extend(f'="{value}"' for value in values)
+    pieces.extend(f' {getattr(XmlConstants, attributeName)}="' for attributeName in attributeNames)
+    for depth in range(MAXIMUM_DEPTH, 0, -1):
+        pieces.append(f'\n{INDENT_SPACES * depth}')
+    for elementName in elementNames:
+        element: str = getattr(XmlConstants, elementName)
+        pieces.append(f'</{element}>\n<{element} ')
+
+    return ''.join(pieces).encode('iso-8859-1')
+
+
+_dictionaries: Dict[int, bytes] = {}
+
+
+def presetDictionary(dictionaryVersion: int) -> bytes:
+    """
+    Args:
+        dictionaryVersion:  As recorded in the file header
+
+    Returns:  That version's dictionary
+    """
+    if dictionaryVersion not in _dictionaries:
+        if dictionaryVersion != DICTIONARY_VERSION_1:
+            raise UnsupportedVersion(f'Unknown preset dictionary version {dictionaryVersion}')
+        _dictionaries[dictionaryVersion] = buildDictionary(
+            attributeNames=VERSION_1_ATTRIBUTES,
+            elementNames=VERSION_1_ELEMENTS,
+            values=VERSION_1_VALUES,
+            xmlVersion=VERSION_1_XML_VERSION
+        )
+
+    return _dictionaries[dictionaryVersion]
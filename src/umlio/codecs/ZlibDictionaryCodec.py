@@ -0,0 +1,110 @@
+
+from struct import Struct
+
+from zlib import Z_DEFAULT_COMPRESSION
+from zlib import compressobj
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.Codec import Decompressor
+from umlio.codecs.ZlibCodec import ZlibDecompressor
+from umlio.codecs.ZlibDictionary import LATEST_DICTIONARY_VERSION
+from umlio.codecs.ZlibDictionary import presetDictionary
+
+ZLIB_DICTIONARY_CODEC_ID: int = 4
+
+DICTIONARY_MAGIC:  bytes  = b'\x89UDZ'
+DICTIONARY_HEADER: Struct = Struct('>4sH')        # magic, dictionary version
+
+
+class DictionaryCompressor:
+    """
+    Writes the header ahead of the zlib stream
+    """
+    def __init__(self, level: int, dictionaryVersion: int):
+
+        self._header:     bytes = DICTIONARY_HEADER.pack(DICTIONARY_MAGIC, dictionaryVersion)
+        self._compressor        = compressobj(level, zdict=presetDictionary(dictionaryVersion=dictionaryVersion))
+
+    def compress(self, data: bytes) -> bytes:
+
+        compressed: bytes = self._header + self._compressor.compress(data)
+        self._header = b''
+
+        return compressed
+
+    def flush(self) -> bytes:
+
+        compressed: bytes = self._header + self._compressor.flush()
+        self._header = b''
+
+        return compressed
+
+
+class DictionaryDecompressor(Decompressor):
+    """
+    Reads the header to pick the dictionary;  Then hands the rest to zlib
+    """
+    def __init__(self):
+
+        self._headerBytes:  bytes                   = b''
+        self._decompressor: ZlibDecompressor | None = None
+
+    def decompress(self, data: bytes, maxLength: int) -> bytes:
+
+        if self._decompressor is None:
+            self._headerBytes += data
+            if len(self._headerBytes) < DICTIONARY_HEADER.size:
+                return b''
+            magic, dictionaryVersion = DICTIONARY_HEADER.unpack(self._headerBytes[:DICTIONARY_HEADER.size])
+            if magic != DICTIONARY_MAGIC:
+                raise ValueError('Missing the preset dictionary header')
+
+            self._decompressor = ZlibDecompressor(zdict=presetDictionary(dictionaryVersion=dictionaryVersion))
+            data = self._headerBytes[DICTIONARY_HEADER.size:]
+            self._headerBytes = b''
+
+        return self._decompressor.decompress(data, maxLength)
+
+    def flush(self) -> bytes:
+        return b'' if self._decompressor is None else self._decompressor.flush()
+
+    @property
+    def needsInput(self) -> bool:
+        return self._decompressor is None or self._decompressor.needsInput
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor is not None and self._decompressor.eof
+
+
+class ZlibDictionaryCodec(Codec):
+    """
+    zlib primed with a versioned preset dictionary of the project file vocabulary.  The
+    dictionary version follows the magic;  Older dictionaries stay readable forever
+    """
+    def __init__(self, level: int = Z_DEFAULT_COMPRESSION, dictionaryVersion: int = LATEST_DICTIONARY_VERSION):
+
+        self._level:             int = level
+        self._dictionaryVersion: int = dictionaryVersion
+
+    @property
+    def name(self) -> str:
+        return 'zlib+dictionary'
+
+    @property
+    def codecId(self) -> int:
+        return ZLIB_DICTIONARY_CODEC_ID
+
+    @property
+    def dictionaryVersion(self) -> int:
+        return self._dictionaryVersion
+
+    def matches(self, leadingBytes: bytes) -> bool:
+        return leadingBytes.startswith(DICTIONARY_MAGIC)
+
+    def compressor(self) -> Compressor:
+        return DictionaryCompressor(level=self._level, dictionaryVersion=self._dictionaryVersion)
+
+    def decompressor(self) -> Decompressor:
+        return DictionaryDecompressor()
@@ -0,0 +1,41 @@
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.Codec import Decompressor
+from umlio.codecs.Codec import NeedsInputDecompressor
+
+try:
+    from compression.zstd import ZstdCompressor        # type: ignore[import-not-found]
+    from compression.zstd import ZstdDecompressor
+    ZSTD_AVAILABLE: bool = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+ZSTD_CODEC_ID: int   = 3
+ZSTD_MAGIC:    bytes = b'\x28\xb5\x2f\xfd'
+
+
+class ZstdCodec(Codec):
+    """
+    Only where the standard library provides zstd (Python 3.14 and later);  Check ZSTD_AVAILABLE
+    """
+    def __init__(self, level: int = 3):
+
+        self._level: int = level
+
+    @property
+    def name(self) -> str:
+        return 'zstd'
+
+    @property
+    def codecId(self) -> int:
+        return ZSTD_CODEC_ID
+
+    def matches(self, leadingBytes: bytes) -> bool:
+        return leadingBytes.startswith(ZSTD_MAGIC)
+
+    def compressor(self) -> Compressor:
+        return ZstdCompressor(level=self._level)
+
+    def decompressor(self) -> Decompressor:
+        return NeedsInputDecompressor(ZstdDecompressor())
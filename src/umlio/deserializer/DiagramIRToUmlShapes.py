@@ -0,0 +1,342 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from umlmodel.Link import Link
+from umlmodel.Interface import Interface
+
+from umlmodel.enumerations.LinkType import LinkType
+
+from umlshapes.utils.BasicUtils import BasicUtils
+
+from umlshapes.types.Common import AttachmentSide
+from umlshapes.types.Common import EndPositions
+from umlshapes.types.UmlPosition import UmlPositions
+
+from umlshapes.links.UmlLink import UmlLink
+from umlshapes.links.UmlNoteLink import UmlNoteLink
+from umlshapes.links.UmlAssociation import UmlAssociation
+from umlshapes.links.UmlInheritance import UmlInheritance
+from umlshapes.links.UmlComposition import UmlComposition
+from umlshapes.links.UmlAggregation import UmlAggregation
+from umlshapes.links.UmlInterface import UmlInterface
+from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
+
+from umlshapes.shapes.UmlActor import UmlActor
+from umlshapes.shapes.UmlClass import UmlClass
+from umlshapes.shapes.UmlNote import UmlNote
+from umlshapes.shapes.UmlText import UmlText
+from umlshapes.shapes.UmlUseCase import UmlUseCase
+
+from umlshapes.ShapeTypes import UmlLinkGenre
+from umlshapes.ShapeTypes import LinkableUmlShape
+from umlshapes.ShapeTypes import LinkableUmlShapes
+from umlshapes.ShapeTypes import linkableUmlShapesFactory
+
+from umlio.IOStats import IOStats
+from umlio.IOStats import PHASE_LINK_RATIONALIZATION
+from umlio.IOStats import PHASE_SHAPE_BUILD
+from umlio.IOStats import phase
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlProject
+
+from umlio.IRTypes import ActorIR
+from umlio.IRTypes import ClassIR
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import LinkIR
+from umlio.IRTypes import LollipopIR
+from umlio.IRTypes import NoteIR
+from umlio.IRTypes import ProjectIR
+from umlio.IRTypes import TextIR
+from umlio.IRTypes import UseCaseIR
+
+UmlAssociationClasses = Union[UmlAssociation, UmlComposition, UmlAggregation]
+
+LinkTypeToClass = NewType('LinkTypeToClass', Dict[LinkType, type[UmlAssociationClasses]])
+
+CLASSMAP: LinkTypeToClass = LinkTypeToClass(
+    {
+        LinkType.ASSOCIATION: UmlAssociation,
+        LinkType.AGGREGATION: UmlAggregation,
+        LinkType.COMPOSITION: UmlComposition
+    }
+)
+ASSOCIATION_LINK_TYPES: List[LinkType] = [
+    LinkType.COMPOSITION, LinkType.AGGREGATION, LinkType.ASSOCIATION
+]
+
+
+class DiagramIRToUmlShapes:
+    """
+    The second loading stage;  The intermediate representation to UML shapes.  This is
+    the only stage that needs wx;  Run it on the GUI thread
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._ioStats: Optional[IOStats] = None
+
+    @property
+    def ioStats(self) -> Optional[IOStats]:
+        """
+        When set, the shape construction and link rationalization times are added to it
+        """
+        return self._ioStats
+
+    @ioStats.setter
+    def ioStats(self, ioStats: Optional[IOStats]):
+        self._ioStats = ioStats
+
+    def materializeProject(self, projectIR: ProjectIR) -> UmlProject:
+        """
+        Args:
+            projectIR:  The project's intermediate representation
+
+        Returns:  The UML project
+        """
+        umlProject: UmlProject = UmlProject(fileName=projectIR.fileName, version=projectIR.version, codePath=projectIR.codePath)
+
+        for documentTitle, diagramIR in projectIR.diagramIRs.items():
+            umlProject.umlDocuments[documentTitle] = self.materialize(diagramIR=diagramIR)
+
+        return umlProject
+
+    def materialize(self, diagramIR: DiagramIR) -> UmlDocument:
+        """
+        Args:
+            diagramIR:  A diagram's intermediate representation
+
+        Returns:  The UML document with all its shapes
+        """
+        with phase(self._ioStats, PHASE_SHAPE_BUILD):
+            return self._materialize(diagramIR=diagramIR)
+
+    def _materialize(self, diagramIR: DiagramIR) -> UmlDocument:
+
+        umlDocument: UmlDocument = UmlDocument(
+            documentType=diagramIR.documentType,
+            documentTitle=diagramIR.documentTitle,
+            scrollPositionX=diagramIR.scrollPositionX,
+            scrollPositionY=diagramIR.scrollPositionY,
+            pixelsPerUnitX=diagramIR.pixelsPerUnitX,
+            pixelsPerUnitY=diagramIR.pixelsPerUnitY
+        )
+        linkableUmlShapes: LinkableUmlShapes = linkableUmlShapesFactory()
+
+        for classIR in diagramIR.classIRs:
+            umlClass: UmlClass = self.toUmlClass(classIR=classIR)
+            umlDocument.umlClasses.append(umlClass)
+            linkableUmlShapes[classIR.modelClass.id] = umlClass
+
+        for noteIR in diagramIR.noteIRs:
+            umlNote: UmlNote = self.toUmlNote(noteIR=noteIR)
+            umlDocument.umlNotes.append(umlNote)
+            linkableUmlShapes[noteIR.modelNote.id] = umlNote
+
+        for textIR in diagramIR.textIRs:
+            umlDocument.umlTexts.append(self.toUmlText(textIR=textIR))
+
+        for actorIR in diagramIR.actorIRs:
+            umlActor: UmlActor = self.toUmlActor(actorIR=actorIR)
+            umlDocument.umlActors.append(umlActor)
+            linkableUmlShapes[actorIR.modelActor.id] = umlActor
+
+        for useCaseIR in diagramIR.useCaseIRs:
+            umlUseCase: UmlUseCase = self.toUmlUseCase(useCaseIR=useCaseIR)
+            umlDocument.umlUseCases.append(umlUseCase)
+            linkableUmlShapes[useCaseIR.modelUseCase.id] = umlUseCase
+
+        for linkIR in diagramIR.linkIRs:
+            umlDocument.umlLinks.append(self.toUmlLink(linkIR=linkIR, linkableUmlShapes=linkableUmlShapes))
+
+        for lollipopIR in diagramIR.lollipopIRs:
+            umlDocument.umlLollipopInterfaces.append(self.toUmlLollipop(lollipopIR=lollipopIR, linkableUmlShapes=linkableUmlShapes))
+
+        return umlDocument
+
+    def toUmlClass(self, classIR: ClassIR) -> UmlClass:
+
+        umlClass: UmlClass = UmlClass(modelClass=classIR.modelClass)
+        umlClass.id       = classIR.graphicInformation.id
+        umlClass.size     = classIR.graphicInformation.size
+        umlClass.position = classIR.graphicInformation.position
+
+        return umlClass
+
+    def toUmlNote(self, noteIR: NoteIR) -> UmlNote:
+
+        umlNote: UmlNote = UmlNote(note=noteIR.modelNote)
+        umlNote.id       = noteIR.graphicInformation.id
+        umlNote.size     = noteIR.graphicInformation.size
+        umlNote.position = noteIR.graphicInformation.position
+
+        return umlNote
+
+    def toUmlText(self, textIR: TextIR) -> UmlText:
+
+        umlText: UmlText = UmlText(text=textIR.modelText)
+        umlText.id       = textIR.graphicInformation.id
+        umlText.size     = textIR.graphicInformation.size
+        umlText.position = textIR.graphicInformation.position
+
+        return umlText
+
+    def toUmlActor(self, actorIR: ActorIR) -> UmlActor:
+
+        umlActor: UmlActor = UmlActor(actor=actorIR.modelActor)
+        umlActor.id       = actorIR.graphicInformation.id
+        umlActor.size     = actorIR.graphicInformation.size
+        umlActor.position = actorIR.graphicInformation.position
+
+        return umlActor
+
+    def toUmlUseCase(self, useCaseIR: UseCaseIR) -> UmlUseCase:
+
+        umlUseCase: UmlUseCase = UmlUseCase(useCase=useCaseIR.modelUseCase)
+        umlUseCase.id       = useCaseIR.graphicInformation.id
+        umlUseCase.size     = useCaseIR.graphicInformation.size
+        umlUseCase.position = useCaseIR.graphicInformation.position
+
+        return umlUseCase
+
+    def toUmlLink(self, linkIR: LinkIR, linkableUmlShapes: LinkableUmlShapes) -> UmlLink:
+        """
+        Args:
+            linkIR:             The link IR
+            linkableUmlShapes:  The diagram's shapes indexed by their model ID
+
+        Returns:  The link shape attached to the shapes at its ends
+        """
+        try:
+            sourceShape:      LinkableUmlShape = linkableUmlShapes[linkIR.sourceId]
+            destinationShape: LinkableUmlShape = linkableUmlShapes[linkIR.destinationId]
+        except KeyError as ke:
+            self.logger.error(f'Developer Error -- {linkIR.sourceId=} {linkIR.destinationId=}  KeyError index: {ke}')
+            assert False, 'Developer error'
+
+        self._checkLinkEnds(sourceShape=sourceShape, destinationShape=destinationShape)
+
+        umlLink: UmlLink = self._umlLinkFactory(srcShape=sourceShape, link=linkIR.link, destShape=destinationShape)
+
+        umlLink.id     = linkIR.umlLinkAttributes.id
+        umlLink.spline = linkIR.umlLinkAttributes.spline
+
+        umlLink.MakeLineControlPoints(n=2)       # Make this configurable
+
+        umlLink.endPositions = EndPositions(
+            toPosition=linkIR.umlLinkAttributes.toPosition,
+            fromPosition=linkIR.umlLinkAttributes.fromPosition
+        )
+        controlPoints: UmlPositions = linkIR.controlPoints
+        for cp in controlPoints:
+            umlLink.addLineControlPoint(umlPosition=cp)
+
+        if self._ioStats is None:
+            BasicUtils.rationalizeTheLinkDataModel(umlLink=umlLink)
+        else:
+            with self._ioStats.phase(PHASE_LINK_RATIONALIZATION):
+                BasicUtils.rationalizeTheLinkDataModel(umlLink=umlLink)
+
+        return umlLink
+
+    def toUmlLollipop(self, lollipopIR: LollipopIR, linkableUmlShapes: LinkableUmlShapes) -> UmlLollipopInterface:
+        """
+        Args:
+            lollipopIR:         The lollipop IR
+            linkableUmlShapes:  The diagram's shapes
+
+        Returns:   A UML Lollipop interface attached to its implementing class
+        """
+        interface:            Interface            = lollipopIR.interface
+        umlLollipopInterface: UmlLollipopInterface = UmlLollipopInterface(interface=interface)
+
+        umlLollipopInterface.lineCentum     = lollipopIR.lineCentum
+        umlLollipopInterface.attachmentSide = AttachmentSide.toEnum(lollipopIR.attachmentSide)
+        umlLollipopInterface.attachedTo     = self._findAttachedToClass(attachedToId=lollipopIR.attachedToId, linkableUmlShapes=linkableUmlShapes)
+
+        return umlLollipopInterface
+
+    def _checkLinkEnds(self, sourceShape: LinkableUmlShape, destinationShape: LinkableUmlShape):
+        """
+        Only classes, notes and actors start a link;  Only classes and use cases end one
+
+        Args:
+            sourceShape:       The shape at the source end
+            destinationShape:  The shape at the destination end
+        """
+        assert isinstance(sourceShape, (UmlClass, UmlNote, UmlActor)), f'{sourceShape=} is not a source linkable UML Shape'
+        assert isinstance(destinationShape, (UmlClass, UmlUseCase)), f'{destinationShape=} is not a destination linkable UML Shape'
+
+    def _findAttachedToClass(self, attachedToId: str, linkableUmlShapes: LinkableUmlShapes) -> UmlClass:
+        """
+        This method is necessary because the linkable shapes dictionary is indexed by the model class ID
+        However, the pointer to the attached class is a UmlClass id.  All this came about because
+        lollipops reused the model Interface class
+
+        Args:
+            attachedToId:
+            linkableUmlShapes:
+
+        Returns:  The appropriate UmlClass
+        """
+        foundClass: UmlClass = cast(UmlClass, None)
+        for uc in linkableUmlShapes.values():
+            umlClass: UmlClass = cast(UmlClass, uc)
+            if umlClass.id == attachedToId:
+                foundClass = umlClass
+                break
+
+        assert foundClass is not None, 'Developer error, missing class in linkableUmlShapes'
+        return foundClass
+
+    def _umlLinkFactory(self, srcShape: LinkableUmlShape, link: Link, destShape: LinkableUmlShape) -> UmlLinkGenre:
+        """
+
+        Args:
+            srcShape:
+            link:
+            destShape:
+
+        Returns:  The appropriate UML Link shape
+        """
+        if link.linkType == LinkType.INHERITANCE:
+            # Note dest and source are reversed here
+            subClass:  UmlClass = srcShape              # type: ignore
+            baseClass: UmlClass = destShape             # type: ignore
+
+            umlInheritance: UmlInheritance = UmlInheritance(baseClass=baseClass, link=link, subClass=subClass)
+
+            return umlInheritance
+
+        elif link.linkType in ASSOCIATION_LINK_TYPES:
+            umlAssociation = CLASSMAP[link.linkType](link)
+            #
+            # Need to do this because the shape is not yet on a canvas
+            #
+            umlAssociation.sourceShape      = srcShape
+            umlAssociation.destinationShape = destShape
+            return umlAssociation
+        elif link.linkType == LinkType.NOTELINK:
+            umlNote:     UmlNote     = srcShape         # type: ignore
+            umlClass:    UmlClass    = destShape        # type: ignore
+            umlNoteLink: UmlNoteLink = UmlNoteLink(link=link)
+            umlNoteLink.sourceNote       = umlNote
+            umlNoteLink.destinationClass = umlClass
+            return umlNoteLink
+        elif link.linkType == LinkType.INTERFACE:
+            implementingClass: UmlClass = srcShape      # type: ignore
+            interfaceClass:    UmlClass = destShape     # type: ignore
+            umlInterface: UmlInterface = UmlInterface(link=link, implementingClass=implementingClass, interfaceClass=interfaceClass)
+
+            return umlInterface
+        else:
+            assert False, f'Unknown link type, {link.linkType=}'
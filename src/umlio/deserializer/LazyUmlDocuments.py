@@ -0,0 +1,95 @@
+
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import MutableMapping
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentTitle
+
+from umlio.deserializer.XmlDiagramScanner import DiagramLocation
+from umlio.deserializer.XmlDiagramScanner import DiagramLocations
+
+DiagramLoader = Callable[[DiagramLocation], UmlDocument]
+
+
+class LazyUmlDocuments(MutableMapping[UmlDocumentTitle, UmlDocument]):
+    """
+    Stands in for UmlDocuments.  The titles are known up front;  A document is only
+    deserialized the first time somebody asks for it.  After that it is an ordinary entry.
+    Documents that are assigned are never loaded
+    """
+    def __init__(self, diagramLocations: DiagramLocations, diagramLoader: DiagramLoader):
+        """
+
+        Args:
+            diagramLocations:  Where to find each diagram
+            diagramLoader:     Turns a diagram location into a document
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramLoader: DiagramLoader = diagramLoader
+
+        self._locations:    Dict[UmlDocumentTitle, DiagramLocation]       = {}
+        self._umlDocuments: Dict[UmlDocumentTitle, Optional[UmlDocument]] = {}
+
+        for diagramLocation in diagramLocations:
+            self._locations[diagramLocation.documentTitle]    = diagramLocation
+            self._umlDocuments[diagramLocation.documentTitle] = None
+
+    def isMaterialized(self, documentTitle: UmlDocumentTitle) -> bool:
+        """
+        Args:
+            documentTitle:  A document title
+
+        Returns:  True if the document has been deserialized or assigned
+        """
+        return self._umlDocuments.get(documentTitle) is not None
+
+    def diagramLocation(self, documentTitle: UmlDocumentTitle) -> DiagramLocation:
+        """
+        Cheap access to the title, type and diagram attributes without deserializing
+
+        Args:
+            documentTitle:  A document title
+
+        Returns:  Where the document lives in the XML
+        """
+        return self._locations[documentTitle]
+
+    def __getitem__(self, documentTitle: UmlDocumentTitle) -> UmlDocument:
+
+        umlDocument: Optional[UmlDocument] = self._umlDocuments[documentTitle]
+        if umlDocument is None:
+            self.logger.debug(f'Materializing: {documentTitle}')
+            umlDocument = self._diagramLoader(self._locations[documentTitle])
+            self._umlDocuments[documentTitle] = umlDocument
+
+        return umlDocument
+
+    def __setitem__(self, documentTitle: UmlDocumentTitle, umlDocument: UmlDocument):
+        self._umlDocuments[documentTitle] = umlDocument
+
+    def __delitem__(self, documentTitle: UmlDocumentTitle):
+
+        del self._umlDocuments[documentTitle]
+        self._locations.pop(documentTitle, None)
+
+    def __iter__(self) -> Iterator[UmlDocumentTitle]:
+        return iter(self._umlDocuments)
+
+    def __len__(self) -> int:
+        return len(self._umlDocuments)
+
+    def __contains__(self, documentTitle: object) -> bool:
+        return documentTitle in self._umlDocuments
+
+    def __repr__(self) -> str:
+
+        materialized: int = len([title for title in self._umlDocuments if self.isMaterialized(title)])
+
+        return f'<{self.__class__.__name__} documents={len(self)} materialized={materialized}>'
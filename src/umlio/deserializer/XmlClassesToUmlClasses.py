@@ -1,29 +1,28 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 
-from umlmodel.Class import Class
 from untangle import Element
 
-from umlshapes.shapes.UmlClass import UmlClass
-
-from umlio.IOTypes import Elements
-from umlio.IOTypes import GraphicInformation
 from umlio.IOTypes import UmlClasses
 from umlio.IOTypes import umlClassesFactory
 
 from umlio.XMLConstants import XmlConstants
 
-from umlio.deserializer.XmlToUmlModel import XmlToUmlModel
+from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
 
 
 class XmlClassesToUmlClasses:
+    """
+    Kept for existing callers;  The readers no longer use it.  Delegates to the two loading
+    stages, XmlToDiagramIR and DiagramIRToUmlShapes
+    """
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
-        self._xmlToUmlModel: XmlToUmlModel = XmlToUmlModel()
+        self._xmlToDiagramIR:       XmlToDiagramIR       = XmlToDiagramIR()
+        self._diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
 
     def deserialize(self, umlDiagramElement: Element) -> UmlClasses:
         """
@@ -31,22 +30,11 @@ class XmlClassesToUmlClasses:
         Args:
             umlDiagramElement:  The Element document
 
-        Returns:  deserialized UmlNote objects if any exist, else an empty list
+        Returns:  deserialized UmlClass objects if any exist, else an empty list
         """
-        umlClasses:    UmlClasses = umlClassesFactory()
-        classElements: Elements   = cast(Elements, umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_CLASS))
-
-        for classElement in classElements:
-            self.logger.debug(f'{classElement}')
-
-            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=classElement)
-            modelClass:         Class              = self._xmlToUmlModel.classToModelClass(umlClassElement=classElement)
-            umlClass:           UmlClass           = UmlClass(modelClass=modelClass)
-
-            umlClass.id       = graphicInformation.id
-            umlClass.size     = graphicInformation.size
-            umlClass.position = graphicInformation.position
+        umlClasses: UmlClasses = umlClassesFactory()
 
-            umlClasses.append(umlClass)
+        for classElement in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_CLASS):
+            umlClasses.append(self._diagramIRToUmlShapes.toUmlClass(classIR=self._xmlToDiagramIR.toClassIR(classElement=classElement)))
 
         return umlClasses
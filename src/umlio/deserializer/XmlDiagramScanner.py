@@ -0,0 +1,209 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from xml.parsers.expat import ParserCreate
+from xml.parsers.expat import XMLParserType
+from xml.parsers.expat import XML_PARAM_ENTITY_PARSING_NEVER
+
+from defusedxml import EntitiesForbidden
+from defusedxml import ExternalReferenceForbidden
+
+from umlio.ProjectTypes import ElementAttributes
+from umlio.ProjectTypes import ElementCounts
+from umlio.ProjectTypes import UmlDocumentTitle
+from umlio.ProjectTypes import UmlDocumentType
+from umlio.ProjectTypes import elementCountsFactory
+
+from umlio.XMLConstants import XmlConstants
+
+UNKNOWN_OFFSET: int = -1
+
+
+@dataclass
+class DiagramLocation:
+    """
+    Where a UMLDiagram element lives in the uncompressed XML.  The range runs from the
+    diagram's start tag up to the start of whatever follows the diagram;  So it may carry
+    some trailing whitespace.
+
+    Locations that come from a diagram index carry the hash of their bytes instead of the
+    attributes and element counts
+    """
+    documentTitle: UmlDocumentTitle  = UmlDocumentTitle('')
+    documentType:  UmlDocumentType   = UmlDocumentType.NOT_SET
+    attributes:    ElementAttributes = field(default_factory=lambda: ElementAttributes({}))
+    elementCounts: ElementCounts     = field(default_factory=elementCountsFactory)
+    startOffset:   int = UNKNOWN_OFFSET
+    endOffset:     int = UNKNOWN_OFFSET
+    contentHash:   str = ''
+
+
+DiagramLocations = NewType('DiagramLocations', List[DiagramLocation])
+
+
+def diagramLocationsFactory() -> DiagramLocations:
+    return DiagramLocations([])
+
+
+@dataclass
+class ScannedProject:
+    """
+    What the scan learned about the project
+    """
+    version:          str               = ''
+    codePath:         str               = ''
+    prolog:           bytes             = b''
+    diagramLocations: DiagramLocations  = field(default_factory=diagramLocationsFactory)
+
+    def diagramDocument(self, fragment: bytes) -> bytes:
+        """
+        Wraps a diagram's bytes in a bare project element behind the original XML
+        declaration;  So a deserializer sees a one diagram project
+
+        Args:
+            fragment:  The bytes of a diagram location
+
+        Returns:  A complete XML document
+        """
+        return b''.join([
+            self.prolog,
+            f'<{XmlConstants.ELEMENT_UML_PROJECT}>'.encode(),
+            fragment,
+            f'</{XmlConstants.ELEMENT_UML_PROJECT}>'.encode()
+        ])
+
+
+class XmlDiagramScanner:
+    """
+    A cheap first pass over the project XML.  It only notes the project attributes and the
+    title, type, byte range and the number of direct children of each UMLDiagram.  Nothing
+    deeper is looked at and no shapes are created.  The scan stops pulling chunks as soon as
+    the project element closes;  So a compressed source is never inflated past that point.
+
+    Like the deserializers, the scan refuses entity declarations and external references
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._parser:         XMLParserType  = cast(XMLParserType, None)
+        self._scannedProject: ScannedProject = ScannedProject()
+        self._depth:          int            = 0
+        self._prologBytes:    List[bytes]    = []
+        self._prologComplete: bool           = False
+        self._position:       int            = 0
+        self._projectClosed:  bool           = False
+        self._inDiagram:      bool           = False
+
+    def scan(self, xmlChunks: Iterable[bytes]) -> ScannedProject:
+        """
+        Args:
+            xmlChunks:  The raw XML bytes in document order
+
+        Returns:  The project attributes and the location of every diagram
+        """
+        parser: XMLParserType = ParserCreate()
+
+        parser.SetParamEntityParsing(XML_PARAM_ENTITY_PARSING_NEVER)
+        parser.StartElementHandler      = self._startElement
+        parser.EndElementHandler        = self._endElement
+        parser.EntityDeclHandler        = self._entityDeclaration
+        parser.ExternalEntityRefHandler = self._externalEntityReference
+
+        self._parser         = parser
+        self._scannedProject = ScannedProject()
+
+        chunkIterator: Iterator[bytes] = iter(xmlChunks)
+        for xmlChunk in chunkIterator:
+            if self._prologComplete is False:
+                self._prologBytes.append(xmlChunk)
+            parser.Parse(xmlChunk, False)
+            self._position += len(xmlChunk)
+            if self._projectClosed is True:
+                break
+        else:
+            parser.Parse(b'', True)
+
+        if hasattr(chunkIterator, 'close'):
+            chunkIterator.close()       # Let a generator release its file now
+
+        self.logger.debug(f'Scanned {len(self._scannedProject.diagramLocations)} diagrams in {self._position} bytes')
+
+        return self._scannedProject
+
+    def _startElement(self, name: str, attributes: Dict[str, str]):
+
+        self._depth += 1
+        if self._depth == 1 and name == XmlConstants.ELEMENT_UML_PROJECT:
+            self._completeProlog(endOffset=self._parser.CurrentByteIndex)
+            self._scannedProject.version  = attributes.get(XmlConstants.ATTRIBUTE_VERSION, '')
+            self._scannedProject.codePath = attributes.get(XmlConstants.ATTRIBUTE_CODE_PATH, '')
+
+        elif self._depth == 3 and self._inDiagram is True:
+            elementCounts: ElementCounts = self._scannedProject.diagramLocations[-1].elementCounts
+            elementCounts[name] = elementCounts.get(name, 0) + 1
+
+        elif self._depth == 2:
+            self._closeLastDiagram(endOffset=self._parser.CurrentByteIndex)
+            self._inDiagram = name == XmlConstants.ELEMENT_UML_DIAGRAM
+            if self._inDiagram is True:
+                self._scannedProject.diagramLocations.append(
+                    DiagramLocation(
+                        documentTitle=UmlDocumentTitle(attributes.get(XmlConstants.ATTRIBUTE_TITLE, '')),
+                        documentType=self._toDocumentType(attributes.get(XmlConstants.ATTRIBUTE_DOCUMENT_TYPE, '')),
+                        attributes=ElementAttributes(attributes),
+                        startOffset=self._parser.CurrentByteIndex
+                    )
+                )
+
+    def _endElement(self, name: str):
+
+        if self._depth == 1:
+            self._closeLastDiagram(endOffset=self._parser.CurrentByteIndex)
+            self._projectClosed = True
+        elif self._depth == 2:
+            self._inDiagram = False
+        self._depth -= 1
+
+    def _closeLastDiagram(self, endOffset: int):
+
+        diagramLocations: DiagramLocations = self._scannedProject.diagramLocations
+        if len(diagramLocations) > 0 and diagramLocations[-1].endOffset == UNKNOWN_OFFSET:
+            diagramLocations[-1].endOffset = endOffset
+
+    def _completeProlog(self, endOffset: int):
+        """
+        Keep the XML declaration;  It carries the encoding a diagram fragment needs to be parsed on its own
+        """
+        prolog: bytes = b''.join(self._prologBytes)
+
+        self._scannedProject.prolog = prolog[:endOffset]
+        self._prologBytes    = []
+        self._prologComplete = True
+
+    def _toDocumentType(self, documentType: str) -> UmlDocumentType:
+
+        try:
+            return UmlDocumentType(documentType)
+        except ValueError:
+            self.logger.warning(f'Unknown diagram type: `{documentType}`')
+            return UmlDocumentType.NOT_SET
+
+    # noinspection PyUnusedLocal
+    def _entityDeclaration(self, name, isParameterEntity, value, base, systemId, publicId, notationName):
+        raise EntitiesForbidden(name, value, base, systemId, publicId, notationName)
+
+    # noinspection PyUnusedLocal
+    def _externalEntityReference(self, context, base, systemId, publicId):
+        raise ExternalReferenceForbidden(context, base, systemId, publicId)
@@ -1,30 +1,28 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 
 from untangle import Element
 
-from umlmodel.Note import Note
-
-from umlshapes.shapes.UmlNote import UmlNote
-
-from umlio.IOTypes import Elements
-from umlio.IOTypes import GraphicInformation
 from umlio.IOTypes import UmlNotes
 from umlio.IOTypes import umlNotesFactory
 
 from umlio.XMLConstants import XmlConstants
 
-from umlio.deserializer.XmlToUmlModel import XmlToUmlModel
+from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
 
 
 class XmlNotesToUmlNotes:
+    """
+    Kept for existing callers;  The readers no longer use it.  Delegates to the two loading
+    stages, XmlToDiagramIR and DiagramIRToUmlShapes
+    """
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
-        self._xmlToUmlModel: XmlToUmlModel = XmlToUmlModel()
+        self._xmlToDiagramIR:       XmlToDiagramIR       = XmlToDiagramIR()
+        self._diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
 
     def deserialize(self, umlDiagramElement: Element) -> UmlNotes:
         """
@@ -34,20 +32,9 @@ class XmlNotesToUmlNotes:
 
         Returns:  deserialized UmlNote objects if any exist, else an empty list
         """
-        umlNotes:     UmlNotes = umlNotesFactory()
-        noteElements: Elements = cast(Elements, umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_NOTE))
-
-        for noteElement in noteElements:
-            self.logger.debug(f'{noteElement}')
-
-            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=noteElement)
-            note:               Note               = self._xmlToUmlModel.noteToModelNote(umlNoteElement=noteElement)
-            umlNote:            UmlNote            = UmlNote(note=note)
-
-            umlNote.id       = graphicInformation.id
-            umlNote.size     = graphicInformation.size
-            umlNote.position = graphicInformation.position
+        umlNotes: UmlNotes = umlNotesFactory()
 
-            umlNotes.append(umlNote)
+        for noteElement in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_NOTE):
+            umlNotes.append(self._diagramIRToUmlShapes.toUmlNote(noteIR=self._xmlToDiagramIR.toNoteIR(noteElement=noteElement)))
 
         return umlNotes
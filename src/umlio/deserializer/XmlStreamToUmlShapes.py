@@ -0,0 +1,208 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from keyword import iskeyword
+
+from pathlib import Path
+
+from xml.sax.handler import ContentHandler
+from xml.sax.xmlreader import AttributesImpl
+
+from defusedxml.sax import make_parser
+
+from untangle import Element
+
+from umlio.IOStats import PHASE_MODEL_BUILD
+from umlio.IOStats import PHASE_PARSE
+from umlio.IOStats import phase
+
+from umlio.IOTypes import Elements
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentType
+
+from umlio.IRTypes import DiagramIR
+
+from umlio.deserializer.XmlToDiagramIR import ModelObjects
+from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+
+from umlio.sources.XmlFileSource import XmlFileSource
+
+from umlio.XMLConstants import XmlConstants
+
+#
+# The diagram children each document type cares about;  Anything else is dropped, just like
+# the per type deserializers ignore it
+#
+DOCUMENT_ELEMENT_NAMES: Dict[UmlDocumentType, List[str]] = {
+    UmlDocumentType.CLASS_DOCUMENT: [
+        XmlConstants.ELEMENT_UML_CLASS, XmlConstants.ELEMENT_UML_NOTE, XmlConstants.ELEMENT_UML_TEXT,
+        XmlConstants.ELEMENT_UML_LINK,  XmlConstants.ELEMENT_LOLLIPOP
+    ],
+    UmlDocumentType.USE_CASE_DOCUMENT: [
+        XmlConstants.ELEMENT_UML_NOTE, XmlConstants.ELEMENT_UML_ACTOR, XmlConstants.ELEMENT_UML_USE_CASE, XmlConstants.ELEMENT_UML_LINK
+    ],
+    UmlDocumentType.SEQUENCE_DOCUMENT: [
+        XmlConstants.ELEMENT_UML_TEXT, XmlConstants.ELEMENT_UML_NOTE
+    ],
+}
+
+
+class XmlStreamToUmlShapes(XmlToUmlShapes, ContentHandler):
+    """
+    A single pass, event driven alternative to the untangle DOM.  Only the subtree of the
+    diagram child currently being parsed is materialized as untangle Elements.  As soon as
+    a child closes it is turned into its intermediate representation and then dropped.  Links
+    need every linkable model object of their diagram, so they wait for the diagram's end
+    tag;  Then the diagram's shapes are materialized.
+
+    The resulting UmlProject is identical to the one XmlToUmlShapes builds
+    """
+    def __init__(self):
+
+        XmlToUmlShapes.__init__(self)
+        ContentHandler.__init__(self)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName:      Path      = Path('')
+        self._diagramIR:     DiagramIR = cast(DiagramIR, None)
+        self._elementStack:  Elements  = Elements([])
+        self._linkElements:  Elements  = Elements([])
+
+    def deserializeXmlChunks(self, xmlChunks: Iterable[bytes], fileName: Path):
+        """
+        Parse the XML as it arrives
+
+        Args:
+            xmlChunks:  The raw XML bytes in document order
+            fileName:   The file name from which the XML came from
+        """
+        self._fileName = fileName
+
+        parser = make_parser()
+        parser.setContentHandler(self)
+        with phase(self._ioStats, PHASE_PARSE):
+            for xmlChunk in xmlChunks:
+                parser.feed(xmlChunk)
+            parser.close()
+
+    def deserializeXmlFile(self, fileName: Path):
+        """
+        Parse the memory mapped file a slice at a time
+
+        Args:
+            fileName:  The XML file name
+        """
+        self.deserializeXmlChunks(xmlChunks=XmlFileSource(fileName=fileName).chunks(), fileName=fileName)
+
+    def startElement(self, name: str, attrs: AttributesImpl):
+
+        if name == XmlConstants.ELEMENT_UML_PROJECT and self._diagramIR is None:
+            self._deserializeProjectInformation(umlProject=self._toElement(name=name, attrs=attrs), fileName=self._fileName)
+
+        elif name == XmlConstants.ELEMENT_UML_DIAGRAM and self._diagramIR is None:
+            self._diagramIR = self._xmlToDiagramIR.createDiagramIR(umlDiagramElement=self._toElement(name=name, attrs=attrs))
+
+        elif self._diagramIR is not None:
+            element: Element = self._toElement(name=name, attrs=attrs)
+            if len(self._elementStack) > 0:
+                self._elementStack[-1].add_child(element)
+            self._elementStack.append(element)
+
+    def endElement(self, name: str):
+
+        if len(self._elementStack) > 0:
+            element: Element = self._elementStack.pop()
+            if len(self._elementStack) == 0:
+                self._dispatch(elementName=name, element=element)
+
+        elif name == XmlConstants.ELEMENT_UML_DIAGRAM and self._diagramIR is not None:
+            self._completeUmlDocument()
+
+    def characters(self, content: str):
+        #
+        # Whitespace between the project and diagram elements is of no interest
+        #
+        if len(self._elementStack) > 0:
+            self._elementStack[-1].add_cdata(content)
+
+    def _dispatch(self, elementName: str, element: Element):
+        """
+        Send a completed diagram child to the first loading stage
+
+        Args:
+            elementName:  The XML element name
+            element:      A direct child of the current UMLDiagram element
+        """
+        diagramIR: DiagramIR = self._diagramIR
+
+        if elementName not in DOCUMENT_ELEMENT_NAMES[diagramIR.documentType]:
+            return
+
+        if self._ioStats is None:
+            self._toIR(elementName=elementName, element=element, diagramIR=diagramIR)
+        else:
+            with self._ioStats.phase(PHASE_MODEL_BUILD):
+                self._toIR(elementName=elementName, element=element, diagramIR=diagramIR)
+
+    def _toIR(self, elementName: str, element: Element, diagramIR: DiagramIR):
+        """
+        Links only wait for the end of the diagram
+        """
+        if elementName == XmlConstants.ELEMENT_UML_CLASS:
+            diagramIR.classIRs.append(self._xmlToDiagramIR.toClassIR(classElement=element))
+        elif elementName == XmlConstants.ELEMENT_UML_NOTE:
+            diagramIR.noteIRs.append(self._xmlToDiagramIR.toNoteIR(noteElement=element))
+        elif elementName == XmlConstants.ELEMENT_UML_TEXT:
+            diagramIR.textIRs.append(self._xmlToDiagramIR.toTextIR(textElement=element))
+        elif elementName == XmlConstants.ELEMENT_UML_ACTOR:
+            diagramIR.actorIRs.append(self._xmlToDiagramIR.toActorIR(actorElement=element))
+        elif elementName == XmlConstants.ELEMENT_UML_USE_CASE:
+            diagramIR.useCaseIRs.append(self._xmlToDiagramIR.toUseCaseIR(useCaseElement=element))
+        elif elementName == XmlConstants.ELEMENT_UML_LINK:
+            self._linkElements.append(element)
+        elif elementName == XmlConstants.ELEMENT_LOLLIPOP:
+            diagramIR.lollipopIRs.append(self._xmlToDiagramIR.toLollipopIR(lollipopElement=element))
+
+    def _completeUmlDocument(self):
+        """
+        All the linkable model objects are now known;  Resolve the links and build the shapes
+        """
+        diagramIR: DiagramIR = self._diagramIR
+
+        with phase(self._ioStats, PHASE_MODEL_BUILD):
+            modelObjects: ModelObjects = self._xmlToDiagramIR.buildModelObjects(diagramIR=diagramIR)
+            tracing:      bool         = self._xmlToDiagramIR.tracing
+
+            for linkElement in self._linkElements:
+                diagramIR.linkIRs.append(self._xmlToDiagramIR.toLinkIR(umlLinkElement=linkElement, modelObjects=modelObjects, tracing=tracing))
+
+        umlDocument: UmlDocument = self._diagramIRToUmlShapes.materialize(diagramIR=diagramIR)
+
+        self._umlProject.umlDocuments[umlDocument.documentTitle] = umlDocument
+
+        self._diagramIR    = cast(DiagramIR, None)
+        self._linkElements = Elements([])
+
+    def _toElement(self, name: str, attrs: AttributesImpl) -> Element:
+        """
+        Mimic the untangle Handler so that the per type deserializers see exactly
+        what they see when untangle builds the whole document
+
+        Args:
+            name:   The XML element name
+            attrs:  Its attributes
+
+        Returns:  A childless untangle Element
+        """
+        name = name.replace('-', '_').replace('.', '_').replace(':', '_')
+        if iskeyword(name):
+            name += '_'
+
+        return Element(name, dict(attrs.items()))
@@ -1,36 +1,28 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 
 from untangle import Element
 
-from umlmodel.Text import Text
-
-from umlshapes.shapes.UmlText import UmlText
-
-from umlio.IOTypes import Elements
-from umlio.IOTypes import GraphicInformation
 from umlio.IOTypes import UmlTexts
 from umlio.IOTypes import umlTextsFactory
 
-from umlio.deserializer.XmlToUmlModel import XmlToUmlModel
-
 from umlio.XMLConstants import XmlConstants
 
+from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
+
 
 class XmlTextsToUmlTexts:
     """
-    Yes, I know bad English
+    Kept for existing callers;  The readers no longer use it.  Delegates to the two loading
+    stages, XmlToDiagramIR and DiagramIRToUmlShapes
     """
     def __init__(self):
-
-        super().__init__()
-
         self.logger: Logger = getLogger(__name__)
 
-        self._xmlToUmlModel: XmlToUmlModel = XmlToUmlModel()
+        self._xmlToDiagramIR:       XmlToDiagramIR       = XmlToDiagramIR()
+        self._diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
 
     def deserialize(self, umlDiagramElement: Element) -> UmlTexts:
         """
@@ -40,21 +32,9 @@ class XmlTextsToUmlTexts:
 
         Returns:  deserialized UmlText objects if any exist, else an empty list
         """
+        umlTexts: UmlTexts = umlTextsFactory()
 
-        umlTexts:     UmlTexts = umlTextsFactory()
-        textElements: Elements = cast(Elements, umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_TEXT))
-
-        for textElement in textElements:
-            self.logger.debug(f'{textElement}')
-
-            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=textElement)
-            text:               Text               = self._xmlToUmlModel.textToModelText(umlTextElement=textElement)
-            umlText:            UmlText            = UmlText(text=text)
-
-            umlText.id       = graphicInformation.id
-            umlText.size     = graphicInformation.size
-            umlText.position = graphicInformation.position
-
-            umlTexts.append(umlText)
+        for textElement in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_TEXT):
+            umlTexts.append(self._diagramIRToUmlShapes.toUmlText(textIR=self._xmlToDiagramIR.toTextIR(textElement=textElement)))
 
         return umlTexts
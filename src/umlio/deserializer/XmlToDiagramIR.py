@@ -0,0 +1,328 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from threading import Lock
+
+from defusedxml.sax import make_parser
+
+from untangle import Element
+from untangle import Handler
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from umlmodel.Link import Link
+from umlmodel.UmlModelBase import UmlModelBase
+
+from umlshapes.types.UmlPosition import UmlPosition
+from umlshapes.types.UmlPosition import UmlPositions
+
+from umlio.ElementTracing import ElementTracer
+
+from umlio.IRTypes import ActorIR
+from umlio.IRTypes import ActorIRs
+from umlio.IRTypes import ClassIR
+from umlio.IRTypes import ClassIRs
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import LinkIR
+from umlio.IRTypes import LinkIRs
+from umlio.IRTypes import LollipopIR
+from umlio.IRTypes import LollipopIRs
+from umlio.IRTypes import NoteIR
+from umlio.IRTypes import NoteIRs
+from umlio.IRTypes import ProjectIR
+from umlio.IRTypes import TextIR
+from umlio.IRTypes import TextIRs
+from umlio.IRTypes import UseCaseIR
+from umlio.IRTypes import UseCaseIRs
+
+from umlio.ProjectTypes import Elements
+from umlio.ProjectTypes import GraphicInformation
+from umlio.ProjectTypes import UmlDocumentTitle
+from umlio.ProjectTypes import UmlDocumentType
+from umlio.ProjectTypes import UmlLinkAttributes
+
+from umlio.XMLConstants import XmlConstants
+
+from umlio.deserializer.InvalidProjectXml import InvalidProjectXml
+from umlio.deserializer.XmlToUmlModel import XmlToUmlModel
+
+ModelObjects = NewType('ModelObjects', Dict[str, UmlModelBase])
+
+#
+# umlmodel hands out model ids from a single shared generator that is not thread safe;  Threads
+# that build model objects at the same time take this lock.  Worker processes have their own
+#
+MODEL_LOCK: Lock = Lock()
+
+
+class XmlToDiagramIR:
+    """
+    The first loading stage;  Untangled XML to the intermediate representation.  Builds
+    the model objects and collects the geometry, but creates no shapes.  Nothing in this
+    stage imports wx;  So it can run headless or in a worker process.
+
+    The single pass deserializer uses the per element methods as the elements arrive
+    """
+    def __init__(self):
+
+        self.logger:         Logger        = getLogger(__name__)
+        self._elementTracer: ElementTracer = ElementTracer(logger=self.logger)
+
+        self._xmlToUmlModel: XmlToUmlModel = XmlToUmlModel()
+        self._projectIR:     ProjectIR     = ProjectIR()
+
+    @property
+    def projectIR(self) -> ProjectIR:
+        return self._projectIR
+
+    def deserializeXmlChunks(self, xmlChunks: Iterable[bytes], fileName: Path):
+        """
+        Args:
+            xmlChunks:  The raw XML bytes in document order
+            fileName:   The file name from which the XML came from
+        """
+        self.deserializeUmlProject(umlProjectElement=self.untangle(xmlChunks=xmlChunks), fileName=fileName)
+
+    def untangle(self, xmlChunks: Iterable[bytes]) -> Element:
+        """
+        Only parses;  No model objects are built.  So threads may untangle without MODEL_LOCK
+
+        Args:
+            xmlChunks:  The raw XML bytes in document order
+
+        Returns:  The UmlProject Element
+        """
+        handler: Handler = Handler()
+        parser           = make_parser()
+
+        parser.setContentHandler(handler)
+        for xmlChunk in xmlChunks:
+            parser.feed(xmlChunk)
+        parser.close()
+
+        return handler.root.UmlProject
+
+    def deserializeUmlProject(self, umlProjectElement: Element, fileName: Path):
+        """
+        Builds the model objects;  Threads hold MODEL_LOCK around this
+
+        Args:
+            umlProjectElement:  The untangled UmlProject Element
+            fileName:           The file name from which the XML came from
+        """
+        self._projectIR.fileName = fileName
+        self._projectIR.version  = umlProjectElement[XmlConstants.ATTRIBUTE_VERSION]
+        self._projectIR.codePath = umlProjectElement[XmlConstants.ATTRIBUTE_CODE_PATH]
+
+        for umlDiagramElement in umlProjectElement.get_elements(XmlConstants.ELEMENT_UML_DIAGRAM):
+            diagramIR: DiagramIR = self.deserializeUmlDiagram(umlDiagramElement=umlDiagramElement)
+            self._projectIR.diagramIRs[diagramIR.documentTitle] = diagramIR
+
+    def deserializeUmlDiagram(self, umlDiagramElement: Element) -> DiagramIR:
+        """
+        Args:
+            umlDiagramElement:  The diagram Element
+
+        Returns:  The diagram's intermediate representation
+        """
+        diagramIR: DiagramIR = self.createDiagramIR(umlDiagramElement=umlDiagramElement)
+
+        if diagramIR.documentType == UmlDocumentType.CLASS_DOCUMENT:
+
+            diagramIR.classIRs = ClassIRs([self.toClassIR(classElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_CLASS)])
+            diagramIR.noteIRs  = NoteIRs([self.toNoteIR(noteElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_NOTE)])
+            diagramIR.textIRs  = TextIRs([self.toTextIR(textElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_TEXT)])
+
+            diagramIR.linkIRs     = self._toLinkIRs(umlDiagramElement=umlDiagramElement, diagramIR=diagramIR)
+            diagramIR.lollipopIRs = LollipopIRs([self.toLollipopIR(lollipopElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_LOLLIPOP)])
+
+        elif diagramIR.documentType == UmlDocumentType.USE_CASE_DOCUMENT:
+
+            diagramIR.noteIRs    = NoteIRs([self.toNoteIR(noteElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_NOTE)])
+            diagramIR.actorIRs   = ActorIRs([self.toActorIR(actorElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_ACTOR)])
+            diagramIR.useCaseIRs = UseCaseIRs([self.toUseCaseIR(useCaseElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_USE_CASE)])
+
+            diagramIR.linkIRs = self._toLinkIRs(umlDiagramElement=umlDiagramElement, diagramIR=diagramIR)
+
+        elif diagramIR.documentType == UmlDocumentType.SEQUENCE_DOCUMENT:
+
+            diagramIR.textIRs = TextIRs([self.toTextIR(textElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_TEXT)])
+            diagramIR.noteIRs = NoteIRs([self.toNoteIR(noteElement=e) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_NOTE)])
+
+        return diagramIR
+
+    def createDiagramIR(self, umlDiagramElement: Element) -> DiagramIR:
+        """
+        Only uses the diagram attributes;  Does not look at the diagram's children.  Every
+        read path starts a diagram here;  So this is where the numbering of unnamed model objects restarts
+
+        Args:
+            umlDiagramElement:  The diagram Element
+
+        Returns:  An empty diagram IR of the appropriate type
+        """
+        diagramIR: DiagramIR = DiagramIR(
+            documentTitle=UmlDocumentTitle(umlDiagramElement[XmlConstants.ATTRIBUTE_TITLE]),
+            scrollPositionX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_X]),
+            scrollPositionY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y]),
+            pixelsPerUnitX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X]),
+            pixelsPerUnitY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y])
+        )
+        documentType: str = umlDiagramElement[XmlConstants.ATTRIBUTE_DOCUMENT_TYPE]
+        if documentType == UmlDocumentType.CLASS_DOCUMENT.value:
+            diagramIR.documentType = UmlDocumentType.CLASS_DOCUMENT
+        elif documentType == UmlDocumentType.USE_CASE_DOCUMENT.value:
+            diagramIR.documentType = UmlDocumentType.USE_CASE_DOCUMENT
+        elif documentType == UmlDocumentType.SEQUENCE_DOCUMENT.value:
+            diagramIR.documentType = UmlDocumentType.SEQUENCE_DOCUMENT
+        else:
+            assert False, 'Unknown diagram Type - Perhaps corrupted fle'
+
+        self._xmlToUmlModel.startDiagram()
+
+        return diagramIR
+
+    def toClassIR(self, classElement: Element) -> ClassIR:
+        return ClassIR(
+            modelClass=self._xmlToUmlModel.classToModelClass(umlClassElement=classElement),
+            graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=classElement)
+        )
+
+    def toNoteIR(self, noteElement: Element) -> NoteIR:
+        return NoteIR(
+            modelNote=self._xmlToUmlModel.noteToModelNote(umlNoteElement=noteElement),
+            graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=noteElement)
+        )
+
+    def toTextIR(self, textElement: Element) -> TextIR:
+        return TextIR(
+            modelText=self._xmlToUmlModel.textToModelText(umlTextElement=textElement),
+            graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=textElement)
+        )
+
+    def toActorIR(self, actorElement: Element) -> ActorIR:
+        return ActorIR(
+            modelActor=self._xmlToUmlModel.actorToModelActor(umlActorElement=actorElement),
+            graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=actorElement)
+        )
+
+    def toUseCaseIR(self, useCaseElement: Element) -> UseCaseIR:
+        return UseCaseIR(
+            modelUseCase=self._xmlToUmlModel.useCaseToModelUseCase(umlUseCaseElement=useCaseElement),
+            graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=useCaseElement)
+        )
+
+    @property
+    def tracing(self) -> bool:
+        """
+        Whether element tracing is on for this module;  Check it once before a loop over the links
+        """
+        return self._elementTracer.enabled
+
+    def toLinkIR(self, umlLinkElement: Element, modelObjects: ModelObjects, tracing: bool = False) -> LinkIR:
+        """
+        Args:
+            umlLinkElement:  A single UmlLink Element
+            modelObjects:    The diagram's linkable model objects indexed by model ID
+            tracing:         The value of the tracing property before the loop
+
+        Returns:  The link IR;  Its model link references the model objects at its ends
+        """
+        linkElements: Elements = self._getElements(umlLinkElement, XmlConstants.ELEMENT_MODEL_LINK)
+        assert len(linkElements) == 1, 'There can only be one'      # noqa
+
+        singleLinkElement: Element    = linkElements[0]
+        sourceId:          str | None = singleLinkElement[XmlConstants.ATTRIBUTE_SOURCE_ID]
+        destinationId:     str | None = singleLinkElement[XmlConstants.ATTRIBUTE_DESTINATION_ID]
+
+        if sourceId is None or destinationId is None:
+            raise InvalidProjectXml(f'Links must have source and destination IDs.  {sourceId=} {destinationId=}')
+        if sourceId not in modelObjects or destinationId not in modelObjects:
+            self.logger.error(f'Developer Error -- {umlLinkElement=}')     # noqa
+            self.logger.error(f'Developer Error -- {sourceId=} {destinationId=}')
+            assert False, 'Developer error'
+
+        link: Link = self._xmlToUmlModel.linkToModelLink(
+            singleLink=singleLinkElement,
+            source=modelObjects[sourceId],              # type: ignore
+            destination=modelObjects[destinationId]     # type: ignore
+        )
+        if tracing is True:
+            self._elementTracer.trace('link=%s', link)
+
+        return LinkIR(
+            link=link,
+            sourceId=sourceId,
+            destinationId=destinationId,
+            umlLinkAttributes=UmlLinkAttributes.fromGraphicLink(linkElement=umlLinkElement),
+            controlPoints=self._getLineControlPoints(umlLinkElement=umlLinkElement)
+        )
+
+    def toLollipopIR(self, lollipopElement: Element) -> LollipopIR:
+        """
+        <UmlLollipopInterface lineCentum="0.1" attachmentSide="Right" attachedToId="valley.darkness.implementor">
+        """
+        return LollipopIR(
+            interface=self._xmlToUmlModel.interfaceToModelInterface(lollipopElement),
+            attachedToId=lollipopElement[XmlConstants.ATTRIBUTE_ATTACHED_TO_ID],
+            attachmentSide=lollipopElement[XmlConstants.ATTRIBUTE_ATTACHMENT_SIDE],
+            lineCentum=SecureConversions.secureFloat(lollipopElement[XmlConstants.ATTRIBUTE_LINE_CENTUM])
+        )
+
+    def buildModelObjects(self, diagramIR: DiagramIR) -> ModelObjects:
+        """
+        The model side of linkableUmlShapes
+
+        Args:
+            diagramIR:   The diagram IR;  Its linkable objects must already be deserialized
+
+        Returns:  The linkable model objects indexed by model ID
+        """
+        modelObjects: ModelObjects = ModelObjects({})
+
+        for classIR in diagramIR.classIRs:
+            modelObjects[classIR.modelClass.id] = classIR.modelClass
+        for noteIR in diagramIR.noteIRs:
+            modelObjects[noteIR.modelNote.id] = noteIR.modelNote
+        for useCaseIR in diagramIR.useCaseIRs:
+            modelObjects[useCaseIR.modelUseCase.id] = useCaseIR.modelUseCase
+        for actorIR in diagramIR.actorIRs:
+            modelObjects[actorIR.modelActor.id] = actorIR.modelActor
+
+        return modelObjects
+
+    def _toLinkIRs(self, umlDiagramElement: Element, diagramIR: DiagramIR) -> LinkIRs:
+        """
+        Must run after the linkable objects are deserialized
+        """
+        modelObjects: ModelObjects = self.buildModelObjects(diagramIR=diagramIR)
+        tracing:      bool         = self._elementTracer.enabled
+
+        return LinkIRs([
+            self.toLinkIR(umlLinkElement=e, modelObjects=modelObjects, tracing=tracing) for e in self._getElements(umlDiagramElement, XmlConstants.ELEMENT_UML_LINK)
+        ])
+
+    def _getLineControlPoints(self, umlLinkElement: Element) -> UmlPositions:
+        """
+         <LineControlPoint x="100" y="100" />
+        """
+        controlPoints: UmlPositions = UmlPositions([])
+
+        for controlPointElement in self._getElements(umlLinkElement, XmlConstants.ELEMENT_MODEL_LINE_CONTROL_POINT):
+            x: int = SecureConversions.secureInteger(controlPointElement[XmlConstants.ATTRIBUTE_X])
+            y: int = SecureConversions.secureInteger(controlPointElement[XmlConstants.ATTRIBUTE_Y])
+
+            controlPoints.append(UmlPosition(x=x, y=y))
+
+        return controlPoints
+
+    def _getElements(self, parentElement: Element, elementName: str) -> Elements:
+        return cast(Elements, parentElement.get_elements(elementName))
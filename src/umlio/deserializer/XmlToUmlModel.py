@@ -45,7 +45,9 @@ from umlmodel.enumerations.DisplayParameters import DisplayParameters
 from codeallybasic.Common import XML_END_OF_LINE_MARKER
 from codeallybasic.SecureConversions import SecureConversions
 
-from umlio.IOTypes import Elements
+from umlio.ElementTracing import ElementTracer
+
+from umlio.ProjectTypes import Elements
 
 from umlio.XMLConstants import XmlConstants
 
@@ -64,14 +66,25 @@ class ConvolutedModelSDMessageInformation:
 
 class XmlToUmlModel:
     """
-    Converts Uml Model Version 14 XML to Uml Model instance
+    Converts Uml Model Version 14 XML to Uml Model instance.
+
+    Unnamed model objects are numbered per diagram;  So a diagram gets the same names however
+    the project is read;  Sequentially, in worker processes or lazily one diagram at a time
     """
     NOTE_NAME:   str = 'Note'
-    noteCounter: int = 0
 
     def __init__(self):
 
-        self.logger: Logger = getLogger(__name__)
+        self.logger:         Logger        = getLogger(__name__)
+        self._elementTracer: ElementTracer = ElementTracer(logger=self.logger)
+
+        self._noteCounter: int = 0
+
+    def startDiagram(self):
+        """
+        Call at the start of each diagram;  Restarts the numbering of unnamed model objects
+        """
+        self._noteCounter = 0
 
     def classToModelClass(self, umlClassElement: Element) -> Class:
         classElement: Element = umlClassElement.ModelClass
@@ -279,11 +292,13 @@ class XmlToUmlModel:
         untangledModelMethods: Methods = Methods([])
 
         methodElements: Elements = cast(Elements, classElement.get_elements(XmlConstants.ELEMENT_MODEL_METHOD))
+        tracing:        bool     = self._elementTracer.enabled
 
         for methodElement in methodElements:
             methodName: str        = methodElement['name']
             visibility: Visibility = Visibility.toEnum(methodElement[XmlConstants.ATTRIBUTE_VISIBILITY])
-            self.logger.debug(f"{methodName=} - {visibility=}")
+            if tracing is True:
+                self._elementTracer.trace('methodName=%s - visibility=%s', methodName, visibility)
 
             method: Method = Method(name=methodName, visibility=visibility)
 
@@ -365,9 +380,11 @@ class XmlToUmlModel:
         sourceCodeElements = methodElement.get_elements(XmlConstants.ELEMENT_MODEL_SOURCE_CODE)
         codeElements = sourceCodeElements[0].get_elements(XmlConstants.ELEMENT_MODEL_CODE)
         sourceCode: SourceCode = SourceCode([])
+        tracing:    bool       = self._elementTracer.enabled
         for codeElement in codeElements:
-            self.logger.debug(f'{codeElement.cdata=}')
             codeLine: str = codeElement.cdata
+            if tracing is True:
+                self._elementTracer.trace('codeLine=%s', codeLine)
             sourceCode.append(codeLine)
         return sourceCode
 
@@ -392,8 +409,8 @@ class XmlToUmlModel:
         umlModelBase.fileName = modelElement[XmlConstants.ATTRIBUTE_FILENAME]
 
         if umlModelBase.name is None:
-            XmlToUmlModel.noteCounter += 1
-            umlModelBase.name = f'{XmlToUmlModel.NOTE_NAME}-{XmlToUmlModel.noteCounter}'
+            self._noteCounter += 1
+            umlModelBase.name = f'{XmlToUmlModel.NOTE_NAME}-{self._noteCounter}'
         return umlModelBase
 
     def _secureDisplayMethods(self, displayStr: str) -> DisplayMethods:
@@ -1,216 +1,121 @@
 
+from typing import Iterable
+from typing import Optional
+
 from logging import Logger
 from logging import getLogger
 
 from pathlib import Path
 
+from defusedxml.sax import make_parser
+
 from untangle import Element
+from untangle import Handler
 from untangle import parse
 
-from codeallybasic.SecureConversions import SecureConversions
-
-from umlshapes.ShapeTypes import LinkableUmlShapes
-from umlshapes.ShapeTypes import linkableUmlShapesFactory
+from umlio.IOStats import IOStats
+from umlio.IOStats import PHASE_MODEL_BUILD
+from umlio.IOStats import PHASE_PARSE
+from umlio.IOStats import phase
 
-from umlio.IOTypes import UmlActors
-from umlio.IOTypes import UmlClasses
 from umlio.IOTypes import UmlDocument
-from umlio.IOTypes import UmlDocumentTitle
-from umlio.IOTypes import UmlDocumentType
-from umlio.IOTypes import UmlLinks
-from umlio.IOTypes import UmlLollipopInterfaces
-from umlio.IOTypes import UmlNotes
-from umlio.IOTypes import UmlTexts
 from umlio.IOTypes import UmlProject
-from umlio.IOTypes import UmlUseCases
 
-from umlio.deserializer.XmlActorsToUmlActors import XmlActorsToUmlActors
-from umlio.deserializer.XmlClassesToUmlClasses import XmlClassesToUmlClasses
-from umlio.deserializer.XmlLinksToUmlLinks import XmlLinksToUmlLinks
-from umlio.deserializer.XmlLollipopsToUmlLollipops import XmlLollipopsToUmlLollipops
-from umlio.deserializer.XmlNotesToUmlNotes import XmlNotesToUmlNotes
-from umlio.deserializer.XmlTextsToUmlTexts import XmlTextsToUmlTexts
-from umlio.deserializer.XmlUseCasesToUmlUseCases import XmlUseCasesToUmlUseCases
+from umlio.IRTypes import DiagramIR
+
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
+from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+
+from umlio.sources.XmlFileSource import XmlFileSource
 
 from umlio.XMLConstants import XmlConstants
 
 
 class XmlToUmlShapes:
+    """
+    Untangles the whole document, then runs each diagram through both loading stages;
+    XmlToDiagramIR, then DiagramIRToUmlShapes
+    """
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
-        self._umlProject:  UmlProject  = UmlProject()
+        self._umlProject:  UmlProject        = UmlProject()
+        self._ioStats:     Optional[IOStats] = None
+
+        self._xmlToDiagramIR:       XmlToDiagramIR       = XmlToDiagramIR()
+        self._diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
 
     @property
     def umlProject(self) -> UmlProject:
         return self._umlProject
 
-    def deserializeProjectFile(self, fileName: Path):
-        pass
-
-    def deserializeXmlFile(self, fileName: Path):
+    @property
+    def ioStats(self) -> Optional[IOStats]:
         """
-        Untangle the input Xml string to UmlShapes
-        Args:
-            fileName:  The file name from which the XML came from
+        When set, the parse, model build and shape build times are added to it
         """
+        return self._ioStats
 
-        xmlString: str = fileName.read_text()
-        self.deserializeXml(xmlString=xmlString, fileName=fileName)
-
-    def deserializeXml(self, xmlString: str, fileName: Path):
-        root:       Element = parse(xmlString)
-        umlProject: Element = root.UmlProject
-
-        self._umlProject.fileName = fileName
-        self._umlProject.version  = umlProject[XmlConstants.ATTRIBUTE_VERSION]
-        self._umlProject.codePath = umlProject[XmlConstants.ATTRIBUTE_CODE_PATH]
-
-        for umlDiagramElement in umlProject.UMLDiagram:
-
-            umlDocument: UmlDocument = UmlDocument(
-                documentTitle=umlDiagramElement[XmlConstants.ATTRIBUTE_TITLE],
-                scrollPositionX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_X]),
-                scrollPositionY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y]),
-                pixelsPerUnitX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X]),
-                pixelsPerUnitY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y])
-            )
-            umlDocument.documentTitle = UmlDocumentTitle(umlDiagramElement[XmlConstants.ATTRIBUTE_TITLE])
-
-            if umlDiagramElement[XmlConstants.ATTRIBUTE_DOCUMENT_TYPE] == UmlDocumentType.CLASS_DOCUMENT.value:
-
-                umlDocument.documentType = UmlDocumentType.CLASS_DOCUMENT
-                umlDocument.umlClasses = self._deserializeUmlClassElements(umlDiagramElement=umlDiagramElement)
-                umlDocument.umlNotes   = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
-                umlDocument.umlTexts   = self._deserializeUmlTextElements(umlDiagramElement=umlDiagramElement)
-
-                linkableUmlShapes: LinkableUmlShapes = self._buildLinkableUmlShapes(umlDocument=umlDocument)
-
-                umlDocument.umlLinks              = self._deserializeUmlLinkElements(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
-                umlDocument.umlLollipopInterfaces = self._deserializeLollipopInterfaces(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
-
-            elif umlDiagramElement[XmlConstants.ATTRIBUTE_DOCUMENT_TYPE] == UmlDocumentType.USE_CASE_DOCUMENT.value:
-
-                umlDocument.documentType = UmlDocumentType.USE_CASE_DOCUMENT
-                umlDocument.umlNotes    = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
-                umlDocument.umlActors   = self._deserializeUmlActorElements(umlDiagramElement=umlDiagramElement)
-                umlDocument.umlUseCases = self._deserializeUmlUseCaseElements(umlDiagramElement=umlDiagramElement)
-
-                linkableUmlShapes = self._buildLinkableUmlShapes(umlDocument=umlDocument)
-
-                umlDocument.umlLinks = self._deserializeUmlLinkElements(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
-
-            elif umlDiagramElement[XmlConstants.ATTRIBUTE_DOCUMENT_TYPE] == UmlDocumentType.SEQUENCE_DOCUMENT.value:
-
-                umlDocument.documentType = UmlDocumentType.SEQUENCE_DOCUMENT
-                umlDocument.umlTexts   = self._deserializeUmlTextElements(umlDiagramElement=umlDiagramElement)
-                umlDocument.umlNotes    = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
-
-            else:
-                assert False, 'Unknown diagram Type - Perhaps corrupted fle'
-
-            self._umlProject.umlDocuments[umlDocument.documentTitle] = umlDocument
-
-    def _deserializeUmlClassElements(self, umlDiagramElement: Element) -> UmlClasses:
-
-        umlClassesDeSerializer: XmlClassesToUmlClasses = XmlClassesToUmlClasses()
-        umlClasses:             UmlClasses             = umlClassesDeSerializer.deserialize(umlDiagramElement=umlDiagramElement)
+    @ioStats.setter
+    def ioStats(self, ioStats: Optional[IOStats]):
+        self._ioStats                      = ioStats
+        self._diagramIRToUmlShapes.ioStats = ioStats
 
-        return umlClasses
-
-    def _deserializeUmlTextElements(self, umlDiagramElement: Element) -> UmlTexts:
-        """
-        Yeah, yeah, I know bad English;
-
-        Args:
-            umlDiagramElement:  The diagram Element
-
-        Returns:  deserialized UmlText objects if any exist, else an empty list
-        """
-        umlTextDeSerializer: XmlTextsToUmlTexts = XmlTextsToUmlTexts()
-        umlTexts: UmlTexts = umlTextDeSerializer.deserialize(umlDiagramElement=umlDiagramElement)
-
-        return umlTexts
+    def deserializeProjectFile(self, fileName: Path):
+        pass
 
-    def _deserializeUmlNoteElements(self, umlDiagramElement: Element) -> UmlNotes:
+    def deserializeXmlFile(self, fileName: Path):
         """
+        Untangle the input Xml file to UmlShapes.  The parser reads the memory mapped file
+        directly;  The document is never decoded into a string
 
         Args:
-            umlDiagramElement:  The diagram Element
-
-        Returns:  deserialized UmlNote objects if any exist, else an empty list
-        """
-        xmlNotesToUmlNotes: XmlNotesToUmlNotes = XmlNotesToUmlNotes()
-        umlNotes: UmlNotes = xmlNotesToUmlNotes.deserialize(umlDiagramElement=umlDiagramElement)
-
-        return umlNotes
-
-    def _deserializeUmlActorElements(self, umlDiagramElement: Element) -> UmlActors:
+            fileName:  The file name from which the XML came from
         """
+        self.deserializeXmlChunks(xmlChunks=XmlFileSource(fileName=fileName).chunks(), fileName=fileName)
 
-        Args:
-            umlDiagramElement:  The diagram Element
-
-        Returns:  deserialized UmlActor objects if any exist, else an empty list
-        """
-        xmlActorsToUmlActors: XmlActorsToUmlActors = XmlActorsToUmlActors()
+    def deserializeXml(self, xmlString: str, fileName: Path):
 
-        umlActors: UmlActors = xmlActorsToUmlActors.deserialize(umlDiagramElement=umlDiagramElement)
+        with phase(self._ioStats, PHASE_PARSE):
+            root: Element = parse(xmlString)
 
-        return umlActors
+        self._deserializeUmlProject(umlProject=root.UmlProject, fileName=fileName)
 
-    def _deserializeUmlUseCaseElements(self, umlDiagramElement: Element) -> UmlUseCases:
+    def deserializeXmlChunks(self, xmlChunks: Iterable[bytes], fileName: Path):
         """
+        Untangle the XML as it arrives.  The chunks are fed straight into an incremental
+        parser;  So the raw document is never assembled nor decoded into a single string
 
         Args:
-            umlDiagramElement:  The diagram Element
-
-        Returns:  deserialized UmlUseCase objects if any exist, else an empty list
+            xmlChunks:  The raw XML bytes in document order
+            fileName:   The file name from which the XML came from
         """
-        xmlUseCasesToUmlUseCases: XmlUseCasesToUmlUseCases = XmlUseCasesToUmlUseCases()
-
-        umlUseCases: UmlUseCases = xmlUseCasesToUmlUseCases.deserialize(umlDiagramElement=umlDiagramElement)
-
-        return umlUseCases
-
-    def _deserializeUmlLinkElements(self, umlDiagramElement: Element, linkableUmlShapes: LinkableUmlShapes) -> UmlLinks:
-
-        xmlLinksToUmlLinks: XmlLinksToUmlLinks = XmlLinksToUmlLinks()
-
-        umlLinks: UmlLinks = xmlLinksToUmlLinks.deserialize(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
-
-        return umlLinks
-
-    def _deserializeLollipopInterfaces(self, umlDiagramElement: Element, linkableUmlShapes: LinkableUmlShapes) -> UmlLollipopInterfaces:
+        handler: Handler = Handler()
+        parser           = make_parser()        # The same hardened parser that untangle.parse uses
 
-        xmlLollipopsToUmLollipops: XmlLollipopsToUmlLollipops = XmlLollipopsToUmlLollipops()
+        parser.setContentHandler(handler)
+        with phase(self._ioStats, PHASE_PARSE):
+            for xmlChunk in xmlChunks:
+                parser.feed(xmlChunk)
+            parser.close()
 
-        lollipopInterfaces: UmlLollipopInterfaces = xmlLollipopsToUmLollipops.deserialize(umlDiagramElement=umlDiagramElement,
-                                                                                          linkableUmlShapes=linkableUmlShapes
-                                                                                          )
-        return lollipopInterfaces
+        self._deserializeUmlProject(umlProject=handler.root.UmlProject, fileName=fileName)
 
-    def _buildLinkableUmlShapes(self, umlDocument: UmlDocument) -> LinkableUmlShapes:
-        """
+    def _deserializeUmlProject(self, umlProject: Element, fileName: Path):
 
-        Args:
-            umlDocument:   The created document either Use case or class diagram
+        self._deserializeProjectInformation(umlProject=umlProject, fileName=fileName)
 
-        Returns:  Linkable UML Shapes Dictionary
-        """
-
-        linkableUmlShapes: LinkableUmlShapes = linkableUmlShapesFactory()
+        for umlDiagramElement in umlProject.UMLDiagram:
 
-        for umlClass in umlDocument.umlClasses:
-            linkableUmlShapes[umlClass.modelClass.id] = umlClass
+            with phase(self._ioStats, PHASE_MODEL_BUILD):
+                diagramIR: DiagramIR = self._xmlToDiagramIR.deserializeUmlDiagram(umlDiagramElement=umlDiagramElement)
 
-        for umlNote in umlDocument.umlNotes:
-            linkableUmlShapes[umlNote.modelNote.id] = umlNote
+            umlDocument: UmlDocument = self._diagramIRToUmlShapes.materialize(diagramIR=diagramIR)
 
-        for umlUseCase in umlDocument.umlUseCases:
-            linkableUmlShapes[umlUseCase.modelUseCase.id] = umlUseCase
+            self._umlProject.umlDocuments[umlDocument.documentTitle] = umlDocument
 
-        for umlActor in umlDocument.umlActors:
-            linkableUmlShapes[umlActor.modelActor.id] = umlActor
+    def _deserializeProjectInformation(self, umlProject: Element, fileName: Path):
 
-        return linkableUmlShapes
+        self._umlProject.fileName = fileName
+        self._umlProject.version  = umlProject[XmlConstants.ATTRIBUTE_VERSION]
+        self._umlProject.codePath = umlProject[XmlConstants.ATTRIBUTE_CODE_PATH]
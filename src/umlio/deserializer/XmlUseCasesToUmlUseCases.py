@@ -1,36 +1,30 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 
 from untangle import Element
 
-from umlmodel.UseCase import UseCase
-
-from umlshapes.shapes.UmlUseCase import UmlUseCase
-
-from umlio.IOTypes import Elements
-from umlio.IOTypes import GraphicInformation
 from umlio.IOTypes import UmlUseCases
 from umlio.IOTypes import umlUseCasesFactory
 
 from umlio.XMLConstants import XmlConstants
 
-from umlio.deserializer.XmlToUmlModel import XmlToUmlModel
+from umlio.deserializer.DiagramIRToUmlShapes import DiagramIRToUmlShapes
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
 
 
 class XmlUseCasesToUmlUseCases:
     """
-    XML Elements to UML use case shape objects and associated model objects
+    Kept for existing callers;  The readers no longer use it.  Delegates to the two loading
+    stages, XmlToDiagramIR and DiagramIRToUmlShapes
     """
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
-        self._xmlToUmlModel: XmlToUmlModel = XmlToUmlModel()
+        self._xmlToDiagramIR:       XmlToDiagramIR       = XmlToDiagramIR()
+        self._diagramIRToUmlShapes: DiagramIRToUmlShapes = DiagramIRToUmlShapes()
 
     def deserialize(self, umlDiagramElement: Element) -> UmlUseCases:
-
         """
 
         Args:
@@ -38,20 +32,9 @@ class XmlUseCasesToUmlUseCases:
 
         Returns:  deserialized UmlUseCase objects if any exist, else an empty list
         """
-        umlUseCases:     UmlUseCases = umlUseCasesFactory()
-        useCaseElements: Elements = cast(Elements, umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_USE_CASE))
-
-        for useCaseElement in useCaseElements:
-            self.logger.debug(f'{useCaseElement}')
-
-            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=useCaseElement)
-            useCase:            UseCase            = self._xmlToUmlModel.useCaseToModelUseCase(umlUseCaseElement=useCaseElement)
-            umlUseCase:         UmlUseCase         = UmlUseCase(useCase=useCase)
-
-            umlUseCase.id       = graphicInformation.id
-            umlUseCase.size     = graphicInformation.size
-            umlUseCase.position = graphicInformation.position
+        umlUseCases: UmlUseCases = umlUseCasesFactory()
 
-            umlUseCases.append(umlUseCase)
+        for useCaseElement in umlDiagramElement.get_elements(XmlConstants.ELEMENT_UML_USE_CASE):
+            umlUseCases.append(self._diagramIRToUmlShapes.toUmlUseCase(useCaseIR=self._xmlToDiagramIR.toUseCaseIR(useCaseElement=useCaseElement)))
 
         return umlUseCases
@@ -0,0 +1,7 @@
+
+
+class DecompressionLimitException(Exception):
+
+    def __init__(self, message: str):
+
+        super().__init__(message)
@@ -0,0 +1,130 @@
+
+from logging import Logger
+from logging import getLogger
+
+from hashlib import blake2b
+
+from umlmodel.Interface import Interface
+from umlmodel.Link import Link
+from umlmodel.Method import Method
+
+from umlshapes.ShapeTypes import UmlShapeGenre
+
+from umlshapes.links.UmlAssociation import UmlAssociation
+from umlshapes.links.UmlLink import UmlLink
+from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
+
+from umlio.IOTypes import UmlDocument
+
+from umlio.serializer.UmlShapesToXml import umlDocumentAttributes
+
+
+class DiagramFingerprint:
+    """
+    Digests a diagram straight from its shapes and model objects;  Nothing is serialized and
+    no element tree is built.  The values digested are the ones the serializers write;  So a
+    change to anything that ends up in the XML changes the fingerprint.
+
+    Keep it in step with the serializers;  A value written but not digested here means an edit
+    to it is lost from an incremental save
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def fingerprint(self, umlDiagram: UmlDocument, prettyPrint: bool) -> bytes:
+        """
+        Args:
+            umlDiagram:   The UML diagram about to be saved
+            prettyPrint:  The fragment's layout depends on it
+
+        Returns:  The fingerprint
+        """
+        digest = blake2b(repr((prettyPrint, umlDocumentAttributes(umlDiagram=umlDiagram))).encode())
+
+        def update(*values: object):
+            digest.update(repr(values).encode())
+
+        for umlClass in umlDiagram.umlClasses:
+            modelClass = umlClass.modelClass
+            update(
+                'class', self._shapeValues(umlShape=umlClass),
+                modelClass.id, modelClass.name, modelClass.stereotype.value, modelClass.showMethods, modelClass.displayParameters.value,
+                modelClass.displayConstructor.value, modelClass.displayDunderMethods.value, modelClass.showFields, modelClass.displayStereoType,
+                modelClass.fileName, modelClass.description
+            )
+            for method in modelClass.methods:
+                update('method', *self._methodValues(method=method))
+            for field in modelClass.fields:
+                update('field', field.name, field.visibility.name, field.type.value, field.defaultValue)
+
+        for umlUseCase in umlDiagram.umlUseCases:
+            modelUseCase = umlUseCase.modelUseCase
+            update('useCase', self._shapeValues(umlShape=umlUseCase), modelUseCase.id, modelUseCase.name, modelUseCase.fileName)
+        for umlActor in umlDiagram.umlActors:
+            modelActor = umlActor.modelActor
+            update('actor', self._shapeValues(umlShape=umlActor), modelActor.id, modelActor.name, modelActor.fileName)
+
+        for umlNote in umlDiagram.umlNotes:
+            modelNote = umlNote.modelNote
+            update('note', self._shapeValues(umlShape=umlNote), modelNote.id, modelNote.content, modelNote.fileName)
+        for umlText in umlDiagram.umlTexts:
+            modelText = umlText.modelText
+            update('text', self._shapeValues(umlShape=umlText), modelText.id, modelText.content)
+
+        for umlLink in umlDiagram.umlLinks:
+            update('link', *self._linkValues(umlLink=umlLink))
+
+        for umlLollipop in umlDiagram.umlLollipopInterfaces:
+            update('lollipop', *self._lollipopValues(umlLollipopInterface=umlLollipop))
+            for method in umlLollipop.modelInterface.methods:
+                update('method', *self._methodValues(method=method))
+
+        return digest.digest()
+
+    def _shapeValues(self, umlShape: UmlShapeGenre) -> tuple:
+        """
+        The values BaseUmlToXml writes
+        """
+        return str(umlShape.id), umlShape.size.width, umlShape.size.height, umlShape.position.x, umlShape.position.y
+
+    def _methodValues(self, method: Method) -> tuple:
+
+        return (
+            method.name, method.visibility.name, method.returnType.value,
+            [modifier.name for modifier in method.modifiers],
+            list(method.sourceCode),
+            [(parameter.name, parameter.type.value, parameter.defaultValue) for parameter in method.parameters]
+        )
+
+    def _linkValues(self, umlLink: UmlLink) -> tuple:
+        """
+        The values UmlLinksToXml writes;  The control points include the end points it drops
+        """
+        endPositions = umlLink.endPositions
+        modelLink:    Link = umlLink.modelLink
+
+        labelDeltas: list[tuple] = []
+        if isinstance(umlLink, UmlAssociation):
+            for umlLinkLabel in (umlLink.associationName, umlLink.sourceCardinality, umlLink.destinationCardinality):
+                labelDeltas.append((umlLinkLabel.linkDelta.deltaX, umlLinkLabel.linkDelta.deltaY))
+
+        return (
+            type(umlLink).__name__, str(umlLink.id), umlLink.spline,
+            endPositions.fromPosition.x, endPositions.fromPosition.y, endPositions.toPosition.x, endPositions.toPosition.y,
+            labelDeltas,
+            [(controlPoint.x, controlPoint.y) for controlPoint in umlLink.GetLineControlPoints()],
+            modelLink.name, modelLink.linkType.name, modelLink.source.id, modelLink.destination.id, modelLink.bidirectional,
+            modelLink.sourceCardinality, modelLink.destinationCardinality
+        )
+
+    def _lollipopValues(self, umlLollipopInterface: UmlLollipopInterface) -> tuple:
+        """
+        The values UmlLollipopsToXml writes, less the interface methods
+        """
+        interface: Interface = umlLollipopInterface.modelInterface
+
+        return (
+            umlLollipopInterface.lineCentum, umlLollipopInterface.attachmentSide.value, umlLollipopInterface.attachedTo.id,
+            interface.id, interface.name, interface.description, list(interface.implementors)
+        )
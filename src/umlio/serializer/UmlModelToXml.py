@@ -27,6 +27,8 @@ from umlmodel.SDMessage import SDMessage
 from umlmodel.Text import Text
 from umlmodel.UseCase import UseCase
 
+from umlio.ElementTracing import ElementTracer
+
 from umlio.IOTypes import ElementAttributes
 
 from umlio.XMLConstants import XmlConstants
@@ -39,7 +41,8 @@ class UmlModelToXml:
 
     def __init__(self):
         super().__init__()
-        self.logger: Logger = getLogger(__name__)
+        self.logger:         Logger        = getLogger(__name__)
+        self._elementTracer: ElementTracer = ElementTracer(logger=self.logger)
 
     def classToXml(self, modelClass: Class, umlClassElement: Element) -> Element:
         """
@@ -122,8 +125,10 @@ class UmlModelToXml:
         for method in interface.methods:
             self._methodToXml(method=method, classElement=interfaceElement)
 
+        tracing: bool = self._elementTracer.enabled
         for className in interface.implementors:
-            self.logger.debug(f'implementing className: {className}')
+            if tracing is True:
+                self._elementTracer.trace('implementing className: %s', className)
             self._implementorToXml(className, interfaceElement)
 
         return interfaceElement
@@ -14,6 +14,7 @@ from xml.etree.ElementTree import fromstring as xmlFromString
 
 from umlio.IOTypes import XML_VERSION
 from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import ElementAttributes
 
 from umlio.serializer.UmlLinksToXml import UmlLinksToXml
 from umlio.serializer.UmlNotesToXml import UmlNotesToXml
@@ -27,6 +28,49 @@ from umlio.XMLConstants import XmlConstants
 INDENT_SPACES: str = '    '     # TODO: Make this configurable
 
 
+def umlDocumentAttributes(umlDiagram: UmlDocument) -> ElementAttributes:
+    """
+    Args:
+        umlDiagram:
+
+    Returns:  The attributes of the diagram's document element
+    """
+    attributes: ElementAttributes = ElementAttributes({
+        XmlConstants.ATTRIBUTE_DOCUMENT_TYPE:     umlDiagram.documentType.value,
+        XmlConstants.ATTRIBUTE_TITLE:             umlDiagram.documentTitle,
+        XmlConstants.ATTRIBUTE_SCROLL_POSITION_X: str(umlDiagram.scrollPositionX),
+        XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y: str(umlDiagram.scrollPositionY),
+        XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X: str(umlDiagram.pixelsPerUnitX),
+        XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y: str(umlDiagram.pixelsPerUnitY),
+    })
+    return attributes
+
+
+def serializeUmlDocument(documentElement: Element, umlDiagram: UmlDocument):
+    """
+    Serialize the diagram's shapes under its document element
+
+    Args:
+        documentElement:  The diagram's document element
+        umlDiagram:       The UML diagram to serialize
+    """
+    umlClassToXml:     UmlClassToXml     = UmlClassToXml()
+    umlUseCaseToXml:   UmlUseCasesToXml  = UmlUseCasesToXml()
+    umlNotesToXml:     UmlNotesToXml     = UmlNotesToXml()
+    umlTextsToXml:     UmlTextsToXml     = UmlTextsToXml()
+    umlLinksToXml:     UmlLinksToXml     = UmlLinksToXml()
+    umlLollipopsToXml: UmlLollipopsToXml = UmlLollipopsToXml()
+
+    umlClassToXml.serialize(documentTop=documentElement, umlClasses=umlDiagram.umlClasses)
+    umlUseCaseToXml.serialize(documentTop=documentElement, umlUseCases=umlDiagram.umlUseCases, umlActors=umlDiagram.umlActors)
+
+    umlNotesToXml.serialize(documentTop=documentElement, umlNotes=umlDiagram.umlNotes)
+    umlTextsToXml.serialize(documentTop=documentElement, umlTexts=umlDiagram.umlTexts)
+    umlLinksToXml.serialize(documentTop=documentElement, umlLinks=umlDiagram.umlLinks)
+
+    umlLollipopsToXml.serialize(documentTop=documentElement, umlLollipops=umlDiagram.umlLollipopInterfaces)
+
+
 class UmlShapesToXml:
     """
     The driver class to turn UML Shapes to XML
@@ -84,23 +128,9 @@ class UmlShapesToXml:
             umlDiagram:  The UML diagram to serialize
 
         """
-        umlClassToXml:   UmlClassToXml    = UmlClassToXml()
-        umlUseCaseToXml: UmlUseCasesToXml = UmlUseCasesToXml()
-        umlNotesToXml:   UmlNotesToXml    = UmlNotesToXml()
-        umlTextsToXml:   UmlTextsToXml    = UmlTextsToXml()
-        umlLinksToXml:   UmlLinksToXml    = UmlLinksToXml()
-        umlLollipopsToXml: UmlLollipopsToXml = UmlLollipopsToXml()
+        documentElement: Element = SubElement(self._xmlProjectElement, XmlConstants.ELEMENT_UML_DIAGRAM, attrib=umlDocumentAttributes(umlDiagram=umlDiagram))
 
-        documentElement: Element       = self._umlDocumentAttributesToXml(umlDiagram=umlDiagram)
-
-        umlClassToXml.serialize(documentTop=documentElement, umlClasses=umlDiagram.umlClasses)
-        umlUseCaseToXml.serialize(documentTop=documentElement, umlUseCases=umlDiagram.umlUseCases, umlActors=umlDiagram.umlActors)
-
-        umlNotesToXml.serialize(documentTop=documentElement, umlNotes=umlDiagram.umlNotes)
-        umlTextsToXml.serialize(documentTop=documentElement, umlTexts=umlDiagram.umlTexts)
-        umlLinksToXml.serialize(documentTop=documentElement, umlLinks=umlDiagram.umlLinks)
-
-        umlLollipopsToXml.serialize(documentTop=documentElement, umlLollipops=umlDiagram.umlLollipopInterfaces)
+        serializeUmlDocument(documentElement=documentElement, umlDiagram=umlDiagram)
 
     def writeXml(self, fileName: Path):
         """
@@ -111,29 +141,6 @@ class UmlShapesToXml:
         """
         fileName.write_text(self.xml)
 
-    def _umlDocumentAttributesToXml(self, umlDiagram: UmlDocument) -> Element:
-        """
-        Create a document sub element under the project element
-
-        Args:
-            umlDiagram:
-
-        Returns:  The newly created document top sub element
-
-        """
-
-        attributes = {
-            XmlConstants.ATTRIBUTE_DOCUMENT_TYPE:              umlDiagram.documentType.value,
-            XmlConstants.ATTRIBUTE_TITLE:             umlDiagram.documentTitle,
-            XmlConstants.ATTRIBUTE_SCROLL_POSITION_X: str(umlDiagram.scrollPositionX),
-            XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y: str(umlDiagram.scrollPositionY),
-            XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X: str(umlDiagram.pixelsPerUnitX),
-            XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y: str(umlDiagram.pixelsPerUnitY),
-        }
-        documentTop: Element = SubElement(self._xmlProjectElement, XmlConstants.ELEMENT_UML_DIAGRAM, attrib=attributes)
-
-        return documentTop
-
     def _toPrettyString(self, originalProjectElement: Element) -> str:
         """
         Create a copy of the input originalElement
@@ -0,0 +1,183 @@
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from xml.etree.ElementTree import Element
+
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+from xml.etree.ElementTree import fromstring as xmlFromString
+
+from umlio.IOTypes import XML_VERSION
+from umlio.IOTypes import UmlDocument
+
+from umlio.DiagramIndex import DiagramIndex
+from umlio.DiagramIndex import IndexedDiagram
+from umlio.DiagramIndex import diagramHash
+
+from umlio.cache.DiagramFragmentCache import DiagramFragmentCache
+
+from umlio.serializer.DiagramFingerprint import DiagramFingerprint
+from umlio.serializer.UmlShapesToXml import INDENT_SPACES
+from umlio.serializer.UmlShapesToXml import serializeUmlDocument
+from umlio.serializer.UmlShapesToXml import umlDocumentAttributes
+
+from umlio.sinks.XmlSink import XmlSink
+
+from umlio.XMLConstants import XmlConstants
+
+XML_ENCODING: str = 'iso-8859-1'
+
+EMPTY_ELEMENT_END: bytes = b' />'
+
+
+class UmlShapesToXmlStream:
+    """
+    Turns UML Shapes to XML one diagram at a time.  Only the element tree of the diagram
+    being serialized is ever built;  It is written to the sink and dropped before the next
+    diagram starts.  So memory is bounded by the largest diagram, not by the project.
+
+    The bytes written are the ones UmlShapesToXml produces for the same project.  With
+    a fragment cache, diagrams that have not changed since the last save are spliced in
+    from the cache;  Their element trees are never built.  With a diagram index, the byte range
+    and hash of each diagram are noted as it is written
+    """
+    def __init__(self, projectFileName: Path, projectCodePath: Path, xmlSink: XmlSink,
+                 fragmentCache: DiagramFragmentCache | None = None, diagramIndex: DiagramIndex | None = None):
+        """
+
+        Args:
+            projectFileName:
+            projectCodePath:
+            xmlSink:            Where the XML goes
+            fragmentCache:      Optional;  Keep the same one across saves of a project
+            diagramIndex:       Optional;  Filled in as the diagrams are written
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        xmlProjectElement: Element = Element(XmlConstants.ELEMENT_UML_PROJECT)
+
+        xmlProjectElement.set(XmlConstants.ATTRIBUTE_FILENAME, str(projectFileName))
+        xmlProjectElement.set(XmlConstants.ATTRIBUTE_VERSION, XML_VERSION)
+        xmlProjectElement.set(XmlConstants.ATTRIBUTE_CODE_PATH, str(projectCodePath))
+
+        self._xmlProjectElement: Element                     = xmlProjectElement
+        self._xmlSink:           XmlSink                     = xmlSink
+        self._fragmentCache:     DiagramFragmentCache | None = fragmentCache
+        self._fingerprint:       DiagramFingerprint          = DiagramFingerprint()
+        self._diagramIndex:      DiagramIndex | None         = diagramIndex
+        self._prettyPrint:       bool                        = True
+        self._diagramCount:      int                         = 0
+
+    @property
+    def prettyPrint(self) -> bool:
+        return self._prettyPrint
+
+    @prettyPrint.setter
+    def prettyPrint(self, prettyPrint: bool):
+        self._prettyPrint = prettyPrint
+
+    def serialize(self, umlDiagram: UmlDocument):
+        """
+        Repeatedly call this method for each diagram in a UML project;  Then call close()
+
+        Args:
+            umlDiagram:  The UML diagram to serialize
+        """
+        if self._diagramCount == 0:
+            self._writeProjectStart(projectStart=self._projectStartTag())
+            self._xmlSink.endBlock()
+
+        if self.prettyPrint is True:
+            self._xmlSink.write(f'\n{INDENT_SPACES}'.encode(XML_ENCODING))
+
+        fragment: bytes | None
+        if self._fragmentCache is None:
+            fragment = self._toFragment(umlDiagram=umlDiagram)
+        else:
+            fingerprint: bytes = self._fingerprint.fingerprint(umlDiagram=umlDiagram, prettyPrint=self.prettyPrint)
+
+            fragment = self._fragmentCache.load(documentTitle=umlDiagram.documentTitle, fingerprint=fingerprint)
+            if fragment is None:
+                fragment = self._toFragment(umlDiagram=umlDiagram)
+                self._fragmentCache.store(documentTitle=umlDiagram.documentTitle, fingerprint=fingerprint, fragment=fragment)
+
+        if self._diagramIndex is not None:
+            self._diagramIndex.indexedDiagrams.append(
+                IndexedDiagram(
+                    documentTitle=umlDiagram.documentTitle,
+                    documentType=umlDiagram.documentType.value,
+                    startOffset=self._xmlSink.xmlOffset,
+                    length=len(fragment),
+                    contentHash=diagramHash(fragment=fragment)
+                )
+            )
+        self._xmlSink.write(fragment)
+
+        self._xmlSink.endBlock()
+        self._diagramCount += 1
+
+    def close(self):
+        """
+        End the project element;  The sink is left to the caller
+        """
+        if self._diagramCount == 0:
+            self._writeProjectStart(projectStart=self._toBytes(self._xmlProjectElement))
+        else:
+            projectEnd: str = f'</{XmlConstants.ELEMENT_UML_PROJECT}>'
+            if self.prettyPrint is True:
+                projectEnd = f'\n{projectEnd}'
+            self._xmlSink.write(projectEnd.encode(XML_ENCODING))
+
+        self.logger.debug(f'Streamed {self._diagramCount} diagrams')
+
+    def _writeProjectStart(self, projectStart: bytes):
+        """
+        Args:
+            projectStart:  The XML declaration and the project start tag
+        """
+        if self._diagramIndex is not None:
+            self._diagramIndex.version      = XML_VERSION
+            self._diagramIndex.codePath     = self._xmlProjectElement.get(XmlConstants.ATTRIBUTE_CODE_PATH, '')
+            self._diagramIndex.prologLength = projectStart.index(f'<{XmlConstants.ELEMENT_UML_PROJECT}'.encode(XML_ENCODING))
+
+        self._xmlSink.write(projectStart)
+
+    def _toFragment(self, umlDiagram: UmlDocument) -> bytes:
+        """
+        Builds the diagram's element tree;  Only the one diagram's
+
+        Args:
+            umlDiagram:  The UML diagram to serialize
+
+        Returns:  The serialized diagram
+        """
+        documentElement: Element = Element(XmlConstants.ELEMENT_UML_DIAGRAM, attrib=umlDocumentAttributes(umlDiagram=umlDiagram))
+
+        serializeUmlDocument(documentElement=documentElement, umlDiagram=umlDiagram)
+
+        if self.prettyPrint is True:
+            #
+            # Same round trip as UmlShapesToXml._toPrettyString();  The diagram sits one level below the project
+            #
+            documentElement = xmlFromString(xmlToString(documentElement))
+            xmlIndent(documentElement, space=INDENT_SPACES, level=1)
+
+        return xmlToString(documentElement, encoding=XML_ENCODING, xml_declaration=False)
+
+    def _projectStartTag(self) -> bytes:
+        """
+        Let ElementTree quote the project attributes and write the declaration;  Then reopen
+        the childless project element
+
+        Returns:  The XML declaration and the project start tag
+        """
+        emptyProject: bytes = self._toBytes(self._xmlProjectElement)
+        assert emptyProject.endswith(EMPTY_ELEMENT_END), 'ElementTree changed how it writes empty elements'
+
+        return emptyProject[:-len(EMPTY_ELEMENT_END)] + b'>'
+
+    def _toBytes(self, element: Element) -> bytes:
+        return xmlToString(element, encoding=XML_ENCODING, xml_declaration=True)
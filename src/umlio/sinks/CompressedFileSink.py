@@ -0,0 +1,35 @@
+
+from typing import BinaryIO
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Compressor
+from umlio.codecs.ZlibCodec import ZlibCodec
+
+from umlio.sinks.XmlSink import XmlSink
+
+
+class CompressedFileSink(XmlSink):
+    """
+    A single stream compressed project file.  The XML is compressed as it arrives;  Only the
+    codec's own window is ever held in memory.  With the default codec the stream is identical
+    to what zlib.compress() produces for the whole document
+    """
+    def __init__(self, fileName: Path, codec: Codec = ZlibCodec(), outputStream: BinaryIO | None = None):
+
+        super().__init__(fileName=fileName, outputStream=outputStream)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self.logger.debug(f'{codec.name=}')
+        self._compressor: Compressor = codec.compressor()
+
+    def _encode(self, xmlBytes: bytes) -> bytes:
+        return self._compressor.compress(xmlBytes)
+
+    def _flush(self) -> bytes:
+        return self._compressor.flush()
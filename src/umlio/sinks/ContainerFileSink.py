@@ -0,0 +1,154 @@
+from typing import BinaryIO
+from typing import Deque
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from pathlib import Path
+
+from types import TracebackType
+
+from zlib import crc32
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.ZlibCodec import ZlibCodec
+
+from umlio.ContainerFormat import BlockEntries
+from umlio.ContainerFormat import BlockEntry
+from umlio.ContainerFormat import ContainerHeader
+from umlio.ContainerFormat import DEFAULT_CODEC_THREADS
+from umlio.ContainerFormat import HEADER_STRUCT
+from umlio.ContainerFormat import blockEntriesFactory
+from umlio.ContainerFormat import compressBlock
+from umlio.ContainerFormat import packBlockEntries
+
+from umlio.IOStats import PHASE_COMPRESS
+from umlio.IOStats import phase
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sinks.XmlSink import XmlSink
+
+PendingBlock = tuple[Future, BlockEntry]
+
+
+class ContainerFileSink(XmlSink):
+    """
+    A version 2 project file container.  The XML between two block boundaries is
+    compressed on a codec thread while the serializer moves on to the next diagram;
+    Compressed blocks are written in document order as soon as they are ready.  So at
+    most a few blocks are held in memory at a time.
+
+    The header is written last, once the table of contents is in place;  So an output stream
+    must be seekable
+    """
+    def __init__(self, fileName: Path, codec: Codec = ZlibCodec(), codecThreads: int = DEFAULT_CODEC_THREADS, outputStream: BinaryIO | None = None):
+
+        if outputStream is not None and outputStream.seekable() is False:
+            raise UnsupportedFileTypeException(message='The container format needs a seekable output stream')
+
+        super().__init__(fileName=fileName, outputStream=outputStream)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._codec:              Codec               = codec
+        self._codecThreads:       int                 = max(1, codecThreads)
+        self._executor:           ThreadPoolExecutor  = ThreadPoolExecutor(max_workers=self._codecThreads)
+        self._pendingXml:         List[bytes]         = []
+        self._pendingBlocks:      Deque[PendingBlock] = deque()
+        self._blockEntries:       BlockEntries        = blockEntriesFactory()
+        self._compressedOffset:   int                 = HEADER_STRUCT.size
+        self._uncompressedOffset: int                 = 0
+        self._headerOffset:       int                 = 0
+
+    def __enter__(self) -> 'ContainerFileSink':
+
+        super().__enter__()
+        self._headerOffset = self._outputFile.tell()          # Offsets in the container are relative to its header
+        self._outputFile.write(ContainerHeader(codecId=self._codec.codecId).pack())        # Placeholder until the table of contents is known
+
+        return self
+
+    def __exit__(self, excType: type | None, excValue: BaseException | None, traceBack: TracebackType | None) -> None:
+
+        try:
+            super().__exit__(excType, excValue, traceBack)
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def endBlock(self):
+
+        with phase(self._ioStats, PHASE_COMPRESS):
+            self._endBlock()
+
+    def _endBlock(self):
+
+        xmlBytes: bytes = b''.join(self._pendingXml)
+        self._pendingXml = []
+        if len(xmlBytes) == 0:
+            return
+
+        blockEntry: BlockEntry = BlockEntry(
+            compressedOffset=0,
+            compressedLength=0,
+            uncompressedOffset=self._uncompressedOffset,
+            uncompressedLength=len(xmlBytes),
+            checksum=crc32(xmlBytes)
+        )
+        self._uncompressedOffset += len(xmlBytes)
+        self._pendingBlocks.append((self._executor.submit(compressBlock, xmlBytes, self._codec), blockEntry))
+
+        self._writeReadyBlocks(inFlightLimit=2 * self._codecThreads)
+
+    def _encode(self, xmlBytes: bytes) -> bytes:
+        """
+        Hold on to the XML until the block ends
+        """
+        self._pendingXml.append(xmlBytes)
+        return b''
+
+    def _flush(self) -> bytes:
+        """
+        Write the remaining blocks and the table of contents;  Then go back and fill in the header
+        """
+        self._endBlock()
+        self._writeReadyBlocks(inFlightLimit=0)
+
+        tableOfContentsOffset: int = self._compressedOffset
+        self._outputFile.write(packBlockEntries(blockEntries=self._blockEntries))
+
+        self._outputFile.seek(self._headerOffset)
+        self._outputFile.write(ContainerHeader(codecId=self._codec.codecId, blockCount=len(self._blockEntries), tableOfContentsOffset=tableOfContentsOffset).pack())
+        self._outputFile.seek(0, 2)
+
+        self.logger.debug(f'{len(self._blockEntries)} blocks;  {self._uncompressedOffset} bytes of XML in {tableOfContentsOffset} bytes')
+
+        return b''
+
+    def _writeReadyBlocks(self, inFlightLimit: int):
+        """
+        Write the finished blocks at the head of the queue;  Wait for the head while more
+        than inFlightLimit blocks are queued
+
+        Args:
+            inFlightLimit:  How many blocks may remain queued
+        """
+        while len(self._pendingBlocks) > 0:
+            future, blockEntry = self._pendingBlocks[0]
+            if future.done() is False and len(self._pendingBlocks) <= inFlightLimit:
+                break
+            compressedBytes: bytes = future.result()
+            self._pendingBlocks.popleft()
+
+            blockEntry.compressedOffset = self._compressedOffset
+            blockEntry.compressedLength = len(compressedBytes)
+            self._outputFile.write(compressedBytes)
+
+            self._compressedOffset += len(compressedBytes)
+            self._blockEntries.append(blockEntry)
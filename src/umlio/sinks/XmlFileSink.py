@@ -0,0 +1,10 @@
+
+from umlio.sinks.XmlSink import XmlSink
+
+
+class XmlFileSink(XmlSink):
+    """
+    A plain XML project file
+    """
+    def _encode(self, xmlBytes: bytes) -> bytes:
+        return xmlBytes
@@ -0,0 +1,123 @@
+
+from typing import BinaryIO
+from typing import Optional
+from typing import cast
+
+from abc import ABC
+from abc import abstractmethod
+
+from os import replace as osReplace
+
+from pathlib import Path
+
+from types import TracebackType
+
+from umlio.IOStats import IOStats
+from umlio.IOStats import PHASE_COMPRESS
+from umlio.IOStats import phase
+
+TEMPORARY_SUFFIX: str = '.tmp'
+
+
+class XmlSink(ABC):
+    """
+    Where the serialized project XML goes.  Sinks accept the XML as bytes in document
+    order and write them out as they arrive;  Nothing is accumulated in memory.
+
+    A sink is a context manager.  The bytes go to a temporary sibling of the output file
+    which replaces the output file only when the context exits cleanly;  A failed write
+    never leaves a truncated project behind.
+
+    Given an output stream the bytes go straight to it instead;  The stream belongs to the
+    caller, so it is neither replaced nor closed
+    """
+    def __init__(self, fileName: Path, outputStream: BinaryIO | None = None):
+
+        self._fileName:          Path            = fileName
+        self._temporaryFileName: Path            = fileName.with_name(f'{fileName.name}{TEMPORARY_SUFFIX}')
+        self._outputStream:      BinaryIO | None = outputStream
+        self._outputFile:        BinaryIO        = cast(BinaryIO, None)
+        self._xmlOffset:         int             = 0
+        self._ioStats:           IOStats | None  = None
+
+    @property
+    def fileName(self) -> Path:
+        return self._fileName
+
+    @property
+    def xmlOffset(self) -> int:
+        """
+        How many XML bytes were written so far;  The offset of the next byte in the uncompressed XML
+        """
+        return self._xmlOffset
+
+    @property
+    def ioStats(self) -> IOStats | None:
+        """
+        When set, encoding and writing the stored bytes count as the compress phase
+        """
+        return self._ioStats
+
+    @ioStats.setter
+    def ioStats(self, ioStats: IOStats | None):
+        self._ioStats = ioStats
+
+    def __enter__(self) -> 'XmlSink':
+
+        if self._outputStream is not None:
+            self._outputFile = self._outputStream
+        else:
+            self._outputFile = self._temporaryFileName.open('wb')
+        return self
+
+    def __exit__(self, excType: Optional[type], excValue: Optional[BaseException], traceBack: Optional[TracebackType]) -> None:
+
+        if self._outputStream is not None:
+            if excType is None:
+                with phase(self._ioStats, PHASE_COMPRESS):
+                    self._outputFile.write(self._flush())
+            return
+
+        try:
+            if excType is None:
+                with phase(self._ioStats, PHASE_COMPRESS):
+                    self._outputFile.write(self._flush())
+        finally:
+            self._outputFile.close()
+
+        if excType is None:
+            osReplace(self._temporaryFileName, self._fileName)
+        else:
+            self._temporaryFileName.unlink(missing_ok=True)
+
+    def write(self, xmlBytes: bytes):
+        """
+        Args:
+            xmlBytes:  The next raw XML bytes
+        """
+        with phase(self._ioStats, PHASE_COMPRESS):
+            self._outputFile.write(self._encode(xmlBytes))
+        self._xmlOffset += len(xmlBytes)
+
+    def endBlock(self):
+        """
+        The serializer calls this after the project start tag and after each diagram.
+        Sinks that do not store the XML in blocks ignore it
+        """
+        pass
+
+    @abstractmethod
+    def _encode(self, xmlBytes: bytes) -> bytes:
+        """
+        Args:
+            xmlBytes:  The next raw XML bytes
+
+        Returns:  What to write to the file;  May be empty
+        """
+        pass
+
+    def _flush(self) -> bytes:
+        """
+        Returns:  Anything the encoding still holds once all the XML has been written
+        """
+        return b''
@@ -0,0 +1,126 @@
+from typing import Iterator
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from umlio.exceptions.DecompressionLimitException import DecompressionLimitException
+
+from umlio.sources.XmlSource import FragmentRanges
+from umlio.sources.XmlSource import XmlSource
+
+#
+# Markup that starts with '<' but is not an element start tag
+#
+NOT_START_TAGS: bytes = b'/?!'
+
+
+@dataclass(frozen=True)
+class DecompressionLimits:
+    """
+    Generous for any real project;  A None disables that limit
+    """
+    maximumXmlBytes: int | None = 256 * 1024 * 1024
+    maximumRatio:    int | None = 200         # Real projects stay well under 100;  zlib itself tops out near 1032
+    maximumElements: int | None = 2_000_000
+
+
+DEFAULT_DECOMPRESSION_LIMITS: DecompressionLimits = DecompressionLimits()
+
+
+class BoundedXmlSource(XmlSource):
+    """
+    Wraps the source of a compressed project file.  The XML is checked as it streams by;
+    A crafted or corrupted file is abandoned as soon as it crosses a limit, long before it
+    can expand in memory.
+
+    The element count comes from counting start tags in the raw bytes;  No parsing needed
+    """
+    def __init__(self, xmlSource: XmlSource, decompressionLimits: DecompressionLimits = DEFAULT_DECOMPRESSION_LIMITS):
+
+        super().__init__(fileName=xmlSource.fileName)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._xmlSource:           XmlSource           = xmlSource
+        self._decompressionLimits: DecompressionLimits = decompressionLimits
+
+    @property
+    def storedSize(self) -> int:
+        return self._xmlSource.storedSize
+
+    @property
+    def inMemory(self) -> bool:
+        return self._xmlSource.inMemory
+
+    @property
+    def seekable(self) -> bool:
+        return self._xmlSource.seekable
+
+    def chunks(self) -> Iterator[bytes]:
+
+        limits:         DecompressionLimits = self._decompressionLimits
+        compressedSize: int                 = max(self._xmlSource.storedSize, 1)
+
+        xmlByteCount:   int  = 0
+        elementCount:   int  = 0
+        openTagPending: bool = False        # The previous chunk ended with '<'
+
+        xmlChunks: Iterator[bytes] = self._xmlSource.chunks()
+        try:
+            for xmlChunk in xmlChunks:
+                xmlByteCount += len(xmlChunk)
+                elementCount += self._countStartTags(xmlChunk=xmlChunk, openTagPending=openTagPending)
+                openTagPending = xmlChunk.endswith(b'<')
+
+                if limits.maximumXmlBytes is not None and xmlByteCount > limits.maximumXmlBytes:
+                    raise DecompressionLimitException(f'{self._fileName} expands past {limits.maximumXmlBytes} bytes')
+                if limits.maximumRatio is not None and xmlByteCount > limits.maximumRatio * compressedSize:
+                    raise DecompressionLimitException(f'{self._fileName} expands more than {limits.maximumRatio} times its size')
+                if limits.maximumElements is not None and elementCount > limits.maximumElements:
+                    raise DecompressionLimitException(f'{self._fileName} has more than {limits.maximumElements} elements')
+
+                yield xmlChunk
+        finally:
+            xmlChunks.close()      # type: ignore
+
+    @property
+    def changedSinceStamp(self) -> bool:
+        return self._xmlSource.changedSinceStamp
+
+    def noteFileStamp(self):
+        self._xmlSource.noteFileStamp()
+
+    def expectFragments(self, fragmentRanges: FragmentRanges):
+        self._xmlSource.expectFragments(fragmentRanges=fragmentRanges)
+
+    def fragment(self, startOffset: int, endOffset: int) -> bytes:
+        """
+        A source that cannot seek streams the document again;  Perhaps a different file than
+        the one scanned.  So it streams through chunks() and the limits apply again.  Sources
+        that seek check what they inflate themselves
+        """
+        if self._xmlSource.seekable is True:
+            return self._xmlSource.fragment(startOffset=startOffset, endOffset=endOffset)
+
+        return self._xmlSource.streamFragment(startOffset=startOffset, endOffset=endOffset, xmlChunks=self.chunks)
+
+    def _countStartTags(self, xmlChunk: bytes, openTagPending: bool) -> int:
+        """
+        Attribute values and text cannot hold a raw '<';  So every '<' that is not an end
+        tag, a processing instruction, a comment or a CDATA section starts an element
+
+        Args:
+            xmlChunk:        The next raw XML bytes
+            openTagPending:  True when the previous chunk ended with a '<'
+
+        Returns:  The number of start tags in the chunk
+        """
+        startTags: int = xmlChunk.count(b'<') - xmlChunk.count(b'</') - xmlChunk.count(b'<?') - xmlChunk.count(b'<!')
+        if xmlChunk.endswith(b'<'):
+            startTags -= 1          # The next chunk decides
+        if openTagPending is True and xmlChunk[:1] not in NOT_START_TAGS:
+            startTags += 1
+
+        return startTags
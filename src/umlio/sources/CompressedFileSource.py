@@ -0,0 +1,156 @@
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.Codec import Decompressor
+from umlio.codecs.Codec import MAGIC_LENGTH
+from umlio.codecs.CompressionProfile import codecForLeadingBytes
+
+from umlio.exceptions.CorruptProjectFileException import CorruptProjectFileException
+from umlio.exceptions.UnsupportedVersion import UnsupportedVersion
+
+from umlio.sources.XmlSource import FileStamp
+from umlio.sources.XmlSource import FragmentRange
+from umlio.sources.XmlSource import FragmentRanges
+from umlio.sources.XmlSource import XmlChunks
+from umlio.sources.XmlSource import XmlSource
+
+READ_CHUNK_SIZE:          int = 64 * 1024         # compressed bytes read from disk at a time
+DECOMPRESSION_CHUNK_SIZE: int = 256 * 1024        # upper bound on the XML bytes handed to the parser at a time
+
+
+class CompressedFileSource(XmlSource):
+    """
+    A single stream compressed project file.  The file is inflated a bounded slice at a time;
+    So neither the compressed nor the decompressed document ever sit in memory all at once;
+    Except for fragments, see below.  Unless told, the codec is recognized from the file's
+    leading bytes
+    """
+    def __init__(self, fileName: Path, codec: Codec | None = None, projectBuffer: memoryview | None = None):
+
+        super().__init__(fileName=fileName, projectBuffer=projectBuffer)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._codec: Codec | None = codec
+
+        self._expectedRanges: FragmentRanges             = FragmentRanges([])
+        self._fragments:      Dict[FragmentRange, bytes] = {}
+        self._fragmentsStamp: FileStamp | None           = None
+
+    def chunks(self) -> Iterator[bytes]:
+        """
+        Incrementally decompresses a previously UML Diagrammer compressed file.
+        The XML is handed out in chunks of at most DECOMPRESSION_CHUNK_SIZE bytes
+
+        Returns:  An iterator over the raw XML bytes
+        """
+        fileName: Path = self._fileName
+        try:
+            compressedFile = self._open()
+        except (ValueError, Exception) as e:
+            self.logger.error(f'decompress open:  {e}')
+            raise e
+
+        with compressedFile:
+            codec: Codec = self._codec if self._codec is not None else codecForLeadingBytes(leadingBytes=compressedFile.read(MAGIC_LENGTH))
+            compressedFile.seek(0)
+
+            self.logger.info(f'{codec.name=}')
+            decompressor: Decompressor = codec.decompressor()
+            xmlByteCount: int          = 0
+            while compressedChunk := compressedFile.read(READ_CHUNK_SIZE):
+                #
+                # Bound each output chunk;  Whatever could not be expanded is kept by the decompressor
+                #
+                while True:
+                    xmlChunk: bytes = self._decompress(decompressor=decompressor, compressedChunk=compressedChunk)
+                    if xmlChunk:
+                        xmlByteCount += len(xmlChunk)
+                        yield xmlChunk
+                    compressedChunk = b''
+                    if decompressor.needsInput is True or decompressor.eof is True:
+                        break
+
+        lastChunk: bytes = decompressor.flush()
+        if lastChunk:
+            xmlByteCount += len(lastChunk)
+            yield lastChunk
+
+        if decompressor.eof is False:
+            raise CorruptProjectFileException(f'{fileName} is truncated;  The compressed stream ended prematurely')
+
+        self.logger.debug(f'Document read: {xmlByteCount} bytes')
+
+    def expectFragments(self, fragmentRanges: FragmentRanges):
+
+        self._expectedRanges = FragmentRanges(list(fragmentRanges))
+        self._fragments      = {}
+
+    def streamFragment(self, startOffset: int, endOffset: int, xmlChunks: XmlChunks) -> bytes:
+        """
+        A single stream cannot seek;  Streaming it from the start for every fragment makes a
+        lazy read of all the diagrams quadratic.  So a pass also cuts the expected fragments
+        that were not handed out yet.  Each is kept until it is asked for and then dropped;
+        The whole document is never held.  A changed file discards them
+
+        Args:
+            startOffset:  The offset of the first byte
+            endOffset:    The offset just past the last byte
+            xmlChunks:    Starts a stream of the whole document
+
+        Returns:  The bytes in the requested range
+        """
+        fragmentRange: FragmentRange    = FragmentRange((startOffset, endOffset))
+        fileStamp:     FileStamp | None = self._currentFileStamp()
+        if fileStamp != self._fragmentsStamp:
+            self._fragments = {}
+
+        if fragmentRange not in self._fragments:
+            self._fragments      = self._cutFragments(fragmentRanges=set(self._expectedRanges) | {fragmentRange}, xmlChunks=xmlChunks)
+            self._fragmentsStamp = fileStamp
+
+        if fragmentRange in self._expectedRanges:
+            self._expectedRanges.remove(fragmentRange)
+
+        return self._fragments.pop(fragmentRange)
+
+    def _cutFragments(self, fragmentRanges: set[FragmentRange], xmlChunks: XmlChunks) -> Dict[FragmentRange, bytes]:
+        """
+        Returns:  The bytes of every range from a single pass over the document
+        """
+        pieces:    Dict[FragmentRange, List[bytes]] = {fragmentRange: [] for fragmentRange in fragmentRanges}
+        lastEnd:   int                              = max(fragmentRange[1] for fragmentRange in fragmentRanges)
+        position:  int                              = 0
+
+        documentChunks: Iterator[bytes] = xmlChunks()
+        try:
+            for xmlChunk in documentChunks:
+                chunkEnd: int = position + len(xmlChunk)
+                for (startOffset, endOffset), rangePieces in pieces.items():
+                    if startOffset < chunkEnd and endOffset > position:
+                        rangePieces.append(xmlChunk[max(startOffset - position, 0):endOffset - position])
+                if chunkEnd >= lastEnd:
+                    break
+                position = chunkEnd
+        finally:
+            documentChunks.close()        # type: ignore
+
+        return {fragmentRange: b''.join(rangePieces) for fragmentRange, rangePieces in pieces.items()}
+
+    def _decompress(self, decompressor: Decompressor, compressedChunk: bytes) -> bytes:
+
+        if decompressor.eof is True:
+            return b''          # Trailing bytes after the end of the stream are ignored, as zlib always did
+        try:
+            return decompressor.decompress(compressedChunk, DECOMPRESSION_CHUNK_SIZE)
+        except UnsupportedVersion:
+            raise
+        except (OSError, ValueError, Exception) as e:
+            raise CorruptProjectFileException(f'{self._fileName} does not decompress: {e}')
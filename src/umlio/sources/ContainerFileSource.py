@@ -0,0 +1,153 @@
+from typing import BinaryIO
+from typing import Deque
+from typing import Iterator
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from pathlib import Path
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.CompressionProfile import codecForId
+
+from umlio.ContainerFormat import BlockEntries
+from umlio.ContainerFormat import BlockEntry
+from umlio.ContainerFormat import ContainerHeader
+from umlio.ContainerFormat import DEFAULT_CODEC_THREADS
+from umlio.ContainerFormat import HEADER_STRUCT
+from umlio.ContainerFormat import ENTRY_STRUCT
+from umlio.ContainerFormat import decompressBlock
+from umlio.ContainerFormat import unpackBlockEntries
+
+from umlio.exceptions.CorruptProjectFileException import CorruptProjectFileException
+from umlio.exceptions.DecompressionLimitException import DecompressionLimitException
+
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.XmlSource import XmlSource
+
+
+class ContainerFileSource(XmlSource):
+    """
+    A version 2 project file container.  Blocks are decompressed and CRC checked on codec
+    threads a few blocks ahead of the parser.  A fragment only reads and decompresses the
+    blocks it overlaps;  So a lazily loaded diagram touches nothing but its own block.
+
+    The table of contents declares how far each block expands.  Those lengths are checked
+    against the decompression limits before any block is inflated;  And no block inflates
+    past what is left of the byte budget
+    """
+    def __init__(self, fileName: Path, codecThreads: int = DEFAULT_CODEC_THREADS, projectBuffer: memoryview | None = None,
+                 decompressionLimits: DecompressionLimits | None = None):
+        """
+        Args:
+            fileName:             The project file;  Only a label when there is a project buffer
+            codecThreads:         How many blocks to decompress at a time
+            projectBuffer:        The stored bytes when they are already in memory
+            decompressionLimits:  Where to abandon a container that declares too much XML;  None to trust it
+        """
+        super().__init__(fileName=fileName, projectBuffer=projectBuffer)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._codecThreads:        int                        = max(1, codecThreads)
+        self._decompressionLimits: DecompressionLimits | None = decompressionLimits
+
+    def chunks(self) -> Iterator[bytes]:
+        """
+        Returns:  An iterator over the blocks' XML in document order
+        """
+        with self._open() as containerFile, ThreadPoolExecutor(max_workers=self._codecThreads) as executor:
+
+            codec, blockEntries = self._readTableOfContents(containerFile=containerFile)
+
+            pendingBlocks: Deque[Future[bytes]] = deque()
+
+            for blockNumber, blockEntry in enumerate(blockEntries):
+                compressedBytes: bytes = self._readBlock(containerFile=containerFile, blockEntry=blockEntry, blockNumber=blockNumber)
+                pendingBlocks.append(executor.submit(decompressBlock, compressedBytes, codec, blockEntry, blockNumber, self._maximumLength(blockEntry)))
+                if len(pendingBlocks) >= self._codecThreads:
+                    yield pendingBlocks.popleft().result()
+
+            while len(pendingBlocks) > 0:
+                yield pendingBlocks.popleft().result()
+
+    @property
+    def seekable(self) -> bool:
+        return True
+
+    def fragment(self, startOffset: int, endOffset: int) -> bytes:
+
+        with self._open() as containerFile:
+
+            codec, blockEntries = self._readTableOfContents(containerFile=containerFile)
+
+            pieces: List[bytes] = []
+            for blockNumber, blockEntry in enumerate(blockEntries):
+                if blockEntry.uncompressedEnd <= startOffset or blockEntry.uncompressedOffset >= endOffset:
+                    continue
+                compressedBytes: bytes = self._readBlock(containerFile=containerFile, blockEntry=blockEntry, blockNumber=blockNumber)
+                xmlBytes:        bytes = decompressBlock(compressedBytes, codec, blockEntry, blockNumber, self._maximumLength(blockEntry))
+
+                pieces.append(xmlBytes[max(startOffset - blockEntry.uncompressedOffset, 0):endOffset - blockEntry.uncompressedOffset])
+
+        return b''.join(pieces)
+
+    def _readTableOfContents(self, containerFile: BinaryIO) -> tuple[Codec, BlockEntries]:
+        """
+        Returns:  The codec of the blocks and their table of contents entries
+        """
+
+        containerHeader: ContainerHeader = ContainerHeader.unpack(headerBytes=containerFile.read(HEADER_STRUCT.size))
+
+        containerFile.seek(containerHeader.tableOfContentsOffset)
+        tableOfContents: bytes = containerFile.read(containerHeader.blockCount * ENTRY_STRUCT.size)
+
+        blockEntries: BlockEntries = unpackBlockEntries(tableOfContents=tableOfContents, blockCount=containerHeader.blockCount)
+        self._checkTableOfContents(blockEntries=blockEntries)
+
+        return codecForId(codecId=containerHeader.codecId), blockEntries
+
+    def _checkTableOfContents(self, blockEntries: BlockEntries):
+        """
+        The blocks must tile the XML in order;  Then their declared lengths add up to the size of
+        the whole document, which must be within the decompression limits
+
+        Raises:  CorruptProjectFileException or DecompressionLimitException
+        """
+        xmlByteCount: int = 0
+        for blockNumber, blockEntry in enumerate(blockEntries):
+            if blockEntry.uncompressedOffset != xmlByteCount:
+                raise CorruptProjectFileException(f'{self._fileName} has an inconsistent table of contents at block {blockNumber}')
+            xmlByteCount += blockEntry.uncompressedLength
+
+        limits: DecompressionLimits | None = self._decompressionLimits
+        if limits is None:
+            return
+        if limits.maximumXmlBytes is not None and xmlByteCount > limits.maximumXmlBytes:
+            raise DecompressionLimitException(f'{self._fileName} declares {xmlByteCount} bytes of XML;  More than {limits.maximumXmlBytes}')
+        if limits.maximumRatio is not None and xmlByteCount > limits.maximumRatio * max(self.storedSize, 1):
+            raise DecompressionLimitException(f'{self._fileName} declares more than {limits.maximumRatio} times its size in XML')
+
+    def _maximumLength(self, blockEntry: BlockEntry) -> int:
+        """
+        Returns:  The most a block may inflate to;  What is left of the byte budget once the blocks before it are counted
+        """
+        if self._decompressionLimits is None or self._decompressionLimits.maximumXmlBytes is None:
+            return blockEntry.uncompressedLength
+
+        return max(self._decompressionLimits.maximumXmlBytes - blockEntry.uncompressedOffset, 0)
+
+    def _readBlock(self, containerFile: BinaryIO, blockEntry: BlockEntry, blockNumber: int) -> bytes:
+
+        containerFile.seek(blockEntry.compressedOffset)
+        compressedBytes: bytes = containerFile.read(blockEntry.compressedLength)
+        if len(compressedBytes) != blockEntry.compressedLength:
+            raise CorruptProjectFileException(f'{self._fileName} is truncated;  Block {blockNumber} is incomplete')
+
+        return compressedBytes
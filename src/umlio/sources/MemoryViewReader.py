@@ -0,0 +1,49 @@
+
+from io import RawIOBase
+from io import SEEK_CUR
+from io import SEEK_END
+from io import SEEK_SET
+
+
+class MemoryViewReader(RawIOBase):
+    """
+    A read only, seekable binary file over a buffer that is already in memory.  Unlike
+    BytesIO it never copies the whole buffer;  Each read copies only what was asked for
+    """
+    def __init__(self, projectBuffer: memoryview):
+
+        super().__init__()
+
+        self._projectBuffer: memoryview = projectBuffer
+        self._position:      int        = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+
+        byteCount: int = max(0, min(len(buffer), len(self._projectBuffer) - self._position))
+
+        buffer[:byteCount] = self._projectBuffer[self._position:self._position + byteCount]
+        self._position += byteCount
+
+        return byteCount
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+
+        if whence == SEEK_SET:
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position += offset
+        elif whence == SEEK_END:
+            self._position = len(self._projectBuffer) + offset
+
+        self._position = max(0, self._position)
+
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
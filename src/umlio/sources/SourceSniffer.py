@@ -0,0 +1,132 @@
+
+from typing import cast
+
+from pathlib import Path
+
+from umlio.ProjectTypes import PROJECT_SUFFIX
+from umlio.ProjectTypes import ProjectData
+from umlio.ProjectTypes import XML_SUFFIX
+
+from umlio.ContainerFormat import isContainer
+
+from umlio.codecs.Codec import MAGIC_LENGTH
+from umlio.codecs.CompressionProfile import codecForLeadingBytes
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sources.BoundedXmlSource import BoundedXmlSource
+from umlio.sources.BoundedXmlSource import DEFAULT_DECOMPRESSION_LIMITS
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import XmlSource
+from umlio.sources.CompressedFileSource import CompressedFileSource
+from umlio.sources.ContainerFileSource import ContainerFileSource
+
+XML_BYTE_ORDER_MARK: bytes = b'\xef\xbb\xbf'
+XML_SNIFF_LENGTH:    int   = 64             # Room for a byte order mark and some leading white space
+
+
+def projectFileSource(fileName: Path, decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> XmlSource:
+    """
+    Every project file format uses the project suffix;  The leading bytes tell the version 2
+    container and the single stream codecs apart
+
+    Args:
+        fileName:             A project file
+        decompressionLimits:  Where to abandon a file that expands too much;  None to trust the file
+
+    Returns:  The source that can read it
+    """
+    with fileName.open('rb') as projectFile:
+        leadingBytes: bytes = projectFile.read(MAGIC_LENGTH)
+
+    return _boundedSource(
+        xmlSource=_compressedSource(leadingBytes=leadingBytes, fileName=fileName, decompressionLimits=decompressionLimits),
+        decompressionLimits=decompressionLimits
+    )
+
+
+def sourceForFile(fileName: Path, decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> XmlSource:
+    """
+    Args:
+        fileName:             A PROJECT_SUFFIX or XML_SUFFIX file
+        decompressionLimits:  Where to abandon a project file that expands too much;  None to trust the file
+
+    Returns:  The source that can read it, chosen by the suffix
+    """
+    if fileName.suffix == PROJECT_SUFFIX:
+        return projectFileSource(fileName=fileName, decompressionLimits=decompressionLimits)
+    elif fileName.suffix == XML_SUFFIX:
+        return XmlFileSource(fileName=fileName)
+    else:
+        raise UnsupportedFileTypeException(message=f'File does not end with {PROJECT_SUFFIX} or {XML_SUFFIX} suffix')
+
+
+def projectDataSource(projectData: ProjectData, fileName: Path = Path(''),
+                      decompressionLimits: DecompressionLimits | None = DEFAULT_DECOMPRESSION_LIMITS) -> XmlSource:
+    """
+    Project data has no suffix;  Plain XML, the version 2 container and each codec are all
+    told apart by the leading bytes
+
+    Args:
+        projectData:          The project's stored bytes or a binary file positioned at them
+        fileName:             Only a label;  It ends up in the project and in error messages
+        decompressionLimits:  Where to abandon compressed data that expands too much;  None to trust the data
+
+    Returns:  The source that can read it
+    """
+    buffer:       memoryview = projectBuffer(projectData=projectData)
+    leadingBytes: bytes      = bytes(buffer[:XML_SNIFF_LENGTH])
+
+    if isXml(leadingBytes=leadingBytes) is True:
+        return XmlFileSource(fileName=fileName, projectBuffer=buffer)
+
+    return _boundedSource(
+        xmlSource=_compressedSource(leadingBytes=leadingBytes, fileName=fileName, projectBuffer=buffer, decompressionLimits=decompressionLimits),
+        decompressionLimits=decompressionLimits
+    )
+
+
+def projectBuffer(projectData: ProjectData) -> memoryview:
+    """
+    Bytes, byte arrays and memory views are used in place.  A binary file is read to its end
+    once;  Lazy reads come back to the data long after the file has moved on
+
+    Args:
+        projectData:  The project's stored bytes or a binary file positioned at them
+
+    Returns:  A flat byte view of the data
+    """
+    if isinstance(projectData, (bytes, bytearray, memoryview)):
+        return memoryview(projectData).cast('B')
+
+    return memoryview(cast(bytes, projectData.read()))
+
+
+def isXml(leadingBytes: bytes) -> bool:
+    """
+    Args:
+        leadingBytes:  The first few bytes of project data
+
+    Returns:  True when they look like the start of an uncompressed XML document
+    """
+    return leadingBytes.removeprefix(XML_BYTE_ORDER_MARK).lstrip().startswith(b'<')
+
+
+def _compressedSource(leadingBytes: bytes, fileName: Path, projectBuffer: memoryview | None = None,
+                      decompressionLimits: DecompressionLimits | None = None) -> XmlSource:
+    """
+    The container checks its table of contents against the limits itself;  Before any block is inflated
+    """
+    if isContainer(leadingBytes=leadingBytes) is True:
+        return ContainerFileSource(fileName=fileName, projectBuffer=projectBuffer, decompressionLimits=decompressionLimits)
+
+    return CompressedFileSource(fileName=fileName, codec=codecForLeadingBytes(leadingBytes=leadingBytes[:MAGIC_LENGTH]), projectBuffer=projectBuffer)
+
+
+def _boundedSource(xmlSource: XmlSource, decompressionLimits: DecompressionLimits | None) -> XmlSource:
+
+    if decompressionLimits is None:
+        return xmlSource
+
+    return BoundedXmlSource(xmlSource=xmlSource, decompressionLimits=decompressionLimits)
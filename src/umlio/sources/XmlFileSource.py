@@ -0,0 +1,77 @@
+
+from typing import Iterator
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from mmap import ACCESS_READ
+from mmap import mmap
+
+from pathlib import Path
+
+from umlio.sources.XmlSource import XmlSource
+
+READ_CHUNK_SIZE:   int = 64 * 1024
+MAPPED_CHUNK_SIZE: int = 256 * 1024        # Slicing the map copies nothing;  But expat buffers what it is fed, so keep the slices modest
+
+
+class XmlFileSource(XmlSource):
+    """
+    An uncompressed XML project file or buffer.  A file is memory mapped and the parser is
+    fed read only views of the map;  No text decode and no copy.  Processes that read the
+    same project share the page cache.  Files that cannot be mapped are read a chunk at a time
+    """
+    def __init__(self, fileName: Path, projectBuffer: memoryview | None = None):
+
+        super().__init__(fileName=fileName, projectBuffer=projectBuffer)
+
+        self.logger: Logger = getLogger(__name__)
+
+    def chunks(self) -> Iterator[bytes]:
+        """
+        The chunks are memoryview slices wherever possible;  The parsers accept any buffer.
+        A map is released once the consumer drops the last of its slices
+
+        Returns:  An iterator over the raw XML bytes
+        """
+        xmlView: memoryview | None = self._xmlView()
+        if xmlView is None:
+            yield from self._readChunks()
+            return
+
+        for startOffset in range(0, len(xmlView), MAPPED_CHUNK_SIZE):
+            yield cast(bytes, xmlView[startOffset:startOffset + MAPPED_CHUNK_SIZE])
+
+    @property
+    def seekable(self) -> bool:
+        return True
+
+    def fragment(self, startOffset: int, endOffset: int) -> bytes:
+
+        if self._projectBuffer is not None:
+            return bytes(self._projectBuffer[startOffset:endOffset])
+
+        with self._open() as xmlFile:
+            xmlFile.seek(startOffset)
+            return xmlFile.read(endOffset - startOffset)
+
+    def _xmlView(self) -> memoryview | None:
+        """
+        Returns:  The buffer or a view of the mapped file;  None when the file cannot be mapped
+        """
+        if self._projectBuffer is not None:
+            return self._projectBuffer
+
+        with self._open() as xmlFile:
+            try:
+                return memoryview(mmap(xmlFile.fileno(), 0, access=ACCESS_READ))       # The map keeps its own handle to the file
+            except (OSError, ValueError) as e:
+                self.logger.debug(f'{self._fileName} is not mapped: {e}')      # e.g. an empty file or a pipe
+                return None
+
+    def _readChunks(self) -> Iterator[bytes]:
+
+        with self._open() as xmlFile:
+            while xmlChunk := xmlFile.read(READ_CHUNK_SIZE):
+                yield xmlChunk
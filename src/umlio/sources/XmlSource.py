@@ -0,0 +1,161 @@
+
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterator
+from typing import NewType
+from typing import cast
+
+from abc import ABC
+from abc import abstractmethod
+
+from pathlib import Path
+
+from umlio.sources.MemoryViewReader import MemoryViewReader
+
+FileStamp = NewType('FileStamp', tuple[int, int])      # The size and the modification time in nanoseconds
+
+FragmentRange  = NewType('FragmentRange',  tuple[int, int])        # The start offset and the offset just past the end
+FragmentRanges = NewType('FragmentRanges', list[FragmentRange])
+
+XmlChunks = Callable[[], Iterator[bytes]]
+
+
+class XmlSource(ABC):
+    """
+    Where the raw project XML comes from.  Sources hand out the XML as bytes in document
+    order and never decode it;  The XML declaration tells the parser the encoding.
+
+    Byte offsets are always relative to the start of the uncompressed XML.
+
+    When a project buffer is given the stored bytes come from it instead of the file;  The
+    file name is then only a label.
+
+    A scan notes the file's stamp;  Byte offsets from the scan are only good while the file
+    still has that stamp
+    """
+    def __init__(self, fileName: Path, projectBuffer: memoryview | None = None):
+
+        self._fileName:      Path              = fileName
+        self._projectBuffer: memoryview | None = projectBuffer
+        self._fileStamp:     FileStamp | None  = None
+
+    @property
+    def fileName(self) -> Path:
+        return self._fileName
+
+    @property
+    def storedSize(self) -> int:
+        """
+        The number of bytes in the file or the buffer;  Compressed sources measure their
+        expansion against this
+        """
+        if self._projectBuffer is not None:
+            return len(self._projectBuffer)
+
+        return self._fileName.stat().st_size
+
+    @property
+    def inMemory(self) -> bool:
+        return self._projectBuffer is not None
+
+    @property
+    def seekable(self) -> bool:
+        """
+        False when a fragment is cut from a stream of the whole document;  See streamFragment
+        """
+        return False
+
+    @property
+    def changedSinceStamp(self) -> bool:
+        """
+        True when the file's size or modification time differ from those noted;  Always
+        False for a project buffer or when nothing was noted
+        """
+        return self._fileStamp is not None and self._currentFileStamp() != self._fileStamp
+
+    def noteFileStamp(self):
+        """
+        Call before scanning;  Remembers the file's size and modification time
+        """
+        self._fileStamp = self._currentFileStamp()
+
+    def expectFragments(self, fragmentRanges: FragmentRanges):
+        """
+        A scan hands over where it found the diagrams;  Sources that cannot seek may then cut
+        them all in a single pass.  The default ignores them
+
+        Args:
+            fragmentRanges:  The ranges the scan located
+        """
+        pass
+
+    @abstractmethod
+    def chunks(self) -> Iterator[bytes]:
+        """
+        Returns:  An iterator over the raw XML bytes
+        """
+        pass
+
+    def _currentFileStamp(self) -> FileStamp | None:
+        """
+        Returns:  The file's stamp;  None for a project buffer or a file that is gone
+        """
+        if self._projectBuffer is not None:
+            return None
+        try:
+            fileStat = self._fileName.stat()
+        except OSError:
+            return None
+
+        return FileStamp((fileStat.st_size, fileStat.st_mtime_ns))
+
+    def _open(self) -> BinaryIO:
+        """
+        Returns:  The stored bytes as a binary file
+        """
+        if self._projectBuffer is not None:
+            return cast(BinaryIO, MemoryViewReader(projectBuffer=self._projectBuffer))
+
+        return self._fileName.open('rb')
+
+    def fragment(self, startOffset: int, endOffset: int) -> bytes:
+        """
+        The default implementation streams the document;  Sources that can seek should
+        override this and seekable
+
+        Args:
+            startOffset:  The offset of the first byte
+            endOffset:    The offset just past the last byte
+
+        Returns:  The bytes in the requested range
+        """
+        return self.streamFragment(startOffset=startOffset, endOffset=endOffset, xmlChunks=self.chunks)
+
+    def streamFragment(self, startOffset: int, endOffset: int, xmlChunks: XmlChunks) -> bytes:
+        """
+        Streams the document until it has seen the requested range.  The document comes from
+        xmlChunks, not chunks();  So a wrapping source can check what is streamed
+
+        Args:
+            startOffset:  The offset of the first byte
+            endOffset:    The offset just past the last byte
+            xmlChunks:    Starts a stream of the whole document
+
+        Returns:  The bytes in the requested range
+        """
+        pieces:   list[bytes] = []
+        position: int         = 0
+
+        documentChunks: Iterator[bytes] = xmlChunks()
+        try:
+            for xmlChunk in documentChunks:
+                chunkEnd: int = position + len(xmlChunk)
+                if chunkEnd > startOffset:
+                    pieces.append(xmlChunk[max(startOffset - position, 0):endOffset - position])
+                if chunkEnd >= endOffset:
+                    break
+                position = chunkEnd
+        finally:
+            documentChunks.close()        # type: ignore
+
+        return b''.join(pieces)
@@ -0,0 +1,80 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from asyncio import CancelledError
+from asyncio import create_task
+from asyncio import run
+from asyncio import sleep as asyncSleep
+
+from concurrent.futures import ThreadPoolExecutor
+
+from threading import Event
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.AsyncJobs import runJob
+
+
+class TestAsyncJobs(UnitTestBase):
+    """
+    The executor jobs are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        super().tearDown()
+        self._executor.shutdown()
+
+    def testJobResult(self):
+
+        async def runIt() -> int:
+            return await runJob(self._executor, lambda: 6 * 7)
+
+        self.assertEqual(42, run(runIt()))
+
+    def testCancelledJobRunsToItsEnd(self):
+
+        jobStarted:  Event = Event()
+        releaseJob:  Event = Event()
+        jobFinished: Event = Event()
+
+        def job():
+            jobStarted.set()
+            releaseJob.wait(timeout=5)
+            jobFinished.set()
+
+        async def cancelIt():
+            task = create_task(runJob(self._executor, job))
+            while jobStarted.is_set() is False:
+                await asyncSleep(0.01)
+            task.cancel()
+            await asyncSleep(0.05)
+            self.assertFalse(task.done(), 'The cancellation waits for the running job')
+            releaseJob.set()
+            with self.assertRaises(CancelledError):
+                await task
+
+        run(cancelIt())
+
+        self.assertTrue(jobFinished.is_set(), 'A started job is never abandoned halfway')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAsyncJobs))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
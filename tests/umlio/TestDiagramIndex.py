@@ -0,0 +1,120 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.DiagramIndex import DiagramIndex
+from umlio.DiagramIndex import IndexedDiagram
+from umlio.DiagramIndex import diagramHash
+from umlio.DiagramIndex import indexFileName
+from umlio.DiagramIndex import loadDiagramIndex
+from umlio.DiagramIndex import saveDiagramIndex
+
+from umlio.deserializer.XmlDiagramScanner import ScannedProject
+from umlio.deserializer.XmlDiagramScanner import XmlDiagramScanner
+
+PROJECT_START: bytes = b"<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Indexed.xml\" version=\"14.0\" codePath=\"/users/hasii\">"
+PROJECT_END:   bytes = b'\n</UmlProject>'
+
+DIAGRAMS: list[bytes] = [
+    b'<UMLDiagram documentType="Class Document" title="Classes" scrollPositionX="1" scrollPositionY="1" pixelsPerUnitX="20" pixelsPerUnitY="20" />',
+    b'<UMLDiagram documentType="Use Case Document" title="Use Cases" scrollPositionX="1" scrollPositionY="1" pixelsPerUnitX="20" pixelsPerUnitY="20" />',
+]
+
+
+class TestDiagramIndex(UnitTestBase):
+    """
+    The diagram index is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._xmlFileName:        Path               = Path(self._temporaryDirectory.name) / 'Indexed.xml'
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testIndexMatchesScan(self):
+
+        diagramIndex: DiagramIndex = self._writeIndexedXml()
+
+        loadedIndex: DiagramIndex | None = loadDiagramIndex(xmlFileName=self._xmlFileName)
+        self.assertIsNotNone(loadedIndex, 'A fresh index should load')
+        assert loadedIndex is not None
+        self.assertEqual(diagramIndex, loadedIndex)
+
+        xml:            bytes          = self._xmlFileName.read_bytes()
+        scannedProject: ScannedProject = XmlDiagramScanner().scan(xmlChunks=[xml])
+        indexedProject: ScannedProject = loadedIndex.scannedProject(prolog=xml[:loadedIndex.prologLength])
+
+        self.assertEqual(scannedProject.prolog,   indexedProject.prolog)
+        self.assertEqual(scannedProject.version,  indexedProject.version)
+        self.assertEqual(scannedProject.codePath, indexedProject.codePath)
+        for scanned, indexed in zip(scannedProject.diagramLocations, indexedProject.diagramLocations):
+            self.assertEqual(scanned.documentTitle, indexed.documentTitle)
+            self.assertEqual(scanned.documentType,  indexed.documentType)
+            self.assertEqual(scanned.startOffset,   indexed.startOffset)
+            self.assertEqual(xml[indexed.startOffset:indexed.endOffset], xml[scanned.startOffset:scanned.endOffset].rstrip(), 'The index range is the bare element')
+
+    def testStaleWhenXmlChanges(self):
+
+        self._writeIndexedXml()
+        self._xmlFileName.write_bytes(self._xmlFileName.read_bytes() + b'\n')
+
+        self.assertIsNone(loadDiagramIndex(xmlFileName=self._xmlFileName), 'The size no longer matches')
+
+    def testMissingOrCorruptIndex(self):
+
+        self._writeIndexedXml()
+        indexFileName(xmlFileName=self._xmlFileName).write_text('{"formatVersion": 1')
+
+        self.assertIsNone(loadDiagramIndex(xmlFileName=self._xmlFileName), 'A corrupt index is ignored')
+
+        indexFileName(xmlFileName=self._xmlFileName).unlink()
+        self.assertIsNone(loadDiagramIndex(xmlFileName=self._xmlFileName), 'No index at all')
+
+    def _writeIndexedXml(self) -> DiagramIndex:
+        """
+        Lay out the XML the way the stream serializer does and index it along the way
+        """
+        diagramIndex: DiagramIndex = DiagramIndex(version='14.0', codePath='/users/hasii', prologLength=PROJECT_START.index(b'<UmlProject'))
+
+        xml: bytes = PROJECT_START
+        for diagram in DIAGRAMS:
+            xml += b'\n    '
+            documentTitle: str = diagram.split(b'title="')[1].split(b'"')[0].decode()
+            documentType:  str = diagram.split(b'documentType="')[1].split(b'"')[0].decode()
+            diagramIndex.indexedDiagrams.append(
+                IndexedDiagram(documentTitle=documentTitle, documentType=documentType, startOffset=len(xml), length=len(diagram), contentHash=diagramHash(fragment=diagram))
+            )
+            xml += diagram
+        xml += PROJECT_END
+
+        self._xmlFileName.write_bytes(xml)
+        saveDiagramIndex(diagramIndex=diagramIndex, xmlFileName=self._xmlFileName)
+
+        return diagramIndex
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagramIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
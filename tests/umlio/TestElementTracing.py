@@ -0,0 +1,80 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from logging import DEBUG
+
+from pathlib import Path
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.ElementTracing import setElementTracing
+
+from umlio.IRReader import IRReader
+
+GOLDEN_FILES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.goldenfiles'
+
+COMPLEX_CLASSES_XML_PROJECT: str = 'ComplexClassesProject.xml'
+NOTE_TO_CLASS_XML_PROJECT:   str = 'NoteToClassAssociationProject.xml'
+
+MODEL_LOGGER_NAME: str = 'umlio.deserializer.XmlToUmlModel'
+IR_LOGGER_NAME:    str = 'umlio.deserializer.XmlToDiagramIR'
+
+
+class TestElementTracing(UnitTestBase):
+    """
+    Element tracing is checked on the first loading stage;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        setElementTracing(False)
+        super().tearDown()
+
+    def testOffByDefault(self):
+
+        with self.assertNoLogs(MODEL_LOGGER_NAME, level=DEBUG):
+            self._readIR(fileName=COMPLEX_CLASSES_XML_PROJECT)
+        with self.assertNoLogs(IR_LOGGER_NAME, level=DEBUG):
+            self._readIR(fileName=NOTE_TO_CLASS_XML_PROJECT)
+
+    def testTracesMethods(self):
+
+        setElementTracing(True)
+        with self.assertLogs(MODEL_LOGGER_NAME, level=DEBUG) as logs:
+            self._readIR(fileName=COMPLEX_CLASSES_XML_PROJECT)
+
+        self.assertIn('methodName=MethodName-222', logs.output[0])
+
+    def testTracesLinks(self):
+
+        setElementTracing(True)
+        with self.assertLogs(IR_LOGGER_NAME, level=DEBUG) as logs:
+            self._readIR(fileName=NOTE_TO_CLASS_XML_PROJECT)
+
+        self.assertEqual(1, len([output for output in logs.output if 'link=' in output]), 'Expected a trace of the one link')
+
+    def _readIR(self, fileName: str):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=fileName)
+
+        IRReader().readXmlFile(fileName=Path(fqFileName))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestElementTracing))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
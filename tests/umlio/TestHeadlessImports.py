@@ -0,0 +1,96 @@
+
+from json import loads as jsonLoads
+
+from os import environ
+from os import pathsep
+
+from subprocess import run as subProcessRun
+
+import sys
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+#
+# Everything a headless worker needs;  Types, probing, the intermediate representation and
+# format conversion
+#
+HEADLESS_MODULES: list[str] = [
+    'umlio.IOTypes',
+    'umlio.IOStats',
+    'umlio.IOProfiler',
+    'umlio.ElementTracing',
+    'umlio.IRReader',
+    'umlio.ProjectProbe',
+    'umlio.Reader',
+    'umlio.Writer',
+    'umlio.sources.SourceSniffer',
+    'umlio.sinks.ContainerFileSink',
+    'umlio.ProjectConverter',
+    'umlio.BatchJobs',
+    'umlio.MainClass',
+    'umlio.benchmark.StageBenchmark',
+    'umlio.benchmark.MemoryBenchmark',
+]
+SHAPE_MODULE_PREFIXES: tuple[str, ...] = ('wx', 'umlshapes.shapes', 'umlshapes.links', 'umlshapes.frames')
+
+IMPORT_SCRIPT: str = '''
+import json, sys
+for moduleName in sys.argv[1:]:
+    __import__(moduleName)
+print(json.dumps({'loaded': [name for name in sys.modules if name.startswith(%r)]}))
+'''
+
+
+class TestHeadlessImports(UnitTestBase):
+    """
+    Importing umlio must not pull in wx;  Each import runs in a fresh interpreter
+    since this one may already have loaded it
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testNoShapeLayerOnImport(self):
+
+        importResult: dict = self._importInFreshInterpreter(moduleNames=HEADLESS_MODULES)
+
+        self.assertEqual([], importResult['loaded'], 'Importing umlio loaded the shape layer')
+
+    def _importInFreshInterpreter(self, moduleNames: list[str]) -> dict:
+        """
+        Returns:  The shape layer modules that got loaded
+        """
+        environment: dict[str, str] = dict(environ)
+        environment['PYTHONPATH'] = pathsep.join(sys.path)
+
+        completedProcess = subProcessRun(
+            [sys.executable, '-c', IMPORT_SCRIPT % (SHAPE_MODULE_PREFIXES, )] + moduleNames,
+            capture_output=True,
+            text=True,
+            env=environment,
+            check=True
+        )
+        return jsonLoads(completedProcess.stdout)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestHeadlessImports))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
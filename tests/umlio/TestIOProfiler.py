@@ -0,0 +1,101 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from pstats import Stats
+
+from tempfile import TemporaryDirectory
+
+from tracemalloc import Snapshot
+from tracemalloc import is_tracing
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.IOProfiler import IOProfiler
+from umlio.IOProfiler import NO_PROFILER
+from umlio.IOProfiler import PROFILE_DIRECTORY_VARIABLE
+from umlio.IOProfiler import PROFILE_MEMORY_VARIABLE
+from umlio.IOProfiler import PROFILE_SUFFIX
+from umlio.IOProfiler import ProfileSettings
+from umlio.IOProfiler import environmentProfileSettings
+from umlio.IOProfiler import ioProfiler
+
+from umlio.Reader import Reader
+
+PROFILED_FILE_NAME: str = 'MultiDiagramsProject.xml'
+
+
+class TestIOProfiler(UnitTestBase):
+    """
+    The profiler is headless and a lazy read builds no shapes;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testEnvironmentSettings(self):
+
+        self.assertIsNone(environmentProfileSettings(environment={}))
+        self.assertEqual(
+            ProfileSettings(directory=Path('/tmp/profiles'), memory=False),
+            environmentProfileSettings(environment={PROFILE_DIRECTORY_VARIABLE: '/tmp/profiles'})
+        )
+        self.assertEqual(
+            ProfileSettings(directory=Path('/tmp/profiles'), memory=True),
+            environmentProfileSettings(environment={PROFILE_DIRECTORY_VARIABLE: '/tmp/profiles', PROFILE_MEMORY_VARIABLE: '1'})
+        )
+
+    def testNoSettingsNoProfiler(self):
+
+        self.assertIs(NO_PROFILER, ioProfiler(None, operation='read', fileName=Path(PROFILED_FILE_NAME)))
+
+    def testProfileAndSnapshot(self):
+
+        with TemporaryDirectory() as directoryName:
+            profileSettings: ProfileSettings = ProfileSettings(directory=Path(directoryName), memory=True)
+            with IOProfiler(profileSettings=profileSettings, operation='write', fileName=Path('Profiled.udt'), fileSize=1234) as profiler:
+                sorted(range(1000), reverse=True)
+
+            self.assertTrue(profiler.profileFileName.name.startswith('Profiled-1234-write-'), 'Not tagged with the file name and size')
+            self.assertGreater(Stats(str(profiler.profileFileName)).total_calls, 0)
+            self.assertGreater(len(Snapshot.load(str(profiler.snapshotFileName)).traces), 0)
+
+        self.assertFalse(is_tracing(), 'The profiler left tracemalloc running')
+
+    def testProfiledRead(self):
+
+        fileName: Path = Path(UnitTestBase.getFullyQualifiedResourceFileName(package=UnitTestBase.RESOURCES_PACKAGE_NAME, fileName=PROFILED_FILE_NAME))
+
+        with TemporaryDirectory() as directoryName:
+            reader: Reader = Reader()
+            reader.lazy            = True
+            reader.profileSettings = ProfileSettings(directory=Path(directoryName))
+            reader.readXmlFile(fileName=fileName)
+
+            profileFileNames: list[str] = [profileFileName.name for profileFileName in Path(directoryName).iterdir()]
+
+        self.assertEqual(1, len(profileFileNames), 'One profile and no snapshot expected')
+        self.assertTrue(profileFileNames[0].startswith(f'{fileName.stem}-{fileName.stat().st_size}-read-'))
+        self.assertTrue(profileFileNames[0].endswith(PROFILE_SUFFIX))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIOProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,108 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from io import BytesIO
+
+from pathlib import Path
+
+from time import sleep
+
+from zlib import compress
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.IOStats import IOStats
+from umlio.IOStats import NO_PHASE
+from umlio.IOStats import OPERATION_WRITE
+from umlio.IOStats import PHASE_COMPRESS
+from umlio.IOStats import PHASE_DECOMPRESS
+from umlio.IOStats import PHASE_PARSE
+from umlio.IOStats import PHASE_SERIALIZE
+from umlio.IOStats import phase
+from umlio.IOStats import timedChunks
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+
+XML_CHUNKS: list[bytes] = [
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n",
+    b'<UmlProject fileName="Stats.udt" version="14.0" codePath="/users/hasii">',
+    b'\n</UmlProject>',
+]
+
+OUTER_SECONDS: float = 0.02
+INNER_SECONDS: float = 0.05
+
+
+class TestIOStats(UnitTestBase):
+    """
+    The stats are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testNestedPhasesAreExclusive(self):
+
+        ioStats: IOStats = IOStats()
+        with ioStats.total():
+            with ioStats.phase(PHASE_PARSE):
+                sleep(OUTER_SECONDS)
+                with ioStats.phase(PHASE_DECOMPRESS):
+                    sleep(INNER_SECONDS)
+
+        parseSeconds:      float = ioStats.phases[PHASE_PARSE].wallSeconds
+        decompressSeconds: float = ioStats.phases[PHASE_DECOMPRESS].wallSeconds
+
+        self.assertGreaterEqual(decompressSeconds, INNER_SECONDS)
+        self.assertLess(parseSeconds, INNER_SECONDS, 'The inner phase was counted in the outer one')
+        self.assertLessEqual(parseSeconds + decompressSeconds, ioStats.wallSeconds)
+
+    def testNoStatsNoTimer(self):
+
+        self.assertIs(NO_PHASE, phase(None, PHASE_PARSE))
+
+    def testTimedChunks(self):
+
+        ioStats:   IOStats     = IOStats()
+        xmlChunks: list[bytes] = list(timedChunks(ioStats=ioStats, xmlChunks=XML_CHUNKS))
+
+        self.assertEqual(XML_CHUNKS, xmlChunks)
+        self.assertEqual(len(b''.join(XML_CHUNKS)), ioStats.bytesOut)
+        self.assertEqual(len(XML_CHUNKS) + 1, ioStats.phases[PHASE_DECOMPRESS].calls, 'Fetching each chunk and the end is timed')
+
+    def testSinkWritesAreCompression(self):
+
+        outputStream: BytesIO = BytesIO()
+        ioStats:      IOStats = IOStats(operation=OPERATION_WRITE)
+
+        compressedFileSink: CompressedFileSink = CompressedFileSink(fileName=Path('Stats.udt'), outputStream=outputStream)
+        compressedFileSink.ioStats = ioStats
+        with compressedFileSink:
+            for xmlChunk in XML_CHUNKS:
+                with ioStats.phase(PHASE_SERIALIZE):
+                    compressedFileSink.write(xmlChunk)
+
+        self.assertEqual(compress(b''.join(XML_CHUNKS)), outputStream.getvalue())
+        self.assertEqual(len(XML_CHUNKS) + 1, ioStats.phases[PHASE_COMPRESS].calls, 'Each write and the flush is compression')
+        self.assertEqual(len(XML_CHUNKS), ioStats.phases[PHASE_SERIALIZE].calls)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIOStats))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,100 @@
+from json import loads as jsonLoads
+
+from shutil import copy
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from click.testing import CliRunner
+from click.testing import Result
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.MainClass import commandHandler
+
+GOLDEN_FILES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.goldenfiles'
+
+GOLDEN_XML_PROJECTS: list[str] = ['LollipopProject.xml', 'NoteToClassAssociationProject.xml']
+
+
+class TestMainClass(UnitTestBase):
+    """
+    The command line is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._projectsPath:       Path               = Path(self._temporaryDirectory.name) / 'projects'
+        self._projectsPath.mkdir()
+        for fileName in GOLDEN_XML_PROJECTS:
+            copy(UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=fileName), self._projectsPath)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testConvertDirectory(self):
+
+        outputPath: Path = Path(self._temporaryDirectory.name) / 'archive'
+
+        summary: dict = self._invoke(['convert', '--to', 'udt', '--container', '--output-directory', str(outputPath), str(self._projectsPath)])
+
+        self.assertEqual(2, summary['succeeded'], 'Not every project converted')
+        self.assertEqual(
+            sorted(Path(fileName).with_suffix('.udt').name for fileName in GOLDEN_XML_PROJECTS),
+            sorted(path.name for path in outputPath.iterdir()),
+            'Wrong output files'
+        )
+        self.assertEqual('container/zlib', summary['results'][0]['details']['outputFormat'], 'Wrong output format')
+
+    def testValidateReportsFailures(self):
+
+        (self._projectsPath / 'Broken.xml').write_text('<UmlProject version="12.0"><UMLDiagram')
+
+        summary: dict = self._invoke(['validate', str(self._projectsPath)], exitCode=1)
+
+        self.assertEqual(3, summary['files'],  'Wrong file count')
+        self.assertEqual(1, summary['failed'], 'Wrong failure count')
+
+        failures: list[dict] = [result for result in summary['results'] if result['succeeded'] is False]
+        self.assertTrue(failures[0]['fileName'].endswith('Broken.xml'), 'Wrong file failed')
+
+    def testStatsGlob(self):
+
+        summary: dict = self._invoke(['stats', str(self._projectsPath / 'Lollipop*.xml')])
+
+        self.assertEqual(1, summary['files'], 'The glob matched the wrong files')
+        self.assertEqual({'UmlClass': 1, 'UmlLollipopInterface': 1}, summary['results'][0]['details']['elementCounts'], 'Wrong element counts')
+
+    def _invoke(self, arguments: list[str], exitCode: int = 0) -> dict:
+        """
+        Returns:  The JSON summary
+        """
+        summaryFileName: Path   = Path(self._temporaryDirectory.name) / 'summary.json'
+        result:          Result = CliRunner().invoke(commandHandler, ['--workers', '1', '--quiet', '--summary', str(summaryFileName)] + arguments)
+
+        self.assertEqual(exitCode, result.exit_code, f'Wrong exit code: {result.output}')
+
+        return jsonLoads(summaryFileName.read_text())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestMainClass))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
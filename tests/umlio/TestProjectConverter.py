@@ -0,0 +1,87 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.ProjectConverter import ProjectConverter
+
+from umlio.ContainerFormat import isContainer
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+GOLDEN_FILES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.goldenfiles'
+
+EMPTY_DIAGRAMS_XML_PROJECT: str = 'EmptyDiagramsProject.xml'
+
+
+class TestProjectConverter(UnitTestBase):
+    """
+    The converter is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._outputPath:         Path               = Path(self._temporaryDirectory.name)
+        self._xmlFileName:        Path               = Path(
+            UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testRoundTripIsByteIdentical(self):
+
+        for containerFormat in [False, True]:
+            with self.subTest(containerFormat=containerFormat):
+                projectFileName: Path = self._outputPath / 'Converted.udt'
+                xmlFileName:     Path = self._outputPath / 'Converted.xml'
+
+                ProjectConverter(containerFormat=containerFormat).convert(fileName=self._xmlFileName, outputFileName=projectFileName)
+                ProjectConverter().convert(fileName=projectFileName, outputFileName=xmlFileName)
+
+                self.assertEqual(containerFormat, isContainer(leadingBytes=projectFileName.read_bytes()), 'Wrong project file format')
+                self.assertEqual(self._xmlFileName.read_bytes(), xmlFileName.read_bytes(), 'The XML changed')
+
+    def testRecompressInPlace(self):
+
+        projectFileName: Path = self._outputPath / 'Recompressed.udt'
+        xmlFileName:     Path = self._outputPath / 'Recompressed.xml'
+
+        ProjectConverter().convert(fileName=self._xmlFileName, outputFileName=projectFileName)
+        ProjectConverter(compressionProfile=CompressionProfile.LZMA, containerFormat=True).convert(fileName=projectFileName, outputFileName=projectFileName)
+        ProjectConverter().convert(fileName=projectFileName, outputFileName=xmlFileName)
+
+        self.assertEqual(self._xmlFileName.read_bytes(), xmlFileName.read_bytes(), 'The XML changed')
+        self.assertEqual([projectFileName.name, xmlFileName.name], sorted(path.name for path in self._outputPath.iterdir()), 'Left a temporary file behind')
+
+    def testUnsupportedOutputSuffix(self):
+
+        self.assertRaises(
+            UnsupportedFileTypeException,
+            lambda: ProjectConverter().convert(fileName=self._xmlFileName, outputFileName=self._outputPath / 'Converted.txt')
+        )
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectConverter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
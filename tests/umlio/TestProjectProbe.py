@@ -0,0 +1,72 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.ProjectProbe import ProjectProbe
+from umlio.ProjectTypes import DiagramSummary
+from umlio.ProjectTypes import ProjectSummary
+from umlio.ProjectTypes import UmlDocumentType
+
+GOLDEN_FILES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.goldenfiles'
+
+NOTE_TO_CLASS_XML_PROJECT:        str = 'NoteToClassAssociationProject.xml'
+NOTE_TO_CLASS_COMPRESSED_PROJECT: str = 'NoteToClassAssociationProject.udt'
+
+
+class TestProjectProbe(UnitTestBase):
+    """
+    The probe is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testProbeXml(self):
+
+        projectSummary: ProjectSummary = self._probe(fileName=NOTE_TO_CLASS_XML_PROJECT)
+
+        self.assertEqual('12.0', projectSummary.version, 'Wrong project version')
+        self.assertEqual(1, len(projectSummary.diagramSummaries), 'Wrong diagram count')
+
+        diagramSummary: DiagramSummary = projectSummary.diagramSummaries[0]
+
+        self.assertEqual('Bare Association Class Diagram', diagramSummary.documentTitle)
+        self.assertEqual(UmlDocumentType.CLASS_DOCUMENT,   diagramSummary.documentType)
+        self.assertEqual({'UmlClass': 1, 'UmlNote': 1, 'UmlLink': 1}, diagramSummary.elementCounts, 'Wrong element counts')
+
+    def testProbeCompressed(self):
+
+        expectedSummary: ProjectSummary = self._probe(fileName=NOTE_TO_CLASS_XML_PROJECT)
+        actualSummary:   ProjectSummary = self._probe(fileName=NOTE_TO_CLASS_COMPRESSED_PROJECT)
+
+        self.assertEqual(expectedSummary.diagramSummaries, actualSummary.diagramSummaries, 'Compressed and plain summaries differ')
+
+    def _probe(self, fileName: str) -> ProjectSummary:
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=fileName)
+
+        return ProjectProbe().probe(fileName=Path(fqFileName))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectProbe))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -18,12 +18,15 @@ from umlio.IOTypes import UmlProject
 
 from umlio.Reader import Reader
 
+from umlio.deserializer.LazyUmlDocuments import LazyUmlDocuments
+
 SINGLE_TEXT_DIAGRAM_XML_PROJECT:     str = 'SingleTextProject.xml'
 SINGLE_NOTE_DIAGRAM_XML_PROJECT:     str = 'SingleNoteProject.xml'
 SINGLE_ACTOR_DIAGRAM_XML_PROJECT:    str = 'SingleActorProject.xml'
 SINGLE_USE_CASE_DIAGRAM_XML_PROJECT: str = 'SingleUseCaseProject.xml'
 COMPLEX_CLASSES_DIAGRAM_XML_PROJECT: str = 'ComplexClassesProject.xml'
 INHERITANCE_XML_PROJECT:             str = 'InheritanceProject.xml'
+NOTE_TO_CLASS_COMPRESSED_PROJECT:    str = 'NoteToClassAssociationProject.udt'
 
 
 class TestReader(UnitTestBaseW):
@@ -53,6 +56,20 @@ class TestReader(UnitTestBaseW):
 
         reader.readXmlFile(Path(emptyProject))
 
+    def testBasicProjectRead(self):
+
+        compressedProject: str = UnitTestBase.getFullyQualifiedResourceFileName(
+            package=UmlIOBaseTest.GOLDEN_FILES_PACKAGE_NAME,
+            fileName=NOTE_TO_CLASS_COMPRESSED_PROJECT)
+
+        reader: Reader = Reader()
+
+        umlProject:   UmlProject  = reader.readProjectFile(Path(compressedProject))
+        classDiagram: UmlDocument = umlProject.umlDocuments[UmlDocumentTitle('Bare Association Class Diagram')]
+
+        self.assertEqual(1, len(classDiagram.umlClasses), 'Streaming decompression lost the class')
+        self.assertEqual(1, len(classDiagram.umlLinks),   'Streaming decompression lost the note link')
+
     def testDeserializeUmlTextElements(self):
 
         umlTextProject: str = UnitTestBase.getFullyQualifiedResourceFileName(
@@ -132,6 +149,53 @@ class TestReader(UnitTestBaseW):
 
         self.assertEqual(1, len(inheritanceDiagram.umlLinks), 'Not the correct # of links')
 
+    def testSinglePassMatchesUntangle(self):
+        inheritanceProject: str = UnitTestBase.getFullyQualifiedResourceFileName(
+            package=UmlIOBaseTest.GOLDEN_FILES_PACKAGE_NAME,
+            fileName=INHERITANCE_XML_PROJECT)
+
+        untangleReader:   Reader = Reader()
+        singlePassReader: Reader = Reader()
+        singlePassReader.singlePass = True
+
+        expectedProject: UmlProject = untangleReader.readXmlFile(Path(inheritanceProject))
+        actualProject:   UmlProject = singlePassReader.readXmlFile(Path(inheritanceProject))
+
+        self.assertEqual(list(expectedProject.umlDocuments.keys()), list(actualProject.umlDocuments.keys()), 'Diagram mismatch')
+
+        title:            UmlDocumentTitle = UmlDocumentTitle('Inheritance Class Diagram')
+        expectedDocument: UmlDocument      = expectedProject.umlDocuments[title]
+        actualDocument:   UmlDocument      = actualProject.umlDocuments[title]
+
+        self.assertEqual([umlClass.id for umlClass in expectedDocument.umlClasses], [umlClass.id for umlClass in actualDocument.umlClasses])
+        self.assertEqual([umlLink.id for umlLink in expectedDocument.umlLinks],     [umlLink.id for umlLink in actualDocument.umlLinks])
+
+    def testLazyRead(self):
+        emptyDiagramsProject: str = UnitTestBase.getFullyQualifiedResourceFileName(
+            package=UmlIOBaseTest.GOLDEN_FILES_PACKAGE_NAME,
+            fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+
+        eagerReader: Reader = Reader()
+        lazyReader:  Reader = Reader()
+        lazyReader.lazy = True
+
+        expectedProject: UmlProject = eagerReader.readXmlFile(Path(emptyDiagramsProject))
+        actualProject:   UmlProject = lazyReader.readXmlFile(Path(emptyDiagramsProject))
+
+        lazyDocuments: LazyUmlDocuments = actualProject.umlDocuments     # type: ignore
+
+        self.assertEqual(list(expectedProject.umlDocuments.keys()), list(lazyDocuments.keys()), 'The scan missed a diagram')
+
+        titles: list[UmlDocumentTitle] = list(lazyDocuments.keys())
+        for title in titles:
+            self.assertFalse(lazyDocuments.isMaterialized(title), 'Nothing should be deserialized yet')
+
+        firstDocument: UmlDocument = lazyDocuments[titles[0]]
+
+        self.assertTrue(lazyDocuments.isMaterialized(titles[0]),  'Lookup should deserialize')
+        self.assertFalse(lazyDocuments.isMaterialized(titles[1]), 'Only the requested diagram should be deserialized')
+        self.assertEqual(expectedProject.umlDocuments[titles[0]].documentType, firstDocument.documentType)
+
 
 def suite() -> TestSuite:
     import unittest
@@ -2,16 +2,26 @@
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from asyncio import run
+
+from io import BytesIO
+
 from pathlib import Path
 
+from zlib import decompress
+
 from codeallybasic.UnitTestBase import UnitTestBase
 
 from umlio.IOTypes import UmlDocument
 from umlio.IOTypes import UmlDocumentTitle
 from umlio.IOTypes import UmlDocumentType
 from umlio.IOTypes import UmlProject
+from umlio.Reader import Reader
+from umlio.DiagramIndex import indexFileName
 from umlio.Writer import Writer
 
+from umlio.serializer.UmlShapesToXml import UmlShapesToXml
+
 from tests.umlio.UmlIOBaseTest import UmlIOBaseTest
 from tests.umlio.UmlIOBaseTest import EMPTY_DIAGRAMS_COMPRESSED_PROJECT
 from tests.umlio.UmlIOBaseTest import EMPTY_DIAGRAMS_XML_PROJECT
@@ -73,6 +83,132 @@ class TestWriter(UmlIOBaseTest):
         # self.assertEqual(EXPECTED_FILE_SIZE, actualFileSize, 'Hmm.  Maybe zlib changed')
         self.assertTrue(actualFileSize > 0, 'Looks like it is empty')
 
+    def testStreamedMatchesTreeSerialization(self):
+        directory:             Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        emptyDiagramsFileName: Path = directory / EMPTY_DIAGRAMS_COMPRESSED_PROJECT
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        writer: Writer = Writer()
+        writer.writeFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        umlShapesToXml: UmlShapesToXml = UmlShapesToXml(projectFileName=emptyDiagramsFileName, projectCodePath=umlProject.codePath)
+        for umlDiagram in umlProject.umlDocuments.values():
+            umlShapesToXml.serialize(umlDiagram=umlDiagram)
+
+        self.assertEqual(umlShapesToXml.xml.encode(), decompress(emptyDiagramsFileName.read_bytes()), 'Streamed XML differs')
+
+    def testIncrementalSaveReusesUnchangedDiagrams(self):
+        directory:             Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        emptyDiagramsFileName: Path = directory / EMPTY_DIAGRAMS_COMPRESSED_PROJECT
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        writer: Writer = Writer()
+        writer.incremental = True
+        writer.writeFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        umlProject.umlDocuments[UmlDocumentTitle('Number One')].scrollPositionX = 42
+        writer.writeFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        assert writer.fragmentCache is not None
+        self.assertEqual(2, writer.fragmentCache.statistics.hits,   'Unchanged diagrams should be reused')
+        self.assertEqual(4, writer.fragmentCache.statistics.misses, 'Only the changed diagram should be serialized again')
+
+        umlShapesToXml: UmlShapesToXml = UmlShapesToXml(projectFileName=emptyDiagramsFileName, projectCodePath=umlProject.codePath)
+        for umlDiagram in umlProject.umlDocuments.values():
+            umlShapesToXml.serialize(umlDiagram=umlDiagram)
+
+        self.assertEqual(umlShapesToXml.xml.encode(), decompress(emptyDiagramsFileName.read_bytes()), 'Spliced XML differs')
+
+    def testIncrementalSaveSeesModelEdits(self):
+        directory:          Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        singleNoteFileName: Path = directory / 'SingleNoteProject.udt'
+
+        umlNoteProject: str = UnitTestBase.getFullyQualifiedResourceFileName(
+            package=UmlIOBaseTest.GOLDEN_FILES_PACKAGE_NAME,
+            fileName='SingleNoteProject.xml'
+        )
+        umlProject: UmlProject = Reader().readXmlFile(fileName=Path(umlNoteProject))
+        directory.mkdir(parents=True, exist_ok=True)
+
+        writer: Writer = Writer()
+        writer.incremental = True
+        writer.writeFile(umlProject=umlProject, fileName=singleNoteFileName)
+
+        umlDocument: UmlDocument = next(iter(umlProject.umlDocuments.values()))
+        umlDocument.umlNotes[0].modelNote.content = 'Edited in the model only'
+        writer.writeFile(umlProject=umlProject, fileName=singleNoteFileName)
+
+        assert writer.fragmentCache is not None
+        self.assertEqual(0, writer.fragmentCache.statistics.hits, 'A model edit should invalidate the diagram')
+        self.assertIn(b'Edited in the model only', decompress(singleNoteFileName.read_bytes()))
+
+    def testContainerFormatRoundTrip(self):
+        directory:             Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        emptyDiagramsFileName: Path = directory / EMPTY_DIAGRAMS_COMPRESSED_PROJECT
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        writer: Writer = Writer()
+        writer.containerFormat = True
+        writer.writeFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        readProject: UmlProject = Reader().readProjectFile(fileName=emptyDiagramsFileName)
+
+        self.assertEqual(list(umlProject.umlDocuments.keys()), list(readProject.umlDocuments.keys()), 'Diagrams did not survive the container')
+
+    def testStreamRoundTripWithoutFiles(self):
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+
+        projectStream: BytesIO = BytesIO()
+        Writer().writeStream(umlProject=umlProject, projectStream=projectStream)
+
+        readProject: UmlProject = Reader().readData(projectData=memoryview(projectStream.getbuffer()), fileName=umlProject.fileName)
+
+        self.assertEqual(list(umlProject.umlDocuments.keys()), list(readProject.umlDocuments.keys()), 'Diagrams did not survive the stream')
+
+    def testDiagramIndexReadsOneDiagram(self):
+        directory:             Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        emptyDiagramsFileName: Path = directory / EMPTY_DIAGRAMS_XML_PROJECT
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        writer: Writer = Writer()
+        writer.diagramIndex = True
+        writer.writeXmlFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        self.assertTrue(indexFileName(xmlFileName=emptyDiagramsFileName).exists(), 'No sidecar index')
+
+        for documentTitle, umlDocument in umlProject.umlDocuments.items():
+            readDocument: UmlDocument = Reader().readXmlDiagram(fileName=emptyDiagramsFileName, documentTitle=documentTitle)
+            self.assertEqual(umlDocument.documentType, readDocument.documentType, 'Read the wrong diagram')
+
+        writer.diagramIndex = False
+        writer.writeXmlFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+
+        self.assertFalse(indexFileName(xmlFileName=emptyDiagramsFileName).exists(), 'The index would be stale')
+
+    def testAsyncRoundTrip(self):
+        directory:             Path = Path.home() / UNIT_TEST_DIAGRAM_DIRECTORY
+        emptyDiagramsFileName: Path = directory / EMPTY_DIAGRAMS_COMPRESSED_PROJECT
+
+        umlProject: UmlProject = self._createEmptyDiagramsProject()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        async def roundTrip() -> UmlProject:
+            await Writer().aWriteFile(umlProject=umlProject, fileName=emptyDiagramsFileName)
+            return await Reader().aReadProjectFile(fileName=emptyDiagramsFileName)
+
+        readProject: UmlProject = run(roundTrip())
+
+        self.assertEqual(list(umlProject.umlDocuments.keys()), list(readProject.umlDocuments.keys()), 'Diagrams did not survive the coroutines')
+
     def _createEmptyDiagramsProject(self) -> UmlProject:
 
         umlProject: UmlProject = UmlProject()
@@ -0,0 +1,71 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.benchmark.MemoryBenchmark import CALL_STAGES
+from umlio.benchmark.MemoryBenchmark import ElementCosts
+from umlio.benchmark.MemoryBenchmark import MemoryBenchmark
+from umlio.benchmark.MemoryBenchmark import MemoryMeasurement
+from umlio.benchmark.MemoryBenchmark import STAGE_READ_IR
+from umlio.benchmark.MemoryBenchmark import StageMemory
+
+from umlio.benchmark.ProjectGenerator import GeneratorParameters
+
+from umlio.benchmark.StageBenchmark import SHAPE_STAGES
+from umlio.benchmark.StageBenchmark import STAGES
+from umlio.benchmark.StageBenchmark import STAGE_PARSE
+
+
+class TestMemoryBenchmark(UnitTestBase):
+    """
+    The memory benchmark is headless;  No wx here, so the shape stages and calls are skipped
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._memoryBenchmark: MemoryBenchmark = MemoryBenchmark(shapeStages=False)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMeasure(self):
+
+        measurement: MemoryMeasurement = self._memoryBenchmark.measure(generatorParameters=GeneratorParameters(classesPerDiagram=20))
+
+        headlessStages: list[str] = [stageName for stageName in STAGES if stageName not in SHAPE_STAGES] + [STAGE_READ_IR]
+        for stageName in STAGES + CALL_STAGES:
+            if stageName in headlessStages:
+                self.assertIsNotNone(measurement.stageMemories[stageName], f'{stageName} was not measured')
+            else:
+                self.assertIsNone(measurement.stageMemories[stageName], f'{stageName} should not run headless')
+
+        parseMemory: StageMemory | None = measurement.stageMemories[STAGE_PARSE]
+        assert parseMemory is not None
+        self.assertGreater(parseMemory.retainedBytes, measurement.xmlBytes, 'The parse tree is bigger than its XML')
+        self.assertGreaterEqual(parseMemory.peakBytes, parseMemory.retainedBytes, 'The peak cannot be below what is kept')
+
+    def testClassCostGrowsWithMethods(self):
+
+        elementCosts: ElementCosts = self._memoryBenchmark.elementCosts(elementName='UmlClass', parameterName='methodsPerClass', values=[0, 10])
+
+        self.assertEqual('intermediate', elementCosts[0].representation, 'Without wx there are no shapes')
+        self.assertGreater(elementCosts[0].bytesPerElement, 0.0, 'A class costs something')
+        self.assertGreater(elementCosts[1].bytesPerElement, elementCosts[0].bytesPerElement, 'Methods cost nothing')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestMemoryBenchmark))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,114 @@
+from dataclasses import replace
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlmodel.Class import Class
+
+from umlio.IRReader import IRReader
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import ProjectIR
+from umlio.ProjectProbe import ProjectProbe
+from umlio.ProjectTypes import ProjectSummary
+
+from umlio.benchmark.ProjectGenerator import GeneratorParameters
+from umlio.benchmark.ProjectGenerator import ProjectGenerator
+
+GENERATOR_PARAMETERS: GeneratorParameters = GeneratorParameters(
+    diagrams=3,
+    classesPerDiagram=7,
+    methodsPerClass=4,
+    parametersPerMethod=3,
+    fieldsPerClass=2,
+    notesPerDiagram=2,
+    linksPerDiagram=9,
+    controlPointsPerLink=3,
+    lollipopsPerDiagram=2
+)
+
+
+class TestProjectGenerator(UnitTestBase):
+    """
+    The generator is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._xml: bytes = ProjectGenerator(generatorParameters=GENERATOR_PARAMETERS).generateXml()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testDeterministic(self):
+
+        self.assertEqual(self._xml, ProjectGenerator(generatorParameters=GENERATOR_PARAMETERS).generateXml(), 'The same parameters gave different XML')
+
+        otherSeed: GeneratorParameters = replace(GENERATOR_PARAMETERS, seed=7)
+
+        self.assertNotEqual(self._xml, ProjectGenerator(generatorParameters=otherSeed).generateXml(), 'The seed made no difference')
+
+    def testElementCounts(self):
+
+        with TemporaryDirectory() as temporaryDirectory:
+            fileName: Path = Path(temporaryDirectory) / 'Generated.xml'
+            fileName.write_bytes(self._xml)
+
+            projectSummary: ProjectSummary = ProjectProbe().probe(fileName=fileName)
+
+        self.assertEqual(GENERATOR_PARAMETERS.diagrams, len(projectSummary.diagramSummaries), 'Wrong diagram count')
+        for diagramSummary in projectSummary.diagramSummaries:
+            self.assertEqual(
+                {
+                    'UmlClass':             GENERATOR_PARAMETERS.classesPerDiagram,
+                    'UmlNote':              GENERATOR_PARAMETERS.notesPerDiagram,
+                    'UmlLink':              GENERATOR_PARAMETERS.linksPerDiagram,
+                    'UmlLollipopInterface': GENERATOR_PARAMETERS.lollipopsPerDiagram,
+                },
+                diagramSummary.elementCounts,
+                'Wrong element counts'
+            )
+
+    def testReadsBack(self):
+
+        projectIR: ProjectIR = IRReader().readData(projectData=self._xml)
+
+        self.assertEqual(GENERATOR_PARAMETERS.diagrams, len(projectIR.diagramIRs), 'Wrong diagram count')
+        for diagramIR in projectIR.diagramIRs.values():
+            self._checkDiagramIR(diagramIR=diagramIR)
+
+    def _checkDiagramIR(self, diagramIR: DiagramIR):
+
+        self.assertEqual(GENERATOR_PARAMETERS.classesPerDiagram,   len(diagramIR.classIRs),    'Wrong class count')
+        self.assertEqual(GENERATOR_PARAMETERS.linksPerDiagram,     len(diagramIR.linkIRs),     'Wrong link count')
+        self.assertEqual(GENERATOR_PARAMETERS.lollipopsPerDiagram, len(diagramIR.lollipopIRs), 'Wrong lollipop count')
+
+        modelClass: Class = diagramIR.classIRs[0].modelClass
+        self.assertEqual(GENERATOR_PARAMETERS.methodsPerClass,     len(modelClass.methods),               'Wrong method count')
+        self.assertEqual(GENERATOR_PARAMETERS.parametersPerMethod, len(modelClass.methods[0].parameters), 'Wrong parameter count')
+        self.assertEqual(GENERATOR_PARAMETERS.fieldsPerClass,      len(modelClass.fields),                'Wrong field count')
+
+        for linkIR in diagramIR.linkIRs:
+            self.assertEqual(GENERATOR_PARAMETERS.controlPointsPerLink, len(linkIR.controlPoints), 'Wrong control point count')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectGenerator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,83 @@
+from json import loads as jsonLoads
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from click.testing import CliRunner
+from click.testing import Result
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.benchmark.ProjectGenerator import GeneratorParameters
+
+from umlio.benchmark.StageBenchmark import SHAPE_STAGES
+from umlio.benchmark.StageBenchmark import STAGES
+from umlio.benchmark.StageBenchmark import StageBenchmark
+from umlio.benchmark.StageBenchmark import StageMeasurements
+from umlio.benchmark.StageBenchmark import benchmarkHandler
+
+SMALL_PROJECT: GeneratorParameters = GeneratorParameters(classesPerDiagram=3, linksPerDiagram=2)
+
+
+class TestStageBenchmark(UnitTestBase):
+    """
+    The benchmark is headless;  No wx here, so the shape stages are skipped
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._stageBenchmark: StageBenchmark = StageBenchmark(repetitions=1, shapeStages=False)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSweep(self):
+
+        measurements: StageMeasurements = self._stageBenchmark.sweep(parameterName='linksPerDiagram', values=[0, 4], generatorParameters=SMALL_PROJECT)
+
+        self.assertEqual([0, 4], [m.generatorParameters.linksPerDiagram for m in measurements], 'Wrong sweep')
+        self.assertLess(measurements[0].xmlBytes, measurements[1].xmlBytes, 'The links added no XML')
+        for measurement in measurements:
+            for stageName in STAGES:
+                if stageName in SHAPE_STAGES:
+                    self.assertIsNone(measurement.stageSeconds[stageName], f'{stageName} should not run headless')
+                else:
+                    self.assertGreater(measurement.stageSeconds[stageName], 0.0, f'{stageName} was not timed')
+
+    def testCommandLineWritesResults(self):
+
+        with TemporaryDirectory() as temporaryDirectory:
+            outputFileName: Path   = Path(temporaryDirectory) / 'results.json'
+            result:         Result = CliRunner().invoke(
+                benchmarkHandler,
+                ['--sweep', 'classesPerDiagram=1,2', '--sweep', 'diagrams=2', '--repetitions', '1', '--no-shapes', '--output', str(outputFileName)]
+            )
+            self.assertEqual(0, result.exit_code, f'Wrong exit code: {result.output}')
+
+            results: dict = jsonLoads(outputFileName.read_text())
+
+        self.assertEqual(STAGES, results['stages'], 'Wrong stages')
+        self.assertEqual(3, len(results['results']), 'One result per swept value')
+        self.assertEqual(2, results['results'][2]['generatorParameters']['diagrams'], 'Wrong parameters')
+        self.assertIn('umlioVersion', results, 'Results must say what they measured')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestStageBenchmark))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,168 @@
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from shutil import rmtree
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import OGLInitialize
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentTitle
+from umlio.IOTypes import UmlProject
+
+from umlio.Reader import Reader
+
+from umlio.IRTypes import ProjectIR
+
+from umlio.cache.ParseCache import ENTRY_SUFFIX
+from umlio.cache.ParseCache import ENTRY_VERSION
+from umlio.cache.ParseCache import INDEX_FILE_NAME
+from umlio.cache.ParseCache import TEMPORARY_SUFFIX
+from umlio.cache.ParseCache import ParseCache
+
+from tests.umlio.UmlIOBaseTest import UmlIOBaseTest
+
+INHERITANCE_XML_PROJECT: str = 'InheritanceProject.xml'
+
+
+class VanishingEntriesCache(ParseCache):
+    """
+    Lists an entry that another process evicted after the directory was read
+    """
+    def _entryPaths(self) -> list[Path]:
+        return super()._entryPaths() + [self.cacheDirectory / f'evicted{ENTRY_SUFFIX}']
+
+
+class TestParseCache(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        OGLInitialize()
+
+        self._cacheDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._cacheDirectory.cleanup()
+
+    def testHitAfterMiss(self):
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name))
+        reader:     Reader     = Reader()
+        reader.parseCache = parseCache
+
+        missProject: UmlProject = reader.readXmlFile(self._inheritanceProject())
+        hitProject:  UmlProject = reader.readXmlFile(self._inheritanceProject())
+
+        self.assertEqual(1, parseCache.statistics.misses, 'First read should miss')
+        self.assertEqual(1, parseCache.statistics.hits,   'Second read should hit')
+
+        title:        UmlDocumentTitle = UmlDocumentTitle('Inheritance Class Diagram')
+        missDocument: UmlDocument      = missProject.umlDocuments[title]
+        hitDocument:  UmlDocument      = hitProject.umlDocuments[title]
+
+        self.assertEqual([umlClass.id for umlClass in missDocument.umlClasses], [umlClass.id for umlClass in hitDocument.umlClasses])
+        self.assertEqual([umlLink.id for umlLink in missDocument.umlLinks],     [umlLink.id for umlLink in hitDocument.umlLinks])
+
+    def testEvictsOverSizeCap(self):
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name), maximumSize=1)
+        reader:     Reader     = Reader()
+        reader.parseCache = parseCache
+
+        reader.readXmlFile(self._inheritanceProject())
+
+        self.assertEqual(1, parseCache.statistics.stores,    'Should have stored the project')
+        self.assertEqual(1, parseCache.statistics.evictions, 'The entry does not fit')
+
+    def testDiscardsUnreadableEntry(self):
+
+        parseCache:  ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name))
+        projectFile: Path       = self._inheritanceProject()
+
+        parseCache.store(fileName=projectFile, projectIR=ProjectIR())
+        entryPaths: list[Path] = list(Path(self._cacheDirectory.name).glob(f'*{ENTRY_SUFFIX}'))
+        entryPaths[0].write_bytes(b'\x80\x05truncated')
+
+        self.assertIsNone(parseCache.load(fileName=projectFile), 'A truncated entry is a miss')
+        self.assertFalse(entryPaths[0].exists(), 'The unreadable entry should be discarded')
+        self.assertEqual([], list(Path(self._cacheDirectory.name).glob(f'*{TEMPORARY_SUFFIX}')), 'Temporary files left behind')
+
+    def testEntryNamesCarryTheVersions(self):
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name))
+
+        parseCache.store(fileName=self._inheritanceProject(), projectIR=ProjectIR())
+        entryPaths: list[Path] = list(Path(self._cacheDirectory.name).glob(f'*{ENTRY_SUFFIX}'))
+
+        self.assertTrue(entryPaths[0].name.endswith(f'-{ENTRY_VERSION}{ENTRY_SUFFIX}'), 'An upgrade would load entries of the old versions')
+
+    def testEvictionSkipsVanishedEntries(self):
+
+        parseCache: ParseCache = VanishingEntriesCache(cacheDirectory=Path(self._cacheDirectory.name), maximumSize=1)
+
+        parseCache.store(fileName=self._inheritanceProject(), projectIR=ProjectIR())
+
+        self.assertEqual(1, parseCache.statistics.stores,    'Should have stored the project')
+        self.assertEqual(1, parseCache.statistics.evictions, 'Only the entry that exists is evicted')
+
+    def testFailedStoreDoesNotRaise(self):
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name))
+        rmtree(self._cacheDirectory.name)
+
+        parseCache.store(fileName=self._inheritanceProject(), projectIR=ProjectIR())
+
+        self.assertEqual(0, parseCache.statistics.stores, 'Nothing could be stored')
+
+    def testIndexForgetsDeletedFiles(self):
+
+        parseCache:  ParseCache = ParseCache(cacheDirectory=Path(self._cacheDirectory.name))
+        deletedFile: Path       = Path(self._cacheDirectory.name) / 'Deleted.xml'
+        deletedFile.write_bytes(self._inheritanceProject().read_bytes())
+
+        parseCache.store(fileName=deletedFile, projectIR=ProjectIR())
+        deletedFile.unlink()
+        parseCache.store(fileName=self._inheritanceProject(), projectIR=ProjectIR())
+
+        indexedNames: list[str] = list(jsonLoads((Path(self._cacheDirectory.name) / INDEX_FILE_NAME).read_text()).keys())
+
+        self.assertEqual([str(self._inheritanceProject().resolve())], indexedNames, 'The index should drop files that are gone')
+
+    def _inheritanceProject(self) -> Path:
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=UmlIOBaseTest.GOLDEN_FILES_PACKAGE_NAME, fileName=INHERITANCE_XML_PROJECT)
+
+        return Path(fqFileName)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParseCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
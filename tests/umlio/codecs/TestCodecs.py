@@ -0,0 +1,129 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import adler32
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.codecs.CompressionProfile import CompressionProfile
+from umlio.codecs.ZlibDictionary import DICTIONARY_VERSION_1
+from umlio.codecs.ZlibDictionary import presetDictionary
+
+from umlio.exceptions.CorruptProjectFileException import CorruptProjectFileException
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+from umlio.sinks.ContainerFileSink import ContainerFileSink
+from umlio.sinks.XmlSink import XmlSink
+
+from umlio.sources.CompressedFileSource import CompressedFileSource
+from umlio.sources.SourceSniffer import projectFileSource
+
+PROJECT_XML: bytes = (
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n"
+    b'<UmlProject fileName="Codec.udt" version="14.0" codePath="/users/hasii">'
+    + b''.join(b'\n    <UMLDiagram documentType="Class Document" title="Diagram %d" />' % n for n in range(2000))
+    + b'\n</UmlProject>'
+)
+
+#
+# Files compressed with version 1 can only be read with exactly these dictionary bytes
+#
+DICTIONARY_VERSION_1_ADLER32: int = 3024995065
+
+SMALL_PROJECT_XML: bytes = (
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n"
+    b'<UmlProject fileName="Small.udt" version="14.0" codePath="/users/hasii">\n'
+    b'    <UMLDiagram documentType="Class Document" title="Small" scrollPositionX="1" scrollPositionY="1" pixelsPerUnitX="1" pixelsPerUnitY="1">\n'
+    b'        <UmlClass id="1" width="100" height="100" x="10" y="10">\n'
+    b'            <ModelClass id="2" name="Small" displayMethods="True" displayParameters="Unspecified" displayConstructor="Unspecified" '
+    b'displayDunderMethods="Unspecified" displayFields="True" displayStereotype="True" fileName="" description="">\n'
+    b'                <ModelMethod name="method" visibility="PUBLIC" returnType="">\n'
+    b'                    <SourceCode />\n'
+    b'                </ModelMethod>\n'
+    b'            </ModelClass>\n'
+    b'        </UmlClass>\n'
+    b'    </UMLDiagram>\n'
+    b'</UmlProject>'
+)
+
+
+class TestCodecs(UnitTestBase):
+    """
+    The codecs are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testEveryProfileRoundTrips(self):
+
+        for profile in CompressionProfile.availableProfiles():
+            with self.subTest(profile=profile):
+                singleStream: Path = self._write(xmlSink=CompressedFileSink(fileName=self._fileName('SingleStream.udt'), codec=profile.codec))
+                container:    Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName('Container.udt'), codec=profile.codec))
+
+                self.assertEqual(PROJECT_XML, b''.join(projectFileSource(fileName=singleStream).chunks()))
+                self.assertEqual(PROJECT_XML, b''.join(projectFileSource(fileName=container).chunks()))
+
+    def testDictionaryVersion1IsFrozen(self):
+        self.assertEqual(DICTIONARY_VERSION_1_ADLER32, adler32(presetDictionary(dictionaryVersion=DICTIONARY_VERSION_1)), 'Released dictionaries must never change')
+
+    def testDictionaryShrinksSmallProjects(self):
+
+        plainSize:      int = len(CompressionProfile.BALANCED.codec.compress(SMALL_PROJECT_XML))
+        dictionarySize: int = len(CompressionProfile.DICTIONARY.codec.compress(SMALL_PROJECT_XML))
+
+        self.assertLess(dictionarySize, plainSize * 0.8, 'The preset dictionary should pay for itself on small projects')
+
+    def testUnknownCompressionIsUnsupported(self):
+
+        fileName: Path = self._fileName('Unknown.udt')
+        fileName.write_bytes(b'PK\x03\x04 not a project file')
+
+        with self.assertRaises(UnsupportedFileTypeException):
+            projectFileSource(fileName=fileName)
+
+    def testTruncatedStreamIsCorrupt(self):
+
+        fileName: Path = self._write(xmlSink=CompressedFileSink(fileName=self._fileName('Truncated.udt'), codec=CompressionProfile.LZMA.codec))
+        fileName.write_bytes(fileName.read_bytes()[:-20])
+
+        with self.assertRaises(CorruptProjectFileException):
+            b''.join(CompressedFileSource(fileName=fileName).chunks())
+
+    def _fileName(self, name: str) -> Path:
+        return Path(self._temporaryDirectory.name) / name
+
+    def _write(self, xmlSink: XmlSink) -> Path:
+
+        with xmlSink:
+            xmlSink.write(PROJECT_XML)
+
+        return xmlSink.fileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCodecs))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,181 @@
+
+from typing import Iterator
+
+from pickle import dumps as pickleDumps
+from pickle import loads as pickleLoads
+
+from pathlib import Path
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.IRReader import IRReadResult
+from umlio.IRReader import IRReader
+from umlio.IRTypes import DiagramIR
+from umlio.IRTypes import ProjectIR
+from umlio.ProjectTypes import UmlDocumentTitle
+
+from umlio.deserializer.XmlToDiagramIR import MODEL_LOCK
+from umlio.deserializer.XmlToDiagramIR import XmlToDiagramIR
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+GOLDEN_FILES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.goldenfiles'
+
+LOLLIPOP_XML_PROJECT:       str = 'LollipopProject.xml'
+EMPTY_DIAGRAMS_XML_PROJECT: str = 'EmptyDiagramsProject.xml'
+NOTE_TO_CLASS_XML_PROJECT:  str = 'NoteToClassAssociationProject.xml'
+
+UNNAMED_NOTE:    str = '<UmlNote id="{diagramNumber}.{noteNumber}" width="100" height="50" x="10" y="10"><ModelNote id="{diagramNumber}{noteNumber}" content="" fileName="" /></UmlNote>'
+UNNAMED_DIAGRAM: str = '<UMLDiagram documentType="Class Document" title="Diagram {diagramNumber}" scrollPositionX="1" scrollPositionY="1" pixelsPerUnitX="1" pixelsPerUnitY="1">{notes}</UMLDiagram>'
+
+
+class TestXmlToDiagramIR(UnitTestBase):
+    """
+    The first loading stage runs without wx
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testLollipopIR(self):
+
+        projectIR: ProjectIR = self._readIR(fileName=LOLLIPOP_XML_PROJECT)
+        diagramIR: DiagramIR = projectIR.diagramIRs[UmlDocumentTitle('Lollipop Class Diagram')]
+
+        self.assertEqual(1, len(diagramIR.classIRs),    'Wrong class count')
+        self.assertEqual(1, len(diagramIR.lollipopIRs), 'Wrong lollipop count')
+        self.assertEqual(diagramIR.classIRs[0].graphicInformation.id, diagramIR.lollipopIRs[0].attachedToId, 'Lollipop not attached to the class')
+
+    def testLinkReferencesModelObjects(self):
+
+        projectIR: ProjectIR = self._readIR(fileName=NOTE_TO_CLASS_XML_PROJECT)
+        diagramIR: DiagramIR = projectIR.diagramIRs[UmlDocumentTitle('Bare Association Class Diagram')]
+
+        self.assertIs(diagramIR.noteIRs[0].modelNote,   diagramIR.linkIRs[0].link.source,      'Link source is not the model note')
+        self.assertIs(diagramIR.classIRs[0].modelClass, diagramIR.linkIRs[0].link.destination, 'Link destination is not the model class')
+
+    def testPickles(self):
+
+        projectIR: ProjectIR = self._readIR(fileName=NOTE_TO_CLASS_XML_PROJECT)
+        copiedIR:  ProjectIR = pickleLoads(pickleDumps(projectIR))
+
+        diagramIR: DiagramIR = copiedIR.diagramIRs[UmlDocumentTitle('Bare Association Class Diagram')]
+
+        self.assertIs(diagramIR.classIRs[0].modelClass, diagramIR.linkIRs[0].link.destination, 'Pickling should keep the shared model objects')
+
+    def testParallelMatchesSequential(self):
+
+        sequentialIR: ProjectIR = self._readIR(fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+        parallelIR:   ProjectIR = self._readIR(fileName=EMPTY_DIAGRAMS_XML_PROJECT, workers=2)
+
+        self.assertEqual(list(sequentialIR.diagramIRs.keys()), list(parallelIR.diagramIRs.keys()), 'Diagrams out of order')
+        self.assertEqual(
+            [diagramIR.documentType for diagramIR in sequentialIR.diagramIRs.values()],
+            [diagramIR.documentType for diagramIR in parallelIR.diagramIRs.values()]
+        )
+        self.assertEqual(sequentialIR.version, parallelIR.version, 'Lost the project version')
+
+    def testParallelNamesUnnamedNotesLikeSequential(self):
+
+        diagrams: str = ''.join(
+            UNNAMED_DIAGRAM.format(diagramNumber=diagramNumber, notes=''.join(UNNAMED_NOTE.format(diagramNumber=diagramNumber, noteNumber=noteNumber) for noteNumber in range(3)))
+            for diagramNumber in range(4)
+        )
+        projectData: bytes = f'<?xml version="1.0" encoding="iso-8859-1"?><UmlProject fileName="" version="12.0" codePath="/users/hasii">{diagrams}</UmlProject>'.encode()
+
+        sequentialIR: ProjectIR = IRReader().readData(projectData=projectData, workers=1)
+        parallelIR:   ProjectIR = IRReader().readData(projectData=projectData, workers=2)
+
+        self.assertEqual(self._noteNames(projectIR=sequentialIR), self._noteNames(projectIR=parallelIR))
+        self.assertEqual(['Note-1', 'Note-2', 'Note-3'], self._noteNames(projectIR=parallelIR)[-1], 'Unnamed notes are numbered per diagram')
+
+    def testUntangleDoesNotNeedTheModelLock(self):
+
+        fileName:       Path           = self._fqFileName(fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+        xmlToDiagramIR: XmlToDiagramIR = XmlToDiagramIR()
+
+        with MODEL_LOCK:        # Another read building model objects
+            umlProjectElement = xmlToDiagramIR.untangle(xmlChunks=[fileName.read_bytes()])
+        xmlToDiagramIR.deserializeUmlProject(umlProjectElement=umlProjectElement, fileName=fileName)
+
+        expectedIR: ProjectIR = self._readIR(fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+
+        self.assertEqual(list(expectedIR.diagramIRs.keys()), list(xmlToDiagramIR.projectIR.diagramIRs.keys()), 'Untangling first lost diagrams')
+
+    def testReadManyIsolatesErrors(self):
+
+        fileNames: list[Path] = [
+            self._fqFileName(fileName=LOLLIPOP_XML_PROJECT),
+            Path('NotAProject.txt'),
+            Path('DoesNotExist.xml'),
+            self._fqFileName(fileName=NOTE_TO_CLASS_XML_PROJECT),
+        ]
+        results: dict[str, ProjectIR | Exception] = {
+            fileName.name: result for fileName, result in IRReader().readMany(fileNames=fileNames, workers=2, processes=False)
+        }
+
+        self.assertEqual(4, len(results), 'Every file should have a result')
+        self.assertIsInstance(results[LOLLIPOP_XML_PROJECT],      ProjectIR)
+        self.assertIsInstance(results[NOTE_TO_CLASS_XML_PROJECT], ProjectIR)
+        self.assertIsInstance(results['NotAProject.txt'],         UnsupportedFileTypeException)
+        self.assertIsInstance(results['DoesNotExist.xml'],        FileNotFoundError)
+
+    def testReadManyMatchesReadXmlFile(self):
+
+        fileName: Path = self._fqFileName(fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+
+        _, projectIR = next(IRReader().readMany(fileNames=[fileName], workers=1, processes=False))
+        expectedIR: ProjectIR = self._readIR(fileName=EMPTY_DIAGRAMS_XML_PROJECT)
+
+        self.assertEqual(list(expectedIR.diagramIRs.keys()), list(projectIR.diagramIRs.keys()), 'Batch read lost diagrams')
+
+    def testReadManyBackpressure(self):
+
+        pulled: list[Path] = []
+
+        def fileNames() -> Iterator[Path]:
+            for _ in range(10):
+                fileName: Path = self._fqFileName(fileName=LOLLIPOP_XML_PROJECT)
+                pulled.append(fileName)
+                yield fileName
+
+        irReadResults: Iterator[IRReadResult] = IRReader().readMany(fileNames=fileNames(), workers=1, maximumPending=2, processes=False)
+        next(irReadResults)
+
+        self.assertLessEqual(len(pulled), 3, 'Read too far ahead of the consumer')
+        self.assertEqual(9, len(list(irReadResults)), 'Lost results')
+
+    def _fqFileName(self, fileName: str) -> Path:
+        return Path(UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=fileName))
+
+    def _noteNames(self, projectIR: ProjectIR) -> list[list[str]]:
+        return [[noteIR.modelNote.name for noteIR in diagramIR.noteIRs] for diagramIR in projectIR.diagramIRs.values()]
+
+    def _readIR(self, fileName: str, workers: int = 1) -> ProjectIR:
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=GOLDEN_FILES_PACKAGE_NAME, fileName=fileName)
+
+        return IRReader().readXmlFile(fileName=Path(fqFileName), workers=workers)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestXmlToDiagramIR))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
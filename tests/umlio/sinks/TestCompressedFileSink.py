@@ -0,0 +1,73 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+from zlib import decompress
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+
+XML_PIECES: list[bytes] = [
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n",
+    b'<UmlProject fileName="Sink.udt" version="14.0" codePath="/users/hasii">',
+    b'\n    <UMLDiagram documentType="CLASS_DOCUMENT" title="Sink" />',
+    b'\n</UmlProject>',
+]
+
+
+class TestCompressedFileSink(UnitTestBase):
+    """
+    The sinks are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMatchesOneShotCompression(self):
+
+        with TemporaryDirectory() as directoryName:
+            fileName: Path = Path(directoryName) / 'Sink.udt'
+            with CompressedFileSink(fileName=fileName) as compressedFileSink:
+                for xmlPiece in XML_PIECES:
+                    compressedFileSink.write(xmlPiece)
+
+            compressedBytes: bytes = fileName.read_bytes()
+
+        self.assertEqual(compress(b''.join(XML_PIECES)), compressedBytes, 'Streamed stream differs from zlib.compress()')
+        self.assertEqual(b''.join(XML_PIECES), decompress(compressedBytes))
+
+    def testFailedWriteLeavesNoFile(self):
+
+        with TemporaryDirectory() as directoryName:
+            fileName: Path = Path(directoryName) / 'Sink.udt'
+            with self.assertRaises(ValueError):
+                with CompressedFileSink(fileName=fileName) as compressedFileSink:
+                    compressedFileSink.write(XML_PIECES[0])
+                    raise ValueError('Serialization failed')
+
+            self.assertEqual([], list(Path(directoryName).iterdir()), 'Partial output left behind')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCompressedFileSink))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,151 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.codecs.Codec import Codec
+from umlio.codecs.LzmaCodec import LzmaCodec
+from umlio.codecs.ZlibCodec import ZlibCodec
+
+from umlio.exceptions.DecompressionLimitException import DecompressionLimitException
+
+from umlio.sources.BoundedXmlSource import BoundedXmlSource
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.SourceSniffer import projectFileSource
+from umlio.sources.XmlSource import XmlSource
+
+PROJECT_START: bytes = b"<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Bomb.udt\" version=\"14.0\" codePath=\"/users/hasii\">"
+PROJECT_END:   bytes = b'\n</UmlProject>'
+DIAGRAM:       bytes = b'\n    <UMLDiagram documentType="Class Document" title="Diagram"><!-- empty --></UMLDiagram>'
+
+UNLIMITED: DecompressionLimits = DecompressionLimits(maximumXmlBytes=None, maximumRatio=None, maximumElements=None)
+
+
+class TestBoundedXmlSource(UnitTestBase):
+    """
+    The decompression limits are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testOrdinaryProjectPasses(self):
+
+        xml:      bytes = PROJECT_START + DIAGRAM * 3 + PROJECT_END
+        fileName: Path  = self._writeProject(xml=xml, codec=ZlibCodec())
+
+        self.assertEqual(xml, b''.join(projectFileSource(fileName=fileName).chunks()), 'The default limits must not get in the way')
+
+    def testByteLimit(self):
+
+        fileName: Path = self._writeBomb(codec=ZlibCodec())
+        limits:   DecompressionLimits = DecompressionLimits(maximumXmlBytes=64 * 1024, maximumRatio=None, maximumElements=None)
+
+        with self.assertRaises(DecompressionLimitException):
+            list(projectFileSource(fileName=fileName, decompressionLimits=limits).chunks())
+
+    def testRatioLimit(self):
+
+        fileName: Path = self._writeBomb(codec=LzmaCodec())
+        limits:   DecompressionLimits = DecompressionLimits(maximumXmlBytes=None, maximumRatio=100, maximumElements=None)
+
+        with self.assertRaises(DecompressionLimitException):
+            list(projectFileSource(fileName=fileName, decompressionLimits=limits).chunks())
+
+    def testElementLimit(self):
+
+        fileName: Path = self._writeBomb(codec=ZlibCodec())
+        limits:   DecompressionLimits = DecompressionLimits(maximumXmlBytes=None, maximumRatio=None, maximumElements=1000)
+
+        with self.assertRaises(DecompressionLimitException):
+            list(projectFileSource(fileName=fileName, decompressionLimits=limits).chunks())
+
+    def testAbortsEarly(self):
+        """
+        The bomb is abandoned after the first chunk over the limit, not after it is fully expanded
+        """
+        fileName: Path = self._writeBomb(codec=ZlibCodec())
+        limits:   DecompressionLimits = DecompressionLimits(maximumXmlBytes=64 * 1024, maximumRatio=None, maximumElements=None)
+
+        boundedSource: BoundedXmlSource = BoundedXmlSource(xmlSource=projectFileSource(fileName=fileName, decompressionLimits=None), decompressionLimits=limits)
+
+        xmlByteCount: int = 0
+        with self.assertRaises(DecompressionLimitException):
+            for xmlChunk in boundedSource.chunks():
+                xmlByteCount += len(xmlChunk)
+
+        self.assertLess(xmlByteCount, 1024 * 1024, 'Should stop long before the whole bomb expands')
+
+    def testFragmentOfSwappedFileIsLimited(self):
+        """
+        A fragment streams the file again;  By then it may be a bomb
+        """
+        xml:      bytes               = PROJECT_START + DIAGRAM * 3 + PROJECT_END
+        fileName: Path                = self._writeProject(xml=xml, codec=ZlibCodec())
+        limits:   DecompressionLimits = DecompressionLimits(maximumXmlBytes=64 * 1024, maximumRatio=None, maximumElements=None)
+
+        xmlSource: XmlSource = projectFileSource(fileName=fileName, decompressionLimits=limits)
+        self.assertEqual(DIAGRAM, xmlSource.fragment(startOffset=len(PROJECT_START), endOffset=len(PROJECT_START) + len(DIAGRAM)))
+
+        self._writeBomb(codec=ZlibCodec())
+        with self.assertRaises(DecompressionLimitException):
+            xmlSource.fragment(startOffset=4 * 1024 * 1024, endOffset=4 * 1024 * 1024 + len(DIAGRAM))
+
+    def testElementCountAcrossChunks(self):
+        """
+        A '<' at the end of one chunk is only a start tag if the next chunk says so
+        """
+        xml:           bytes = PROJECT_START + DIAGRAM * 7 + PROJECT_END
+        expectedCount: int   = 1 + 7
+        fileName:      Path  = self._writeProject(xml=xml, codec=ZlibCodec())
+
+        boundedSource: BoundedXmlSource = BoundedXmlSource(xmlSource=projectFileSource(fileName=fileName, decompressionLimits=None), decompressionLimits=UNLIMITED)
+        for chunkSize in [1, 2, 3, 7, 64]:
+            elementCount:   int  = 0
+            openTagPending: bool = False
+            for startOffset in range(0, len(xml), chunkSize):
+                xmlChunk: bytes = xml[startOffset:startOffset + chunkSize]
+                elementCount  += boundedSource._countStartTags(xmlChunk=xmlChunk, openTagPending=openTagPending)
+                openTagPending = xmlChunk.endswith(b'<')
+
+            self.assertEqual(expectedCount, elementCount, f'Wrong count with {chunkSize} byte chunks')
+
+    def _writeBomb(self, codec: Codec) -> Path:
+        """
+        About 8MB of XML that compresses to a few tens of kilobytes
+        """
+        return self._writeProject(xml=PROJECT_START + DIAGRAM * (8 * 1024 * 1024 // len(DIAGRAM)) + PROJECT_END, codec=codec)
+
+    def _writeProject(self, xml: bytes, codec: Codec) -> Path:
+
+        fileName: Path = Path(self._temporaryDirectory.name) / 'Bomb.udt'
+        fileName.write_bytes(codec.compress(xml))
+
+        return fileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBoundedXmlSource))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
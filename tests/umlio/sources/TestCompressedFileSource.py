@@ -0,0 +1,126 @@
+
+from typing import Iterator
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+
+from umlio.sources.CompressedFileSource import CompressedFileSource
+from umlio.sources.XmlSource import FragmentRange
+from umlio.sources.XmlSource import FragmentRanges
+
+XML_DIAGRAMS: list[bytes] = [
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Legacy.udt\" version=\"14.0\" codePath=\"/users/hasii\">",
+    b'\n    <UMLDiagram documentType="Class Document" title="Zero" />',
+    b'\n    <UMLDiagram documentType="Class Document" title="One" />',
+    b'\n</UmlProject>',
+]
+
+
+class CountingSource(CompressedFileSource):
+    """
+    Counts the passes over the compressed stream
+    """
+    def __init__(self, fileName: Path):
+        super().__init__(fileName=fileName)
+        self.passes: int = 0
+
+    def chunks(self) -> Iterator[bytes]:
+        self.passes += 1
+        return super().chunks()
+
+
+class TestCompressedFileSource(UnitTestBase):
+    """
+    The single stream codec is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testExpectedFragmentsInflateOnce(self):
+
+        fileName:       Path           = self._write(xmlDiagrams=XML_DIAGRAMS)
+        countingSource: CountingSource = CountingSource(fileName=fileName)
+
+        fragmentRanges: FragmentRanges = self._diagramRanges()
+        countingSource.expectFragments(fragmentRanges=fragmentRanges)
+        for fragmentRange, xmlDiagram in zip(fragmentRanges, XML_DIAGRAMS[1:3]):
+            self.assertEqual(xmlDiagram, countingSource.fragment(startOffset=fragmentRange[0], endOffset=fragmentRange[1]))
+
+        self.assertEqual(1, countingSource.passes, 'Each fragment inflated the file again')
+
+    def testHandedOutFragmentsAreDropped(self):
+
+        fileName:       Path           = self._write(xmlDiagrams=XML_DIAGRAMS)
+        countingSource: CountingSource = CountingSource(fileName=fileName)
+
+        fragmentRange: FragmentRange = self._diagramRanges()[0]
+        countingSource.expectFragments(fragmentRanges=self._diagramRanges())
+        countingSource.fragment(startOffset=fragmentRange[0], endOffset=fragmentRange[1])
+
+        self.assertEqual(XML_DIAGRAMS[1], countingSource.fragment(startOffset=fragmentRange[0], endOffset=fragmentRange[1]))
+        self.assertEqual(2, countingSource.passes, 'The first fragment should not have been kept')
+
+    def testChangedSinceStamp(self):
+
+        fileName:             Path                 = self._write(xmlDiagrams=XML_DIAGRAMS)
+        compressedFileSource: CompressedFileSource = CompressedFileSource(fileName=fileName)
+
+        self.assertFalse(compressedFileSource.changedSinceStamp, 'Nothing noted yet')
+        compressedFileSource.noteFileStamp()
+        compressedFileSource.fragment(startOffset=0, endOffset=1)
+        self.assertFalse(compressedFileSource.changedSinceStamp)
+
+        changedDiagrams: list[bytes] = XML_DIAGRAMS[:2] + XML_DIAGRAMS[3:]
+        self._write(xmlDiagrams=changedDiagrams)
+
+        self.assertTrue(compressedFileSource.changedSinceStamp)
+        self.assertEqual(b''.join(changedDiagrams), compressedFileSource.fragment(startOffset=0, endOffset=len(b''.join(XML_DIAGRAMS))), 'Kept stale bytes')
+
+    def _diagramRanges(self) -> FragmentRanges:
+        """
+        Where a scan would find the two diagrams
+        """
+        startOffset:  int = len(XML_DIAGRAMS[0])
+        middleOffset: int = startOffset + len(XML_DIAGRAMS[1])
+
+        return FragmentRanges([FragmentRange((startOffset, middleOffset)), FragmentRange((middleOffset, middleOffset + len(XML_DIAGRAMS[2])))])
+
+    def _write(self, xmlDiagrams: list[bytes]) -> Path:
+
+        compressedFileSink: CompressedFileSink = CompressedFileSink(fileName=Path(self._temporaryDirectory.name) / 'Legacy.udt')
+        with compressedFileSink:
+            for xmlDiagram in xmlDiagrams:
+                compressedFileSink.write(xmlDiagram)
+
+        return compressedFileSink.fileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCompressedFileSource))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,148 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.ContainerFormat import ENTRY_STRUCT
+
+from umlio.exceptions.CorruptProjectFileException import CorruptProjectFileException
+from umlio.exceptions.DecompressionLimitException import DecompressionLimitException
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+from umlio.sinks.ContainerFileSink import ContainerFileSink
+from umlio.sinks.XmlSink import XmlSink
+
+from umlio.sources.BoundedXmlSource import DecompressionLimits
+from umlio.sources.CompressedFileSource import CompressedFileSource
+from umlio.sources.ContainerFileSource import ContainerFileSource
+from umlio.sources.SourceSniffer import projectFileSource
+
+XML_BLOCKS: list[bytes] = [
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Container.udt\" version=\"14.0\" codePath=\"/users/hasii\">",
+    b'\n    <UMLDiagram documentType="Class Document" title="Zero" />',
+    b'\n    <UMLDiagram documentType="Class Document" title="One" />',
+    b'\n</UmlProject>',
+]
+
+
+class TestContainerFileSource(UnitTestBase):
+    """
+    The container codec is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testBlocksRoundTrip(self):
+
+        fileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()))
+
+        self.assertEqual(XML_BLOCKS, list(ContainerFileSource(fileName=fileName).chunks()), 'One chunk per block, in order')
+
+    def testFragmentSpansBlocks(self):
+
+        fileName: Path  = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()))
+        xml:      bytes = b''.join(XML_BLOCKS)
+
+        startOffset: int = xml.index(b'title="Zero"')
+        endOffset:   int = xml.index(b'title="One"')
+
+        self.assertEqual(xml[startOffset:endOffset], ContainerFileSource(fileName=fileName).fragment(startOffset=startOffset, endOffset=endOffset))
+
+    def testSniffsLegacyAndContainer(self):
+
+        containerFileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName(name='Container.udt')))
+        legacyFileName:    Path = self._write(xmlSink=CompressedFileSink(fileName=self._fileName(name='Legacy.udt')))
+
+        self.assertIsInstance(projectFileSource(fileName=containerFileName, decompressionLimits=None), ContainerFileSource)
+        self.assertIsInstance(projectFileSource(fileName=legacyFileName,    decompressionLimits=None), CompressedFileSource)
+
+    def testCorruptBlockFailsCrc(self):
+
+        fileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()))
+
+        containerBytes: bytearray = bytearray(fileName.read_bytes())
+        containerBytes[-1] ^= 0xFF      # The last table of contents entry's checksum
+        fileName.write_bytes(bytes(containerBytes))
+
+        with self.assertRaises(CorruptProjectFileException):
+            list(ContainerFileSource(fileName=fileName).chunks())
+
+    def testForgedLengthFailsBeforeDecompressing(self):
+
+        fileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()))
+        self._forgeLastEntry(fileName=fileName, uncompressedLength=0xFFFFFFFF)
+
+        with self.assertRaises(DecompressionLimitException):
+            next(iter(projectFileSource(fileName=fileName).chunks()))
+
+    def testDeclaredRatioIsLimited(self):
+
+        fileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()), xmlBlocks=[XML_BLOCKS[1] * 1000])
+
+        with self.assertRaises(DecompressionLimitException):
+            next(iter(projectFileSource(fileName=fileName, decompressionLimits=DecompressionLimits(maximumRatio=2)).chunks()))
+
+    def testInconsistentTableOfContents(self):
+
+        fileName: Path = self._write(xmlSink=ContainerFileSink(fileName=self._fileName()))
+        self._forgeLastEntry(fileName=fileName, uncompressedOffset=0)
+
+        with self.assertRaises(CorruptProjectFileException):
+            next(iter(ContainerFileSource(fileName=fileName).chunks()))
+
+    def _forgeLastEntry(self, fileName: Path, **entryFields: int):
+        """
+        Rewrites the last table of contents entry in place;  It is the end of the file
+        """
+        containerBytes: bytearray = bytearray(fileName.read_bytes())
+        entryStart:     int       = len(containerBytes) - ENTRY_STRUCT.size
+
+        compressedOffset, compressedLength, uncompressedOffset, uncompressedLength, checksum = ENTRY_STRUCT.unpack(containerBytes[entryStart:])
+
+        containerBytes[entryStart:] = ENTRY_STRUCT.pack(
+            compressedOffset,
+            compressedLength,
+            entryFields.get('uncompressedOffset', uncompressedOffset),
+            entryFields.get('uncompressedLength', uncompressedLength),
+            checksum
+        )
+        fileName.write_bytes(bytes(containerBytes))
+
+    def _fileName(self, name: str = 'Container.udt') -> Path:
+        return Path(self._temporaryDirectory.name) / name
+
+    def _write(self, xmlSink: XmlSink, xmlBlocks: list[bytes] = XML_BLOCKS) -> Path:
+
+        with xmlSink:
+            for xmlBlock in xmlBlocks:
+                xmlSink.write(xmlBlock)
+                xmlSink.endBlock()
+
+        return xmlSink.fileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestContainerFileSource))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
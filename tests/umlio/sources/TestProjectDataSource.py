@@ -0,0 +1,125 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from io import BytesIO
+
+from pathlib import Path
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.codecs.LzmaCodec import LzmaCodec
+
+from umlio.sinks.CompressedFileSink import CompressedFileSink
+from umlio.sinks.ContainerFileSink import ContainerFileSink
+from umlio.sinks.XmlSink import XmlSink
+
+from umlio.sources.BoundedXmlSource import BoundedXmlSource
+from umlio.sources.MemoryViewReader import MemoryViewReader
+from umlio.sources.SourceSniffer import projectDataSource
+from umlio.sources.XmlFileSource import XmlFileSource
+from umlio.sources.XmlSource import XmlSource
+
+XML_BLOCKS: list[bytes] = [
+    b"<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Data.udt\" version=\"14.0\" codePath=\"/users/hasii\">",
+    b'\n    <UMLDiagram documentType="Class Document" title="Zero" />',
+    b'\n    <UMLDiagram documentType="Class Document" title="One" />',
+    b'\n</UmlProject>',
+]
+XML: bytes = b''.join(XML_BLOCKS)
+
+STREAM_PREFIX: bytes = b'not part of the project'
+
+
+class TestProjectDataSource(UnitTestBase):
+    """
+    The data entry points are headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPlainXml(self):
+
+        xmlSource: XmlSource = projectDataSource(projectData=XML)
+
+        self.assertIsInstance(xmlSource, XmlFileSource)
+        self.assertEqual(XML, b''.join(xmlSource.chunks()))
+
+    def testXmlFragmentInPlace(self):
+
+        xmlSource:   XmlSource = projectDataSource(projectData=memoryview(bytearray(XML)))
+        startOffset: int       = XML.index(b'<UMLDiagram')
+
+        self.assertEqual(XML_BLOCKS[1].lstrip(), xmlSource.fragment(startOffset=startOffset, endOffset=startOffset + len(XML_BLOCKS[1]) - 5))
+
+    def testCompressedBytes(self):
+
+        outputStream: BytesIO = BytesIO()
+        projectData:  bytes   = self._write(xmlSink=CompressedFileSink(fileName=Path('Data.udt'), codec=LzmaCodec(), outputStream=outputStream), outputStream=outputStream)
+        xmlSource:    XmlSource = projectDataSource(projectData=projectData)
+
+        self.assertIsInstance(xmlSource, BoundedXmlSource)
+        self.assertEqual(XML, b''.join(xmlSource.chunks()))
+
+    def testContainerInsideLargerStream(self):
+        """
+        The container's offsets are relative to its header;  So it may start anywhere in the stream
+        """
+        outputStream: BytesIO = BytesIO(STREAM_PREFIX)
+        outputStream.seek(len(STREAM_PREFIX))
+
+        projectData: bytes = self._write(xmlSink=ContainerFileSink(fileName=Path('Data.udt'), outputStream=outputStream), outputStream=outputStream)[len(STREAM_PREFIX):]
+
+        self.assertEqual(XML, b''.join(projectDataSource(projectData=projectData).chunks()))
+
+    def testBinaryFile(self):
+
+        outputStream: BytesIO = BytesIO()
+        projectData:  bytes   = self._write(xmlSink=CompressedFileSink(fileName=Path('Data.udt'), outputStream=outputStream), outputStream=outputStream)
+
+        self.assertEqual(XML, b''.join(projectDataSource(projectData=BytesIO(projectData), fileName=Path('Data.udt')).chunks()))
+
+    def testOutputStreamLeftOpen(self):
+
+        outputStream: BytesIO = BytesIO()
+        self._write(xmlSink=CompressedFileSink(fileName=Path('Data.udt'), outputStream=outputStream), outputStream=outputStream)
+
+        self.assertFalse(outputStream.closed, 'The stream belongs to the caller')
+
+    def testMemoryViewReaderSeeks(self):
+
+        memoryViewReader: MemoryViewReader = MemoryViewReader(projectBuffer=memoryview(XML))
+
+        memoryViewReader.seek(-len(XML_BLOCKS[-1]), 2)
+        self.assertEqual(XML_BLOCKS[-1], memoryViewReader.read())
+        self.assertEqual(b'', memoryViewReader.read(), 'Reads past the end are empty')
+
+    def _write(self, xmlSink: XmlSink, outputStream: BytesIO) -> bytes:
+
+        with xmlSink:
+            for xmlBlock in XML_BLOCKS:
+                xmlSink.write(xmlBlock)
+                xmlSink.endBlock()
+
+        return outputStream.getvalue()
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectDataSource))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,95 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from xml.parsers.expat import ParserCreate
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.sources.XmlFileSource import MAPPED_CHUNK_SIZE
+from umlio.sources.XmlFileSource import XmlFileSource
+
+XML_START:   bytes = "<?xml version='1.0' encoding='iso-8859-1'?>\n<UmlProject fileName=\"Mapped.xml\" version=\"14.0\" codePath=\"/users/hasii/Café\">".encode('iso-8859-1')
+XML_DIAGRAM: bytes = b'\n    <UMLDiagram documentType="Class Document" title="Diagram" />'
+XML_END:     bytes = b'\n</UmlProject>'
+
+
+class TestXmlFileSource(UnitTestBase):
+    """
+    The mapped XML source is headless;  No wx here
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testChunksAreViewsOfTheMap(self):
+
+        xml:      bytes = XML_START + XML_DIAGRAM * (2 * MAPPED_CHUNK_SIZE // len(XML_DIAGRAM)) + XML_END
+        fileName: Path  = self._writeXml(xml=xml)
+
+        xmlChunks: list = list(XmlFileSource(fileName=fileName).chunks())
+
+        self.assertEqual(3, len(xmlChunks), 'The file spans three slices')
+        self.assertTrue(all(isinstance(xmlChunk, memoryview) for xmlChunk in xmlChunks), 'Slices of the map are not copied')
+        self.assertEqual(xml, b''.join(xmlChunks))
+
+    def testParserHonorsDeclaredEncoding(self):
+        """
+        The parser gets the raw bytes;  So the declaration, not the locale, decides the encoding
+        """
+        codePaths: list[str] = []
+
+        parser = ParserCreate()
+        parser.StartElementHandler = lambda name, attributes: codePaths.append(attributes.get('codePath', ''))
+
+        for xmlChunk in XmlFileSource(fileName=self._writeXml(xml=XML_START + XML_END)).chunks():
+            parser.Parse(xmlChunk, False)
+        parser.Parse(b'', True)
+
+        self.assertEqual('/users/hasii/Café', codePaths[0])
+
+    def testEmptyFileIsNotMapped(self):
+
+        self.assertEqual([], list(XmlFileSource(fileName=self._writeXml(xml=b'')).chunks()))
+
+    def testFragment(self):
+
+        xml:         bytes = XML_START + XML_DIAGRAM + XML_END
+        startOffset: int   = len(XML_START)
+
+        fragment: bytes = XmlFileSource(fileName=self._writeXml(xml=xml)).fragment(startOffset=startOffset, endOffset=startOffset + len(XML_DIAGRAM))
+
+        self.assertEqual(XML_DIAGRAM, fragment)
+
+    def _writeXml(self, xml: bytes) -> Path:
+
+        fileName: Path = Path(self._temporaryDirectory.name) / 'Mapped.xml'
+        fileName.write_bytes(xml)
+
+        return fileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestXmlFileSource))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()